@@ -15,7 +15,10 @@ from PIL import Image as PILImage
 
 from sip_studio.config.logging import get_logger
 from sip_studio.config.settings import get_settings
-from sip_studio.studio.services.rate_limiter import rate_limited_generate_content
+from sip_studio.studio.services.rate_limiter import (
+    RequestPriority,
+    rate_limited_generate_content,
+)
 
 logger = get_logger(__name__)
 
@@ -100,6 +103,7 @@ async def analyze_image(image_path: Path) -> ImageAnalysisResult | None:
             "gemini-2.0-flash",
             [_ANALYSIS_PROMPT, pil_image],
             types.GenerateContentConfig(temperature=0.1),
+            priority=RequestPriority.BACKGROUND,
         )
 
         # Parse response
@@ -200,6 +204,7 @@ async def analyze_packaging_text(
             "gemini-3-pro-image-preview",
             [prompt, pil_image],
             types.GenerateContentConfig(temperature=0.1),
+            priority=RequestPriority.BACKGROUND,
         )
         response_text = (response.text or "").strip()
         # Handle potential markdown code blocks (reuse existing pattern)
@@ -9,8 +9,6 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
-from openai import AsyncOpenAI
-
 from sip_studio.advisor.session_manager import (
     Message,
     MessagesFile,
@@ -22,6 +20,7 @@ from sip_studio.advisor.session_manager import (
     session_lock,
 )
 from sip_studio.config.logging import get_logger
+from sip_studio.studio.services.openai_client import chat_completion
 
 if TYPE_CHECKING:
     pass
@@ -76,25 +75,16 @@ TOKEN_HARD_LIMIT = 250_000  # Alias for old code
 TOKEN_SAFETY_MARGIN = 20_000
 SUMMARY_TOKEN_LIMIT = SUMMARY_TARGET_TOKENS
 MAX_CONTEXT_LIMIT = 250_000  # Server handles actual limit
-# endregion
-# region LLM Helpers
-_openai_client: AsyncOpenAI | None = None
-
-
-def _get_openai_client() -> AsyncOpenAI:
-    global _openai_client
-    if _openai_client is None:
-        _openai_client = AsyncOpenAI()
-    return _openai_client
 
 
+# endregion
+# region LLM Helpers
 async def _call_llm_with_retry(prompt: str, max_tokens: int = 500) -> str | None:
     """LLM call with timeout/retry/backoff. Returns None on failure."""
-    client = _get_openai_client()
     for attempt in range(3):
         try:
             response = await asyncio.wait_for(
-                client.chat.completions.create(
+                chat_completion(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=max_tokens,
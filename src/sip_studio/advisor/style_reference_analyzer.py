@@ -18,7 +18,10 @@ from sip_studio.brands.models import (
 )
 from sip_studio.config.logging import get_logger
 from sip_studio.config.settings import get_settings
-from sip_studio.studio.services.rate_limiter import rate_limited_generate_content
+from sip_studio.studio.services.rate_limiter import (
+    RequestPriority,
+    rate_limited_generate_content,
+)
 
 logger = get_logger(__name__)
 # V1 geometry-focused analysis prompt
@@ -170,6 +173,7 @@ async def analyze_style_reference(images: list[Path | bytes]) -> StyleReferenceA
             "gemini-2.0-flash",
             contents,
             types.GenerateContentConfig(temperature=0.1),
+            priority=RequestPriority.BACKGROUND,
         )
         txt = _strip_md((resp.text or "").strip())
         data = json.loads(txt)
@@ -289,6 +293,7 @@ async def analyze_style_reference_v2(images: list[Path | bytes]) -> StyleReferen
             "gemini-2.0-flash",
             contents,
             types.GenerateContentConfig(temperature=0.1),
+            priority=RequestPriority.BACKGROUND,
         )
         txt = _strip_md((resp.text or "").strip())
         data = json.loads(txt)
@@ -390,6 +395,7 @@ async def analyze_style_reference_v3(images: list[Path | bytes]) -> StyleReferen
             "gemini-2.0-flash",
             contents,
             types.GenerateContentConfig(temperature=0.1),
+            priority=RequestPriority.BACKGROUND,
         )
         txt = _strip_md((resp.text or "").strip())
         data = json.loads(txt)
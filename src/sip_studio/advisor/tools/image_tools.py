@@ -9,6 +9,7 @@ from pathlib import Path
 from agents import function_tool
 
 from sip_studio.config.logging import get_logger
+from sip_studio.generators.resolution import ImagePurpose, resolve_image_size
 from sip_studio.models.aspect_ratio import validate_aspect_ratio
 
 from . import _common
@@ -123,10 +124,11 @@ async def _impl_generate_image(
     import io
     import time
 
-    from google import genai
     from google.genai import types
     from PIL import Image as PILImage
 
+    from sip_studio.studio.services.gemini_client import get_gemini_client
+
     logger.info(
         "[generate_image] PARAMS: slug=%s, slugs=%s, ref_img=%s, template_slug=%s, strict=%s, validate=%s",
         product_slug,
@@ -139,7 +141,10 @@ async def _impl_generate_image(
     settings = _common.get_settings()
     brand_slug = _common.get_active_brand()
     model = "gemini-3-pro-image-preview"
-    image_size = "4K"
+    # Chat output lands unsorted in the workstation: generate at draft size and
+    # upscale to the final size only if the user keeps it. Validation attempts use
+    # the draft size too, since the accepted attempt is the image the user gets.
+    image_size = resolve_image_size(ImagePurpose.DRAFT)
     if brand_slug:
         output_dir = _common.get_brand_dir(brand_slug) / "assets" / "generated"
     else:
@@ -344,7 +349,7 @@ async def _impl_generate_image(
             status="pending",
         )
         try:
-            client = genai.Client(api_key=settings.gemini_api_key, vertexai=False)
+            client = get_gemini_client(settings.gemini_api_key)
             result = await generate_with_multi_validation(
                 client=client,
                 prompt=generation_prompt,
@@ -357,6 +362,7 @@ async def _impl_generate_image(
                 product_slugs=product_slugs,
                 style_ref_images_bytes=style_ref_images_bytes or None,
                 style_ref_name=style_ref_name,
+                image_size=image_size,
             )
             if isinstance(result, str):
                 return result
@@ -571,9 +577,8 @@ async def _impl_generate_image(
         expertise="Image Generation",
         status="pending",
     )
-    client = None
     try:
-        client = genai.Client(api_key=settings.gemini_api_key, vertexai=False)
+        client = get_gemini_client(settings.gemini_api_key)
         if validate_identity and reference_image_bytes:
             from sip_studio.advisor.validation import generate_with_validation
 
@@ -589,6 +594,7 @@ async def _impl_generate_image(
                 max_retries=max_retries,
                 style_ref_images_bytes=style_ref_images_bytes or None,
                 style_ref_name=style_ref_name,
+                image_size=image_size,
             )
             if isinstance(val_result, str):
                 return val_result
@@ -678,9 +684,9 @@ async def _impl_generate_image(
         else:
             contents = generation_prompt  # type: ignore[assignment]
             logger.info(f"Generating image: {generation_prompt[:100]}...")
-        from sip_studio.studio.services.rate_limiter import rate_limited_generate_content
+        from sip_studio.studio.services.rate_limiter import rate_limited_generate_content_async
 
-        response = rate_limited_generate_content(
+        response = await rate_limited_generate_content_async(
             client,
             model,
             contents,
@@ -773,13 +779,6 @@ async def _impl_generate_image(
             step_id=step_id,
         )
         return f"Error generating image: {str(e)}"
-    finally:
-        # Ensure GenAI client is properly closed to avoid async task warnings
-        if client is not None and hasattr(client, "aclose"):
-            try:
-                await client.aclose()  # type: ignore[attr-defined]
-            except Exception:
-                pass  # Ignore cleanup errors
 
 
 @function_tool
@@ -81,7 +81,10 @@ async def _generate_style_reference_name(image_path: Path) -> str:
         from google import genai
         from google.genai import types
 
-        from sip_studio.studio.services.rate_limiter import rate_limited_generate_content
+        from sip_studio.studio.services.rate_limiter import (
+            RequestPriority,
+            rate_limited_generate_content,
+        )
 
         settings = _common.get_settings()
         client = genai.Client(api_key=settings.gemini_api_key)
@@ -92,6 +95,7 @@ async def _generate_style_reference_name(image_path: Path) -> str:
             "gemini-2.0-flash",
             [types.Part.from_bytes(data=img_bytes, mime_type="image/png"), prompt],
             None,
+            priority=RequestPriority.BACKGROUND,
         )
         name = (resp.text or "").strip().strip('"').strip("'")
         return name if name else "New Style Reference"
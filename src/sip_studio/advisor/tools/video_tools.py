@@ -337,6 +337,15 @@ async def _impl_generate_video_clip(
             if image_metadata:
                 video_meta["source_image_metadata"] = image_metadata
             store_video_metadata(str(target_path), video_meta)
+            try:
+                from sip_studio.studio.services.video_thumbnails import (
+                    schedule_video_thumbnails,
+                )
+
+                # Poster and scrub strip are ready by the time the grid asks
+                schedule_video_thumbnails(target_path)
+            except Exception as thumb_err:
+                logger.debug(f"Could not schedule video thumbnails: {thumb_err}")
             deleted_paths = set()
             if resolved_concept and resolved_concept.exists():
                 try:
@@ -11,7 +11,8 @@ from typing import TYPE_CHECKING
 from sip_studio.advisor.tools import emit_tool_thinking
 from sip_studio.config.logging import get_logger
 from sip_studio.config.settings import get_settings
-from sip_studio.studio.services.rate_limiter import rate_limited_generate_content
+from sip_studio.generators.resolution import ImagePurpose, resolve_image_size
+from sip_studio.studio.services.rate_limiter import rate_limited_generate_content_async
 
 from .metrics import (
     GenerationMetrics,
@@ -46,6 +47,7 @@ async def generate_with_validation(
     reference_images_bytes: list[bytes] | None = None,
     style_ref_images_bytes: list[bytes] | None = None,
     style_ref_name: str = "",
+    image_size: str | None = None,
 ) -> ValidationGenerationResult | str:
     """Generate image with reference and validate for identity preservation.
     This function implements a retry loop that:
@@ -63,12 +65,15 @@ async def generate_with_validation(
             filename: Base filename (without extension).
             aspect_ratio: Image aspect ratio.
             max_retries: Maximum validation attempts.
+            image_size: Gemini image_size for attempts. Defaults to the resolution
+                    policy's validation-attempt size.
     Returns:
             ValidationGenerationResult with path and attempt details, or an error string.
     """
     from google.genai import types
     from PIL import Image as PILImage
 
+    image_size = image_size or resolve_image_size(ImagePurpose.VALIDATION_ATTEMPT)
     attempts: list[ValidationAttempt] = []
     attempts_meta: list[dict] = []
     best: ValidationAttempt | None = None
@@ -116,13 +121,15 @@ async def generate_with_validation(
                     "Refining the prompt...", f"Attempt {anum}", expertise="Image Generation"
                 )
             # Generate image (rate-limited)
-            resp = rate_limited_generate_content(
+            resp = await rate_limited_generate_content_async(
                 client,
                 "gemini-3-pro-image-preview",
                 contents,
                 types.GenerateContentConfig(
                     response_modalities=["IMAGE"],
-                    image_config=types.ImageConfig(aspect_ratio=aspect_ratio, image_size="4K"),
+                    image_config=types.ImageConfig(
+                        aspect_ratio=aspect_ratio, image_size=image_size
+                    ),
                 ),
             )
             # Extract and save generated image
@@ -256,6 +263,7 @@ async def generate_with_multi_validation(
     grouped_generation_images: list[tuple[str, list[bytes]]] | None = None,
     style_ref_images_bytes: list[bytes] | None = None,
     style_ref_name: str = "",
+    image_size: str | None = None,
 ) -> MultiValidationGenerationResult | str:
     """Generate image with multiple products and validate each one.
     This function implements a retry loop that:
@@ -276,6 +284,8 @@ async def generate_with_multi_validation(
             grouped_generation_images: Optional list of (product_name, [image_bytes, ...]) tuples
                     for GENERATION. Groups images by product so we can add explicit labels in the
                     API call. If None, uses product_references (one image per product).
+            image_size: Gemini image_size for attempts. Defaults to the resolution
+                    policy's validation-attempt size.
     Returns:
             MultiValidationGenerationResult with path and attempt details, or an error string.
     """
@@ -283,6 +293,7 @@ async def generate_with_multi_validation(
     from PIL import Image as PILImage
 
     st = get_settings()
+    image_size = image_size or resolve_image_size(ImagePurpose.VALIDATION_ATTEMPT)
     # If grouped_generation_images not provided, extract from product_references
     if grouped_generation_images is None:
         grouped_generation_images = [(n, [ib]) for n, ib in product_references]
@@ -357,13 +368,15 @@ async def generate_with_multi_validation(
                     "Refining the prompt...", f"Attempt {anum}", expertise="Image Generation"
                 )
             # Generate image (rate-limited)
-            resp = rate_limited_generate_content(
+            resp = await rate_limited_generate_content_async(
                 client,
                 "gemini-3-pro-image-preview",
                 contents,
                 types.GenerateContentConfig(
                     response_modalities=["IMAGE"],
-                    image_config=types.ImageConfig(aspect_ratio=aspect_ratio, image_size="4K"),
+                    image_config=types.ImageConfig(
+                        aspect_ratio=aspect_ratio, image_size=image_size
+                    ),
                 ),
             )
             # Extract and save generated image
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
@@ -322,9 +323,10 @@ class ImageProductionManager:
             return await self._generate_without_review(element)
         num_variants = min(max(num_variants, 1), 4)
         logger.info(f"Generating {num_variants} variants for {element.id} with early-exit review")
-        # Generate all variants in parallel
+        # Generate all variants as one batch (single request or pipelined, shared setup)
+        aspect_ratio = self.generator._get_aspect_ratio_for_element(element)
         variant_paths = await self.generator.generate_reference_image_variants(
-            element, self.output_dir, num_variants
+            element, self.output_dir, num_variants, aspect_ratio=aspect_ratio
         )
         if not variant_paths:
             logger.warning(f"No variants generated for {element.id}")
@@ -500,6 +502,7 @@ class ImageProductionManager:
             return []
         semaphore = asyncio.Semaphore(max_concurrent)
         results: dict[str, ImageGenerationResult] = {}
+        started = time.monotonic()
         use_variants = num_variants > 1
 
         async def generate_single(element: SharedElement) -> None:
@@ -533,6 +536,11 @@ class ImageProductionManager:
         fallback = sum(1 for r in ordered_results if r.status == "fallback")
         failed = sum(1 for r in ordered_results if r.status == "failed")
         unreviewed = sum(1 for r in ordered_results if r.status == "unreviewed")
+        elapsed = max(time.monotonic() - started, 1e-6)
+        logger.info(
+            f"Image production throughput: {len(elements) * 60 / elapsed:.1f} elements/min "
+            f"({len(elements)} in {elapsed:.1f}s)"
+        )
         if unreviewed:
             logger.info(
                 f"Parallel image production complete: {unreviewed} unreviewed, {failed} failed (total: {len(elements)}, max_concurrent: {max_concurrent})"
@@ -1,5 +1,44 @@
 """Video assembly and FFmpeg integration."""
 
+from sip_studio.assembler.batch import AssemblyQueue, AssemblySpec, BatchReport
+from sip_studio.assembler.encoding import (
+    EncodingProfile,
+    get_encoding_profile,
+    run_encoder_benchmark,
+    select_profile,
+    select_profile_for_clip,
+)
 from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.incremental import AssemblyManifest, IncrementalMusicAssembly
+from sip_studio.assembler.loudness import LoudnessCache, LoudnessMeasurement, get_loudness_cache
+from sip_studio.assembler.normalize import ClipNormalizer, TargetProfile
+from sip_studio.assembler.probe import ProbeCache, ProbeResult, StreamInfo, get_probe_cache
+from sip_studio.assembler.proxy import proxy_path_for
+from sip_studio.assembler.runner import FFmpegProgress, run_ffmpeg
 
-__all__ = ["FFmpegAssembler", "FFmpegError"]
+__all__ = [
+    "AssemblyManifest",
+    "AssemblyQueue",
+    "AssemblySpec",
+    "BatchReport",
+    "ClipNormalizer",
+    "EncodingProfile",
+    "FFmpegAssembler",
+    "FFmpegError",
+    "FFmpegProgress",
+    "IncrementalMusicAssembly",
+    "LoudnessCache",
+    "LoudnessMeasurement",
+    "ProbeCache",
+    "ProbeResult",
+    "StreamInfo",
+    "TargetProfile",
+    "get_encoding_profile",
+    "get_loudness_cache",
+    "get_probe_cache",
+    "proxy_path_for",
+    "run_encoder_benchmark",
+    "run_ffmpeg",
+    "select_profile",
+    "select_profile_for_clip",
+]
@@ -0,0 +1,325 @@
+"""Batch assembly of many output variants from shared clips.
+
+Marketing workflows cut the same clips several ways (16:9 and 9:16, different
+music beds), and assembling each variant separately probes and normalizes the
+same clips again and runs every FFmpeg process back to back.
+
+``AssemblyQueue`` takes any number of ``AssemblySpec`` outputs and:
+
+- plans every spec's normalization up front against the shared probe cache,
+  and runs each distinct re-encode once, even when several specs need it;
+- runs all FFmpeg work (re-encodes and final concats/mixes) on one bounded
+  pool sized to the CPU, starting a spec's final pass as soon as its own
+  clips are ready;
+- reports per-job state and progress, and the batch's total throughput.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.normalize import ClipNormalizer, default_max_workers
+
+if TYPE_CHECKING:
+    from sip_studio.assembler.normalize import _NormalizeJob
+    from sip_studio.assembler.runner import FFmpegProgress
+    from sip_studio.models.music import GeneratedMusic
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AssemblySpec:
+    """One output to assemble.
+
+    Attributes:
+        clip_paths: Clips in playback order.
+        output_path: Where to write the assembled video.
+        music: Optional background music.
+        music_volume: Music volume level 0.0-1.0.
+        fade_duration: Music fade in/out in seconds.
+        size: Output frame size, e.g. (1080, 1920) for a 9:16 cut. Defaults to
+            the most common clip shape.
+        fit: How clips of another shape are converted: "pad" or "crop".
+        name: Label used in progress reports (defaults to the output file name).
+    """
+
+    clip_paths: list[Path]
+    output_path: Path
+    music: GeneratedMusic | None = None
+    music_volume: float = 0.4
+    fade_duration: float = 2.0
+    size: tuple[int, int] | None = None
+    fit: str = "pad"
+    name: str = ""
+
+    @property
+    def label(self) -> str:
+        return self.name or self.output_path.name
+
+
+class JobState(str, Enum):
+    """Lifecycle of a queued assembly."""
+
+    QUEUED = "queued"
+    NORMALIZING = "normalizing"
+    ENCODING = "encoding"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class AssemblyJob:
+    """A spec in the queue, with its progress."""
+
+    index: int
+    spec: AssemblySpec
+    state: JobState = JobState.QUEUED
+    percent: float = 0.0
+    fps: float | None = None
+    output_duration: float = 0.0
+    error: str | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float | None:
+        """Seconds from start to finish (or until now while running)."""
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+
+@dataclass
+class BatchReport:
+    """Outcome and throughput of a queue run."""
+
+    jobs: list[AssemblyJob]
+    elapsed: float
+    normalizations_run: int = 0
+    normalizations_shared: int = 0
+    failed: list[AssemblyJob] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[AssemblyJob]:
+        return [j for j in self.jobs if j.state == JobState.DONE]
+
+    @property
+    def output_seconds(self) -> float:
+        """Total seconds of video produced."""
+        return sum(j.output_duration for j in self.succeeded)
+
+    @property
+    def realtime_factor(self) -> float:
+        """Seconds of output produced per second of wall time."""
+        return self.output_seconds / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def jobs_per_minute(self) -> float:
+        return len(self.succeeded) * 60 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# Called whenever a job changes state or reports encoding progress
+JobCallback = Callable[[AssemblyJob], None]
+
+
+class AssemblyQueue:
+    """Assembles many output specs concurrently, sharing probe and normalization work.
+
+    Example::
+
+        queue = AssemblyQueue(max_processes=4, on_job_progress=print)
+        queue.add(AssemblySpec(clips, out / "ad_16x9.mp4", music=music))
+        queue.add(AssemblySpec(clips, out / "ad_9x16.mp4", size=(1080, 1920), fit="crop"))
+        report = await queue.run()
+    """
+
+    def __init__(
+        self,
+        assembler: FFmpegAssembler | None = None,
+        max_processes: int | None = None,
+        on_job_progress: JobCallback | None = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            assembler: Assembler used for every job (its probe cache, encoding
+                profile and loudness settings are shared). Created if omitted.
+            max_processes: Maximum concurrent FFmpeg processes. Defaults to half
+                the CPU cores, since libx264 is itself threaded.
+            on_job_progress: Called when a job changes state or reports progress.
+
+        Raises:
+            FFmpegError: If no assembler is given and FFmpeg is not installed.
+        """
+        self.assembler = assembler or FFmpegAssembler()
+        self.max_processes = max(1, max_processes or default_max_workers())
+        self.on_job_progress = on_job_progress
+        self._jobs: list[AssemblyJob] = []
+
+    @property
+    def jobs(self) -> list[AssemblyJob]:
+        return list(self._jobs)
+
+    def add(self, spec: AssemblySpec) -> AssemblyJob:
+        """Queue an output for the next ``run``."""
+        job = AssemblyJob(index=len(self._jobs), spec=spec)
+        self._jobs.append(job)
+        return job
+
+    async def run(self) -> BatchReport:
+        """Assemble every queued spec.
+
+        A failing job is reported in the result and does not stop the others.
+        Cancelling the run kills all running FFmpeg processes.
+
+        Returns:
+            Per-job results and batch throughput.
+        """
+        start = time.monotonic()
+        pending = [j for j in self._jobs if j.state == JobState.QUEUED]
+        semaphore = asyncio.Semaphore(self.max_processes)
+        normalizer = ClipNormalizer(
+            self.assembler._probe_cache, self.max_processes, self.assembler.encoding_profile
+        )
+
+        # Plan all normalization first so identical re-encodes are run once
+        plans: dict[int, list[Path]] = {}
+        needs: dict[int, list[tuple[int, Path]]] = defaultdict(list)
+        unique: dict[Path, _NormalizeJob] = {}
+        requested = 0
+        for job in pending:
+            spec = job.spec
+            try:
+                self.assembler._check_clips(spec.clip_paths, "No video clips provided")
+                plans[job.index], norm_jobs = await asyncio.to_thread(
+                    normalizer._plan, spec.clip_paths, spec.size, spec.fit
+                )
+            except FFmpegError as e:
+                self._finish(job, error=e)
+                continue
+            for norm_job in norm_jobs:
+                unique.setdefault(norm_job.output, norm_job)
+                needs[job.index].append((norm_job.index, norm_job.output))
+            requested += len(norm_jobs)
+
+        async def normalize(norm_job: _NormalizeJob) -> Path:
+            async with semaphore:
+                return await normalizer._run_job_async(norm_job)
+
+        norm_tasks = {out: asyncio.create_task(normalize(nj)) for out, nj in unique.items()}
+        if unique:
+            logger.info(
+                "Batch normalization: %d re-encodes for %d requested (%d shared)",
+                len(unique),
+                requested,
+                requested - len(unique),
+            )
+
+        job_tasks = [
+            asyncio.create_task(self._assemble(job, plans[job.index], needs, norm_tasks, semaphore))
+            for job in pending
+            if job.index in plans
+        ]
+        try:
+            await asyncio.gather(*job_tasks)
+        finally:
+            for task in [*job_tasks, *norm_tasks.values()]:
+                task.cancel()
+            await asyncio.gather(*job_tasks, *norm_tasks.values(), return_exceptions=True)
+
+        report = BatchReport(
+            jobs=list(self._jobs),
+            elapsed=time.monotonic() - start,
+            normalizations_run=len(unique),
+            normalizations_shared=requested - len(unique),
+            failed=[j for j in pending if j.state == JobState.FAILED],
+        )
+        logger.info(
+            "Batch assembly: %d/%d jobs in %.1fs (%.1fx realtime, %.1f jobs/min)",
+            len(report.succeeded),
+            len(pending),
+            report.elapsed,
+            report.realtime_factor,
+            report.jobs_per_minute,
+        )
+        return report
+
+    async def _assemble(
+        self,
+        job: AssemblyJob,
+        clips: list[Path],
+        needs: dict[int, list[tuple[int, Path]]],
+        norm_tasks: dict[Path, asyncio.Task[Path]],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Wait for this job's normalized clips, then run its final pass."""
+        spec = job.spec
+        job.started_at = time.monotonic()
+        try:
+            if needs.get(job.index):
+                self._update(job, JobState.NORMALIZING)
+                for i, output in needs[job.index]:
+                    clips[i] = await norm_tasks[output]
+            job.output_duration, _ = await asyncio.to_thread(self.assembler._probe_clips, clips)
+
+            async with semaphore:
+                self._update(job, JobState.ENCODING)
+
+                def on_progress(progress: FFmpegProgress) -> None:
+                    if progress.percent is not None:
+                        job.percent = progress.percent
+                    job.fps = progress.fps
+                    self._notify(job)
+
+                if spec.music is not None:
+                    await self.assembler.assemble_with_music_async(
+                        clips,
+                        spec.music,
+                        spec.output_path,
+                        music_volume=spec.music_volume,
+                        fade_duration=spec.fade_duration,
+                        on_progress=on_progress,
+                        incremental=True,
+                        normalized=True,
+                    )
+                else:
+                    await self.assembler.concatenate_clips_async(
+                        clips, spec.output_path, on_progress=on_progress, normalized=True
+                    )
+        except FFmpegError as e:
+            self._finish(job, error=e)
+            return
+        self._finish(job)
+
+    def _update(self, job: AssemblyJob, state: JobState) -> None:
+        job.state = state
+        self._notify(job)
+
+    def _finish(self, job: AssemblyJob, error: Exception | None = None) -> None:
+        job.finished_at = time.monotonic()
+        if job.started_at is None:
+            job.started_at = job.finished_at
+        if error is not None:
+            logger.warning("Assembly of %s failed: %s", job.spec.label, error)
+            job.error = str(error)
+            self._update(job, JobState.FAILED)
+        else:
+            job.percent = 100.0
+            self._update(job, JobState.DONE)
+
+    def _notify(self, job: AssemblyJob) -> None:
+        if self.on_job_progress is None:
+            return
+        try:
+            self.on_job_progress(job)
+        except Exception as e:
+            logger.debug("Job progress callback failed: %s", e)
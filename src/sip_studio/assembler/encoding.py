@@ -0,0 +1,420 @@
+"""Encoding profiles for the re-encode paths, and a benchmark to choose one.
+
+Every place the assembler re-encodes (clip normalization, a full re-encode
+concat, music mixing and the music bed) takes its x264 preset, CRF, tune,
+thread count and AAC bitrate from an ``EncodingProfile``:
+
+- ``draft``: fastest, visibly softer; for big batches and quick iterations.
+- ``standard``: the previous hardcoded settings (the default).
+- ``archival``: slow presets and low CRF for masters.
+
+``run_encoder_benchmark`` encodes a synthetic ``lavfi testsrc`` clip with each
+profile's normalization settings (the re-encode an assembly actually runs;
+conforming clips are stream-copied) and reports frames per second on this
+machine; results are cached per FFmpeg binary and CPU count. ``select_profile``
+turns a latency target into the best profile expected to meet it.
+``select_profile_for_clip`` measures the candidates on a short excerpt of the
+real footage instead, which tracks the content's actual complexity. Run
+``python -m sip_studio.assembler.encoding`` to print the benchmark.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from sip_studio.assembler.ffmpeg import FFmpegError, stderr_tail
+from sip_studio.utils.file_utils import write_atomically
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_SIZE = (1280, 720)
+BENCHMARK_RATE = 24
+BENCHMARK_SECONDS = 4.0
+# Longest slice of a real clip encoded per candidate profile
+EXCERPT_SECONDS = 2.0
+# Conservative AAC encode speed, in multiples of realtime, for the music mix
+AUDIO_ENCODE_REALTIME = 100.0
+# Bumped when the benchmark measures something else, so cached results are redone
+_BENCHMARK_VERSION = 2
+
+
+@dataclass(frozen=True)
+class EncodingProfile:
+    """x264/AAC settings for one speed/quality trade-off.
+
+    Final encodes use ``preset``/``crf``; clip normalization produces
+    intermediates that are stream-copied into the output, so it uses its own
+    (higher quality for the speed) ``normalize_preset``/``normalize_crf``.
+    """
+
+    name: str
+    preset: str
+    crf: int
+    normalize_preset: str
+    normalize_crf: int
+    tune: str | None = None
+    threads: int = 0  # 0 lets x264 pick
+    audio_bitrate: str = "192k"
+
+    def video_args(self, normalize: bool = False, threads: int | None = None) -> list[str]:
+        """FFmpeg libx264 arguments for a final encode or a normalization.
+
+        Args:
+            normalize: Use the normalization preset and CRF.
+            threads: Thread count overriding the profile's (e.g. per parallel worker).
+        """
+        preset, crf = (
+            (self.normalize_preset, self.normalize_crf) if normalize else (self.preset, self.crf)
+        )
+        args = ["-c:v", "libx264", "-preset", preset, "-crf", str(crf)]
+        if self.tune:
+            args += ["-tune", self.tune]
+        return [*args, "-threads", str(self.threads if threads is None else threads)]
+
+    def audio_args(self) -> list[str]:
+        """FFmpeg AAC arguments."""
+        return ["-c:a", "aac", "-b:a", self.audio_bitrate]
+
+
+PROFILES: dict[str, EncodingProfile] = {
+    "draft": EncodingProfile(
+        name="draft",
+        preset="ultrafast",
+        crf=28,
+        normalize_preset="ultrafast",
+        normalize_crf=23,
+        tune="fastdecode",
+        audio_bitrate="128k",
+    ),
+    "standard": EncodingProfile(
+        name="standard",
+        preset="medium",
+        crf=23,
+        normalize_preset="veryfast",
+        normalize_crf=20,
+    ),
+    "archival": EncodingProfile(
+        name="archival",
+        preset="slow",
+        crf=18,
+        normalize_preset="medium",
+        normalize_crf=16,
+        tune="film",
+        audio_bitrate="256k",
+    ),
+}
+DEFAULT_PROFILE = "standard"
+# Best quality first; select_profile takes the first one that meets the target
+QUALITY_ORDER = ("archival", "standard", "draft")
+
+
+def get_encoding_profile(profile: EncodingProfile | str | None = None) -> EncodingProfile:
+    """Resolve a profile or profile name (None means the default profile).
+
+    Raises:
+        ValueError: If the name is not a known profile.
+    """
+    if isinstance(profile, EncodingProfile):
+        return profile
+    name = profile or DEFAULT_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown encoding profile {name!r}; expected one of {', '.join(PROFILES)}"
+        ) from None
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Encode speed of one profile on this machine."""
+
+    profile: str
+    fps: float
+    frames: int
+    elapsed: float
+    width: int = BENCHMARK_SIZE[0]
+    height: int = BENCHMARK_SIZE[1]
+
+    def estimate_seconds(
+        self, duration: float, fps: float = BENCHMARK_RATE, width: int = 0, height: int = 0
+    ) -> float:
+        """Estimate how long encoding ``duration`` seconds of video would take.
+
+        Args:
+            duration: Length of the video in seconds.
+            fps: Frame rate of the video.
+            width: Frame width (defaults to the benchmark size).
+            height: Frame height (defaults to the benchmark size).
+        """
+        pixel_ratio = (width * height) / (self.width * self.height) if width and height else 1.0
+        return duration * fps * pixel_ratio / self.fps
+
+
+def build_benchmark_command(
+    profile: EncodingProfile,
+    size: tuple[int, int] = BENCHMARK_SIZE,
+    rate: int = BENCHMARK_RATE,
+    seconds: float = BENCHMARK_SECONDS,
+) -> list[str]:
+    """Build the FFmpeg command normalization-encoding a synthetic clip to the null muxer."""
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-v",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        f"testsrc=size={size[0]}x{size[1]}:rate={rate}:duration={seconds}",
+        *profile.video_args(normalize=True),
+        "-pix_fmt",
+        "yuv420p",
+        "-f",
+        "null",
+        "-",
+    ]
+
+
+def run_encoder_benchmark(
+    profiles: list[EncodingProfile] | None = None,
+    size: tuple[int, int] = BENCHMARK_SIZE,
+    rate: int = BENCHMARK_RATE,
+    seconds: float = BENCHMARK_SECONDS,
+    run_fn: Callable[..., Any] = subprocess.run,
+) -> list[BenchmarkResult]:
+    """Measure encode speed for each profile on a synthetic ``testsrc`` clip.
+
+    Args:
+        profiles: Profiles to measure (defaults to all).
+        size: Frame size of the synthetic clip.
+        rate: Frame rate of the synthetic clip.
+        seconds: Length of the synthetic clip.
+        run_fn: Subprocess runner (injectable for tests).
+
+    Returns:
+        One result per profile, in the given order.
+
+    Raises:
+        FFmpegError: If FFmpeg is missing or an encode fails.
+    """
+    frames = max(1, round(seconds * rate))
+    return [
+        _timed_encode(
+            build_benchmark_command(profile, size, rate, seconds), profile, frames, size, run_fn
+        )
+        for profile in profiles or list(PROFILES.values())
+    ]
+
+
+def _timed_encode(
+    cmd: list[str],
+    profile: EncodingProfile,
+    frames: int,
+    size: tuple[int, int],
+    run_fn: Callable[..., Any],
+) -> BenchmarkResult:
+    """Run one benchmark encode and turn its wall time into a result."""
+    start = time.perf_counter()
+    try:
+        run_fn(cmd, check=True, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        raise FFmpegError("FFmpeg not found; cannot run the encoder benchmark") from e
+    except subprocess.CalledProcessError as e:
+        error_msg = stderr_tail(e.stderr) if e.stderr else str(e)
+        raise FFmpegError(f"FFmpeg benchmark of {profile.name} failed: {error_msg}") from e
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    logger.debug("Encoder benchmark: %s at %.1f fps", profile.name, frames / elapsed)
+    return BenchmarkResult(
+        profile=profile.name,
+        fps=frames / elapsed,
+        frames=frames,
+        elapsed=elapsed,
+        width=size[0],
+        height=size[1],
+    )
+
+
+def build_excerpt_command(
+    clip_path: Path, profile: EncodingProfile, seconds: float = EXCERPT_SECONDS
+) -> list[str]:
+    """Build the FFmpeg command normalization-encoding the start of a clip to the null muxer."""
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-v",
+        "error",
+        "-t",
+        f"{seconds:g}",
+        "-i",
+        str(clip_path),
+        "-map",
+        "0:v:0",
+        *profile.video_args(normalize=True),
+        "-pix_fmt",
+        "yuv420p",
+        "-f",
+        "null",
+        "-",
+    ]
+
+
+def select_profile_for_clip(
+    clip_path: Path,
+    duration: float,
+    latency_target: float,
+    fps: float,
+    width: int,
+    height: int,
+    clip_duration: float | None = None,
+    seconds: float = EXCERPT_SECONDS,
+    run_fn: Callable[..., Any] = subprocess.run,
+) -> EncodingProfile:
+    """Pick a profile by timing each candidate on an excerpt of a real clip.
+
+    Candidates are measured best quality first, each on at most ``seconds`` of
+    the clip, and measuring stops at the first one fast enough, so a generous
+    target costs a single short encode.
+
+    Args:
+        clip_path: Clip to take the excerpt from (the start of the footage).
+        duration: Seconds of video the real encode covers.
+        latency_target: Seconds the real encode may take.
+        fps: Frame rate of the clip.
+        width: Frame width of the clip.
+        height: Frame height of the clip.
+        clip_duration: Length of ``clip_path``, if known, to count excerpt frames.
+        seconds: Excerpt length.
+        run_fn: Subprocess runner (injectable for tests).
+
+    Raises:
+        FFmpegError: If FFmpeg is missing or an excerpt encode fails.
+    """
+    excerpt = min(seconds, clip_duration) if clip_duration else seconds
+    frames = max(1, round(excerpt * fps))
+    results = []
+    for name in QUALITY_ORDER:
+        profile = PROFILES[name]
+        cmd = build_excerpt_command(clip_path, profile, seconds)
+        result = _timed_encode(cmd, profile, frames, (width, height), run_fn)
+        results.append(result)
+        if result.estimate_seconds(duration, fps, width, height) <= latency_target:
+            break
+    return select_profile(duration, latency_target, results, fps, width, height)
+
+
+def estimate_audio_seconds(duration: float) -> float:
+    """Estimate the AAC encode of a ``duration`` second soundtrack (the music mix)."""
+    return duration / AUDIO_ENCODE_REALTIME
+
+
+def get_benchmark_path() -> Path:
+    """Get the location of the cached benchmark results."""
+    return Path.home() / ".sip-studio" / "cache" / "encoder_benchmark.json"
+
+
+def _machine_key() -> dict[str, Any]:
+    return {
+        "ffmpeg": shutil.which("ffmpeg"),
+        "cpu_count": os.cpu_count(),
+        "benchmark": _BENCHMARK_VERSION,
+    }
+
+
+def get_benchmark_results(
+    refresh: bool = False, path: Path | None = None, **benchmark_kwargs: Any
+) -> list[BenchmarkResult]:
+    """Get benchmark results for this machine, running the benchmark once.
+
+    Results are reused until the FFmpeg binary, CPU count or benchmark changes.
+
+    Args:
+        refresh: Re-run the benchmark even if results are cached.
+        path: Cache file (defaults to ``get_benchmark_path()``).
+        **benchmark_kwargs: Passed to ``run_encoder_benchmark``.
+
+    Raises:
+        FFmpegError: If the benchmark has to run and fails.
+    """
+    path = path or get_benchmark_path()
+    machine = _machine_key()
+    if not refresh:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("machine") == machine:
+                return [BenchmarkResult(**r) for r in data["results"]]
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+    results = run_encoder_benchmark(**benchmark_kwargs)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"machine": machine, "results": [asdict(r) for r in results]}
+        write_atomically(path, json.dumps(payload, indent=2))
+    except OSError as e:
+        logger.warning("Could not save encoder benchmark: %s", e)
+    return results
+
+
+def select_profile(
+    duration: float,
+    latency_target: float,
+    results: list[BenchmarkResult],
+    fps: float = BENCHMARK_RATE,
+    width: int = 0,
+    height: int = 0,
+) -> EncodingProfile:
+    """Pick the best-quality profile expected to encode within the latency target.
+
+    Args:
+        duration: Seconds of video to encode.
+        latency_target: Seconds the encode may take.
+        results: Benchmark results for this machine.
+        fps: Frame rate of the video.
+        width: Frame width (defaults to the benchmark size).
+        height: Frame height (defaults to the benchmark size).
+
+    Returns:
+        The chosen profile; ``draft`` when none is expected to meet the target.
+    """
+    by_name = {r.profile: r for r in results}
+    for name in QUALITY_ORDER:
+        result = by_name.get(name)
+        if result is None:
+            continue
+        estimate = result.estimate_seconds(duration, fps, width, height)
+        if estimate <= latency_target:
+            logger.info(
+                "Using %s encoding (estimated %.1fs for a %.1fs target)",
+                name,
+                estimate,
+                latency_target,
+            )
+            return PROFILES[name]
+    logger.info("No encoding profile meets the %.1fs target; using draft", latency_target)
+    return PROFILES["draft"]
+
+
+def main() -> None:
+    """Print the encoder benchmark for this machine."""
+    results = get_benchmark_results(refresh=True)
+    width, height = BENCHMARK_SIZE
+    print(f"Encoder benchmark ({width}x{height} @ {BENCHMARK_RATE} fps testsrc):")
+    for r in results:
+        profile = PROFILES[r.profile]
+        realtime = r.fps / BENCHMARK_RATE
+        print(
+            f"  {r.profile:<9} {r.fps:7.1f} fps  ({realtime:4.1f}x realtime)  "
+            f"preset={profile.preset} crf={profile.crf}"
+        )
+
+
+if __name__ == "__main__":
+    main()
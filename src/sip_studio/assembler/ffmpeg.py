@@ -6,6 +6,7 @@ into a final video using FFmpeg, including background music mixing.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import shutil
 import subprocess
@@ -13,15 +14,27 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from sip_studio.assembler.encoding import EncodingProfile
+    from sip_studio.assembler.loudness import LoudnessCache, MixGains
+    from sip_studio.assembler.probe import ProbeCache
+    from sip_studio.assembler.runner import ProgressCallback
     from sip_studio.models.music import GeneratedMusic
 
 logger = logging.getLogger(__name__)
 
+# Number of trailing stderr lines kept in FFmpeg error messages
+STDERR_TAIL_LINES = 40
+
 
 class FFmpegError(Exception):
     """Exception raised for FFmpeg-related errors."""
 
 
+def stderr_tail(stderr: str, lines: int = STDERR_TAIL_LINES) -> str:
+    """Keep only the last lines of FFmpeg stderr (the banner and stats are noise)."""
+    return "\n".join(stderr.rstrip().splitlines()[-lines:])
+
+
 class FFmpegAssembler:
     """FFmpeg wrapper for concatenating video clips.
 
@@ -29,9 +42,55 @@ class FFmpegAssembler:
     Install via: brew install ffmpeg (macOS) or apt install ffmpeg (Linux).
     """
 
-    def __init__(self):
-        """Initialize FFmpeg assembler and verify FFmpeg is available."""
+    def __init__(
+        self,
+        probe_cache: ProbeCache | None = None,
+        max_normalize_workers: int | None = None,
+        encoding_profile: EncodingProfile | str | None = None,
+        normalize_loudness: bool = False,
+        loudness_cache: LoudnessCache | None = None,
+    ):
+        """Initialize FFmpeg assembler and verify FFmpeg is available.
+
+        Args:
+            probe_cache: Clip metadata cache. Defaults to the shared process-wide cache.
+            max_normalize_workers: Concurrent clip re-encodes during normalization.
+                Defaults to half the CPU cores.
+            encoding_profile: Profile (or name: draft, standard, archival) for every
+                re-encode. Defaults to standard.
+            normalize_loudness: Set music mix gains from cached EBU R128 measurements
+                of the clips and music instead of fixed volumes.
+            loudness_cache: Loudness measurement cache. Defaults to the shared
+                process-wide cache.
+
+        Raises:
+            FFmpegError: If FFmpeg is not installed.
+            ValueError: If the encoding profile name is unknown.
+        """
+        from sip_studio.assembler.encoding import get_encoding_profile
+
         self._verify_ffmpeg_installed()
+        self._probe_cache_override = probe_cache
+        self.max_normalize_workers = max_normalize_workers
+        self.encoding_profile = get_encoding_profile(encoding_profile)
+        self.normalize_loudness = normalize_loudness
+        self._loudness_cache_override = loudness_cache
+
+    @property
+    def _probe_cache(self) -> ProbeCache:
+        if self._probe_cache_override is not None:
+            return self._probe_cache_override
+        from sip_studio.assembler.probe import get_probe_cache
+
+        return get_probe_cache()
+
+    @property
+    def _loudness_cache(self) -> LoudnessCache:
+        if self._loudness_cache_override is not None:
+            return self._loudness_cache_override
+        from sip_studio.assembler.loudness import get_loudness_cache
+
+        return get_loudness_cache()
 
     def _verify_ffmpeg_installed(self) -> None:
         """Verify that FFmpeg is installed and accessible.
@@ -48,6 +107,41 @@ class FFmpegAssembler:
             )
         logger.debug("FFmpeg found in PATH")
 
+    def normalize_clips(self, clip_paths: list[Path]) -> list[Path]:
+        """Re-encode only the clips that differ from the common target profile.
+
+        Runs the re-encodes in parallel so the clips can then be concatenated
+        with a stream copy.
+
+        Args:
+            clip_paths: Clips in playback order.
+
+        Returns:
+            Clip paths in the same order, all sharing codec, resolution, fps
+            and audio layout.
+
+        Raises:
+            FFmpegError: If a clip cannot be probed or re-encoded.
+        """
+        from sip_studio.assembler.normalize import ClipNormalizer
+
+        normalizer = ClipNormalizer(
+            self._probe_cache, self.max_normalize_workers, self.encoding_profile
+        )
+        return normalizer.normalize(clip_paths)
+
+    def clips_to_normalize(self, clip_paths: list[Path]) -> list[Path]:
+        """Get the clips ``normalize_clips`` would re-encode (the rest are stream-copied).
+
+        Raises:
+            FFmpegError: If a clip cannot be probed.
+        """
+        from sip_studio.assembler.normalize import choose_target_profile
+
+        probes = [self._probe_cache.probe(clip) for clip in clip_paths]
+        target = choose_target_profile(probes)
+        return [clip for clip, probe in zip(clip_paths, probes) if not target.conforms(probe)]
+
     def concatenate_clips(
         self,
         clip_paths: list[Path],
@@ -59,8 +153,9 @@ class FFmpegAssembler:
         Args:
             clip_paths: List of paths to video clips, in order.
             output_path: Path for the final concatenated video.
-            reencode: If True, re-encode the video (slower but more compatible).
-                     If False, use stream copy (faster but requires same codecs).
+            reencode: If True, re-encode the whole output in one pass.
+                     If False (default), normalize non-conforming clips in
+                     parallel and concatenate with a stream copy.
 
         Returns:
             Path to the concatenated video file.
@@ -68,25 +163,18 @@ class FFmpegAssembler:
         Raises:
             FFmpegError: If concatenation fails or no clips provided.
         """
-        if not clip_paths:
-            raise FFmpegError("No video clips provided for concatenation")
-
-        # Verify all clips exist
-        for clip in clip_paths:
-            if not clip.exists():
-                raise FFmpegError(f"Video clip not found: {clip}")
+        self._check_clips(clip_paths, "No video clips provided for concatenation")
 
         # Create output directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if not reencode:
+            clip_paths = self.normalize_clips(clip_paths)
+
         # Create concat file listing all clips
         concat_file = output_path.parent / f".concat_list_{output_path.stem}.txt"
         try:
-            with open(concat_file, "w") as f:
-                for clip in clip_paths:
-                    # Escape single quotes in path
-                    escaped_path = str(clip.absolute()).replace("'", "'\\''")
-                    f.write(f"file '{escaped_path}'\n")
+            self._write_concat_list(clip_paths, concat_file)
 
             logger.info(
                 "Concatenating %d clips into %s",
@@ -107,19 +195,92 @@ class FFmpegAssembler:
 
             logger.debug("FFmpeg stdout: %s", result.stdout)
             if result.stderr:
-                logger.debug("FFmpeg stderr: %s", result.stderr)
+                logger.debug("FFmpeg stderr: %s", stderr_tail(result.stderr))
 
             logger.info("Successfully created: %s", output_path)
             return output_path
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = stderr_tail(e.stderr) if e.stderr else str(e)
             raise FFmpegError(f"FFmpeg concatenation failed: {error_msg}") from e
         finally:
             # Cleanup concat file
             if concat_file.exists():
                 concat_file.unlink()
 
+    async def concatenate_clips_async(
+        self,
+        clip_paths: list[Path],
+        output_path: Path,
+        reencode: bool = False,
+        on_progress: ProgressCallback | None = None,
+        normalized: bool = False,
+    ) -> Path:
+        """Async variant of ``concatenate_clips`` that does not block the event loop.
+
+        FFmpeg runs as an asyncio subprocess reporting progress; cancelling
+        the awaiting task kills it.
+
+        Args:
+            clip_paths: List of paths to video clips, in order.
+            output_path: Path for the final concatenated video.
+            reencode: If True, re-encode the whole output in one pass.
+            on_progress: Called with progress updates from every FFmpeg run.
+            normalized: The clips already share one profile (e.g. normalized by
+                a batch queue); skip the normalization pass.
+
+        Returns:
+            Path to the concatenated video file.
+
+        Raises:
+            FFmpegError: If concatenation fails or no clips provided.
+        """
+        from sip_studio.assembler.normalize import ClipNormalizer
+        from sip_studio.assembler.runner import run_ffmpeg
+
+        self._check_clips(clip_paths, "No video clips provided for concatenation")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not reencode and not normalized:
+            normalizer = ClipNormalizer(
+                self._probe_cache, self.max_normalize_workers, self.encoding_profile
+            )
+            clip_paths = await normalizer.normalize_async(clip_paths, on_progress)
+        duration, _ = await asyncio.to_thread(self._probe_clips, clip_paths)
+
+        concat_file = output_path.parent / f".concat_list_{output_path.stem}.txt"
+        try:
+            self._write_concat_list(clip_paths, concat_file)
+            logger.info("Concatenating %d clips into %s", len(clip_paths), output_path)
+            await run_ffmpeg(
+                self._build_concat_command(concat_file, output_path, reencode),
+                description="concatenation",
+                total_duration=duration,
+                on_progress=on_progress,
+            )
+            logger.info("Successfully created: %s", output_path)
+            return output_path
+        finally:
+            concat_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _check_clips(clip_paths: list[Path], empty_message: str) -> None:
+        """Fail fast when no clips are given or one is missing."""
+        if not clip_paths:
+            raise FFmpegError(empty_message)
+        for clip in clip_paths:
+            if not clip.exists():
+                raise FFmpegError(f"Video clip not found: {clip}")
+
+    @staticmethod
+    def _write_concat_list(clip_paths: list[Path], concat_file: Path) -> None:
+        """Write a concat demuxer list file for the given clips."""
+        with open(concat_file, "w") as f:
+            for clip in clip_paths:
+                # Escape single quotes in path
+                escaped_path = str(clip.absolute()).replace("'", "'\\''")
+                f.write(f"file '{escaped_path}'\n")
+
     def _build_concat_command(
         self,
         concat_file: Path,
@@ -149,20 +310,8 @@ class FFmpegAssembler:
 
         if reencode:
             # Re-encode for maximum compatibility
-            cmd.extend(
-                [
-                    "-c:v",
-                    "libx264",
-                    "-preset",
-                    "medium",
-                    "-crf",
-                    "23",
-                    "-c:a",
-                    "aac",
-                    "-b:a",
-                    "128k",
-                ]
-            )
+            cmd.extend(self.encoding_profile.video_args())
+            cmd.extend(self.encoding_profile.audio_args())
         else:
             # Stream copy (fast, but requires same codecs)
             cmd.extend(["-c", "copy"])
@@ -173,6 +322,8 @@ class FFmpegAssembler:
     def get_video_duration(self, video_path: Path) -> float:
         """Get the duration of a video file in seconds.
 
+        Served from the shared probe cache (one ffprobe per file).
+
         Args:
             video_path: Path to the video file.
 
@@ -182,32 +333,7 @@ class FFmpegAssembler:
         Raises:
             FFmpegError: If ffprobe fails or video not found.
         """
-        if not video_path.exists():
-            raise FFmpegError(f"Video file not found: {video_path}")
-
-        cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(video_path),
-        ]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return float(result.stdout.strip())
-        except subprocess.CalledProcessError as e:
-            raise FFmpegError(f"Failed to get video duration: {e.stderr}") from e
-        except ValueError as e:
-            raise FFmpegError(f"Invalid duration value: {e}") from e
+        return self._probe_cache.duration(video_path)
 
     def get_video_info(self, video_path: Path) -> dict:
         """Get detailed information about a video file.
@@ -221,63 +347,7 @@ class FFmpegAssembler:
         Raises:
             FFmpegError: If ffprobe fails or video not found.
         """
-        if not video_path.exists():
-            raise FFmpegError(f"Video file not found: {video_path}")
-
-        cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "stream=codec_name,width,height,r_frame_rate,duration",
-            "-show_entries",
-            "format=duration,size",
-            "-of",
-            "json",
-            str(video_path),
-        ]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            import json
-            from typing import Any
-
-            data = json.loads(result.stdout)
-
-            info: dict[str, Any] = {"path": str(video_path)}
-
-            # Extract stream info
-            if data.get("streams"):
-                stream = data["streams"][0]
-                info["codec"] = stream.get("codec_name")
-                info["width"] = stream.get("width")
-                info["height"] = stream.get("height")
-                if stream.get("r_frame_rate"):
-                    # Parse frame rate (e.g., "30/1" -> 30.0)
-                    fps_parts = stream["r_frame_rate"].split("/")
-                    if len(fps_parts) == 2 and int(fps_parts[1]) != 0:
-                        info["fps"] = int(fps_parts[0]) / int(fps_parts[1])
-
-            # Extract format info
-            if data.get("format"):
-                fmt = data["format"]
-                if fmt.get("duration"):
-                    info["duration"] = float(fmt["duration"])
-                if fmt.get("size"):
-                    info["size_bytes"] = int(fmt["size"])
-
-            return info
-        except subprocess.CalledProcessError as e:
-            raise FFmpegError(f"Failed to get video info: {e.stderr}") from e
-        except (ValueError, KeyError) as e:
-            raise FFmpegError(f"Failed to parse video info: {e}") from e
+        return self._probe_cache.video_info(video_path)
 
     def has_audio_stream(self, video_path: Path) -> bool:
         """Check if a video file has an audio stream.
@@ -288,33 +358,7 @@ class FFmpegAssembler:
         Returns:
             True if the video has at least one audio stream, False otherwise.
         """
-        if not video_path.exists():
-            return False
-
-        cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "a",  # Select audio streams only
-            "-show_entries",
-            "stream=index",
-            "-of",
-            "csv=p=0",
-            str(video_path),
-        ]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            # If there's any output, there's at least one audio stream
-            return bool(result.stdout.strip())
-        except subprocess.CalledProcessError:
-            return False
+        return self._probe_cache.has_audio(video_path)
 
     def assemble_with_music(
         self,
@@ -323,12 +367,15 @@ class FFmpegAssembler:
         output_path: Path,
         music_volume: float = 0.4,
         fade_duration: float = 2.0,
+        incremental: bool = False,
     ) -> Path:
         """Assemble video clips and overlay background music.
 
-        Concatenates video clips, then mixes in background music with
-        fade in/out effects. The music is looped to match the video
-        duration if needed.
+        Concatenates video clips and mixes in background music with
+        fade in/out effects in a single FFmpeg pass (concat demuxer input,
+        video stream copied). Clips that differ from the common profile are
+        normalized first. The music is looped to match the video duration
+        if needed.
 
         Args:
             clip_paths: List of paths to video clips, in order.
@@ -338,6 +385,8 @@ class FFmpegAssembler:
                          Default is 0.4 (40%) to sit clearly under dialogue.
             fade_duration: Duration of fade in/out effects in seconds.
                           Default is 2.0 seconds.
+            incremental: Reuse the previous assembly of this output: only changed
+                        clips are rebuilt and the cached music bed is remuxed.
 
         Returns:
             Path to the assembled video file with music.
@@ -345,51 +394,38 @@ class FFmpegAssembler:
         Raises:
             FFmpegError: If assembly or mixing fails.
         """
-        if not clip_paths:
-            raise FFmpegError("No video clips provided for assembly")
-
-        # Validate music file exists
-        music_path = Path(music.file_path)
-        if not music_path.exists():
-            raise FFmpegError(f"Music file not found: {music.file_path}")
-
-        # Validate volume
-        if not 0.0 <= music_volume <= 1.0:
-            raise FFmpegError(f"music_volume must be between 0.0 and 1.0, got {music_volume}")
+        music_path = self._check_music_inputs(clip_paths, music, music_volume)
 
         # Create output directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Step 1: Concatenate video clips to a temp file
-        concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-        try:
-            self.concatenate_clips(clip_paths, concat_temp, reencode=False)
-
-            # Step 2: Get video duration for fade calculation
-            duration = self.get_video_duration(concat_temp)
-            fade_out_start = max(0, duration - fade_duration)
+        # Make the clips stream-copyable before concatenating them
+        clip_paths = self.normalize_clips(clip_paths)
 
-            # Step 2.5: Check if video has audio stream
-            has_audio = self.has_audio_stream(concat_temp)
+        if incremental:
+            from sip_studio.assembler.incremental import IncrementalMusicAssembly
 
-            logger.info(
-                "Mixing music into video (duration: %.1fs, volume: %.0f%%, has_audio: %s)",
-                duration,
-                music_volume * 100,
-                has_audio,
-            )
-
-            # Step 3: Build and run FFmpeg command for audio mixing
-            cmd = self._build_music_mix_command(
-                video_path=concat_temp,
-                music_path=music_path,
-                output_path=output_path,
-                music_volume=music_volume,
-                fade_duration=fade_duration,
-                fade_out_start=fade_out_start,
-                has_video_audio=has_audio,
+            job = IncrementalMusicAssembly(
+                self, music_path, output_path, music_volume, fade_duration
             )
+            try:
+                for step in job.plan(clip_paths):
+                    try:
+                        subprocess.run(step.cmd, check=True, capture_output=True, text=True)
+                    except subprocess.CalledProcessError as e:
+                        error_msg = stderr_tail(e.stderr) if e.stderr else str(e)
+                        raise FFmpegError(f"FFmpeg {step.description} failed: {error_msg}") from e
+                    step.finish()
+                job.commit()
+            finally:
+                job.cleanup()
+            logger.info("Successfully created video with music: %s", output_path)
+            return output_path
 
+        cmd, concat_file, _ = self._prepare_music_mix(
+            clip_paths, music_path, output_path, music_volume, fade_duration
+        )
+        try:
             result = subprocess.run(
                 cmd,
                 check=True,
@@ -399,18 +435,324 @@ class FFmpegAssembler:
 
             logger.debug("FFmpeg stdout: %s", result.stdout)
             if result.stderr:
-                logger.debug("FFmpeg stderr: %s", result.stderr)
+                logger.debug("FFmpeg stderr: %s", stderr_tail(result.stderr))
 
             logger.info("Successfully created video with music: %s", output_path)
             return output_path
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = stderr_tail(e.stderr) if e.stderr else str(e)
             raise FFmpegError(f"FFmpeg music mixing failed: {error_msg}") from e
         finally:
-            # Cleanup temp file
-            if concat_temp.exists():
-                concat_temp.unlink()
+            # Cleanup concat list
+            if concat_file.exists():
+                concat_file.unlink()
+
+    async def assemble_with_music_async(
+        self,
+        clip_paths: list[Path],
+        music: GeneratedMusic,
+        output_path: Path,
+        music_volume: float = 0.4,
+        fade_duration: float = 2.0,
+        on_progress: ProgressCallback | None = None,
+        incremental: bool = False,
+        normalized: bool = False,
+    ) -> Path:
+        """Async variant of ``assemble_with_music`` that does not block the event loop.
+
+        FFmpeg runs as an asyncio subprocess reporting progress; cancelling
+        the awaiting task kills it.
+
+        Args:
+            clip_paths: List of paths to video clips, in order.
+            music: Generated music track to overlay.
+            output_path: Path for the final video with music.
+            music_volume: Volume level for background music (0.0-1.0).
+            fade_duration: Duration of fade in/out effects in seconds.
+            on_progress: Called with progress updates from every FFmpeg run.
+            incremental: Reuse the previous assembly of this output (see
+                ``assemble_with_music``).
+            normalized: The clips already share one profile; skip the
+                normalization pass.
+
+        Returns:
+            Path to the assembled video file with music.
+
+        Raises:
+            FFmpegError: If assembly or mixing fails.
+        """
+        from sip_studio.assembler.normalize import ClipNormalizer
+        from sip_studio.assembler.runner import run_ffmpeg
+
+        music_path = self._check_music_inputs(clip_paths, music, music_volume)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not normalized:
+            normalizer = ClipNormalizer(
+                self._probe_cache, self.max_normalize_workers, self.encoding_profile
+            )
+            clip_paths = await normalizer.normalize_async(clip_paths, on_progress)
+
+        if incremental:
+            from sip_studio.assembler.incremental import IncrementalMusicAssembly
+
+            job = IncrementalMusicAssembly(
+                self, music_path, output_path, music_volume, fade_duration
+            )
+            try:
+                for step in await asyncio.to_thread(job.plan, clip_paths):
+                    await run_ffmpeg(
+                        step.cmd,
+                        description=step.description,
+                        total_duration=step.duration,
+                        on_progress=on_progress,
+                    )
+                    step.finish()
+                job.commit()
+            finally:
+                job.cleanup()
+            logger.info("Successfully created video with music: %s", output_path)
+            return output_path
+
+        cmd, concat_file, duration = await asyncio.to_thread(
+            self._prepare_music_mix,
+            clip_paths,
+            music_path,
+            output_path,
+            music_volume,
+            fade_duration,
+        )
+        try:
+            await run_ffmpeg(
+                cmd,
+                description="music mixing",
+                total_duration=duration,
+                on_progress=on_progress,
+            )
+            logger.info("Successfully created video with music: %s", output_path)
+            return output_path
+        finally:
+            concat_file.unlink(missing_ok=True)
+
+    def render_proxy(
+        self,
+        clip_paths: list[Path],
+        output_path: Path,
+        music: GeneratedMusic | None = None,
+        music_volume: float = 0.4,
+        fade_duration: float = 2.0,
+    ) -> Path:
+        """Render a fast 480p, low-bitrate preview of an assembly.
+
+        Encodes straight from the raw clips with ``-preset ultrafast``,
+        scaling each into the proxy frame in the filter graph (no
+        normalization pass), and mixes the music the same way as
+        ``assemble_with_music``.
+
+        Args:
+            clip_paths: List of paths to video clips, in order.
+            output_path: Path for the proxy video (see ``proxy_path_for``).
+            music: Optional music track to overlay.
+            music_volume: Volume level for background music (0.0-1.0).
+            fade_duration: Duration of fade in/out effects in seconds.
+
+        Returns:
+            Path to the proxy video.
+
+        Raises:
+            FFmpegError: If rendering fails.
+        """
+        from sip_studio.assembler.proxy import plan_proxy
+
+        music_path = self._check_proxy_inputs(clip_paths, music, music_volume)
+        step = plan_proxy(self, clip_paths, output_path, music_path, music_volume, fade_duration)
+        try:
+            subprocess.run(step.cmd, check=True, capture_output=True, text=True)
+            step.finish()
+            logger.info("Successfully created proxy: %s", output_path)
+            return output_path
+        except subprocess.CalledProcessError as e:
+            error_msg = stderr_tail(e.stderr) if e.stderr else str(e)
+            raise FFmpegError(f"FFmpeg {step.description} failed: {error_msg}") from e
+        finally:
+            step.tmp.unlink(missing_ok=True)
+
+    async def render_proxy_async(
+        self,
+        clip_paths: list[Path],
+        output_path: Path,
+        music: GeneratedMusic | None = None,
+        music_volume: float = 0.4,
+        fade_duration: float = 2.0,
+        on_progress: ProgressCallback | None = None,
+    ) -> Path:
+        """Async variant of ``render_proxy`` that does not block the event loop.
+
+        Cancelling the awaiting task kills FFmpeg and leaves no partial proxy.
+
+        Args:
+            clip_paths: List of paths to video clips, in order.
+            output_path: Path for the proxy video.
+            music: Optional music track to overlay.
+            music_volume: Volume level for background music (0.0-1.0).
+            fade_duration: Duration of fade in/out effects in seconds.
+            on_progress: Called with progress updates from FFmpeg.
+
+        Returns:
+            Path to the proxy video.
+
+        Raises:
+            FFmpegError: If rendering fails.
+        """
+        from sip_studio.assembler.proxy import plan_proxy
+        from sip_studio.assembler.runner import run_ffmpeg
+
+        music_path = self._check_proxy_inputs(clip_paths, music, music_volume)
+        step = await asyncio.to_thread(
+            plan_proxy, self, clip_paths, output_path, music_path, music_volume, fade_duration
+        )
+        try:
+            await run_ffmpeg(
+                step.cmd,
+                description=step.description,
+                total_duration=step.duration,
+                on_progress=on_progress,
+            )
+            step.finish()
+            logger.info("Successfully created proxy: %s", output_path)
+            return output_path
+        finally:
+            step.tmp.unlink(missing_ok=True)
+
+    def _check_proxy_inputs(
+        self, clip_paths: list[Path], music: GeneratedMusic | None, music_volume: float
+    ) -> Path | None:
+        """Validate proxy arguments, returning the music path if there is music."""
+        if music is not None:
+            return self._check_music_inputs(clip_paths, music, music_volume)
+        self._check_clips(clip_paths, "No video clips provided for proxy render")
+        return None
+
+    def _check_music_inputs(
+        self, clip_paths: list[Path], music: GeneratedMusic, music_volume: float
+    ) -> Path:
+        """Validate assemble-with-music arguments.
+
+        Returns:
+            Path to the music file.
+
+        Raises:
+            FFmpegError: If clips or music are missing, or the volume is out of range.
+        """
+        if not clip_paths:
+            raise FFmpegError("No video clips provided for assembly")
+
+        # Validate music file exists
+        music_path = Path(music.file_path)
+        if not music_path.exists():
+            raise FFmpegError(f"Music file not found: {music.file_path}")
+
+        # Validate volume
+        if not 0.0 <= music_volume <= 1.0:
+            raise FFmpegError(f"music_volume must be between 0.0 and 1.0, got {music_volume}")
+
+        self._check_clips(clip_paths, "No video clips provided for assembly")
+        return music_path
+
+    def _prepare_music_mix(
+        self,
+        clip_paths: list[Path],
+        music_path: Path,
+        output_path: Path,
+        music_volume: float,
+        fade_duration: float,
+    ) -> tuple[list[str], Path, float]:
+        """Probe normalized clips, write the concat list and build the mix command.
+
+        Returns:
+            Tuple of (FFmpeg command, concat list file to clean up, output duration).
+        """
+        # Duration and audio presence come from the individual clips, so the
+        # concatenated video never has to be written out and probed again
+        duration, has_audio = self._probe_clips(clip_paths)
+        fade_out_start = max(0, duration - fade_duration)
+        gains = self._mix_gains(clip_paths, music_path, music_volume, has_audio)
+
+        logger.info(
+            "Concatenating %d clips and mixing music in one pass "
+            "(duration: %.1fs, volume: %.0f%%, has_audio: %s)",
+            len(clip_paths),
+            duration,
+            music_volume * 100,
+            has_audio,
+        )
+
+        concat_file = output_path.parent / f".concat_list_{output_path.stem}.txt"
+        self._write_concat_list(clip_paths, concat_file)
+        cmd = self._build_music_mix_command(
+            video_path=concat_file,
+            music_path=music_path,
+            output_path=output_path,
+            music_volume=music_volume,
+            fade_duration=fade_duration,
+            fade_out_start=fade_out_start,
+            has_video_audio=has_audio,
+            concat_input=True,
+            gains=gains,
+        )
+        return cmd, concat_file, duration
+
+    def _mix_gains(
+        self,
+        clip_paths: list[Path],
+        music_path: Path,
+        music_volume: float,
+        has_audio: bool,
+    ) -> MixGains | None:
+        """Loudness-based mix gains, or None to use the fixed volumes.
+
+        Measurements come from the loudness cache, so only files not analysed
+        before cost an ebur128 pass. Analysis failures fall back to fixed volumes.
+        """
+        if not self.normalize_loudness:
+            return None
+        from sip_studio.assembler.loudness import compute_mix_gains
+
+        cache = self._loudness_cache
+        try:
+            voiced = clip_paths if has_audio else []
+            clips = cache.measure_many([*voiced, music_path])
+            durations = [self.get_video_duration(p) for p in voiced]
+        except FFmpegError as e:
+            logger.warning("Loudness analysis failed, using fixed mix volumes: %s", e)
+            return None
+        gains = compute_mix_gains(clips[:-1], durations, clips[-1], music_volume)
+        logger.info(
+            "Loudness gains: clips %+.1f dB, music %+.1f dB",
+            gains.video_gain_db,
+            gains.music_gain_db,
+        )
+        return gains
+
+    def _probe_clips(self, clip_paths: list[Path]) -> tuple[float, bool]:
+        """Get total duration and audio presence for a sequence of clips.
+
+        Args:
+            clip_paths: Clips in playback order.
+
+        Returns:
+            Tuple of (summed duration in seconds, whether every clip has audio).
+        """
+        duration = sum(self.get_video_duration(clip) for clip in clip_paths)
+        audio = [self.has_audio_stream(clip) for clip in clip_paths]
+        if any(audio) and not all(audio):
+            logger.warning(
+                "Only %d/%d clips have audio; using music only for the soundtrack",
+                sum(audio),
+                len(audio),
+            )
+        return duration, all(audio)
 
     def _build_music_mix_command(
         self,
@@ -421,6 +763,8 @@ class FFmpegAssembler:
         fade_duration: float,
         fade_out_start: float,
         has_video_audio: bool = True,
+        concat_input: bool = False,
+        gains: MixGains | None = None,
     ) -> list[str]:
         """Build FFmpeg command for mixing music with video.
 
@@ -440,39 +784,22 @@ class FFmpegAssembler:
             fade_duration: Duration of fade effects in seconds.
             fade_out_start: When to start fade out (in seconds).
             has_video_audio: Whether the video has an audio stream.
+            concat_input: If True, video_path is a concat demuxer list and the
+                clips are concatenated as part of the same pass.
+            gains: Loudness-based gains replacing the fixed volumes.
 
         Returns:
             List of command arguments for FFmpeg.
         """
-        if has_video_audio:
-            # Build the filter complex for audio mixing
-            # [1:a] = music input (looped)
-            # - afade: fade in at start, fade out before end
-            # - volume: reduce music volume
-            # [0:a] = video audio
-            # - volume: slightly reduce to make room for music
-            # amix: combine both audio streams
-            video_audio_volume = 1.0 - (music_volume * 0.3)  # Slight reduction
-
-            filter_complex = (
-                f"[1:a]afade=t=in:st=0:d={fade_duration},"
-                f"afade=t=out:st={fade_out_start}:d={fade_duration},"
-                f"volume={music_volume}[music];"
-                f"[0:a]volume={video_audio_volume}[video_audio];"
-                f"[video_audio][music]amix=inputs=2:duration=first:dropout_transition=2[audio_out]"
-            )
-        else:
-            # Video has no audio - just use the music track
-            logger.info("Video has no audio stream, using music only")
-            filter_complex = (
-                f"[1:a]afade=t=in:st=0:d={fade_duration},"
-                f"afade=t=out:st={fade_out_start}:d={fade_duration},"
-                f"volume={music_volume}[audio_out]"
-            )
+        filter_complex = self._build_music_filter(
+            music_volume, fade_duration, fade_out_start, has_video_audio, gains
+        )
 
+        video_input = ["-f", "concat", "-safe", "0"] if concat_input else []
         return [
             "ffmpeg",
             "-y",  # Overwrite output
+            *video_input,
             "-i",
             str(video_path),  # Video input (index 0)
             "-stream_loop",
@@ -488,9 +815,66 @@ class FFmpegAssembler:
             "-shortest",  # Stop when shortest input ends
             "-c:v",
             "copy",  # Copy video stream (no re-encode)
-            "-c:a",
-            "aac",  # Encode audio as AAC
-            "-b:a",
-            "192k",  # Audio bitrate
+            *self.encoding_profile.audio_args(),  # AAC at the profile's bitrate
             str(output_path),
         ]
+
+    @staticmethod
+    def _music_volume_filter(music_volume: float, gains: MixGains | None = None) -> str:
+        if gains is not None:
+            return f"volume={gains.music_gain_db}dB"
+        return f"volume={music_volume}"
+
+    @staticmethod
+    def _video_volume_filter(music_volume: float, gains: MixGains | None = None) -> str:
+        if gains is not None:
+            return f"volume={gains.video_gain_db}dB"
+        return f"volume={1.0 - (music_volume * 0.3)}"  # Slight reduction
+
+    @staticmethod
+    def _amix_filter(gains: MixGains | None = None) -> str:
+        amix = "amix=inputs=2:duration=first:dropout_transition=2"
+        # Loudness gains already set the final levels, so amix must not rescale
+        return f"{amix}:normalize=0" if gains is not None else amix
+
+    def _build_music_filter(
+        self,
+        music_volume: float,
+        fade_duration: float,
+        fade_out_start: float,
+        has_video_audio: bool,
+        gains: MixGains | None = None,
+        video_audio: str = "0:a",
+        music_input: str = "1:a",
+    ) -> str:
+        """Build the filter graph that fades the music and mixes it to ``[audio_out]``.
+
+        By default input 0 is the video and input 1 the looped music; pass
+        ``video_audio`` / ``music_input`` to mix other pads. With ``gains`` the
+        volumes come from loudness analysis instead of ``music_volume``.
+        """
+        music_volume_filter = self._music_volume_filter(music_volume, gains)
+        if has_video_audio:
+            # Build the filter complex for audio mixing
+            # [1:a] = music input (looped)
+            # - afade: fade in at start, fade out before end
+            # - volume: reduce music volume
+            # [0:a] = video audio
+            # - volume: slightly reduce to make room for music
+            # amix: combine both audio streams
+            filter_complex = (
+                f"[{music_input}]afade=t=in:st=0:d={fade_duration},"
+                f"afade=t=out:st={fade_out_start}:d={fade_duration},"
+                f"{music_volume_filter}[music];"
+                f"[{video_audio}]{self._video_volume_filter(music_volume, gains)}[video_audio];"
+                f"[video_audio][music]{self._amix_filter(gains)}[audio_out]"
+            )
+        else:
+            # Video has no audio - just use the music track
+            logger.info("Video has no audio stream, using music only")
+            filter_complex = (
+                f"[{music_input}]afade=t=in:st=0:d={fade_duration},"
+                f"afade=t=out:st={fade_out_start}:d={fade_duration},"
+                f"{music_volume_filter}[audio_out]"
+            )
+        return filter_complex
@@ -0,0 +1,401 @@
+"""Incremental re-assembly with a segment manifest and a cached music bed.
+
+Regenerating one scene used to re-run the whole concat and music mix. An
+assembly now records a manifest next to the output (one entry per segment,
+keyed on the conforming clip's path, mtime and size) and renders the music
+bed (looped, faded, volume-adjusted) once as a separate cached AAC track.
+
+On re-assembly only changed clips are re-normalized (unchanged ones reuse
+their normalized copies) and the bed is reused while the music, duration
+and mix parameters match. When the clips have their own audio, each one is
+mixed with its slice of the bed into a cached PCM segment, so only the
+segments whose clip or position changed are re-mixed. The final step is a
+stream-copy concat of the video with the bed (or the concatenated segment
+mixes, AAC-encoded) muxed in; when nothing changed and the output is intact
+the assembly is skipped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sip_studio.utils.file_utils import write_atomically
+
+if TYPE_CHECKING:
+    from sip_studio.assembler.ffmpeg import FFmpegAssembler
+    from sip_studio.assembler.loudness import MixGains
+
+logger = logging.getLogger(__name__)
+
+ASSEMBLY_DIR = ".assembly"
+_MANIFEST_VERSION = 1
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+@dataclass(frozen=True)
+class SegmentEntry:
+    """One clip of the assembly, as it was when the output was built."""
+
+    path: str
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def for_path(cls, path: Path) -> SegmentEntry:
+        mtime_ns, size = _stamp(path)
+        return cls(path=str(path.absolute()), mtime_ns=mtime_ns, size=size)
+
+
+@dataclass
+class AssemblyManifest:
+    """What an assembled output was built from."""
+
+    segments: list[SegmentEntry] = field(default_factory=list)
+    bed_key: str | None = None
+    mix: dict[str, Any] = field(default_factory=dict)
+    output_stamp: tuple[int, int] | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> AssemblyManifest | None:
+        """Read a manifest, returning None if it is missing, stale or malformed."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != _MANIFEST_VERSION:
+                return None
+            stamp = data.get("output_stamp")
+            return cls(
+                segments=[SegmentEntry(**s) for s in data.get("segments", [])],
+                bed_key=data.get("bed_key"),
+                mix=data.get("mix", {}),
+                output_stamp=tuple(stamp) if stamp else None,
+            )
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug("Ignoring assembly manifest %s: %s", path, e)
+            return None
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "version": _MANIFEST_VERSION,
+            "segments": [asdict(s) for s in self.segments],
+            "bed_key": self.bed_key,
+            "mix": self.mix,
+            "output_stamp": list(self.output_stamp) if self.output_stamp else None,
+        }
+        write_atomically(path, json.dumps(payload, indent=2))
+
+
+@dataclass(frozen=True)
+class AssemblyStep:
+    """One FFmpeg run; output is written to ``tmp`` and moved to ``target`` on success."""
+
+    description: str
+    cmd: list[str]
+    tmp: Path
+    target: Path
+    duration: float | None = None
+
+    def finish(self) -> None:
+        os.replace(self.tmp, self.target)
+
+
+class IncrementalMusicAssembly:
+    """Plans an assemble-with-music run that reuses the previous one's work.
+
+    Typical use::
+
+        job = IncrementalMusicAssembly(assembler, music_path, output_path, 0.4, 2.0)
+        try:
+            for step in job.plan(normalized_clips):
+                run(step.cmd)
+                step.finish()
+            job.commit()
+        finally:
+            job.cleanup()
+    """
+
+    def __init__(
+        self,
+        assembler: FFmpegAssembler,
+        music_path: Path,
+        output_path: Path,
+        music_volume: float,
+        fade_duration: float,
+    ):
+        self._assembler = assembler
+        self.music_path = music_path
+        self.output_path = output_path
+        self.music_volume = music_volume
+        self.fade_duration = fade_duration
+        self.work_dir = output_path.parent / ASSEMBLY_DIR
+        self.manifest_path = self.work_dir / f"{output_path.stem}.manifest.json"
+        self.concat_file = self.work_dir / f"{output_path.stem}.concat.txt"
+        self.audio_concat_file = self.work_dir / f"{output_path.stem}.audio.txt"
+        self._manifest: AssemblyManifest | None = None
+        self._gains: MixGains | None = None
+
+    def plan(self, clip_paths: list[Path]) -> list[AssemblyStep]:
+        """Work out which FFmpeg runs are needed for already-normalized clips.
+
+        Returns:
+            Steps to run in order (empty when the output is already up to date).
+        """
+        previous = AssemblyManifest.load(self.manifest_path)
+        segments = [SegmentEntry.for_path(p) for p in clip_paths]
+        duration, has_audio = self._assembler._probe_clips(clip_paths)
+        durations = [self._assembler.get_video_duration(p) for p in clip_paths]
+        self._gains = self._assembler._mix_gains(
+            clip_paths, self.music_path, self.music_volume, has_audio
+        )
+        mix = {
+            "music_volume": self.music_volume,
+            "fade_duration": self.fade_duration,
+            "has_video_audio": has_audio,
+            "gains": self._gains.key if self._gains else None,
+        }
+        bed_key = self._bed_key(duration)
+        bed_path = self.work_dir / f"{self.output_path.stem}.bed_{bed_key}.m4a"
+        self._manifest = AssemblyManifest(segments=segments, bed_key=bed_key, mix=mix)
+
+        if (
+            previous is not None
+            and previous.segments == segments
+            and previous.bed_key == bed_key
+            and previous.mix == mix
+            and self.output_path.exists()
+            and previous.output_stamp == _stamp(self.output_path)
+        ):
+            logger.info("Assembly of %s is up to date, skipping", self.output_path.name)
+            self._manifest = None
+            return []
+
+        if previous is not None:
+            old = {(s.path, s.mtime_ns, s.size) for s in previous.segments}
+            changed = sum((s.path, s.mtime_ns, s.size) not in old for s in segments)
+            logger.info(
+                "Re-assembling %s: %d/%d segments changed, music bed %s",
+                self.output_path.name,
+                changed,
+                len(segments),
+                "reused" if bed_path.exists() else "re-rendered",
+            )
+
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        steps: list[AssemblyStep] = []
+        audio_source = bed_path
+        if not bed_path.exists():
+            self._prune_beds()
+            tmp = bed_path.with_name(f".{bed_path.name}.part.m4a")
+            steps.append(
+                AssemblyStep(
+                    description="music bed render",
+                    cmd=self._build_bed_command(tmp, duration),
+                    tmp=tmp,
+                    target=bed_path,
+                    duration=duration,
+                )
+            )
+
+        if has_audio:
+            mixes = self._plan_segment_mixes(clip_paths, segments, durations, bed_path, bed_key)
+            pending = [step for step in mixes if not step.target.exists()]
+            if previous is not None:
+                logger.info(
+                    "Reusing %d/%d segment audio mixes", len(mixes) - len(pending), len(mixes)
+                )
+            self._prune_segment_mixes({step.target for step in mixes})
+            steps += pending
+            self._assembler._write_concat_list([m.target for m in mixes], self.audio_concat_file)
+            audio_source = self.audio_concat_file
+
+        self._assembler._write_concat_list(clip_paths, self.concat_file)
+        tmp = self.work_dir / f".{self.output_path.stem}.part{self.output_path.suffix}"
+        steps.append(
+            AssemblyStep(
+                description="music remux",
+                cmd=self._build_remux_command(audio_source, tmp, has_audio),
+                tmp=tmp,
+                target=self.output_path,
+                duration=duration,
+            )
+        )
+        return steps
+
+    def commit(self) -> None:
+        """Record the manifest once every planned step has finished."""
+        if self._manifest is None:
+            return
+        self._manifest.output_stamp = _stamp(self.output_path)
+        self._manifest.save(self.manifest_path)
+
+    def cleanup(self) -> None:
+        """Remove the concat lists and any partial outputs."""
+        self.concat_file.unlink(missing_ok=True)
+        self.audio_concat_file.unlink(missing_ok=True)
+        if self.work_dir.exists():
+            for part in self.work_dir.glob(".*.part*"):
+                part.unlink(missing_ok=True)
+
+    @property
+    def _audio_bitrate(self) -> str:
+        return self._assembler.encoding_profile.audio_bitrate
+
+    def _bed_key(self, duration: float) -> str:
+        mtime_ns, size = _stamp(self.music_path)
+        raw = (
+            f"{self.music_path.absolute()}:{mtime_ns}:{size}:{duration:.3f}:"
+            f"{self.music_volume}:{self.fade_duration}:{self._audio_bitrate}:"
+            f"{self._gains.music_gain_db if self._gains else None}"
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+    def _prune_beds(self) -> None:
+        for old in self.work_dir.glob(f"{self.output_path.stem}.bed_*.m4a"):
+            old.unlink(missing_ok=True)
+
+    def _plan_segment_mixes(
+        self,
+        clip_paths: list[Path],
+        segments: list[SegmentEntry],
+        durations: list[float],
+        bed_path: Path,
+        bed_key: str,
+    ) -> list[AssemblyStep]:
+        """One mix per clip of its audio with the bed slice it plays over.
+
+        Each mix is keyed on the clip, its position and the bed, so a changed
+        scene (or one that moved) only invalidates its own mix.
+        """
+        gains = self._gains.key if self._gains else None
+        mixes: list[AssemblyStep] = []
+        offset = 0.0
+        for i, (clip, segment, seg_duration) in enumerate(zip(clip_paths, segments, durations)):
+            raw = (
+                f"{segment.path}:{segment.mtime_ns}:{segment.size}:{offset:.3f}:"
+                f"{seg_duration:.3f}:{bed_key}:{self.music_volume}:{gains}"
+            )
+            key = hashlib.sha256(raw.encode()).hexdigest()[:16]
+            target = self.work_dir / f"{self.output_path.stem}.seg_{key}.wav"
+            tmp = target.with_name(f".{target.name}.part.wav")
+            mixes.append(
+                AssemblyStep(
+                    description=f"segment {i + 1} audio mix",
+                    cmd=self._build_segment_mix_command(clip, bed_path, tmp, offset, seg_duration),
+                    tmp=tmp,
+                    target=target,
+                    duration=seg_duration,
+                )
+            )
+            offset += seg_duration
+        return mixes
+
+    def _prune_segment_mixes(self, keep: set[Path]) -> None:
+        for old in self.work_dir.glob(f"{self.output_path.stem}.seg_*.wav"):
+            if old not in keep:
+                old.unlink(missing_ok=True)
+
+    def _build_segment_mix_command(
+        self, clip: Path, bed_path: Path, output: Path, offset: float, duration: float
+    ) -> list[str]:
+        """Mix one clip's audio with the bed from ``offset``, as PCM so mixes concat cleanly."""
+        video_volume = self._assembler._video_volume_filter(self.music_volume, self._gains)
+        amix = self._assembler._amix_filter(self._gains)
+        return [
+            "ffmpeg",
+            "-y",
+            "-i",
+            str(clip),
+            "-ss",
+            f"{offset:.3f}",
+            "-t",
+            f"{duration:.3f}",
+            "-i",
+            str(bed_path),
+            "-filter_complex",
+            f"[0:a]{video_volume}[video_audio];[video_audio][1:a]{amix}[audio_out]",
+            "-map",
+            "[audio_out]",
+            "-t",
+            f"{duration:.3f}",
+            "-c:a",
+            "pcm_s16le",
+            "-ar",
+            "48000",
+            "-ac",
+            "2",
+            str(output),
+        ]
+
+    def _build_bed_command(self, output: Path, duration: float) -> list[str]:
+        """Render the looped, faded, volume-adjusted music to exactly ``duration``."""
+        fade_out_start = max(0, duration - self.fade_duration)
+        audio_filter = (
+            f"afade=t=in:st=0:d={self.fade_duration},"
+            f"afade=t=out:st={fade_out_start}:d={self.fade_duration},"
+            f"{self._assembler._music_volume_filter(self.music_volume, self._gains)}"
+        )
+        return [
+            "ffmpeg",
+            "-y",
+            "-stream_loop",
+            "-1",
+            "-i",
+            str(self.music_path),
+            "-af",
+            audio_filter,
+            "-t",
+            f"{duration:.3f}",
+            "-c:a",
+            "aac",
+            "-b:a",
+            self._audio_bitrate,
+            "-ar",
+            "48000",
+            "-ac",
+            "2",
+            str(output),
+        ]
+
+    def _build_remux_command(self, audio: Path, output: Path, has_audio: bool) -> list[str]:
+        """Stream-copy the segments and add the soundtrack.
+
+        ``audio`` is the bed itself, or with clip audio the concat list of the
+        segment mixes, which only needs an audio-only AAC encode.
+        """
+        concat = ["-f", "concat", "-safe", "0"]
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *concat,
+            "-i",
+            str(self.concat_file),
+            *(concat if has_audio else []),
+            "-i",
+            str(audio),
+        ]
+        if has_audio:
+            cmd += [
+                "-map",
+                "0:v",
+                "-map",
+                "1:a",
+                "-c:v",
+                "copy",
+                "-c:a",
+                "aac",
+                "-b:a",
+                self._audio_bitrate,
+            ]
+        else:
+            # Nothing to mix: both streams are copied as-is
+            cmd += ["-map", "0:v", "-map", "1:a", "-c", "copy"]
+        return [*cmd, "-shortest", str(output)]
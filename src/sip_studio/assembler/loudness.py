@@ -0,0 +1,321 @@
+"""Cached EBU R128 loudness analysis and mix gains for music assembly.
+
+The music mix used fixed volumes (``music_volume`` for the music and
+``1 - music_volume * 0.3`` for the clips), so the result was only as
+consistent as the inputs: a quiet clip set came out quiet, and loud music
+buried the dialogue. Loudness-normalizing the mix needs each input measured
+with the ``ebur128`` filter, which is a full decode per file.
+
+Each clip and the music is measured once. The integrated loudness, loudness
+range and true peak are kept in memory and in a JSON sidecar next to the file
+(``.<name>.loudness.json``), keyed on mtime and size. ``compute_mix_gains``
+turns the measurements into dB gains: the clips' combined loudness is brought
+to ``TARGET_LUFS``, and the music sits ``DUCK_DB`` under it, scaled by
+``music_volume``. Repeated assemblies reuse the measurements, so levels stay
+consistent with no extra analysis passes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from sip_studio.assembler.ffmpeg import FFmpegError, stderr_tail
+from sip_studio.utils.file_utils import write_atomically
+
+logger = logging.getLogger(__name__)
+
+# Program loudness of the assembled video (streaming platforms use -14..-16)
+TARGET_LUFS = -16.0
+# How far the music sits under the clip audio at music_volume=1.0
+DUCK_DB = 6.0
+# Keep true peaks under this level after applying gains
+PEAK_CEILING_DBFS = -1.0
+# Never boost or cut an input by more than this
+MAX_GAIN_DB = 20.0
+# ebur128 reports -70 LUFS (its absolute gate) for silence
+SILENCE_LUFS = -70.0
+
+_SIDECAR_VERSION = 1
+_SUMMARY_PATTERNS = {
+    "integrated": re.compile(r"I:\s+(-?[\d.]+|-inf)\s+LUFS"),
+    "loudness_range": re.compile(r"LRA:\s+(-?[\d.]+)\s+LU\b"),
+    "true_peak": re.compile(r"Peak:\s+(-?[\d.]+|-inf)\s+dBFS"),
+}
+
+
+@dataclass(frozen=True)
+class LoudnessMeasurement:
+    """EBU R128 summary of one file's first audio stream."""
+
+    integrated: float
+    loudness_range: float = 0.0
+    true_peak: float | None = None
+
+    @property
+    def is_silent(self) -> bool:
+        return self.integrated <= SILENCE_LUFS
+
+
+@dataclass(frozen=True)
+class MixGains:
+    """Gains (dB) applied to the clip audio and the music in the mix."""
+
+    video_gain_db: float
+    music_gain_db: float
+
+    @property
+    def key(self) -> str:
+        """Stable representation used in cache keys."""
+        return f"{self.video_gain_db:.2f}:{self.music_gain_db:.2f}"
+
+
+def parse_ebur128_summary(stderr: str) -> LoudnessMeasurement:
+    """Parse the summary that the ``ebur128`` filter prints when it finishes.
+
+    Raises:
+        FFmpegError: If the output has no summary.
+    """
+    summary = stderr[stderr.rfind("Summary:") :] if "Summary:" in stderr else ""
+    values: dict[str, float] = {}
+    for name, pattern in _SUMMARY_PATTERNS.items():
+        match = pattern.search(summary)
+        if match:
+            raw = match.group(1)
+            values[name] = -math.inf if raw == "-inf" else float(raw)
+    if "integrated" not in values:
+        raise FFmpegError("No ebur128 summary in FFmpeg output")
+    return LoudnessMeasurement(
+        integrated=max(values["integrated"], SILENCE_LUFS),
+        loudness_range=values.get("loudness_range", 0.0),
+        true_peak=values.get("true_peak"),
+    )
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.loudness.json")
+
+
+class LoudnessCache:
+    """Memoizes ebur128 measurements per file, invalidated by mtime and size."""
+
+    def __init__(
+        self,
+        persist: bool = True,
+        run_fn: Callable[..., subprocess.CompletedProcess] | None = None,
+        max_workers: int = 4,
+    ):
+        """Initialize the cache.
+
+        Args:
+            persist: Write/read JSON sidecars next to measured files.
+            run_fn: Injectable subprocess runner (defaults to ``subprocess.run``).
+            max_workers: Concurrent analyses in ``measure_many``.
+        """
+        self.persist = persist
+        self._run_fn = run_fn
+        self.max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[int, int, LoudnessMeasurement]] = {}
+        self.analyses_run = 0
+
+    def measure(self, path: Path) -> LoudnessMeasurement:
+        """Get the loudness of a file, running ebur128 only on a cache miss.
+
+        Args:
+            path: Video or audio file with at least one audio stream.
+
+        Returns:
+            Loudness summary.
+
+        Raises:
+            FFmpegError: If the file is missing or the analysis fails.
+        """
+        path = Path(path)
+        try:
+            st = path.stat()
+        except OSError as e:
+            raise FFmpegError(f"Audio file not found: {path}") from e
+        key = str(path.absolute())
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+        result = self._load_sidecar(path, stamp) if self.persist else None
+        if result is None:
+            result = self._run_ebur128(path)
+            if self.persist:
+                self._save_sidecar(path, stamp, result)
+        with self._lock:
+            self._entries[key] = (*stamp, result)
+        return result
+
+    def measure_many(self, paths: list[Path]) -> list[LoudnessMeasurement]:
+        """Measure several files, analysing cache misses in parallel.
+
+        Raises:
+            FFmpegError: If any analysis fails.
+        """
+        if len(paths) <= 1:
+            return [self.measure(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as pool:
+            return list(pool.map(self.measure, paths))
+
+    def invalidate(self, path: Path) -> None:
+        """Forget a file's measurement (memory and sidecar)."""
+        path = Path(path)
+        with self._lock:
+            self._entries.pop(str(path.absolute()), None)
+        _sidecar_path(path).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _run_ebur128(self, path: Path) -> LoudnessMeasurement:
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-nostats",
+            "-i",
+            str(path),
+            "-map",
+            "0:a:0",
+            "-af",
+            "ebur128=peak=true",
+            "-f",
+            "null",
+            "-",
+        ]
+        run = self._run_fn or subprocess.run
+        try:
+            proc = run(cmd, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            error_msg = stderr_tail(e.stderr) if e.stderr else str(e)
+            raise FFmpegError(f"Loudness analysis failed for {path.name}: {error_msg}") from e
+        with self._lock:
+            self.analyses_run += 1
+        result = parse_ebur128_summary(proc.stderr or "")
+        logger.debug(
+            "Loudness of %s: %.1f LUFS, LRA %.1f LU",
+            path.name,
+            result.integrated,
+            result.loudness_range,
+        )
+        return result
+
+    def _load_sidecar(self, path: Path, stamp: tuple[int, int]) -> LoudnessMeasurement | None:
+        sidecar = _sidecar_path(path)
+        try:
+            data = json.loads(sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != _SIDECAR_VERSION or tuple(data.get("stamp", ())) != stamp:
+            return None
+        try:
+            return LoudnessMeasurement(**data["result"])
+        except (KeyError, TypeError) as e:
+            logger.debug("Ignoring malformed loudness sidecar %s: %s", sidecar, e)
+            return None
+
+    def _save_sidecar(
+        self, path: Path, stamp: tuple[int, int], result: LoudnessMeasurement
+    ) -> None:
+        payload = {"version": _SIDECAR_VERSION, "stamp": list(stamp), "result": asdict(result)}
+        try:
+            write_atomically(_sidecar_path(path), json.dumps(payload))
+        except OSError as e:
+            logger.debug("Could not persist loudness for %s: %s", path, e)
+
+
+def combined_loudness(
+    measurements: list[LoudnessMeasurement], durations: list[float]
+) -> float | None:
+    """Approximate the integrated loudness of clips played back to back.
+
+    Energy-weights each clip's loudness by its duration; silent clips only
+    add length. Returns None if every clip is silent.
+    """
+    energy = 0.0
+    total = 0.0
+    for m, d in zip(measurements, durations):
+        total += d
+        if not m.is_silent:
+            energy += d * 10 ** (m.integrated / 10)
+    if energy <= 0 or total <= 0:
+        return None
+    return 10 * math.log10(energy / total)
+
+
+def _clamp(gain: float) -> float:
+    return max(-MAX_GAIN_DB, min(MAX_GAIN_DB, gain))
+
+
+def compute_mix_gains(
+    clips: list[LoudnessMeasurement],
+    clip_durations: list[float],
+    music: LoudnessMeasurement,
+    music_volume: float,
+) -> MixGains:
+    """Work out the clip and music gains for a loudness-consistent mix.
+
+    With clip audio, the clips are brought to ``TARGET_LUFS`` (limited so
+    their true peak stays under ``PEAK_CEILING_DBFS``) and the music lands
+    ``DUCK_DB`` below them at ``music_volume=1``, lower for smaller volumes.
+    Without clip audio, the music is brought to the target and scaled by
+    ``music_volume``.
+
+    Args:
+        clips: Measurements of the clips (in playback order).
+        clip_durations: Clip durations in seconds.
+        music: Measurement of the music track.
+        music_volume: Music level 0.0-1.0, as in ``assemble_with_music``.
+
+    Returns:
+        Gains in dB.
+    """
+    volume_db = 20 * math.log10(music_volume) if music_volume > 0 else -MAX_GAIN_DB
+    clip_loudness = combined_loudness(clips, clip_durations) if clips else None
+
+    video_gain = 0.0
+    music_target = TARGET_LUFS + volume_db
+    if clip_loudness is not None:
+        video_gain = _clamp(TARGET_LUFS - clip_loudness)
+        peaks = [m.true_peak for m in clips if m.true_peak is not None and not m.is_silent]
+        if peaks:
+            video_gain = min(video_gain, PEAK_CEILING_DBFS - max(peaks))
+        music_target = clip_loudness + video_gain - DUCK_DB + volume_db
+
+    music_gain = 0.0 if music.is_silent else _clamp(music_target - music.integrated)
+    if music.true_peak is not None:
+        music_gain = min(music_gain, PEAK_CEILING_DBFS - music.true_peak)
+    return MixGains(video_gain_db=round(video_gain, 2), music_gain_db=round(music_gain, 2))
+
+
+# Singleton with factory for testing
+_loudness_cache: LoudnessCache | None = None
+_loudness_cache_lock = threading.Lock()
+
+
+def get_loudness_cache(persist: bool = True, _reset: bool = False) -> LoudnessCache:
+    """Get or create the global loudness cache.
+
+    Args:
+        persist: Whether sidecars are written (used on creation only).
+        _reset: Force create new instance (for testing only).
+    """
+    global _loudness_cache
+    with _loudness_cache_lock:
+        if _loudness_cache is None or _reset:
+            _loudness_cache = LoudnessCache(persist=persist)
+        return _loudness_cache
@@ -0,0 +1,410 @@
+"""Clip normalization for stream-copy concatenation.
+
+Kling, Sora and VEO clips can differ in codec, frame rate, resolution, pixel
+format and audio layout, and the concat demuxer only stream-copies cleanly when
+every input matches. Instead of re-encoding the whole output, each clip is
+probed and only the non-conforming ones are re-encoded to a common target
+profile, in parallel, so the final concat is always ``-c copy``.
+
+Normalized clips are written to a ``.normalized`` directory next to the
+sources, named by a hash of the source stamp and target profile, so repeated
+assemblies of unchanged clips reuse them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sip_studio.assembler.ffmpeg import FFmpegError, stderr_tail
+
+if TYPE_CHECKING:
+    from sip_studio.assembler.encoding import EncodingProfile
+    from sip_studio.assembler.probe import ProbeCache, ProbeResult
+    from sip_studio.assembler.runner import ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+NORMALIZED_DIR = ".normalized"
+# Frame rates closer than this are treated as equal (29.97 vs 30000/1001)
+_FPS_TOLERANCE = 0.01
+
+
+@dataclass(frozen=True)
+class TargetProfile:
+    """Stream layout every clip must share for a stream-copy concat."""
+
+    width: int
+    height: int
+    fps: float
+    video_codec: str = "h264"
+    pix_fmt: str = "yuv420p"
+    has_audio: bool = True
+    audio_codec: str = "aac"
+    sample_rate: int = 48000
+    channels: int = 2
+    # How other shapes are converted: "pad" letterboxes, "crop" fills the frame
+    fit: str = "pad"
+
+    @property
+    def key(self) -> str:
+        """Short stable identifier used in normalized file names."""
+        raw = (
+            f"{self.video_codec}:{self.width}x{self.height}@{self.fps:.3f}:{self.pix_fmt}:"
+            f"{self.audio_codec if self.has_audio else 'noaudio'}:"
+            f"{self.sample_rate}:{self.channels}"
+        )
+        if self.fit != "pad":
+            raw += f":{self.fit}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:12]
+
+    def conforms(self, probe: ProbeResult) -> bool:
+        """Check whether a clip can be stream-copied into this profile."""
+        video = probe.video_stream
+        if video is None or video.fps is None:
+            return False
+        if (
+            video.codec_name != self.video_codec
+            or video.pix_fmt != self.pix_fmt
+            or (video.width, video.height) != (self.width, self.height)
+            or abs(video.fps - self.fps) > _FPS_TOLERANCE
+        ):
+            return False
+        audio = probe.audio_streams
+        if not self.has_audio:
+            return not audio
+        return len(audio) == 1 and (
+            audio[0].codec_name == self.audio_codec
+            and audio[0].sample_rate == self.sample_rate
+            and audio[0].channels == self.channels
+        )
+
+
+def choose_target_profile(
+    probes: list[ProbeResult],
+    size: tuple[int, int] | None = None,
+    fit: str = "pad",
+) -> TargetProfile:
+    """Pick the profile that requires the fewest re-encodes.
+
+    Resolution and frame rate follow the most common clip (first clip wins
+    ties); audio is kept if any clip has it, and silent clips get a silent track.
+
+    Args:
+        probes: Probe results of the clips.
+        size: Force the output frame size (e.g. (1080, 1920) for a 9:16 cut).
+        fit: How clips of another shape are converted ("pad" or "crop").
+
+    Raises:
+        FFmpegError: If no clip has a usable video stream.
+    """
+    shapes = [
+        (v.width, v.height, round(v.fps, 3))
+        for p in probes
+        if (v := p.video_stream) is not None and v.width and v.height and v.fps
+    ]
+    if not shapes:
+        raise FFmpegError("No clip has a readable video stream to normalize against")
+    (width, height, fps), _ = Counter(shapes).most_common(1)[0]
+    if size is not None:
+        width, height = size
+    return TargetProfile(
+        width=width,
+        height=height,
+        fps=fps,
+        has_audio=any(p.has_audio for p in probes),
+        fit=fit,
+    )
+
+
+def default_max_workers() -> int:
+    """Concurrent re-encodes: half the cores, since libx264 is itself threaded."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class ClipNormalizer:
+    """Re-encodes non-conforming clips to a shared target profile in parallel."""
+
+    def __init__(
+        self,
+        probe_cache: ProbeCache,
+        max_workers: int | None = None,
+        profile: EncodingProfile | None = None,
+    ):
+        """Initialize the normalizer.
+
+        Args:
+            probe_cache: Cache used to read clip metadata.
+            max_workers: Maximum concurrent FFmpeg processes. Defaults to half the cores.
+            profile: Encoding profile for the re-encodes. Defaults to standard.
+        """
+        from sip_studio.assembler.encoding import get_encoding_profile
+
+        self._probe_cache = probe_cache
+        self.max_workers = max(1, max_workers or default_max_workers())
+        self.profile = get_encoding_profile(profile)
+
+    def normalize(
+        self,
+        clip_paths: list[Path],
+        size: tuple[int, int] | None = None,
+        fit: str = "pad",
+    ) -> list[Path]:
+        """Return clip paths that can all be stream-copied together.
+
+        Conforming clips are returned unchanged; the rest are replaced by
+        normalized copies (reused when already present).
+
+        Args:
+            clip_paths: Clips in playback order.
+            size: Force the output frame size instead of the majority shape.
+            fit: How clips of another shape are converted ("pad" or "crop").
+
+        Returns:
+            Paths in the same order, pointing at conforming files.
+
+        Raises:
+            FFmpegError: If probing or a re-encode fails.
+        """
+        result, jobs = self._plan(clip_paths, size, fit)
+        if not jobs:
+            return result
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+            futures = {job.index: pool.submit(self._run_job, job) for job in jobs}
+            for i, future in futures.items():
+                result[i] = future.result()
+        return result
+
+    async def normalize_async(
+        self,
+        clip_paths: list[Path],
+        on_progress: ProgressCallback | None = None,
+        size: tuple[int, int] | None = None,
+        fit: str = "pad",
+    ) -> list[Path]:
+        """Async variant of ``normalize`` that never blocks the event loop.
+
+        Re-encodes run through the asyncio FFmpeg runner, at most
+        ``max_workers`` at a time; cancelling kills the running processes.
+
+        Args:
+            clip_paths: Clips in playback order.
+            on_progress: Called with progress updates from each re-encode.
+            size: Force the output frame size instead of the majority shape.
+            fit: How clips of another shape are converted ("pad" or "crop").
+
+        Returns:
+            Paths in the same order, pointing at conforming files.
+
+        Raises:
+            FFmpegError: If probing or a re-encode fails.
+        """
+        result, jobs = await asyncio.to_thread(self._plan, clip_paths, size, fit)
+        if not jobs:
+            return result
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run(job: _NormalizeJob) -> None:
+            async with semaphore:
+                result[job.index] = await self._run_job_async(job, on_progress)
+
+        tasks = [asyncio.create_task(run(job)) for job in jobs]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # One failure (or cancellation) stops the remaining re-encodes
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return result
+
+    def _plan(
+        self,
+        clip_paths: list[Path],
+        size: tuple[int, int] | None = None,
+        fit: str = "pad",
+    ) -> tuple[list[Path], list[_NormalizeJob]]:
+        """Probe clips and work out which ones need re-encoding.
+
+        Returns:
+            Tuple of (paths with reusable normalized copies substituted,
+            re-encode jobs still to run).
+        """
+        probes = [self._probe_cache.probe(clip) for clip in clip_paths]
+        target = choose_target_profile(probes, size, fit)
+        pending = [
+            (i, clip, probe)
+            for i, (clip, probe) in enumerate(zip(clip_paths, probes))
+            if not target.conforms(probe)
+        ]
+        result = list(clip_paths)
+        if not pending:
+            return result, []
+
+        workers = min(self.max_workers, len(pending))
+        threads = self.profile.threads or max(1, (os.cpu_count() or 2) // workers)
+        jobs: list[_NormalizeJob] = []
+        for i, clip, probe in pending:
+            output = _normalized_path(clip, target, self.profile)
+            if output.exists():
+                logger.debug("Reusing normalized clip %s", output.name)
+                result[i] = output
+                continue
+            output.parent.mkdir(parents=True, exist_ok=True)
+            tmp = output.with_name(f".{output.name}.part.mp4")
+            cmd = build_normalize_command(clip, tmp, target, probe.has_audio, threads, self.profile)
+            jobs.append(_NormalizeJob(i, clip, output, tmp, cmd, probe.duration))
+
+        if jobs:
+            logger.info(
+                "Normalizing %d/%d clips to %dx%d@%g (%d workers)",
+                len(jobs),
+                len(clip_paths),
+                target.width,
+                target.height,
+                target.fps,
+                min(self.max_workers, len(jobs)),
+            )
+        return result, jobs
+
+    @staticmethod
+    async def _run_job_async(
+        job: _NormalizeJob, on_progress: ProgressCallback | None = None
+    ) -> Path:
+        from sip_studio.assembler.runner import run_ffmpeg
+
+        try:
+            await run_ffmpeg(
+                job.cmd,
+                description=f"normalization for {job.source.name}",
+                total_duration=job.duration,
+                on_progress=on_progress,
+            )
+            os.replace(job.tmp, job.output)
+        finally:
+            job.tmp.unlink(missing_ok=True)
+        _prune_stale(job.output, job.source)
+        return job.output
+
+    @staticmethod
+    def _run_job(job: _NormalizeJob) -> Path:
+        try:
+            subprocess.run(job.cmd, check=True, capture_output=True, text=True)
+            os.replace(job.tmp, job.output)
+        except subprocess.CalledProcessError as e:
+            error_msg = stderr_tail(e.stderr) if e.stderr else str(e)
+            raise FFmpegError(
+                f"FFmpeg normalization for {job.source.name} failed: {error_msg}"
+            ) from e
+        finally:
+            job.tmp.unlink(missing_ok=True)
+        _prune_stale(job.output, job.source)
+        return job.output
+
+
+@dataclass(frozen=True)
+class _NormalizeJob:
+    """One pending re-encode."""
+
+    index: int
+    source: Path
+    output: Path
+    tmp: Path
+    cmd: list[str]
+    duration: float | None
+
+
+def _normalized_path(clip: Path, target: TargetProfile, profile: EncodingProfile) -> Path:
+    """Location of a clip's normalized copy, unique per source version, target and profile."""
+    stat = clip.stat()
+    digest = hashlib.sha256(
+        f"{clip.name}:{stat.st_mtime_ns}:{stat.st_size}:{target.key}:{profile.name}".encode()
+    ).hexdigest()[:16]
+    return clip.parent / NORMALIZED_DIR / f"{clip.stem}_{digest}.mp4"
+
+
+def _prune_stale(output: Path, source: Path) -> None:
+    """Drop normalized copies of earlier versions of the same clip.
+
+    Copies made before the source last changed are stale; copies of the
+    current version for other targets (e.g. a 9:16 cut) are kept.
+    """
+    stem = output.stem.rsplit("_", 1)[0]
+    try:
+        changed = source.stat().st_mtime_ns
+    except OSError:
+        return
+    for stale in output.parent.glob(f"{stem}_*.mp4"):
+        if stale == output or len(stale.stem) != len(output.stem):
+            continue
+        try:
+            if stale.stat().st_mtime_ns < changed:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def build_normalize_command(
+    src: Path,
+    dst: Path,
+    target: TargetProfile,
+    src_has_audio: bool,
+    threads: int = 0,
+    profile: EncodingProfile | None = None,
+) -> list[str]:
+    """Build the FFmpeg command that re-encodes one clip to the target profile.
+
+    Video is scaled to fit and padded, or scaled to fill and cropped when the
+    target's fit is "crop" (aspect ratio preserved either way); clips without
+    audio get a silent track when the target has audio. Preset, CRF and AAC
+    bitrate come from the encoding profile (standard by default).
+    """
+    from sip_studio.assembler.encoding import get_encoding_profile
+
+    profile = get_encoding_profile(profile)
+    if target.fit == "crop":
+        frame = (
+            f"scale={target.width}:{target.height}:force_original_aspect_ratio=increase,"
+            f"crop={target.width}:{target.height}"
+        )
+    else:
+        frame = (
+            f"scale={target.width}:{target.height}:force_original_aspect_ratio=decrease,"
+            f"pad={target.width}:{target.height}:(ow-iw)/2:(oh-ih)/2"
+        )
+    vf = f"{frame},setsar=1,fps={target.fps:g},format={target.pix_fmt}"
+    cmd = ["ffmpeg", "-y", "-i", str(src)]
+    silent_audio = target.has_audio and not src_has_audio
+    if silent_audio:
+        layout = "stereo" if target.channels == 2 else "mono"
+        cmd += ["-f", "lavfi", "-i", f"anullsrc=r={target.sample_rate}:cl={layout}"]
+    cmd += ["-map", "0:v:0"]
+    if target.has_audio:
+        cmd += ["-map", "1:a:0" if silent_audio else "0:a:0"]
+    cmd += ["-vf", vf, *profile.video_args(normalize=True, threads=threads)]
+    if target.has_audio:
+        cmd += [
+            "-c:a",
+            target.audio_codec,
+            "-b:a",
+            profile.audio_bitrate,
+            "-ar",
+            str(target.sample_rate),
+            "-ac",
+            str(target.channels),
+        ]
+    else:
+        cmd.append("-an")
+    if silent_audio:
+        cmd.append("-shortest")
+    cmd += ["-movflags", "+faststart", str(dst)]
+    return cmd
@@ -0,0 +1,302 @@
+"""Cached ffprobe metadata for video and audio files.
+
+Every assembler question about a clip (duration, audio presence, codecs,
+resolution) is answered from a single ``ffprobe -show_format -show_streams``
+run. Results are keyed on (path, mtime, size), kept in memory for the process
+lifetime and persisted as a small JSON sidecar next to the file
+(``.<name>.probe.json``) so later runs do not spawn ffprobe again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from sip_studio.assembler.ffmpeg import FFmpegError
+from sip_studio.utils.file_utils import write_atomically
+
+logger = logging.getLogger(__name__)
+
+# Bump when the persisted layout changes so stale sidecars are ignored
+_SIDECAR_VERSION = 1
+
+
+def _parse_rate(value: str | None) -> float | None:
+    """Parse an ffprobe frame rate such as "30000/1001"."""
+    if not value:
+        return None
+    num, _, den = value.partition("/")
+    try:
+        n, d = float(num), float(den or 1)
+    except ValueError:
+        return None
+    return n / d if d else None
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value) if value not in (None, "", "N/A") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        return int(value) if value not in (None, "", "N/A") else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class StreamInfo:
+    """One stream reported by ffprobe."""
+
+    index: int
+    codec_type: str
+    codec_name: str | None = None
+    width: int | None = None
+    height: int | None = None
+    fps: float | None = None
+    pix_fmt: str | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+    duration: float | None = None
+
+    @classmethod
+    def from_ffprobe(cls, data: dict[str, Any]) -> StreamInfo:
+        return cls(
+            index=int(data.get("index", 0)),
+            codec_type=str(data.get("codec_type", "")),
+            codec_name=data.get("codec_name"),
+            width=_to_int(data.get("width")),
+            height=_to_int(data.get("height")),
+            fps=_parse_rate(data.get("r_frame_rate")),
+            pix_fmt=data.get("pix_fmt"),
+            sample_rate=_to_int(data.get("sample_rate")),
+            channels=_to_int(data.get("channels")),
+            duration=_to_float(data.get("duration")),
+        )
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Parsed ffprobe output for one file."""
+
+    path: str
+    duration: float | None = None
+    size_bytes: int | None = None
+    format_name: str | None = None
+    bit_rate: int | None = None
+    streams: tuple[StreamInfo, ...] = field(default_factory=tuple)
+
+    @classmethod
+    def from_ffprobe(cls, path: Path, data: dict[str, Any]) -> ProbeResult:
+        fmt = data.get("format") or {}
+        return cls(
+            path=str(path),
+            duration=_to_float(fmt.get("duration")),
+            size_bytes=_to_int(fmt.get("size")),
+            format_name=fmt.get("format_name"),
+            bit_rate=_to_int(fmt.get("bit_rate")),
+            streams=tuple(StreamInfo.from_ffprobe(s) for s in data.get("streams") or []),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ProbeResult:
+        streams = tuple(StreamInfo(**s) for s in data.get("streams", []))
+        return cls(**{**data, "streams": streams})
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def video_stream(self) -> StreamInfo | None:
+        """First video stream, if any."""
+        return next((s for s in self.streams if s.codec_type == "video"), None)
+
+    @property
+    def audio_streams(self) -> list[StreamInfo]:
+        return [s for s in self.streams if s.codec_type == "audio"]
+
+    @property
+    def has_audio(self) -> bool:
+        return bool(self.audio_streams)
+
+    @property
+    def has_video(self) -> bool:
+        return self.video_stream is not None
+
+    def to_video_info(self) -> dict[str, Any]:
+        """Summary in the shape returned by ``FFmpegAssembler.get_video_info``."""
+        info: dict[str, Any] = {"path": self.path}
+        video = self.video_stream
+        if video is not None:
+            info["codec"] = video.codec_name
+            info["width"] = video.width
+            info["height"] = video.height
+            if video.fps is not None:
+                info["fps"] = video.fps
+        if self.duration is not None:
+            info["duration"] = self.duration
+        if self.size_bytes is not None:
+            info["size_bytes"] = self.size_bytes
+        return info
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.probe.json")
+
+
+class ProbeCache:
+    """Memoizes ffprobe results per file, invalidated by mtime and size."""
+
+    def __init__(
+        self,
+        persist: bool = True,
+        run_fn: Callable[..., subprocess.CompletedProcess] | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            persist: Write/read JSON sidecars next to probed files.
+            run_fn: Injectable subprocess runner (defaults to ``subprocess.run``).
+        """
+        self.persist = persist
+        self._run_fn = run_fn
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[int, int, ProbeResult]] = {}
+        self.probes_run = 0
+
+    def probe(self, path: Path) -> ProbeResult:
+        """Get metadata for a file, running ffprobe only on a cache miss.
+
+        Args:
+            path: Video or audio file.
+
+        Returns:
+            Parsed probe result.
+
+        Raises:
+            FFmpegError: If the file is missing or ffprobe fails.
+        """
+        path = Path(path)
+        try:
+            st = path.stat()
+        except OSError as e:
+            raise FFmpegError(f"Video file not found: {path}") from e
+        key = str(path.absolute())
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+        result = self._load_sidecar(path, stamp) if self.persist else None
+        if result is None:
+            result = self._run_ffprobe(path)
+            if self.persist:
+                self._save_sidecar(path, stamp, result)
+        with self._lock:
+            self._entries[key] = (*stamp, result)
+        return result
+
+    def duration(self, path: Path) -> float:
+        """Duration in seconds.
+
+        Raises:
+            FFmpegError: If the file has no readable duration.
+        """
+        result = self.probe(path)
+        if result.duration is None:
+            raise FFmpegError(f"Invalid duration value for {path}")
+        return result.duration
+
+    def has_audio(self, path: Path) -> bool:
+        """Whether the file has at least one audio stream (False if unreadable)."""
+        try:
+            return self.probe(path).has_audio
+        except FFmpegError:
+            return False
+
+    def video_info(self, path: Path) -> dict[str, Any]:
+        """Video summary dict (codec, width, height, fps, duration, size_bytes)."""
+        return self.probe(path).to_video_info()
+
+    def invalidate(self, path: Path) -> None:
+        """Forget a file's cached result (memory and sidecar)."""
+        path = Path(path)
+        with self._lock:
+            self._entries.pop(str(path.absolute()), None)
+        _sidecar_path(path).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _run_ffprobe(self, path: Path) -> ProbeResult:
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_format",
+            "-show_streams",
+            "-of",
+            "json",
+            str(path),
+        ]
+        run = self._run_fn or subprocess.run
+        try:
+            proc = run(cmd, check=True, capture_output=True, text=True)
+            data = json.loads(proc.stdout or "{}")
+        except subprocess.CalledProcessError as e:
+            raise FFmpegError(f"ffprobe failed for {path}: {e.stderr}") from e
+        except (ValueError, TypeError) as e:
+            raise FFmpegError(f"Failed to parse ffprobe output for {path}: {e}") from e
+        with self._lock:
+            self.probes_run += 1
+        return ProbeResult.from_ffprobe(path, data)
+
+    def _load_sidecar(self, path: Path, stamp: tuple[int, int]) -> ProbeResult | None:
+        sidecar = _sidecar_path(path)
+        try:
+            data = json.loads(sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != _SIDECAR_VERSION or tuple(data.get("stamp", ())) != stamp:
+            return None
+        try:
+            return ProbeResult.from_dict(data["result"])
+        except (KeyError, TypeError) as e:
+            logger.debug("Ignoring malformed probe sidecar %s: %s", sidecar, e)
+            return None
+
+    def _save_sidecar(self, path: Path, stamp: tuple[int, int], result: ProbeResult) -> None:
+        payload = {"version": _SIDECAR_VERSION, "stamp": list(stamp), "result": result.to_dict()}
+        try:
+            write_atomically(_sidecar_path(path), json.dumps(payload))
+        except OSError as e:
+            logger.debug("Could not persist probe result for %s: %s", path, e)
+
+
+# Singleton with factory for testing
+_probe_cache: ProbeCache | None = None
+_probe_cache_lock = threading.Lock()
+
+
+def get_probe_cache(persist: bool = True, _reset: bool = False) -> ProbeCache:
+    """Get or create the global probe cache.
+
+    Args:
+        persist: Whether sidecars are written (used on creation only).
+        _reset: Force create new instance (for testing only).
+    """
+    global _probe_cache
+    with _probe_cache_lock:
+        if _probe_cache is None or _reset:
+            _probe_cache = ProbeCache(persist=persist)
+        return _probe_cache
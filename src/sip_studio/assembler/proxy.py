@@ -0,0 +1,196 @@
+"""Low-resolution proxy renders for fast previews of an assembly.
+
+The full-quality ``_final.mp4`` has to wait for clip normalization and the
+music mix, and is heavy to load in the webview. A proxy is a 480p,
+low-bitrate H.264 encode (``-preset ultrafast``) made straight from the raw
+clips, with the music mixed in the same way as the final render. Each clip is
+an input of its own, scaled, padded and resampled to the majority clip shape
+and frame rate before a filter-graph ``concat``, so clips with different
+codecs, sizes or frame rates need no normalization pass and the proxy can run
+before or alongside the final assembly.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sip_studio.assembler.incremental import AssemblyStep
+from sip_studio.assembler.normalize import choose_target_profile
+
+if TYPE_CHECKING:
+    from sip_studio.assembler.ffmpeg import FFmpegAssembler
+
+logger = logging.getLogger(__name__)
+
+# Short side of the proxy frame, so portrait and landscape proxies are both 480p
+PROXY_SHORT_SIDE = 480
+PROXY_CRF = 30
+PROXY_MAX_BITRATE = "1M"
+PROXY_AUDIO_BITRATE = "96k"
+
+
+def proxy_path_for(output_path: Path) -> Path:
+    """Get the proxy path that goes with a final output (``x.mp4`` -> ``x_proxy.mp4``)."""
+    return output_path.with_name(f"{output_path.stem}_proxy{output_path.suffix}")
+
+
+def proxy_dimensions(width: int, height: int, max_side: int = PROXY_SHORT_SIDE) -> tuple[int, int]:
+    """Scale a frame size so its short side is at most ``max_side``, keeping the
+    aspect ratio (even sides): 1920x1080 -> 854x480, 720x1280 -> 480x854."""
+    short = min(width, height)
+    if short > max_side:
+        # Nearest even long side at the new scale
+        if height <= width:
+            width, height = round(width * max_side / (2 * height)) * 2, max_side
+        else:
+            width, height = max_side, round(height * max_side / (2 * width)) * 2
+    return max(2, width // 2 * 2), max(2, height // 2 * 2)
+
+
+def build_proxy_command(
+    clip_paths: list[Path],
+    output_path: Path,
+    width: int,
+    height: int,
+    fps: float,
+    has_video_audio: bool,
+    music_path: Path | None = None,
+    music_filter: str | None = None,
+    sample_rate: int = 48000,
+) -> list[str]:
+    """Build the FFmpeg command for a proxy render of the clips.
+
+    Every clip is scaled and padded to ``width`` x ``height``, resampled to
+    ``fps`` (and its audio to ``sample_rate`` stereo), then joined with the
+    ``concat`` filter, which unlike the concat demuxer accepts inputs that
+    differ in codec, size or frame rate.
+
+    Args:
+        clip_paths: Clips in playback order (inputs 0..n-1).
+        output_path: Where to write the proxy.
+        width: Proxy frame width.
+        height: Proxy frame height.
+        fps: Proxy frame rate.
+        has_video_audio: Whether every clip has an audio stream.
+        music_path: Optional music, looped as input n.
+        music_filter: Filter graph mixing ``[clip_audio]`` and the music at input
+            n to ``[audio_out]`` (required with ``music_path``).
+        sample_rate: Audio sample rate of the joined clip audio.
+
+    Returns:
+        List of command arguments.
+    """
+    cmd = ["ffmpeg", "-y"]
+    for clip in clip_paths:
+        cmd += ["-i", str(clip)]
+    chains = []
+    pads = []
+    for i in range(len(clip_paths)):
+        chains.append(
+            f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps:g},"
+            f"format=yuv420p[v{i}]"
+        )
+        pads.append(f"[v{i}]")
+        if has_video_audio:
+            chains.append(
+                f"[{i}:a]aresample={sample_rate},"
+                f"aformat=sample_fmts=fltp:channel_layouts=stereo[a{i}]"
+            )
+            pads.append(f"[a{i}]")
+    audio_out = "[clip_audio]" if has_video_audio else ""
+    chains.append(
+        f"{''.join(pads)}concat=n={len(clip_paths)}:v=1:a={int(has_video_audio)}"
+        f"[video_out]{audio_out}"
+    )
+    if music_path is not None:
+        cmd += ["-stream_loop", "-1", "-i", str(music_path)]
+        chains.append(str(music_filter))
+        cmd += ["-filter_complex", ";".join(chains)]
+        cmd += ["-map", "[video_out]", "-map", "[audio_out]", "-shortest"]
+    else:
+        cmd += ["-filter_complex", ";".join(chains), "-map", "[video_out]"]
+        cmd += ["-map", "[clip_audio]"] if has_video_audio else ["-an"]
+    cmd += [
+        "-c:v",
+        "libx264",
+        "-preset",
+        "ultrafast",
+        "-crf",
+        str(PROXY_CRF),
+        "-maxrate",
+        PROXY_MAX_BITRATE,
+        "-bufsize",
+        "2M",
+        "-pix_fmt",
+        "yuv420p",
+    ]
+    if music_path is not None or has_video_audio:
+        cmd += ["-c:a", "aac", "-b:a", PROXY_AUDIO_BITRATE]
+    # Put the index first so the webview can start playback before the download ends
+    return [*cmd, "-movflags", "+faststart", str(output_path)]
+
+
+def plan_proxy(
+    assembler: FFmpegAssembler,
+    clip_paths: list[Path],
+    output_path: Path,
+    music_path: Path | None = None,
+    music_volume: float = 0.4,
+    fade_duration: float = 2.0,
+) -> AssemblyStep:
+    """Probe the clips and build the proxy render step.
+
+    Returns:
+        Step writing a temp file then moving it to ``output_path``.
+
+    Raises:
+        FFmpegError: If the clips cannot be probed.
+    """
+    probe_cache = assembler._probe_cache
+    profile = choose_target_profile([probe_cache.probe(p) for p in clip_paths])
+    width, height = proxy_dimensions(profile.width, profile.height)
+    duration, has_audio = assembler._probe_clips(clip_paths)
+
+    music_filter = None
+    if music_path is not None:
+        gains = assembler._mix_gains(clip_paths, music_path, music_volume, has_audio)
+        music_filter = assembler._build_music_filter(
+            music_volume,
+            fade_duration,
+            max(0, duration - fade_duration),
+            has_audio,
+            gains,
+            video_audio="clip_audio",
+            music_input=f"{len(clip_paths)}:a",
+        )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output_path.with_name(f".{output_path.stem}.part{output_path.suffix}")
+    logger.info(
+        "Rendering %dx%d proxy of %d clips (%.1fs) to %s",
+        width,
+        height,
+        len(clip_paths),
+        duration,
+        output_path.name,
+    )
+    return AssemblyStep(
+        description="proxy render",
+        cmd=build_proxy_command(
+            clip_paths,
+            tmp,
+            width,
+            height,
+            profile.fps,
+            has_audio,
+            music_path,
+            music_filter,
+            sample_rate=profile.sample_rate,
+        ),
+        tmp=tmp,
+        target=output_path,
+        duration=duration,
+    )
@@ -0,0 +1,145 @@
+"""Asyncio FFmpeg runner with progress reporting.
+
+FFmpeg is started with ``-progress pipe:1`` so machine-readable progress
+blocks arrive on stdout while the event loop keeps running. Only a bounded
+tail of stderr is kept for error messages, and cancelling the awaiting task
+kills the FFmpeg process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sip_studio.assembler.ffmpeg import STDERR_TAIL_LINES, FFmpegError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FFmpegProgress:
+    """One ``-progress`` update from a running FFmpeg process."""
+
+    out_time: float
+    fps: float | None = None
+    speed: float | None = None
+    frame: int | None = None
+    total_duration: float | None = None
+    done: bool = False
+
+    @property
+    def percent(self) -> float | None:
+        """Completion percentage, if the expected output duration is known."""
+        if self.done:
+            return 100.0
+        if not self.total_duration:
+            return None
+        return max(0.0, min(100.0, self.out_time / self.total_duration * 100))
+
+
+ProgressCallback = Callable[[FFmpegProgress], None]
+
+
+def _num(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value.rstrip("x"))
+    except ValueError:
+        return None
+
+
+def parse_progress_block(fields: dict[str, str], total_duration: float | None) -> FFmpegProgress:
+    """Convert one block of ``key=value`` progress lines into an FFmpegProgress."""
+    # out_time_ms is also in microseconds (long-standing FFmpeg quirk)
+    micros = _num(fields.get("out_time_us")) or _num(fields.get("out_time_ms"))
+    frame = _num(fields.get("frame"))
+    return FFmpegProgress(
+        out_time=(micros or 0.0) / 1_000_000,
+        fps=_num(fields.get("fps")),
+        speed=_num(fields.get("speed")),
+        frame=int(frame) if frame is not None else None,
+        total_duration=total_duration,
+        done=fields.get("progress") == "end",
+    )
+
+
+def with_progress_args(cmd: list[str]) -> list[str]:
+    """Insert ``-progress pipe:1 -nostats`` right after the ffmpeg executable."""
+    return [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+
+
+async def run_ffmpeg(
+    cmd: list[str],
+    *,
+    description: str = "command",
+    total_duration: float | None = None,
+    on_progress: ProgressCallback | None = None,
+    stderr_tail_lines: int = STDERR_TAIL_LINES,
+) -> None:
+    """Run FFmpeg without blocking the event loop.
+
+    Args:
+        cmd: FFmpeg command (``cmd[0]`` is the executable).
+        description: What the command does, used in error messages.
+        total_duration: Expected output duration, used to compute percentages.
+        on_progress: Called for every progress block FFmpeg reports.
+        stderr_tail_lines: Number of trailing stderr lines kept for errors.
+
+    Raises:
+        FFmpegError: If FFmpeg cannot be started or exits with an error.
+        asyncio.CancelledError: If the awaiting task is cancelled. FFmpeg is killed
+            whenever this returns or raises before it exits.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *with_progress_args(cmd),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        raise FFmpegError(f"Could not start FFmpeg: {e}") from e
+
+    tail: deque[str] = deque(maxlen=stderr_tail_lines)
+
+    async def read_progress() -> None:
+        assert proc.stdout is not None
+        fields: dict[str, str] = {}
+        async for raw in proc.stdout:
+            key, sep, value = raw.decode(errors="replace").strip().partition("=")
+            if not sep:
+                continue
+            fields[key] = value
+            if key == "progress":
+                if on_progress is not None:
+                    try:
+                        on_progress(parse_progress_block(fields, total_duration))
+                    except Exception as e:
+                        logger.debug("FFmpeg progress callback failed: %s", e)
+                fields = {}
+
+    async def read_stderr() -> None:
+        assert proc.stderr is not None
+        async for raw in proc.stderr:
+            tail.append(raw.decode(errors="replace").rstrip())
+
+    try:
+        await asyncio.gather(read_progress(), read_stderr())
+        returncode = await proc.wait()
+    finally:
+        # Cancelled, or a reader or callback raised: never leave FFmpeg running
+        if proc.returncode is None:
+            logger.info("Stopping FFmpeg %s (pid %s)", description, proc.pid)
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+
+    if returncode != 0:
+        detail = "\n".join(tail) or f"exit code {returncode}"
+        raise FFmpegError(f"FFmpeg {description} failed: {detail}")
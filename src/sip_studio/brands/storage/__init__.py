@@ -80,6 +80,8 @@ __all__ = [
     "rename_document",
     "load_image_status_raw",
     "save_image_status",
+    "read_image_status_file",
+    "write_image_status_file",
     "get_assets_dir",
     "list_assets",
     "save_asset",
@@ -125,10 +127,12 @@ from .document_storage import (
     list_assets,
     list_documents,
     load_image_status_raw,
+    read_image_status_file,
     rename_document,
     save_asset,
     save_document,
     save_image_status,
+    write_image_status_file,
 )
 from .index import load_index, save_index
 from .product_storage import (
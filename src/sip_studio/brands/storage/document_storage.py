@@ -134,7 +134,13 @@ def load_image_status_raw(brand_slug: str) -> dict:
     """Load raw image status data from file (no migrations applied).
     Returns empty structure if file missing or invalid.
     """
-    fp = get_brand_dir(brand_slug) / IMAGE_STATUS_FILE
+    return read_image_status_file(get_brand_dir(brand_slug) / IMAGE_STATUS_FILE)
+
+
+def read_image_status_file(fp: Path) -> dict:
+    """Load raw image status data from a given status file (no migrations applied).
+    Returns empty structure if file missing or invalid.
+    """
     if not fp.exists():
         return {"version": 1, "images": {}}
     try:
@@ -155,13 +161,17 @@ def save_image_status(brand_slug: str, data: dict) -> None:
     """Atomically save image status data to file.
     Uses temp file + rename for atomicity.
     """
-    fp = get_brand_dir(brand_slug) / IMAGE_STATUS_FILE
+    write_image_status_file(get_brand_dir(brand_slug) / IMAGE_STATUS_FILE, data)
+    logger.debug("Saved image status for brand %s", brand_slug)
+
+
+def write_image_status_file(fp: Path, data: dict) -> None:
+    """Atomically save image status data to a given status file."""
     tmp = fp.with_suffix(".json.tmp")
     fp.parent.mkdir(parents=True, exist_ok=True)
     with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
     _os.replace(tmp, fp)
-    logger.debug("Saved image status for brand %s", brand_slug)
 
 
 def get_assets_dir(brand_slug: str) -> Path:
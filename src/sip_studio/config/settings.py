@@ -129,6 +129,25 @@ class Settings(BaseSettings):
         default=True,
         description="Enable measurement/proportion validation in retry loop",
     )
+    # Generated clip cache (content-addressed, ~/.sip-studio/cache/clips)
+    sip_clip_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse previously generated clips for identical provider requests",
+    )
+    sip_clip_cache_max_mb: int = Field(
+        default=2048,
+        ge=0,
+        description="Clip cache size budget in MB (least recently used clips evicted)",
+    )
+    # Image resolution policy (per-purpose image_size, upscale kept drafts to 4K)
+    sip_image_resolution_policy: Literal["adaptive", "max"] = Field(
+        default="adaptive",
+        description="adaptive: smaller sizes for references/drafts/attempts; max: always 4K",
+    )
+    sip_upscale_on_keep: bool = Field(
+        default=True,
+        description="Upscale draft-resolution images to 4K when they are kept",
+    )
     # Image generation pool settings
     use_image_pool: bool = Field(
         default=True,
@@ -137,6 +156,14 @@ class Settings(BaseSettings):
     image_pool_max_rpm: int = Field(
         default=15, ge=1, le=60, description="Max requests per minute for Gemini API"
     )
+    gemini_model_rpm: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-model requests per minute, for models with their own Gemini quota",
+    )
+    gemini_shared_rate_limit: bool = Field(
+        default=False,
+        description="Share the Gemini RPM budget across all local processes (app, CLI, workers)",
+    )
 
     @field_validator("sip_output_dir", mode="before")
     @classmethod
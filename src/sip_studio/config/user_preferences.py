@@ -47,6 +47,19 @@ class SoraPreferences(BaseModel):
     )
 
 
+class ProviderConcurrency(BaseModel):
+    """Concurrency limits learned for one video provider."""
+
+    max_concurrent: float = Field(
+        default=3.0,
+        description="Learned number of concurrent generations (fractional while adapting)",
+    )
+    inter_request_delay: float = Field(
+        default=2.0,
+        description="Learned delay in seconds between starting generation requests",
+    )
+
+
 class UserPreferences(BaseModel):
     """User preferences stored in ~/.sip-studio/config.json."""
 
@@ -66,6 +79,10 @@ class UserPreferences(BaseModel):
         default_factory=SoraPreferences,
         description="Sora-specific preferences",
     )
+    video_concurrency: dict[str, ProviderConcurrency] = Field(
+        default_factory=dict,
+        description="Adaptive concurrency limits learned per video provider",
+    )
 
     @classmethod
     def get_config_dir(cls) -> Path:
@@ -6,6 +6,11 @@ from sip_studio.generators.base import (
     ServiceAgentNotReadyError,
     VideoGenerationError,
     VideoProvider,
+    VideoRateLimitError,
+)
+from sip_studio.generators.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
 )
 from sip_studio.generators.factory import VideoGeneratorFactory
 from sip_studio.generators.image_generator import (
@@ -20,6 +25,7 @@ from sip_studio.generators.kling_generator import (
 from sip_studio.generators.music_generator import (
     MusicGenerationError,
     MusicGenerator,
+    select_music_candidate,
 )
 from sip_studio.generators.sora_generator import (
     SoraConfig,
@@ -40,7 +46,11 @@ __all__ = [
     "VideoGenerationError",
     "PromptSafetyError",
     "ServiceAgentNotReadyError",
+    "VideoRateLimitError",
     "VideoProvider",
+    # Adaptive concurrency
+    "AdaptiveConcurrencyLimiter",
+    "get_concurrency_limiter",
     # Factory
     "VideoGeneratorFactory",
     # VEO (Google Vertex AI)
@@ -61,4 +71,5 @@ __all__ = [
     # Music generation
     "MusicGenerationError",
     "MusicGenerator",
+    "select_music_candidate",
 ]
@@ -6,14 +6,19 @@ allowing different providers (VEO, Kling, etc.) to be used interchangeably.
 
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
 
 if TYPE_CHECKING:
+    from sip_studio.generators.concurrency import AdaptiveConcurrencyLimiter
     from sip_studio.models.assets import GeneratedAsset
     from sip_studio.models.script import SceneAction, VideoScript
 
+logger = logging.getLogger(__name__)
+
 
 class VideoProvider(str, Enum):
     """Supported video generation providers."""
@@ -41,6 +46,12 @@ class ServiceAgentNotReadyError(VideoGenerationError):
     pass
 
 
+class VideoRateLimitError(VideoGenerationError):
+    """Raised when the provider rejects a request due to rate limits or quota."""
+
+    pass
+
+
 class BaseVideoGenerator(ABC):
     """Abstract base class for video generators.
 
@@ -52,6 +63,7 @@ class BaseVideoGenerator(ABC):
     PROVIDER_NAME: str = "base"
     VALID_DURATIONS: list[int] = []
     MAX_REFERENCE_IMAGES: int = 0
+    MAX_CONCURRENT_LIMIT: int = 8  # Ceiling for adaptive concurrency
 
     @abstractmethod
     async def generate_video_clip(
@@ -92,7 +104,7 @@ class BaseVideoGenerator(ABC):
         script: VideoScript,
         output_dir: str,
         reference_images: list[GeneratedAsset] | None = None,
-        max_concurrent: int = 3,
+        max_concurrent: int | None = None,
         show_progress: bool = True,
     ) -> list[GeneratedAsset]:
         """Generate video clips for all scenes in the script.
@@ -101,7 +113,8 @@ class BaseVideoGenerator(ABC):
             script: The VideoScript containing all scenes.
             output_dir: Local directory to save generated videos.
             reference_images: Optional reference images for visual consistency.
-            max_concurrent: Maximum concurrent generations.
+            max_concurrent: Fixed concurrency limit. If None, the provider's
+                adaptive limiter picks (and learns) the limit.
             show_progress: Whether to show progress bar.
 
         Returns:
@@ -126,3 +139,83 @@ class BaseVideoGenerator(ABC):
 
         # Find the nearest valid duration
         return min(self.VALID_DURATIONS, key=lambda d: abs(d - requested_seconds))
+
+    def _get_concurrency_limiter(
+        self,
+        max_concurrent: int | None = None,
+        inter_request_delay: float | None = None,
+    ) -> AdaptiveConcurrencyLimiter:
+        """Get the limiter that paces generate_all_video_clips for this provider.
+
+        Args:
+            max_concurrent: Explicit concurrency limit. If None, the shared adaptive
+                limiter for this provider is used.
+            inter_request_delay: Delay between request starts when the limit is
+                pinned via max_concurrent.
+
+        Returns:
+            A fixed limiter when max_concurrent is given, else the adaptive one.
+        """
+        from sip_studio.generators.concurrency import (
+            AdaptiveConcurrencyLimiter,
+            get_concurrency_limiter,
+        )
+
+        if max_concurrent is not None:
+            return AdaptiveConcurrencyLimiter.fixed(
+                self.PROVIDER_NAME, max_concurrent, inter_request_delay or 0.0
+            )
+        return get_concurrency_limiter(self.PROVIDER_NAME, max_limit=self.MAX_CONCURRENT_LIMIT)
+
+    @staticmethod
+    def _persist_concurrency(limiter: AdaptiveConcurrencyLimiter) -> None:
+        """Save learned concurrency limits, logging (not raising) on failure."""
+        try:
+            limiter.persist()
+        except Exception as e:
+            logger.warning("Failed to save learned concurrency: %s", e)
+
+    def _clip_cache_key(
+        self,
+        model: str,
+        prompt: str,
+        reference_paths: Iterable[str | Path] = (),
+        params: dict[str, Any] | None = None,
+    ) -> str:
+        """Build the clip cache key for the exact request sent to the provider."""
+        from sip_studio.generators.clip_cache import ClipCache
+
+        return ClipCache.make_key(self.PROVIDER_NAME, model, prompt, reference_paths, params)
+
+    def _load_cached_clip(
+        self, cache_key: str, output_dir: str, scene_number: int
+    ) -> GeneratedAsset | None:
+        """Return a cached clip for this request, materialized in output_dir.
+
+        Args:
+            cache_key: Key from _clip_cache_key.
+            output_dir: Directory the clip would have been downloaded to.
+            scene_number: Scene number for the output filename.
+
+        Returns:
+            GeneratedAsset on a cache hit, None on a miss.
+        """
+        from sip_studio.generators.clip_cache import get_clip_cache
+        from sip_studio.models.assets import AssetType, GeneratedAsset
+
+        dest = Path(output_dir) / f"scene_{scene_number:03d}.mp4"
+        hit = get_clip_cache().get(cache_key, dest)
+        if hit is None:
+            return None
+        logger.info("Scene %d: reusing cached %s clip", scene_number, self.PROVIDER_NAME)
+        return GeneratedAsset(
+            asset_type=AssetType.VIDEO_CLIP,
+            scene_number=scene_number,
+            local_path=str(hit),
+        )
+
+    def _store_cached_clip(self, cache_key: str, local_path: str | Path) -> None:
+        """Store a freshly generated clip in the clip cache."""
+        from sip_studio.generators.clip_cache import get_clip_cache
+
+        get_clip_cache().put(cache_key, Path(local_path))
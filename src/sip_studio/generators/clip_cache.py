@@ -0,0 +1,248 @@
+"""Content-addressed cache for generated video clips.
+
+Clips are keyed by a hash of the exact provider request: final prompt text,
+reference image contents, provider parameters (duration, aspect ratio, mode...)
+and model. Re-running a script where only one scene changed returns every other
+scene from disk instead of paying for a new generation.
+
+Cached MP4s live in ``~/.sip-studio/cache/clips`` and are evicted least recently
+used first once the directory grows past the configured size budget. File
+mtimes double as the LRU clock: a hit touches the cached file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_clip_cache_dir() -> Path:
+    """Get the default clip cache directory."""
+    return Path.home() / ".sip-studio" / "cache" / "clips"
+
+
+# Reference image digests memoized on (path, mtime_ns, size)
+_digest_memo: dict[tuple[str, int, int], str] = {}
+_digest_lock = threading.Lock()
+
+
+def file_digest(path: str | Path) -> str:
+    """Get the SHA-256 digest of a file, memoized on path/mtime/size.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex digest, or an empty string if the file cannot be read.
+    """
+    p = Path(path)
+    try:
+        st = p.stat()
+    except OSError:
+        return ""
+    memo_key = (str(p), st.st_mtime_ns, st.st_size)
+    with _digest_lock:
+        cached = _digest_memo.get(memo_key)
+    if cached is not None:
+        return cached
+    h = hashlib.sha256()
+    try:
+        with open(p, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+    except OSError:
+        return ""
+    digest = h.hexdigest()
+    with _digest_lock:
+        _digest_memo[memo_key] = digest
+    return digest
+
+
+class ClipCache:
+    """Size-bounded LRU cache of generated clips keyed by request hash."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached clips. Defaults to ~/.sip-studio/cache/clips.
+            max_bytes: Size budget; least recently used clips are evicted beyond it.
+            enabled: If False, lookups always miss and stores are no-ops.
+        """
+        self.cache_dir = cache_dir or get_clip_cache_dir()
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        prompt: str,
+        reference_paths: Iterable[str | Path] = (),
+        params: dict[str, Any] | None = None,
+    ) -> str:
+        """Build the cache key for a provider request.
+
+        Args:
+            provider: Provider name (veo, kling, sora).
+            model: Model identifier sent to the provider.
+            prompt: Final prompt text sent to the provider.
+            reference_paths: Reference/start-frame images; hashed by content.
+            params: Remaining request parameters (duration, aspect ratio, ...).
+
+        Returns:
+            Hex SHA-256 key.
+        """
+        payload = {
+            "provider": provider,
+            "model": model,
+            "prompt": prompt,
+            "references": [file_digest(p) for p in reference_paths],
+            "params": params or {},
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.mp4"
+
+    def get(self, key: str, dest: Path) -> Path | None:
+        """Materialize a cached clip at ``dest`` if present.
+
+        Args:
+            key: Cache key from make_key.
+            dest: Where the clip should appear (e.g., output_dir/scene_001.mp4).
+
+        Returns:
+            ``dest`` on a hit, None on a miss.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entry_path(key)
+        if not entry.exists():
+            return None
+        try:
+            os.utime(entry)  # Mark as recently used
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(entry, dest)
+        except OSError as e:
+            logger.warning("Clip cache hit for %s but materialize failed: %s", key[:12], e)
+            return None
+        logger.info("Clip cache hit %s -> %s", key[:12], dest)
+        return dest
+
+    def put(self, key: str, src: Path) -> None:
+        """Store a freshly generated clip and evict old entries if over budget.
+
+        Args:
+            key: Cache key from make_key.
+            src: Generated clip to store.
+        """
+        if not self.enabled or not src.is_file():
+            return
+        entry = self._entry_path(key)
+        tmp = entry.with_suffix(".mp4.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.warning("Failed to store clip in cache: %s", e)
+            tmp.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Evict least recently used clips until the cache fits its budget.
+
+        Returns:
+            Number of clips removed.
+        """
+        with self._lock:
+            entries: list[tuple[float, int, Path]] = []
+            total = 0
+            for p in self.cache_dir.glob("*.mp4"):
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+                total += st.st_size
+            if total <= self.max_bytes:
+                return 0
+            entries.sort()
+            removed = 0
+            for _, size, p in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            logger.debug("Clip cache evicted %d entries", removed)
+            return removed
+
+    def clear(self) -> None:
+        """Remove all cached clips."""
+        with self._lock:
+            for p in self.cache_dir.glob("*.mp4"):
+                p.unlink(missing_ok=True)
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Hard-link ``src`` to ``dest`` (instant), falling back to a copy."""
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+# Singleton with factory for testing
+_clip_cache: ClipCache | None = None
+_clip_cache_lock = threading.Lock()
+
+
+def get_clip_cache(cache_dir: Path | None = None, _reset: bool = False) -> ClipCache:
+    """Get or create the global clip cache.
+
+    Size budget and enablement come from settings (``SIP_CLIP_CACHE_MAX_MB``,
+    ``SIP_CLIP_CACHE_ENABLED``) when available.
+
+    Args:
+        cache_dir: Override cache directory (used on creation only).
+        _reset: Force create new instance (for testing only).
+    """
+    global _clip_cache
+    with _clip_cache_lock:
+        if _clip_cache is None or _reset:
+            max_bytes, enabled = DEFAULT_MAX_BYTES, True
+            try:
+                from sip_studio.config.settings import get_settings
+
+                settings = get_settings()
+                max_bytes = settings.sip_clip_cache_max_mb * 1024 * 1024
+                enabled = settings.sip_clip_cache_enabled
+            except Exception:
+                pass  # Settings unavailable (e.g., missing API keys) - use defaults
+            _clip_cache = ClipCache(cache_dir=cache_dir, max_bytes=max_bytes, enabled=enabled)
+        return _clip_cache
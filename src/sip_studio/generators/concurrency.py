@@ -0,0 +1,349 @@
+"""Adaptive concurrency control for video generation providers.
+
+Video providers enforce per-account quotas, so a fixed ``max_concurrent`` is
+either too timid for generous accounts or trips rate limits on small ones.
+``AdaptiveConcurrencyLimiter`` applies AIMD (additive increase, multiplicative
+decrease): it starts from the last learned limit, grows while requests succeed
+with stable latency, and backs off when the provider reports 429s or quota
+exhaustion. Learned limits are persisted in ``UserPreferences`` so every run
+starts from where the previous one left off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from sip_studio.generators.base import VideoRateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Substrings that identify rate-limit / quota errors in provider messages
+_RATE_LIMIT_MARKERS = (
+    "429",
+    "rate limit",
+    "rate_limit",
+    "ratelimit",
+    "too many requests",
+    "quota",
+    "resource_exhausted",
+    "resource exhausted",
+)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Check whether an exception (or anything it wraps) signals rate limiting.
+
+    Generators wrap SDK errors in ``VideoGenerationError``, so the full
+    ``__cause__``/``__context__`` chain is inspected.
+
+    Args:
+        exc: The exception raised by a generation call.
+
+    Returns:
+        True if the provider rejected the request for rate/quota reasons.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, VideoRateLimitError):
+            return True
+        for attr in ("code", "status_code"):
+            if getattr(current, attr, None) == 429:
+                return True
+        response = getattr(current, "response", None)
+        if getattr(response, "status_code", None) == 429:
+            return True
+        message = str(current).lower()
+        if any(marker in message for marker in _RATE_LIMIT_MARKERS):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter shared by all generations for one provider.
+
+    The limiter owns two knobs: the number of in-flight requests and the
+    minimum spacing between request starts. Successes grow the limit by roughly
+    one slot per window of completed requests and shrink the spacing; rate-limit
+    errors halve the limit and double the spacing. Decreases are rate-limited by
+    a cooldown so a burst of 429s from one congestion event only backs off once.
+
+    Waiting is loop-agnostic (futures are resolved via ``call_soon_threadsafe``),
+    so one limiter can be shared across ``asyncio.run`` invocations.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        initial_limit: float = 3.0,
+        min_limit: int = 1,
+        max_limit: int = 8,
+        initial_interval: float = 2.0,
+        min_interval: float = 0.5,
+        max_interval: float = 60.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 30.0,
+        adaptive: bool = True,
+        time_fn: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            provider: Provider name used for logging and persistence.
+            initial_limit: Starting concurrency limit.
+            min_limit: Lowest limit the limiter will back off to.
+            max_limit: Highest limit the limiter will grow to.
+            initial_interval: Starting delay in seconds between request starts.
+            min_interval: Lowest delay between request starts.
+            max_interval: Highest delay between request starts.
+            decrease_factor: Multiplier applied to the limit on rate-limit errors.
+            latency_tolerance: Growth pauses while smoothed latency exceeds this
+                multiple of the best latency observed.
+            cooldown: Seconds after a decrease during which further rate-limit
+                errors are attributed to the same congestion event.
+            adaptive: If False, limit and interval stay fixed.
+            time_fn: Injectable clock (for testing).
+        """
+        self.provider = provider
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = min(max(float(initial_limit), self._min_limit), self._max_limit)
+        self._min_interval = min_interval
+        self._max_interval = max(min_interval, max_interval)
+        self._interval = min(max(initial_interval, min_interval), self._max_interval)
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._cooldown = cooldown
+        self._adaptive = adaptive
+        self._time_fn = time_fn
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+        self._next_start = 0.0
+        self._last_decrease: float | None = None
+        self._best_latency: float | None = None
+        self._avg_latency: float | None = None
+        self.successes = 0
+        self.rate_limited = 0
+
+    @classmethod
+    def fixed(cls, provider: str, limit: int, interval: float = 0.0) -> AdaptiveConcurrencyLimiter:
+        """Create a non-adaptive limiter pinned to an explicit limit and interval."""
+        return cls(
+            provider,
+            initial_limit=limit,
+            min_limit=limit,
+            max_limit=limit,
+            initial_interval=interval,
+            min_interval=interval,
+            max_interval=interval,
+            adaptive=False,
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self._min_limit, int(self._limit))
+
+    @property
+    def interval(self) -> float:
+        """Current minimum spacing in seconds between request starts."""
+        return self._interval
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a free slot, then wait out the start spacing."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[None] | None = None
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+            else:
+                fut = loop.create_future()
+                self._waiters.append((loop, fut))
+        if fut is not None:
+            try:
+                await fut
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, fut))
+                    except ValueError:
+                        # Slot was already handed to us; pass it on
+                        self._release_locked()
+                raise
+        # Reserve a start time so requests are spaced by the current interval
+        with self._lock:
+            now = self._time_fn()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self._interval
+        delay = start_at - now
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+
+    def release(self) -> None:
+        """Return a slot, waking the next waiter if capacity allows."""
+        with self._lock:
+            self._release_locked()
+
+    def _release_locked(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake_locked()
+
+    def _wake_locked(self) -> None:
+        """Hand free slots to waiters (caller holds the lock)."""
+        while self._waiters and self._in_flight < self.limit:
+            loop, fut = self._waiters.popleft()
+            if fut.done():
+                continue
+            self._in_flight += 1
+            loop.call_soon_threadsafe(_resolve, fut)
+
+    def record_success(self, latency: float) -> None:
+        """Additive increase after a successful request.
+
+        Args:
+            latency: Wall time in seconds the request took.
+        """
+        with self._lock:
+            self.successes += 1
+            if self._best_latency is None or latency < self._best_latency:
+                self._best_latency = latency
+            if self._avg_latency is None:
+                self._avg_latency = latency
+            else:
+                self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+            if not self._adaptive:
+                return
+            congested = self._avg_latency > self._best_latency * self._latency_tolerance
+            if not congested:
+                self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+            self._interval = max(self._min_interval, self._interval * 0.9)
+            self._wake_locked()
+
+    def record_rate_limited(self) -> None:
+        """Multiplicative decrease after a rate-limit or quota error."""
+        with self._lock:
+            self.rate_limited += 1
+            if not self._adaptive:
+                return
+            now = self._time_fn()
+            if self._last_decrease is not None and now - self._last_decrease < self._cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(float(self._min_limit), self._limit * self._decrease_factor)
+            self._interval = min(self._max_interval, max(self._interval, 0.5) * 2)
+            self._next_start = max(self._next_start, now + self._interval)
+        logger.warning(
+            "%s rate limited: concurrency limit now %d, start interval %.1fs",
+            self.provider,
+            self.limit,
+            self._interval,
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for one request and feed its outcome back into the limiter.
+
+        Normal exit counts as a success; exceptions that look like rate limiting
+        trigger a backoff. Other errors release the slot without adjusting limits.
+        """
+        await self.acquire()
+        started = self._time_fn()
+        try:
+            yield
+        except BaseException as e:
+            if isinstance(e, Exception) and is_rate_limit_error(e):
+                self.record_rate_limited()
+            raise
+        else:
+            self.record_success(self._time_fn() - started)
+        finally:
+            self.release()
+
+    def load(self) -> None:
+        """Seed limit and interval from learned values in UserPreferences."""
+        if not self._adaptive:
+            return
+        from sip_studio.config.user_preferences import UserPreferences
+
+        learned = UserPreferences.load().video_concurrency.get(self.provider)
+        if learned is None:
+            return
+        with self._lock:
+            self._limit = min(max(learned.max_concurrent, self._min_limit), self._max_limit)
+            self._interval = min(
+                max(learned.inter_request_delay, self._min_interval), self._max_interval
+            )
+        logger.debug(
+            "Loaded learned concurrency for %s: limit=%.2f interval=%.2fs",
+            self.provider,
+            self._limit,
+            self._interval,
+        )
+
+    def persist(self) -> None:
+        """Save the learned limit and interval to UserPreferences."""
+        if not self._adaptive:
+            return
+        from sip_studio.config.user_preferences import ProviderConcurrency, UserPreferences
+
+        prefs = UserPreferences.load()
+        prefs.video_concurrency[self.provider] = ProviderConcurrency(
+            max_concurrent=round(self._limit, 2),
+            inter_request_delay=round(self._interval, 2),
+        )
+        prefs.save()
+
+
+def _resolve(fut: asyncio.Future[None]) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+# Per-provider limiters shared across runs in this process
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(
+    provider: str,
+    max_limit: int = 8,
+    _reset: bool = False,
+) -> AdaptiveConcurrencyLimiter:
+    """Get or create the adaptive limiter for a provider.
+
+    The first call per provider seeds the limiter from learned preferences.
+
+    Args:
+        provider: Provider name (e.g., "veo", "kling", "sora").
+        max_limit: Upper bound on concurrency for this provider.
+        _reset: Force create new instance (for testing only).
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None or _reset:
+            limiter = AdaptiveConcurrencyLimiter(provider, max_limit=max_limit)
+            try:
+                limiter.load()
+            except Exception as e:
+                logger.warning("Failed to load learned concurrency for %s: %s", provider, e)
+            _limiters[provider] = limiter
+        return limiter
@@ -5,16 +5,22 @@ to create reference images for shared visual elements.
 """
 
 import asyncio
+import time
 from pathlib import Path
 
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from sip_studio.config.logging import get_logger
+from sip_studio.generators.resolution import ImagePurpose, resolve_image_size
 from sip_studio.models.assets import AssetType, GeneratedAsset
 from sip_studio.models.script import SharedElement
-from sip_studio.studio.services.rate_limiter import rate_limited_generate_content
+from sip_studio.studio.services.rate_limiter import (
+    get_rate_limiter,
+    rate_limited_generate_content,
+)
 
 logger = get_logger(__name__)
 
@@ -25,6 +31,15 @@ class ImageGenerationError(Exception):
     pass
 
 
+def _rejects_candidate_count(exc: BaseException) -> bool:
+    """Whether the API refused a request because of the candidate count itself."""
+    return (
+        isinstance(exc, genai_errors.ClientError)
+        and exc.code == 400
+        and "candidate" in str(exc).lower()
+    )
+
+
 class ImageGenerator:
     """Generates reference images using Google Gemini API.
 
@@ -45,6 +60,8 @@ class ImageGenerator:
         # for VEO video generation, but Gemini image gen works with API keys
         self.client = genai.Client(api_key=api_key, vertexai=False)
         self.model = model
+        # Whether the model returns several candidates per request (learned on first batch)
+        self._multi_candidate: bool | None = None
         logger.debug(f"Initialized ImageGenerator with model: {model}")
 
     @retry(
@@ -87,7 +104,7 @@ class ImageGenerator:
                     response_modalities=["IMAGE"],
                     image_config=types.ImageConfig(
                         aspect_ratio=aspect_ratio,
-                        image_size="4K",
+                        image_size=resolve_image_size(ImagePurpose.REFERENCE),
                     ),
                 ),
             )
@@ -283,7 +300,13 @@ class ImageGenerator:
         *,
         aspect_ratio: str | None = None,
     ) -> list[str]:
-        """Generate multiple variant images for a shared element in parallel.
+        """Generate multiple variant images for a shared element as one batch.
+        The prompt and config are built once for the whole batch. The first batch
+        asks for all variants as candidates of a single request; if the model only
+        returns one candidate or rejects the candidate count (a rate limit or timeout
+        does not count), that is remembered and the remaining variants are
+        pipelined as concurrent requests whose rate-limit tokens are reserved
+        together, so a batch never stalls half-way on the shared quota.
         Args:
             element: The SharedElement to generate images for.
             output_dir: Directory to save the generated images.
@@ -296,38 +319,95 @@ class ImageGenerator:
         ar = aspect_ratio or self._get_aspect_ratio_for_element(element)
         logger.info(f"Generating {num_variants} variants for: {element.name} ({element.id})")
         output_dir.mkdir(parents=True, exist_ok=True)
+        started = time.monotonic()
+        prompt = self._build_prompt(element)
+        image_config = types.ImageConfig(
+            aspect_ratio=ar, image_size=resolve_image_size(ImagePurpose.REFERENCE)
+        )
+        images: list = []
+        if num_variants > 1 and self._multi_candidate is not False:
+            try:
+                images = await asyncio.to_thread(
+                    self._request_images, prompt, image_config, num_variants
+                )
+            except Exception as e:
+                logger.debug(f"Multi-candidate request failed for {element.id}: {e}")
+                if _rejects_candidate_count(e):
+                    self._multi_candidate = False
+                    logger.debug(f"{self.model} rejects candidate_count, pipelining variants")
+            # Only a reply tells us whether candidates are honoured; after a rate
+            # limit, timeout or empty reply the next batch probes again
+            if self._multi_candidate is None and images:
+                self._multi_candidate = len(images) > 1
+                logger.debug(f"Multi-candidate support for {self.model}: {self._multi_candidate}")
+            images = images[:num_variants]
+        remaining = num_variants - len(images)
+        if remaining > 0:
+            images.extend(await self._request_images_pipelined(prompt, image_config, remaining))
+        paths: list[str] = []
+        for image in images:
+            path = output_dir / f"{element.id}_v{len(paths)}.png"
+            try:
+                await asyncio.to_thread(image.save, str(path))
+            except Exception as e:
+                logger.warning(f"Failed to save variant {len(paths)} for {element.id}: {e}")
+                continue
+            logger.debug(f"Saved variant {len(paths)} to: {path}")
+            paths.append(str(path))
+        elapsed = max(time.monotonic() - started, 1e-6)
+        logger.info(
+            f"Generated {len(paths)}/{num_variants} variants for {element.id} in {elapsed:.1f}s "
+            f"({len(paths) * 60 / elapsed:.1f} images/min)"
+        )
+        return paths
 
-        async def gen_variant(idx: int) -> str | None:
+    def _request_images(
+        self,
+        prompt: str,
+        image_config: types.ImageConfig,
+        candidate_count: int = 1,
+        reserved: bool = False,
+    ) -> list:
+        """Issue one rate-limited request and return every image it produced."""
+        config = types.GenerateContentConfig(
+            response_modalities=["IMAGE"],
+            image_config=image_config,
+            candidate_count=candidate_count if candidate_count > 1 else None,
+        )
+        response = rate_limited_generate_content(
+            self.client, self.model, prompt, config, reserved=reserved
+        )
+        images = []
+        for candidate in getattr(response, "candidates", None) or []:
+            content = getattr(candidate, "content", None)
+            for part in getattr(content, "parts", None) or []:
+                if part.inline_data:
+                    image = part.as_image()
+                    if image:
+                        images.append(image)
+        return images
+
+    async def _request_images_pipelined(
+        self, prompt: str, image_config: types.ImageConfig, count: int
+    ) -> list:
+        """Run ``count`` single-image requests concurrently under one token reservation."""
+        limiter = get_rate_limiter()
+        tokens = min(count, limiter.capacity(self.model))
+        if not await asyncio.to_thread(limiter.acquire, 60.0, tokens, model=self.model):
+            logger.warning(f"Rate limiter timeout reserving {tokens} variant requests")
+            return []
+
+        async def one(idx: int) -> list:
             try:
-                prompt = self._build_prompt(element)
-                response = rate_limited_generate_content(
-                    self.client,
-                    self.model,
-                    prompt,
-                    types.GenerateContentConfig(
-                        response_modalities=["IMAGE"],
-                        image_config=types.ImageConfig(aspect_ratio=ar, image_size="4K"),
-                    ),
+                return await asyncio.to_thread(
+                    self._request_images, prompt, image_config, 1, idx < tokens
                 )
-                if response.parts:
-                    for part in response.parts:
-                        if part.inline_data:
-                            image = part.as_image()
-                            if image:
-                                path = output_dir / f"{element.id}_v{idx}.png"
-                                image.save(str(path))
-                                logger.debug(f"Saved variant {idx} to: {path}")
-                                return str(path)
-                return None
             except Exception as e:
-                logger.warning(f"Failed to generate variant {idx} for {element.id}: {e}")
-                return None
+                logger.warning(f"Failed to generate variant {idx}: {e}")
+                return []
 
-        tasks = [gen_variant(i) for i in range(num_variants)]
-        results = await asyncio.gather(*tasks)
-        paths = [p for p in results if p]
-        logger.info(f"Generated {len(paths)}/{num_variants} variants for {element.id}")
-        return paths
+        results = await asyncio.gather(*(one(i) for i in range(count)))
+        return [img for batch in results for img in batch[:1]]
 
     def _get_aspect_ratio_for_element(self, element: SharedElement) -> str:
         """Determine the best aspect ratio for an element type.
@@ -21,6 +21,7 @@ from sip_studio.generators.base import (
     BaseVideoGenerator,
     PromptSafetyError,
     VideoGenerationError,
+    VideoRateLimitError,
 )
 from sip_studio.generators.prompt_builder import (
     DEFAULT_MAX_PROMPT_CHARS,
@@ -86,6 +87,7 @@ class KlingVideoGenerator(BaseVideoGenerator):
     API_BASE_URL = "https://api.klingai.com/v1"
     POLL_INTERVAL_SECONDS = 10
     MAX_POLL_TIME_SECONDS = 600  # 10 minutes max wait per video
+    MAX_CONCURRENT_LIMIT = 5  # Kling account limit is typically 5
 
     def __init__(
         self,
@@ -220,6 +222,12 @@ class KlingVideoGenerator(BaseVideoGenerator):
             aspect_ratio=final_aspect_ratio,
         )
 
+        # Reuse a previous clip if this exact request was generated before
+        cache_key = self._clip_cache_key(payload["model_name"], prompt, (), payload)
+        cached = self._load_cached_clip(cache_key, output_dir, scene.scene_number)
+        if cached:
+            return cached
+
         # Submit generation request to v1 API
         client = await self._get_client()
         response = await client.post(
@@ -248,6 +256,7 @@ class KlingVideoGenerator(BaseVideoGenerator):
 
         # Download video from CDN
         local_path = await self._download_video(video_url, output_dir, scene.scene_number)
+        self._store_cached_clip(cache_key, local_path)
 
         return GeneratedAsset(
             asset_type=AssetType.VIDEO_CLIP,
@@ -452,8 +461,14 @@ class KlingVideoGenerator(BaseVideoGenerator):
 
         Raises:
             PromptSafetyError: If the prompt was rejected for safety reasons.
+            VideoRateLimitError: If the request was rejected for rate/quota reasons.
             VideoGenerationError: For other errors.
         """
+        if response.status_code == 429:
+            raise VideoRateLimitError(
+                f"Kling rate limit hit for scene {scene_number}: {response.text}"
+            )
+
         try:
             error_text = response.text
             try:
@@ -568,7 +583,7 @@ class KlingVideoGenerator(BaseVideoGenerator):
         script: VideoScript,
         output_dir: str,
         reference_images: list[GeneratedAsset] | None = None,
-        max_concurrent: int = 3,
+        max_concurrent: int | None = None,
         show_progress: bool = True,
     ) -> list[GeneratedAsset]:
         """Generate video clips for all scenes in the script.
@@ -577,7 +592,8 @@ class KlingVideoGenerator(BaseVideoGenerator):
             script: The VideoScript containing all scenes.
             output_dir: Local directory to save videos.
             reference_images: Optional reference images (not used - Kling requires public URLs).
-            max_concurrent: Maximum concurrent generations (Kling limit is typically 5).
+            max_concurrent: Fixed concurrency limit. If None, the adaptive limiter
+                learns the limit (capped at Kling's typical limit of 5).
             show_progress: Whether to show progress bar.
 
         Returns:
@@ -591,17 +607,17 @@ class KlingVideoGenerator(BaseVideoGenerator):
         # Build scene-to-reference-image mapping
         scene_refs = self._build_scene_reference_map(script, reference_images)
 
-        # Semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Adaptive limiter paces requests and backs off on rate limits
+        limiter = self._get_concurrency_limiter(max_concurrent)
 
         async def generate_with_semaphore(
             scene: SceneAction,
             task_id: TaskID | None,
             progress: Progress | None,
         ) -> GeneratedAsset | None:
-            async with semaphore:
-                try:
-                    refs = scene_refs.get(scene.scene_number, [])
+            try:
+                refs = scene_refs.get(scene.scene_number, [])
+                async with limiter.slot():
                     asset = await self.generate_video_clip(
                         scene=scene,
                         output_dir=output_dir,
@@ -609,16 +625,16 @@ class KlingVideoGenerator(BaseVideoGenerator):
                         total_scenes=total_scenes,
                         script=script,
                     )
-                    if progress and task_id is not None:
-                        progress.update(task_id, advance=1)
-                    return asset
+                if progress and task_id is not None:
+                    progress.update(task_id, advance=1)
+                return asset
 
-                except Exception as e:
-                    logger.error("Failed to generate video for scene %d: %s", scene.scene_number, e)
-                    failed_scenes.append(scene.scene_number)
-                    if progress and task_id is not None:
-                        progress.update(task_id, advance=1)
-                    return None
+            except Exception as e:
+                logger.error("Failed to generate video for scene %d: %s", scene.scene_number, e)
+                failed_scenes.append(scene.scene_number)
+                if progress and task_id is not None:
+                    progress.update(task_id, advance=1)
+                return None
 
         if show_progress:
             with Progress(
@@ -640,6 +656,8 @@ class KlingVideoGenerator(BaseVideoGenerator):
             tasks = [generate_with_semaphore(scene, None, None) for scene in scenes]
             generated = await asyncio.gather(*tasks)
 
+        self._persist_concurrency(limiter)
+
         # Filter out None results (failed generations)
         results = [asset for asset in generated if asset is not None]
 
@@ -2,22 +2,38 @@
 
 This module provides music generation functionality using Google's Lyria 2 model
 to create background music tracks for videos.
+
+Requests go through a shared ``httpx.AsyncClient`` so they never block the event
+loop (concurrent clip polling keeps running), and the base64 WAV payload is
+decoded incrementally straight to disk instead of being held in memory.
 """
 
+from __future__ import annotations
+
+import asyncio
 import base64
+import json
+import random
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 import google.auth
 import google.auth.transport.requests
-import requests
+import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from sip_studio.config.constants import Timeouts
+from sip_studio.config.constants import Limits, Timeouts
 from sip_studio.config.logging import get_logger
 from sip_studio.models.music import GeneratedMusic, MusicBrief
 
+if TYPE_CHECKING:
+    from sip_studio.assembler.loudness import LoudnessCache
+
 logger = get_logger(__name__)
 
+_AUDIO_FIELD = "bytesBase64Encoded"
+
 
 class MusicGenerationError(Exception):
     """Raised when music generation fails."""
@@ -25,6 +41,90 @@ class MusicGenerationError(Exception):
     pass
 
 
+class _Base64FieldWriter:
+    """Streams one base64 string field out of a JSON document into a file.
+
+    Bytes outside the field are kept as a small "skeleton" document (the field
+    value replaced by an empty string) so the rest of the response can still be
+    parsed with ``json.loads`` once the stream ends.
+    """
+
+    def __init__(self, key: str, out: BinaryIO):
+        self._needle = f'"{key}"'.encode()
+        self._out = out
+        self._state = "search"  # search -> open -> value -> done
+        self._pending = b""
+        self._b64_rem = b""
+        self.skeleton = bytearray()
+        self.found = False
+        self.bytes_written = 0
+
+    def feed(self, data: bytes) -> None:
+        """Consume the next chunk of the response body."""
+        buf = self._pending + data
+        self._pending = b""
+        while buf:
+            if self._state == "search":
+                idx = buf.find(self._needle)
+                if idx < 0:
+                    # Keep a tail in case the key is split across chunks
+                    keep = min(len(buf), len(self._needle) - 1)
+                    self.skeleton += buf[: len(buf) - keep]
+                    self._pending = buf[len(buf) - keep :]
+                    return
+                end = idx + len(self._needle)
+                self.skeleton += buf[:end]
+                buf = buf[end:]
+                self._state = "open"
+            elif self._state == "open":
+                idx = buf.find(b'"')
+                if idx < 0:
+                    self.skeleton += buf
+                    return
+                self.skeleton += buf[: idx + 1]
+                buf = buf[idx + 1 :]
+                self._state = "value"
+                self.found = True
+            elif self._state == "value":
+                end = buf.find(b'"')
+                chunk = buf if end < 0 else buf[:end]
+                # JSON may escape "/" as "\/"; base64 never contains backslashes
+                self._decode(chunk.replace(b"\\", b""), final=end >= 0)
+                if end < 0:
+                    return
+                self.skeleton += b'"'
+                buf = buf[end + 1 :]
+                self._state = "done"
+            else:
+                self.skeleton += buf
+                return
+
+    def _decode(self, chunk: bytes, final: bool) -> None:
+        data = self._b64_rem + chunk
+        usable = len(data) if final else len(data) - len(data) % 4
+        if usable:
+            decoded = base64.b64decode(data[:usable])
+            self._out.write(decoded)
+            self.bytes_written += len(decoded)
+        self._b64_rem = data[usable:]
+
+    def close(self) -> dict[str, Any]:
+        """Finish the stream and return the parsed response without the audio field.
+
+        Raises:
+            MusicGenerationError: If the response was truncated or not valid JSON.
+        """
+        if self._state in ("open", "value"):
+            raise MusicGenerationError("Lyria 2 response ended inside the audio payload.")
+        self.skeleton += self._pending
+        self._pending = b""
+        try:
+            result = json.loads(bytes(self.skeleton))
+        except json.JSONDecodeError as e:
+            raise MusicGenerationError(f"Invalid JSON in Lyria 2 response: {e}") from e
+        return result if isinstance(result, dict) else {}
+
+
 class MusicGenerator:
     """Generates background music using Google Vertex AI Lyria 2.
 
@@ -35,12 +135,18 @@ class MusicGenerator:
     # Lyria 2 generates approximately 30-second clips
     LYRIA_DURATION_SECONDS = 30.0
 
-    def __init__(self, project_id: str, location: str = "us-central1"):
+    def __init__(
+        self,
+        project_id: str,
+        location: str = "us-central1",
+        client: httpx.AsyncClient | None = None,
+    ):
         """Initialize the music generator.
 
         Args:
             project_id: Google Cloud Project ID.
             location: Google Cloud region for Vertex AI. Defaults to us-central1.
+            client: Optional HTTP client to reuse. Created lazily if not provided.
         """
         self.project_id = project_id
         self.location = location
@@ -49,11 +155,30 @@ class MusicGenerator:
             f"projects/{project_id}/locations/{location}/"
             f"publishers/google/models/lyria-002:predict"
         )
+        self._client = client
+        self._credentials: Any = None
+        self._auth_lock = threading.Lock()
         logger.debug(f"Initialized MusicGenerator with project: {project_id}")
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(Timeouts.MUSIC_GENERATION, connect=30.0)
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
     def _get_auth_headers(self) -> dict[str, str]:
         """Get authentication headers using Application Default Credentials.
 
+        Credentials are cached on the instance and only refreshed when expired.
+
         Returns:
             Dictionary with Authorization and Content-Type headers.
 
@@ -61,19 +186,29 @@ class MusicGenerator:
             MusicGenerationError: If authentication fails.
         """
         try:
-            # Specify scopes required for Vertex AI
-            scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-            creds, _ = google.auth.default(scopes=scopes)
-            auth_req = google.auth.transport.requests.Request()
-            creds.refresh(auth_req)
-            return {
-                "Authorization": f"Bearer {creds.token}",
-                "Content-Type": "application/json",
-            }
+            with self._auth_lock:
+                if self._credentials is None:
+                    # Specify scopes required for Vertex AI
+                    scopes = ["https://www.googleapis.com/auth/cloud-platform"]
+                    self._credentials, _ = google.auth.default(scopes=scopes)
+                if not self._credentials.valid:
+                    auth_req = google.auth.transport.requests.Request()
+                    self._credentials.refresh(auth_req)
+                return {
+                    "Authorization": f"Bearer {self._credentials.token}",
+                    "Content-Type": "application/json",
+                }
         except Exception as e:
             logger.error(f"Failed to get authentication credentials: {e}")
             raise MusicGenerationError(f"Authentication failed: {e}") from e
 
+    async def _get_auth_headers_async(self) -> dict[str, str]:
+        """Get auth headers without blocking the event loop on token refresh."""
+        creds = self._credentials
+        if creds is not None and creds.valid:
+            return self._get_auth_headers()
+        return await asyncio.to_thread(self._get_auth_headers)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=60),
@@ -84,6 +219,7 @@ class MusicGenerator:
         brief: MusicBrief,
         output_dir: Path,
         seed: int | None = None,
+        filename: str = "background_music.wav",
     ) -> GeneratedMusic:
         """Generate music from a MusicBrief.
 
@@ -91,6 +227,7 @@ class MusicGenerator:
             brief: The MusicBrief containing generation parameters.
             output_dir: Directory to save the generated audio file.
             seed: Optional seed for reproducible generation.
+            filename: Name of the WAV file to write in output_dir.
 
         Returns:
             GeneratedMusic with the local path to the saved WAV file.
@@ -113,16 +250,25 @@ class MusicGenerator:
             "parameters": {},
         }
 
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / filename
+        part_path = output_path.with_suffix(output_path.suffix + ".part")
+
         try:
-            headers = self._get_auth_headers()
-            response = requests.post(
-                self.endpoint,
-                headers=headers,
-                json=request_body,
-                timeout=Timeouts.MUSIC_GENERATION,  # Music generation can take time
-            )
-            response.raise_for_status()
-            result = response.json()
+            headers = await self._get_auth_headers_async()
+            client = await self._get_client()
+            async with client.stream(
+                "POST", self.endpoint, headers=headers, json=request_body
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                # Decode the base64 audio straight to disk as it arrives
+                with open(part_path, "wb") as f:
+                    writer = _Base64FieldWriter(_AUDIO_FIELD, f)
+                    async for chunk in response.aiter_bytes(Limits.CHUNK_SIZE_DOWNLOAD):
+                        writer.feed(chunk)
+                    result = writer.close()
 
             # Extract audio from response
             predictions = result.get("predictions", [])
@@ -131,21 +277,14 @@ class MusicGenerator:
                     "No predictions returned from Lyria 2. The response was empty."
                 )
 
-            # Get the first prediction's audio content
-            prediction = predictions[0]
-            audio_b64 = prediction.get("bytesBase64Encoded")
-            if not audio_b64:
+            # Audio was streamed from the first prediction's bytesBase64Encoded field
+            if not writer.found or writer.bytes_written == 0:
                 raise MusicGenerationError(
                     "No audio content in Lyria 2 response. "
                     "The prediction did not contain bytesBase64Encoded data."
                 )
 
-            # Decode and save audio
-            audio_bytes = base64.b64decode(audio_b64)
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_path = output_dir / "background_music.wav"
-            output_path.write_bytes(audio_bytes)
-
+            part_path.replace(output_path)
             logger.info(f"Saved background music to: {output_path}")
 
             return GeneratedMusic(
@@ -155,8 +294,8 @@ class MusicGenerator:
                 brief=brief,
             )
 
-        except requests.exceptions.HTTPError as e:
-            error_detail = ""
+        except httpx.HTTPStatusError as e:
+            error_detail: Any = ""
             try:
                 error_detail = e.response.json()
             except Exception:
@@ -165,9 +304,108 @@ class MusicGenerator:
             raise MusicGenerationError(
                 f"Lyria 2 API request failed: {e}. Details: {error_detail}"
             ) from e
-        except requests.exceptions.RequestException as e:
+        except httpx.RequestError as e:
             logger.error(f"Network error during music generation: {e}")
             raise MusicGenerationError(f"Network error: {e}") from e
+        except MusicGenerationError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error during music generation: {e}")
             raise MusicGenerationError(f"Music generation failed: {e}") from e
+        finally:
+            part_path.unlink(missing_ok=True)
+
+    async def generate_candidates(
+        self,
+        brief: MusicBrief,
+        output_dir: Path,
+        num_candidates: int = 3,
+        seeds: list[int] | None = None,
+    ) -> list[GeneratedMusic]:
+        """Generate several candidate tracks concurrently with different seeds.
+
+        All candidates share one HTTP connection pool and run in parallel, so
+        "best of N" costs roughly the wall time of a single generation. Pick
+        the one to use with ``select_music_candidate``.
+
+        Args:
+            brief: The MusicBrief containing generation parameters.
+            output_dir: Directory to save the generated audio files.
+            num_candidates: Number of candidates when seeds are not given.
+            seeds: Explicit seeds, one per candidate.
+
+        Returns:
+            Successfully generated candidates, in seed order.
+
+        Raises:
+            MusicGenerationError: If every candidate fails.
+        """
+        if seeds is None:
+            seeds = [random.randint(0, 2**31 - 1) for _ in range(max(1, num_candidates))]
+
+        results = await asyncio.gather(
+            *(
+                self.generate(brief, output_dir, seed=s, filename=f"background_music_{s}.wav")
+                for s in seeds
+            ),
+            return_exceptions=True,
+        )
+        candidates: list[GeneratedMusic] = []
+        errors: list[BaseException] = []
+        for r in results:
+            if isinstance(r, GeneratedMusic):
+                candidates.append(r)
+            elif isinstance(r, BaseException):
+                errors.append(r)
+        if not candidates:
+            raise MusicGenerationError(
+                f"All {len(seeds)} music candidates failed: {errors[0] if errors else 'unknown'}"
+            )
+        if errors:
+            logger.warning(f"{len(errors)}/{len(seeds)} music candidates failed")
+        return candidates
+
+
+def select_music_candidate(
+    candidates: list[GeneratedMusic], loudness_cache: LoudnessCache | None = None
+) -> GeneratedMusic:
+    """Pick the candidate that works best as a background bed.
+
+    Each track is measured with EBU R128 (cached, so the mix reuses the
+    measurement). Silent takes are skipped and the one with the smallest
+    loudness range wins: a steady track sits evenly under the clips' audio
+    instead of swelling over speech. Falls back to the first candidate when
+    the analysis is unavailable.
+
+    Args:
+        candidates: Generated tracks, e.g. from ``generate_candidates``.
+        loudness_cache: Cache to measure with (defaults to the global one).
+
+    Returns:
+        The chosen candidate.
+
+    Raises:
+        ValueError: If there are no candidates.
+    """
+    if not candidates:
+        raise ValueError("No music candidates to choose from")
+    if len(candidates) == 1:
+        return candidates[0]
+    from sip_studio.assembler.ffmpeg import FFmpegError
+    from sip_studio.assembler.loudness import get_loudness_cache
+
+    cache = loudness_cache or get_loudness_cache()
+    try:
+        measurements = cache.measure_many([Path(c.file_path) for c in candidates])
+    except (FFmpegError, OSError) as e:
+        logger.warning(f"Could not analyse music candidates, using the first: {e}")
+        return candidates[0]
+    audible = [(m, c) for m, c in zip(measurements, candidates) if not m.is_silent]
+    if not audible:
+        return candidates[0]
+    best, chosen = min(audible, key=lambda pair: pair[0].loudness_range)
+    logger.info(
+        f"Selected music candidate {Path(chosen.file_path).name} "
+        f"(LRA {best.loudness_range:.1f} LU, {best.integrated:.1f} LUFS)"
+    )
+    return chosen
@@ -0,0 +1,209 @@
+"""Resolution policy for Gemini image generation.
+
+Generating at 4K costs latency, transfer and PNG encoding time, which is wasted
+on intermediate artifacts: reference images only feed VEO (which downsamples
+them), validation attempts are mostly discarded, and workstation drafts are
+often trashed. The policy picks an ``image_size`` per purpose and only pays for
+4K when an image is actually kept, via ``upscale_image``. That writes a separate
+high-resolution variant (see ``hires_variant_path``) and never touches the image
+the user kept; readers serve the variant through ``deliverable_path``.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from sip_studio.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+UPSCALE_MODEL = "gemini-3-pro-image-preview"
+# Hidden subfolder (skipped by asset listings) holding final-resolution variants
+HIRES_DIR = ".hires"
+# Approximate long edge in pixels for each Gemini image_size
+_LONG_EDGE = {"1K": 1024, "2K": 2048, "4K": 4096}
+_SUPPORTED_RATIOS = ("1:1", "2:3", "3:2", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9")
+_UPSCALE_PROMPT = (
+    "Re-render this exact image at higher resolution. Preserve the composition, "
+    "subjects, text, colors and lighting exactly; only add fine detail and sharpness. "
+    "Do not add, remove or move anything."
+)
+
+
+class ImagePurpose(str, Enum):
+    """Why an image is being generated."""
+
+    REFERENCE = "reference"  # Intermediate reference for video generation
+    DRAFT = "draft"  # Workstation output the user has not kept yet
+    VALIDATION_ATTEMPT = "validation_attempt"  # Attempt inside a validation retry loop
+    FINAL = "final"  # Deliverable the user kept
+
+
+@dataclass(frozen=True)
+class ResolutionPolicy:
+    """Image size per purpose, plus whether kept drafts are upscaled."""
+
+    reference: str = "1K"
+    draft: str = "2K"
+    validation_attempt: str = "1K"
+    final: str = "4K"
+    upscale_on_keep: bool = True
+
+    @classmethod
+    def max_quality(cls) -> ResolutionPolicy:
+        """Policy that generates everything at 4K (no upscale needed)."""
+        return cls(
+            reference="4K",
+            draft="4K",
+            validation_attempt="4K",
+            final="4K",
+            upscale_on_keep=False,
+        )
+
+    def image_size(self, purpose: ImagePurpose) -> str:
+        """Get the Gemini ``image_size`` for a purpose."""
+        return str(getattr(self, purpose.value))
+
+    def needs_upscale(self, image_size: str | None) -> bool:
+        """Check whether an image generated at ``image_size`` should be upscaled on keep."""
+        if not self.upscale_on_keep or not image_size:
+            return False
+        return _LONG_EDGE.get(image_size, 0) < _LONG_EDGE.get(self.final, 0)
+
+
+def get_resolution_policy() -> ResolutionPolicy:
+    """Get the active policy from settings (``SIP_IMAGE_RESOLUTION_POLICY``).
+
+    Falls back to the adaptive defaults when settings are unavailable.
+    """
+    try:
+        from sip_studio.config.settings import get_settings
+
+        settings = get_settings()
+        if settings.sip_image_resolution_policy == "max":
+            return ResolutionPolicy.max_quality()
+        return ResolutionPolicy(upscale_on_keep=settings.sip_upscale_on_keep)
+    except Exception:
+        return ResolutionPolicy()
+
+
+def resolve_image_size(purpose: ImagePurpose) -> str:
+    """Get the ``image_size`` to request for a purpose under the active policy."""
+    return get_resolution_policy().image_size(purpose)
+
+
+def _nearest_aspect_ratio(width: int, height: int) -> str:
+    """Pick the supported Gemini aspect ratio closest to the image dimensions."""
+    target = width / height if height else 1.0
+
+    def ratio(r: str) -> float:
+        w, h = r.split(":")
+        return int(w) / int(h)
+
+    return min(_SUPPORTED_RATIOS, key=lambda r: abs(ratio(r) - target))
+
+
+def hires_variant_path(image_path: str | Path) -> Path:
+    """Get where the final-resolution variant of an image is stored."""
+    path = Path(image_path)
+    return path.parent / HIRES_DIR / path.name
+
+
+def deliverable_path(image_path: str | Path) -> Path:
+    """Get the file to serve for an image: its variant if one is current, else the image.
+
+    A variant older than the image belongs to content that has since been
+    replaced (e.g. a kept quick edit) and is ignored.
+    """
+    path = Path(image_path)
+    variant = hires_variant_path(path)
+    try:
+        if variant.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return variant
+    except OSError:
+        pass
+    return path
+
+
+def upscale_image(
+    image_path: str | Path,
+    *,
+    output_path: str | Path | None = None,
+    client: Any = None,
+    aspect_ratio: str | None = None,
+    target_size: str | None = None,
+    model: str = UPSCALE_MODEL,
+) -> Path | None:
+    """Render a final-resolution variant of a kept image.
+
+    The model re-renders the image, so the variant can differ in fine detail;
+    it is written to ``output_path`` and the source image is never modified.
+    Images already at (or near) the target resolution are skipped.
+
+    Args:
+        image_path: Image to upscale.
+        output_path: Where to write the variant. Defaults to ``hires_variant_path``.
+        client: Gemini client. Defaults to the shared client.
+        aspect_ratio: Aspect ratio to request. Inferred from the image if omitted.
+        target_size: Gemini image_size to request. Defaults to the policy's final size.
+        model: Gemini image model.
+
+    Returns:
+        Path of the variant, or None if no upscale was needed.
+
+    Raises:
+        ValueError: If the response contained no image.
+    """
+    from google.genai import types
+    from PIL import Image as PILImage
+
+    from sip_studio.studio.services.rate_limiter import (
+        RequestPriority,
+        rate_limited_generate_content,
+    )
+
+    path = Path(image_path)
+    target_size = target_size or get_resolution_policy().final
+    source = PILImage.open(io.BytesIO(path.read_bytes()))
+    width, height = source.size
+    if max(width, height) >= _LONG_EDGE.get(target_size, 0) * 0.9:
+        logger.debug(f"Skipping upscale of {path.name}: already {width}x{height}")
+        return None
+    if client is None:
+        from sip_studio.studio.services.gemini_client import get_gemini_client
+
+        client = get_gemini_client()
+    response = rate_limited_generate_content(
+        client,
+        model,
+        [_UPSCALE_PROMPT, source],
+        types.GenerateContentConfig(
+            response_modalities=["IMAGE"],
+            image_config=types.ImageConfig(
+                aspect_ratio=aspect_ratio or _nearest_aspect_ratio(width, height),
+                image_size=target_size,
+            ),
+        ),
+        # Nobody is waiting on it: yield to chat and batch generation
+        priority=RequestPriority.BACKGROUND,
+    )
+    for part in response.parts or []:
+        if part.inline_data:
+            image = part.as_image()
+            if image:
+                out = Path(output_path) if output_path else hires_variant_path(path)
+                out.parent.mkdir(parents=True, exist_ok=True)
+                tmp = out.with_name(f".{out.stem}.upscale{out.suffix}")
+                try:
+                    image.save(str(tmp))
+                    os.replace(tmp, out)
+                finally:
+                    tmp.unlink(missing_ok=True)
+                logger.info(f"Upscaled {path.name} from {width}x{height} to {target_size}")
+                return out
+    raise ValueError(f"No image returned when upscaling {path.name}")
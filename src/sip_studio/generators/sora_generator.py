@@ -27,6 +27,7 @@ from sip_studio.generators.base import (
     BaseVideoGenerator,
     PromptSafetyError,
     VideoGenerationError,
+    VideoRateLimitError,
 )
 from sip_studio.generators.prompt_builder import (
     DEFAULT_MAX_PROMPT_CHARS,
@@ -210,6 +211,14 @@ class SoraVideoGenerator(BaseVideoGenerator):
             size,
         )
 
+        # Reuse a previous clip if this exact request was generated before
+        cache_key = self._clip_cache_key(
+            self.config.model, prompt, (), {"seconds": duration, "size": size}
+        )
+        cached = self._load_cached_clip(cache_key, output_dir, scene.scene_number)
+        if cached:
+            return cached
+
         client = await self._get_client()
 
         try:
@@ -233,6 +242,7 @@ class SoraVideoGenerator(BaseVideoGenerator):
             local_path = await self._download_video_by_id(
                 client, video.id, output_dir, scene.scene_number
             )
+            self._store_cached_clip(cache_key, local_path)
 
             return GeneratedAsset(
                 asset_type=AssetType.VIDEO_CLIP,
@@ -244,6 +254,12 @@ class SoraVideoGenerator(BaseVideoGenerator):
         except Exception as e:
             error_msg = str(e).lower()
 
+            # Rate limits / quota exhaustion - surface so the limiter can back off
+            if getattr(e, "status_code", None) == 429:
+                raise VideoRateLimitError(
+                    f"Sora rate limit hit for scene {scene.scene_number}: {e}"
+                ) from e
+
             # Check for safety/policy violations
             if any(
                 term in error_msg
@@ -380,7 +396,7 @@ class SoraVideoGenerator(BaseVideoGenerator):
         script: VideoScript,
         output_dir: str,
         reference_images: list[GeneratedAsset] | None = None,
-        max_concurrent: int = 3,
+        max_concurrent: int | None = None,
         show_progress: bool = True,
     ) -> list[GeneratedAsset]:
         """Generate video clips for all scenes in the script.
@@ -389,7 +405,8 @@ class SoraVideoGenerator(BaseVideoGenerator):
             script: The VideoScript containing all scenes.
             output_dir: Local directory to save videos.
             reference_images: Optional reference images (Sora uses max 1 per scene).
-            max_concurrent: Maximum concurrent generations.
+            max_concurrent: Fixed concurrency limit. If None, the adaptive limiter
+                learns the limit from observed rate limits.
             show_progress: Whether to show progress bar.
 
         Returns:
@@ -403,17 +420,17 @@ class SoraVideoGenerator(BaseVideoGenerator):
         # Build scene-to-reference-image mapping (Sora uses max 1 per scene)
         scene_refs = self._build_scene_reference_map(script, reference_images)
 
-        # Semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Adaptive limiter paces requests and backs off on rate limits
+        limiter = self._get_concurrency_limiter(max_concurrent)
 
         async def generate_with_semaphore(
             scene: SceneAction,
             task_id: TaskID | None,
             progress: Progress | None,
         ) -> GeneratedAsset | None:
-            async with semaphore:
-                try:
-                    refs = scene_refs.get(scene.scene_number, [])
+            try:
+                refs = scene_refs.get(scene.scene_number, [])
+                async with limiter.slot():
                     asset = await self.generate_video_clip(
                         scene=scene,
                         output_dir=output_dir,
@@ -421,20 +438,20 @@ class SoraVideoGenerator(BaseVideoGenerator):
                         total_scenes=total_scenes,
                         script=script,
                     )
-                    if progress and task_id is not None:
-                        progress.update(task_id, advance=1)
-                    return asset
-
-                except Exception as e:
-                    logger.error(
-                        "Failed to generate video for scene %d: %s",
-                        scene.scene_number,
-                        e,
-                    )
-                    failed_scenes.append(scene.scene_number)
-                    if progress and task_id is not None:
-                        progress.update(task_id, advance=1)
-                    return None
+                if progress and task_id is not None:
+                    progress.update(task_id, advance=1)
+                return asset
+
+            except Exception as e:
+                logger.error(
+                    "Failed to generate video for scene %d: %s",
+                    scene.scene_number,
+                    e,
+                )
+                failed_scenes.append(scene.scene_number)
+                if progress and task_id is not None:
+                    progress.update(task_id, advance=1)
+                return None
 
         if show_progress:
             with Progress(
@@ -456,6 +473,8 @@ class SoraVideoGenerator(BaseVideoGenerator):
             tasks = [generate_with_semaphore(scene, None, None) for scene in scenes]
             generated = await asyncio.gather(*tasks)
 
+        self._persist_concurrency(limiter)
+
         # Filter out None results (failed generations)
         results = [asset for asset in generated if asset is not None]
 
@@ -166,6 +166,30 @@ class VEOVideoGenerator(BaseVideoGenerator):
         )
         logger.debug(f"Video prompt: {prompt}")
 
+        # Reuse a previous clip if this exact request was generated before
+        if start_frame_image and start_frame:
+            mode, cache_refs = "image", [start_frame.local_path]
+        elif ref_configs and reference_images:
+            mode = "reference"
+            cache_refs = [
+                a.local_path for a in reference_images[: self.MAX_REFERENCE_IMAGES] if a.local_path
+            ]
+        else:
+            mode, cache_refs = "text", []
+        cache_key = self._clip_cache_key(
+            self.model,
+            prompt,
+            cache_refs,
+            {
+                "mode": mode,
+                "duration": duration,
+                "aspect_ratio": "16:9" if mode == "reference" else final_aspect_ratio,
+            },
+        )
+        cached = self._load_cached_clip(cache_key, output_dir, scene.scene_number)
+        if cached:
+            return cached
+
         try:
             # Start video generation via Gemini API
             # VEO 3.1 generates audio by default
@@ -287,6 +311,7 @@ class VEOVideoGenerator(BaseVideoGenerator):
                 raise VideoGenerationError(f"No video data for scene {scene.scene_number}")
             self.client.files.download(file=video_data.video)
             video_data.video.save(str(video_path))
+            self._store_cached_clip(cache_key, video_path)
 
             logger.info(f"Video clip for scene {scene.scene_number} saved to: {video_path}")
 
@@ -948,7 +973,7 @@ class VEOVideoGenerator(BaseVideoGenerator):
         script: VideoScript,
         output_dir: str,
         reference_images: list[GeneratedAsset] | None = None,
-        max_concurrent: int = 3,
+        max_concurrent: int | None = None,
         inter_request_delay: float = 2.0,
         show_progress: bool = True,
         max_repair_attempts: int = 2,
@@ -964,8 +989,12 @@ class VEOVideoGenerator(BaseVideoGenerator):
             script: The VideoScript containing scenes to generate videos for.
             output_dir: Local directory for video outputs.
             reference_images: Optional list of reference images for visual consistency.
-            max_concurrent: Maximum number of concurrent video generations. Defaults to 3.
-            inter_request_delay: Delay in seconds between starting new requests. Defaults to 2.0.
+            max_concurrent: Fixed number of concurrent video generations. If None
+                (default), the adaptive limiter learns the limit from observed
+                rate limits and latency.
+            inter_request_delay: Delay in seconds between starting new requests when
+                max_concurrent is fixed. Defaults to 2.0. The adaptive limiter
+                learns its own spacing.
             show_progress: Whether to display a Rich progress bar. Defaults to True.
             max_repair_attempts: Maximum number of prompt repair attempts per scene
                 when safety policy violations occur. Defaults to 2.
@@ -979,9 +1008,12 @@ class VEOVideoGenerator(BaseVideoGenerator):
             logger.warning("No scenes to generate video clips for")
             return []
 
+        # Adaptive limiter paces requests and backs off on rate limits
+        limiter = self._get_concurrency_limiter(max_concurrent, inter_request_delay)
+
         logger.info(
             f"Starting parallel video generation for {len(scenes)} scenes "
-            f"(max concurrent: {max_concurrent})"
+            f"(max concurrent: {limiter.limit})"
         )
 
         # Build a mapping of scene elements to reference images
@@ -991,9 +1023,6 @@ class VEOVideoGenerator(BaseVideoGenerator):
         results: list[GeneratedAsset | None] = [None] * len(scenes)
         errors: list[tuple[int, Exception]] = []
 
-        # Semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         # Total scenes for flow context
         total_scene_count = len(scenes)
 
@@ -1003,22 +1032,19 @@ class VEOVideoGenerator(BaseVideoGenerator):
             progress: Progress | None,
             task_id: TaskID | None,
         ) -> None:
-            """Generate a single video clip with semaphore control and prompt repair."""
-            async with semaphore:
-                # Add delay between requests to respect rate limits
-                if idx > 0:
-                    await asyncio.sleep(inter_request_delay)
-
-                # Get reference images for this scene
-                scene_refs = scene_references.get(scene.scene_number, [])
-
-                # Track current scene (may be modified by repair agent)
-                current_scene = scene
-                last_error: Exception | None = None
-
-                # Try generation with up to max_repair_attempts retries for safety errors
-                for attempt in range(max_repair_attempts + 1):
-                    try:
+            """Generate a single video clip with limiter control and prompt repair."""
+            # Get reference images for this scene
+            scene_refs = scene_references.get(scene.scene_number, [])
+
+            # Track current scene (may be modified by repair agent)
+            current_scene = scene
+            last_error: Exception | None = None
+
+            # Try generation with up to max_repair_attempts retries for safety errors
+            for attempt in range(max_repair_attempts + 1):
+                try:
+                    # Hold a provider slot only for the generation itself, not repair
+                    async with limiter.slot():
                         result = await self.generate_video_clip(
                             scene=current_scene,
                             output_dir=output_dir,
@@ -1026,84 +1052,82 @@ class VEOVideoGenerator(BaseVideoGenerator):
                             total_scenes=total_scene_count,
                             script=script,
                         )
-                        results[idx] = result
-
-                        if progress and task_id is not None:
-                            status = "[green]Scene"
-                            if attempt > 0:
-                                status = "[yellow]Scene"  # Repaired
-                            progress.update(
-                                task_id,
-                                advance=1,
-                                description=f"{status} {scene.scene_number} ✓",
+                    results[idx] = result
+
+                    if progress and task_id is not None:
+                        status = "[green]Scene"
+                        if attempt > 0:
+                            status = "[yellow]Scene"  # Repaired
+                        progress.update(
+                            task_id,
+                            advance=1,
+                            description=f"{status} {scene.scene_number} ✓",
+                        )
+                    return  # Success, exit the retry loop
+
+                except PromptSafetyError as e:
+                    last_error = e
+                    # Check if we have retries left
+                    if attempt < max_repair_attempts:
+                        logger.warning(
+                            f"Scene {scene.scene_number} blocked by safety policy "
+                            f"(attempt {attempt + 1}/{max_repair_attempts + 1}), "
+                            "attempting prompt repair..."
+                        )
+                        try:
+                            # Import here to avoid circular imports
+                            from sip_studio.agents.prompt_repair import (
+                                repair_scene_prompt,
+                            )
+
+                            repair_output = await repair_scene_prompt(
+                                scene=current_scene,
+                                error_message=str(e),
+                                attempt_number=attempt + 1,
                             )
-                        return  # Success, exit the retry loop
-
-                    except PromptSafetyError as e:
-                        last_error = e
-                        # Check if we have retries left
-                        if attempt < max_repair_attempts:
-                            logger.warning(
-                                f"Scene {scene.scene_number} blocked by safety policy "
-                                f"(attempt {attempt + 1}/{max_repair_attempts + 1}), "
-                                "attempting prompt repair..."
+                            # Create modified scene with repaired prompts
+                            current_scene = SceneAction(
+                                scene_number=scene.scene_number,
+                                duration_seconds=scene.duration_seconds,
+                                setting_description=repair_output.revised_setting_description,
+                                action_description=repair_output.revised_action_description,
+                                dialogue=scene.dialogue,
+                                camera_direction=scene.camera_direction,
+                                shared_element_ids=scene.shared_element_ids,
                             )
-                            try:
-                                # Import here to avoid circular imports
-                                from sip_studio.agents.prompt_repair import (
-                                    repair_scene_prompt,
-                                )
-
-                                repair_output = await repair_scene_prompt(
-                                    scene=current_scene,
-                                    error_message=str(e),
-                                    attempt_number=attempt + 1,
-                                )
-                                # Create modified scene with repaired prompts
-                                current_scene = SceneAction(
-                                    scene_number=scene.scene_number,
-                                    duration_seconds=scene.duration_seconds,
-                                    setting_description=repair_output.revised_setting_description,
-                                    action_description=repair_output.revised_action_description,
-                                    dialogue=scene.dialogue,
-                                    camera_direction=scene.camera_direction,
-                                    shared_element_ids=scene.shared_element_ids,
-                                )
-                                logger.info(
-                                    f"Scene {scene.scene_number} prompt repaired: "
-                                    f"{repair_output.changes_made}"
-                                )
-                            except Exception as repair_error:
-                                logger.error(
-                                    f"Failed to repair prompt for scene {scene.scene_number}: "
-                                    f"{repair_error}"
-                                )
-                                break  # Exit retry loop on repair failure
-                        else:
-                            # No more retries
+                            logger.info(
+                                f"Scene {scene.scene_number} prompt repaired: "
+                                f"{repair_output.changes_made}"
+                            )
+                        except Exception as repair_error:
                             logger.error(
-                                f"Scene {scene.scene_number} failed after "
-                                f"{max_repair_attempts} repair attempts"
+                                f"Failed to repair prompt for scene {scene.scene_number}: "
+                                f"{repair_error}"
                             )
-                            break
-
-                    except Exception as e:
-                        # Non-safety errors don't get retried with repair
-                        last_error = e
+                            break  # Exit retry loop on repair failure
+                    else:
+                        # No more retries
                         logger.error(
-                            f"Failed to generate video for scene {scene.scene_number}: {e}"
+                            f"Scene {scene.scene_number} failed after "
+                            f"{max_repair_attempts} repair attempts"
                         )
                         break
 
-                # If we get here, all attempts failed
-                if last_error:
-                    errors.append((scene.scene_number, last_error))
-                    if progress and task_id is not None:
-                        progress.update(
-                            task_id,
-                            advance=1,
-                            description=f"[red]Scene {scene.scene_number} ✗",
-                        )
+                except Exception as e:
+                    # Non-safety errors don't get retried with repair
+                    last_error = e
+                    logger.error(f"Failed to generate video for scene {scene.scene_number}: {e}")
+                    break
+
+            # If we get here, all attempts failed
+            if last_error:
+                errors.append((scene.scene_number, last_error))
+                if progress and task_id is not None:
+                    progress.update(
+                        task_id,
+                        advance=1,
+                        description=f"[red]Scene {scene.scene_number} ✗",
+                    )
 
         if show_progress:
             # Use Rich progress bar
@@ -1135,6 +1159,8 @@ class VEOVideoGenerator(BaseVideoGenerator):
             ]
             await asyncio.gather(*tasks)
 
+        self._persist_concurrency(limiter)
+
         # Filter out None results and sort by scene number
         successful_results = [r for r in results if r is not None]
         successful_results.sort(key=lambda x: x.scene_number or 0)
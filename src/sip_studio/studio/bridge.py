@@ -4,6 +4,7 @@ import json
 import sys
 
 from sip_studio.config.logging import get_logger
+from sip_studio.generators.resolution import hires_variant_path
 
 from ..constants import (
     ALLOWED_IMAGE_EXTS,
@@ -18,7 +19,7 @@ from .services.brand_service import BrandService
 from .services.chat_service import ChatService
 from .services.document_service import DocumentService
 from .services.image_pool import get_image_pool
-from .services.image_status import ImageStatusService
+from .services.image_status import ImageStatus, ImageStatusService, schedule_upscale_on_keep
 from .services.product_service import ProductService
 from .services.project_service import ProjectService
 from .services.research_service import ResearchService
@@ -250,11 +251,23 @@ class StudioBridge:
         return self._asset.get_video_path(relative_path)
 
     def replace_asset(self, original_path: str, new_path: str) -> dict:
-        return self._asset.replace_asset(original_path, new_path)
+        """Keep a quick-edit result in place of the original image."""
+        result = self._asset.replace_asset(original_path, new_path)
+        if result.get("success"):
+            brand_dir, _ = self._state.get_brand_dir()
+            if brand_dir is not None:
+                kept = brand_dir / "assets" / result["data"]["path"]
+                # Any earlier variant shows the image from before the edit
+                hires_variant_path(kept).unlink(missing_ok=True)
+                schedule_upscale_on_keep(str(kept))
+        return result
 
     def get_video_data(self, relative_path: str) -> dict:
         return self._asset.get_video_data(relative_path)
 
+    def get_video_thumbnail(self, relative_path: str) -> dict:
+        return self._asset.get_video_thumbnail(relative_path)
+
     def get_image_metadata(self, image_path: str) -> dict:
         return self._asset.get_image_metadata(image_path)
 
@@ -479,6 +492,21 @@ class StudioBridge:
             return bridge_error("No brand selected")
         return self._image_status.list_by_status(slug, "unsorted")
 
+    def get_images_page(
+        self,
+        status: ImageStatus = "unsorted",
+        offset: int = 0,
+        limit: int = 100,
+        brand_slug: str | None = None,
+    ) -> dict:
+        """Get one page of images with a status (oldest first) and the total count."""
+        slug = brand_slug or self._state.get_active_slug()
+        if not slug:
+            return bridge_error("No brand selected")
+        if status not in ("unsorted", "kept", "trashed"):
+            return bridge_error(f"Invalid status: {status}")
+        return self._image_status.page_by_status(slug, status, offset, limit)
+
     def mark_image_viewed(self, image_id: str, brand_slug: str | None = None) -> dict:
         """Mark image as viewed (read)."""
         slug = brand_slug or self._state.get_active_slug()
@@ -486,6 +514,13 @@ class StudioBridge:
             return bridge_error("No brand selected")
         return self._image_status.mark_viewed(slug, image_id)
 
+    def mark_images_viewed(self, image_ids: list[str], brand_slug: str | None = None) -> dict:
+        """Mark several images as viewed (read) in one call."""
+        slug = brand_slug or self._state.get_active_slug()
+        if not slug:
+            return bridge_error("No brand selected")
+        return self._image_status.mark_viewed_many(slug, image_ids)
+
     def register_image(
         self,
         image_path: str,
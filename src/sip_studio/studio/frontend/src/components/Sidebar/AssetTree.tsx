@@ -117,7 +117,7 @@ function TreeItem({ node, depth = 0, onDelete, onRename, onPreview, onPreviewVid
             )}
             {node.type === 'folder' ? (
               <Folder className="h-4 w-4 text-muted-foreground shrink-0" />
-            ) : node.type === 'image' && isPyWebView() ? (
+            ) : (node.type === 'image' || node.type === 'video') && isPyWebView() ? (
               <AssetThumbnail path={node.path} />
             ) : node.type === 'video' ? (
               <Film className="h-4 w-4 text-muted-foreground shrink-0" />
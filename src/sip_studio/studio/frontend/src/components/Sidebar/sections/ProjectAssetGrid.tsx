@@ -1,5 +1,5 @@
 import { useEffect, useState, useCallback, useRef, useMemo } from 'react'
-import { Image, Loader2, RefreshCw, AlertTriangle, Play, Film } from 'lucide-react'
+import { Image, Loader2, RefreshCw, AlertTriangle } from 'lucide-react'
 import { useProjects } from '@/context/ProjectContext'
 import { useBrand } from '@/context/BrandContext'
 import { useWorkstation } from '@/context/WorkstationContext'
@@ -7,6 +7,7 @@ import { bridge, isPyWebView } from '@/lib/bridge'
 import { buildStatusByAssetPath, normalizeAssetPath } from '@/lib/imageStatus'
 import { isHiddenAssetPath } from '@/lib/mediaUtils'
 import { VideoViewer } from '@/components/ui/video-viewer'
+import { VideoScrubThumbnail, clearVideoThumbnailCache } from '@/components/ui/video-scrub-thumbnail'
 import { Button } from '@/components/ui/button'
 
 // Thumbnail cache for the session (Map<assetPath, dataUrl>)
@@ -177,28 +178,6 @@ function AssetThumbnail({ path, onClick, onLoadError }: AssetThumbnailProps) {
   )
 }
 
-function VideoThumbnail({ path: _path, onClick }: { path: string; onClick?: () => void }) {
-  return (
-    <div
-      className="group relative aspect-square rounded-md overflow-hidden bg-gradient-to-br from-brand-500/20 via-brand-500/15 to-brand-500/10 dark:from-brand-500/30 dark:via-brand-500/20 dark:to-brand-500/15 border-2 border-brand-400/50 hover:border-brand-500 hover:shadow-md transition-all duration-200 cursor-pointer"
-      onClick={onClick}
-      title="Click to preview video"
-    >
-      {/* Video icon badge */}
-      <div className="absolute top-1 left-1 flex items-center gap-0.5 bg-black/60 text-white px-1.5 py-0.5 rounded text-[9px] font-medium">
-        <Film className="h-2.5 w-2.5" />
-        <span>MP4</span>
-      </div>
-      {/* Play button center */}
-      <div className="absolute inset-0 flex items-center justify-center">
-        <div className="w-10 h-10 rounded-full bg-white/90 flex items-center justify-center shadow-lg group-hover:scale-110 transition-transform">
-          <Play className="w-5 h-5 text-brand-600 ml-0.5" />
-        </div>
-      </div>
-    </div>
-  )
-}
-
 interface ProjectAssetGridProps {
   projectSlug: string
   expectedAssetCount?: number // Used to detect when assets have changed
@@ -234,6 +213,7 @@ export function ProjectAssetGrid({ projectSlug, expectedAssetCount }: ProjectAss
   // Clear thumbnail cache when switching brands to avoid cross-brand stale thumbnails.
   useEffect(() => {
     thumbnailCache.clear()
+    clearVideoThumbnailCache()
     setThumbnailReloadNonce((n) => n + 1)
     failedAssetsRef.current.clear()
   }, [activeBrand])
@@ -500,7 +480,7 @@ export function ProjectAssetGrid({ projectSlug, expectedAssetCount }: ProjectAss
       <div className="grid grid-cols-[repeat(auto-fill,minmax(60px,1fr))] gap-1.5 py-1">
         {sortedAssets.map((path) => (
           isVideoAsset(path) ? (
-            <VideoThumbnail
+            <VideoScrubThumbnail
               key={`${path}:${thumbnailReloadNonce}`}
               path={path}
               onClick={() => handlePreview(path)}
@@ -0,0 +1,116 @@
+import { useEffect, useRef, useState } from 'react'
+import { Film, Play } from 'lucide-react'
+import { bridge, isPyWebView, type VideoThumbnail } from '@/lib/bridge'
+
+type ReadyThumbnail = Extract<VideoThumbnail, { posterUrl: string }>
+
+// Poster and strip cache for the session (Map<assetPath, thumbnail>)
+const videoThumbnailCache = new Map<string, ReadyThumbnail>()
+// Extraction runs in the background; poll until it lands
+const PENDING_POLL_MS = 1500
+const MAX_PENDING_POLLS = 40
+
+/** Drop cached posters and strips (e.g. on refresh or brand switch). */
+export function clearVideoThumbnailCache() {
+  videoThumbnailCache.clear()
+}
+
+interface Props {
+  path: string
+  onClick?: () => void
+}
+
+/** Video tile showing the poster frame, scrubbing through the strip on hover. */
+export function VideoScrubThumbnail({ path, onClick }: Props) {
+  const [thumb, setThumb] = useState<ReadyThumbnail | null>(() => videoThumbnailCache.get(path) ?? null)
+  const [frame, setFrame] = useState<number | null>(null)
+  const containerRef = useRef<HTMLDivElement>(null)
+
+  useEffect(() => {
+    const cached = videoThumbnailCache.get(path)
+    setThumb(cached ?? null)
+    if (cached || !isPyWebView()) return
+    const container = containerRef.current
+    if (!container) return
+    let cancelled = false
+    let timer: ReturnType<typeof setTimeout> | null = null
+
+    const load = async (polls: number) => {
+      try {
+        const result = await bridge.getVideoThumbnail(path)
+        if (cancelled) return
+        if (result.pending) {
+          if (polls < MAX_PENDING_POLLS) timer = setTimeout(() => void load(polls + 1), PENDING_POLL_MS)
+          return
+        }
+        videoThumbnailCache.set(path, result)
+        setThumb(result)
+      } catch {
+        // No preview (e.g. FFmpeg missing); keep the plain video tile
+      }
+    }
+
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries[0]?.isIntersecting) {
+          observer.disconnect()
+          void load(0)
+        }
+      },
+      { rootMargin: '50px' }
+    )
+    observer.observe(container)
+    return () => {
+      cancelled = true
+      observer.disconnect()
+      if (timer) clearTimeout(timer)
+    }
+  }, [path])
+
+  const handleMouseMove = (e: React.MouseEvent<HTMLDivElement>) => {
+    if (!thumb) return
+    const rect = e.currentTarget.getBoundingClientRect()
+    const ratio = Math.min(Math.max((e.clientX - rect.left) / rect.width, 0), 0.999)
+    setFrame(Math.floor(ratio * thumb.frames))
+  }
+
+  const scrubbing = thumb !== null && frame !== null
+  return (
+    <div
+      ref={containerRef}
+      className="group relative aspect-square rounded-md overflow-hidden bg-gradient-to-br from-brand-500/20 via-brand-500/15 to-brand-500/10 dark:from-brand-500/30 dark:via-brand-500/20 dark:to-brand-500/15 border-2 border-brand-400/50 hover:border-brand-500 hover:shadow-md transition-all duration-200 cursor-pointer"
+      onClick={onClick}
+      onMouseMove={handleMouseMove}
+      onMouseLeave={() => setFrame(null)}
+      title="Click to preview video"
+    >
+      {thumb && !scrubbing && (
+        <img src={thumb.posterUrl} alt="" className="absolute inset-0 w-full h-full object-cover object-center" />
+      )}
+      {scrubbing && (
+        <div
+          className="absolute inset-0 bg-no-repeat"
+          style={{
+            backgroundImage: `url(${thumb.stripUrl})`,
+            // Show one tile of the horizontal strip, filling the tile like object-cover
+            backgroundSize: `${thumb.frames * 100}% auto`,
+            backgroundPosition: `${thumb.frames > 1 ? (frame / (thumb.frames - 1)) * 100 : 0}% 50%`,
+          }}
+        />
+      )}
+      {/* Video icon badge */}
+      <div className="absolute top-1 left-1 flex items-center gap-0.5 bg-black/60 text-white px-1.5 py-0.5 rounded text-[9px] font-medium">
+        <Film className="h-2.5 w-2.5" />
+        <span>MP4</span>
+      </div>
+      {/* Play button center; out of the way while scrubbing */}
+      {!scrubbing && (
+        <div className="absolute inset-0 flex items-center justify-center">
+          <div className="w-10 h-10 rounded-full bg-white/90 flex items-center justify-center shadow-lg group-hover:scale-110 transition-transform">
+            <Play className="w-5 h-5 text-brand-600 ml-0.5" />
+          </div>
+        </div>
+      )}
+    </div>
+  )
+}
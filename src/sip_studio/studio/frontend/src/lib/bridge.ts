@@ -76,6 +76,14 @@ export interface AssetNode {
   size?: number
 }
 
+/**
+ * Poster frame and horizontal scrub strip (`frames` tiles) for a video asset,
+ * or `pending` while they are still being extracted (ask again later).
+ */
+export type VideoThumbnail =
+  | { pending: true }
+  | { pending?: false; posterUrl: string; stripUrl: string; frames: number }
+
 export interface DocumentEntry {
   name: string
   path: string
@@ -560,6 +568,7 @@ interface PyWebViewAPI {
   get_video_path(path: string): Promise<BridgeResponse<{ path: string; filename: string; file_url: string }>>
   replace_asset(original_path: string, new_path: string): Promise<BridgeResponse<{ path: string }>>
   get_video_data(path: string): Promise<BridgeResponse<{ dataUrl: string; path: string; filename: string }>>
+  get_video_thumbnail(path: string): Promise<BridgeResponse<VideoThumbnail>>
   get_image_metadata(path: string): Promise<BridgeResponse<ImageGenerationMetadata | null>>
   get_progress(): Promise<BridgeResponse<ProgressStatus>>
   chat(
@@ -660,7 +669,9 @@ interface PyWebViewAPI {
   restore_identity_backup(filename: string): Promise<BridgeResponse<BrandIdentityFull>>
   //Image status methods (workstation curation)
   get_unsorted_images(brand_slug?: string): Promise<BridgeResponse<ImageStatusEntry[]>>
+  get_images_page(status?: ImageStatusType, offset?: number, limit?: number, brand_slug?: string): Promise<BridgeResponse<{ images: ImageStatusEntry[]; total: number; offset: number }>>
   mark_image_viewed(image_id: string, brand_slug?: string): Promise<BridgeResponse<ImageStatusEntry>>
+  mark_images_viewed(image_ids: string[], brand_slug?: string): Promise<BridgeResponse<{ updated: string[]; missing: string[]; viewedAt: string }>>
   register_image(image_path: string, brand_slug?: string, prompt?: string, source_style_reference_path?: string): Promise<BridgeResponse<ImageStatusEntry>>
   register_generated_images(images: RegisterImageInput[], brand_slug?: string): Promise<BridgeResponse<ImageStatusEntry[]>>
   cancel_generation(brand_slug?: string): Promise<BridgeResponse<{ cancelled: boolean }>>
@@ -830,6 +841,7 @@ export const bridge = {
   getVideoPath: async (p: string) => (await callBridge(() => window.pywebview!.api.get_video_path(p))).file_url,
   replaceAsset: async (orig: string, newPath: string) => (await callBridge(() => window.pywebview!.api.replace_asset(orig, newPath))).path,
   getVideoData: async (p: string) => (await callBridge(() => window.pywebview!.api.get_video_data(p))).dataUrl,
+  getVideoThumbnail: (p: string) => callBridge(() => window.pywebview!.api.get_video_thumbnail(p)),
   getImageMetadata: async (p: string): Promise<ImageGenerationMetadata | null> => {
     try { return await callBridge(() => window.pywebview!.api.get_image_metadata(p)) }
     catch (e) { console.warn('[bridge.getImageMetadata] Error loading metadata:', p, e); return null }
@@ -960,7 +972,9 @@ export const bridge = {
     callBridge(() => window.pywebview!.api.restore_identity_backup(filename)),
   //Image status (workstation curation)
   getUnsortedImages: (brandSlug?: string) => callBridge(() => window.pywebview!.api.get_unsorted_images(brandSlug)),
+  getImagesPage: (status?: ImageStatusType, offset?: number, limit?: number, brandSlug?: string) => callBridge(() => window.pywebview!.api.get_images_page(status, offset, limit, brandSlug)),
   markImageViewed: (imageId: string, brandSlug?: string) => callBridge(() => window.pywebview!.api.mark_image_viewed(imageId, brandSlug)),
+  markImagesViewed: (imageIds: string[], brandSlug?: string) => callBridge(() => window.pywebview!.api.mark_images_viewed(imageIds, brandSlug)),
   registerImage: (imagePath: string, brandSlug?: string, prompt?: string, sourceStyleReferencePath?: string) => callBridge(() => window.pywebview!.api.register_image(imagePath, brandSlug, prompt, sourceStyleReferencePath)),
   registerGeneratedImages: (images: RegisterImageInput[], brandSlug?: string) => callBridge(() => window.pywebview!.api.register_generated_images(images, brandSlug)),
   cancelGeneration: (brandSlug?: string) => callBridge(() => window.pywebview!.api.cancel_generation(brandSlug)),
@@ -12,6 +12,7 @@ from pathlib import Path
 from sip_studio.brands.memory import list_brand_assets
 from sip_studio.brands.storage import get_active_brand
 from sip_studio.brands.storage import save_asset as storage_save_asset
+from sip_studio.generators.resolution import deliverable_path, hires_variant_path
 
 from ..state import BridgeState
 from ..utils.bridge_types import (
@@ -30,6 +31,9 @@ from .image_status import ImageStatusService
 
 logger = logging.getLogger(__name__)
 
+# Error for a video whose poster is still being extracted; ask again later
+VIDEO_THUMBNAIL_PENDING = "Video thumbnail is still being generated"
+
 
 def _get_thumb_cache_dir() -> Path:
     """Get or create thumbnail cache directory."""
@@ -89,6 +93,24 @@ class AssetService:
             return None, "Invalid path: outside brand directory"
         return resolved, None
 
+    def _resolve_asset_path(self, relative_path: str) -> tuple[Path | None, str | None]:
+        """Resolve a path (relative to brand assets, or absolute inside them)."""
+        brand_dir, err = self._state.get_brand_dir()
+        if err or brand_dir is None:
+            return None, err or "No brand selected"
+        rp = Path(relative_path)
+        if rp.is_absolute():
+            absolute = rp.resolve()
+            try:
+                absolute.relative_to((brand_dir / "assets").resolve())
+            except ValueError:
+                return None, "Invalid path: outside assets directory"
+            return absolute, None
+        resolved, error = resolve_assets_path(brand_dir, relative_path)
+        if error or resolved is None:
+            return None, error or "Path resolution failed"
+        return resolved, None
+
     @require_brand(param_name="slug")
     def get_assets(self, slug: str | None = None) -> dict:
         """Get asset tree for a brand."""
@@ -104,6 +126,8 @@ class AssetService:
                     fp = Path(asset["path"])
                     size = fp.stat().st_size if fp.exists() else 0
                     asset_type = asset.get("type", "image")
+                    if asset_type == "video" and size:
+                        self._schedule_video_thumbnails(fp)
                     children.append(
                         {
                             "name": filename,
@@ -140,6 +164,9 @@ class AssetService:
             if resolved is None or not resolved.exists():
                 return bridge_error("Asset not found")
             suffix = resolved.suffix.lower()
+            if suffix in ALLOWED_VIDEO_EXTS:
+                # Videos show their poster frame; the video itself is never read
+                return self._video_poster(resolved)
             if suffix not in ALLOWED_IMAGE_EXTS:
                 return bridge_error("Unsupported file type")
             if suffix == ".svg":
@@ -164,6 +191,63 @@ class AssetService:
         except Exception as e:
             return bridge_error(str(e))
 
+    def get_video_thumbnail(self, relative_path: str) -> dict:
+        """Get the poster frame and scrub strip for a video asset.
+
+        Args:
+            relative_path: Path relative to brand assets (e.g., "video/scene_001.mp4")
+
+        Returns:
+            dict with posterUrl and stripUrl (WebP data URLs) and the number of
+            frames tiled horizontally in the strip, or ``pending`` while they are
+            still being extracted (poll again)
+        """
+        try:
+            resolved, error = self._resolve_asset_path(relative_path)
+            if error or resolved is None:
+                return bridge_error(error or "Path resolution failed")
+            if not resolved.exists():
+                return bridge_error("Video not found")
+            if resolved.suffix.lower() not in ALLOWED_VIDEO_EXTS:
+                return bridge_error("Unsupported video type")
+            from .video_thumbnails import peek_video_thumbnails
+
+            thumbs = peek_video_thumbnails(resolved)
+            if thumbs is None:
+                return bridge_ok({"pending": True})
+            poster = base64.b64encode(thumbs.poster.read_bytes()).decode("utf-8")
+            strip = base64.b64encode(thumbs.strip.read_bytes()).decode("utf-8")
+            return bridge_ok(
+                {
+                    "posterUrl": f"data:image/webp;base64,{poster}",
+                    "stripUrl": f"data:image/webp;base64,{strip}",
+                    "frames": thumbs.frames,
+                }
+            )
+        except Exception as e:
+            return bridge_error(str(e))
+
+    @staticmethod
+    def _video_poster(path: Path) -> dict:
+        """Poster frame response for a video, without waiting for extraction."""
+        from .video_thumbnails import peek_video_thumbnails
+
+        thumbs = peek_video_thumbnails(path)
+        if thumbs is None:
+            return bridge_error(VIDEO_THUMBNAIL_PENDING)
+        enc = base64.b64encode(thumbs.poster.read_bytes()).decode("utf-8")
+        return bridge_ok({"dataUrl": f"data:image/webp;base64,{enc}"})
+
+    @staticmethod
+    def _schedule_video_thumbnails(path: Path) -> None:
+        """Queue background thumbnail extraction for a video (best effort)."""
+        try:
+            from .video_thumbnails import schedule_video_thumbnails
+
+            schedule_video_thumbnails(path)
+        except Exception as e:
+            logger.debug("Could not schedule thumbnails for %s: %s", path, e)
+
     def get_asset_full(self, relative_path: str) -> dict:
         """Get base64-encoded full-resolution image for an asset."""
         try:
@@ -187,7 +271,8 @@ class AssetService:
             suffix = resolved.suffix.lower()
             if suffix not in ALLOWED_IMAGE_EXTS:
                 return bridge_error("Unsupported file type")
-            content = resolved.read_bytes()
+            # Kept images are shown at their final resolution once upscaled
+            content = deliverable_path(resolved).read_bytes()
             enc = base64.b64encode(content).decode("utf-8")
             mime = MIME_TYPES.get(suffix, "image/png")
             return bridge_ok({"dataUrl": f"data:{mime};base64,{enc}"})
@@ -205,7 +290,7 @@ class AssetService:
             suffix = resolved.suffix.lower()
             if suffix not in ALLOWED_IMAGE_EXTS:
                 return bridge_error("Unsupported file type")
-            content = resolved.read_bytes()
+            content = deliverable_path(resolved).read_bytes()
             enc = base64.b64encode(content).decode("utf-8")
             mime = "image/svg+xml" if suffix == ".svg" else MIME_TYPES.get(suffix, "image/png")
             return bridge_ok({"dataUrl": f"data:{mime};base64,{enc}"})
@@ -236,6 +321,11 @@ class AssetService:
                 return bridge_error(f"Image not found: {image_path}")
             # load_image_metadata returns None for missing/corrupt .meta.json
             metadata = load_image_metadata(str(resolved))
+            if metadata and metadata.get("hires_path"):
+                # Only report a variant that is still current for this image
+                if deliverable_path(resolved) == resolved:
+                    metadata.pop("hires_path", None)
+                    metadata.pop("hires_size", None)
             slugs = metadata.get("product_slugs") if metadata else None
             logger.info(
                 f"[get_image_metadata] path={image_path}, "
@@ -254,6 +344,9 @@ class AssetService:
             if not resolved.exists():
                 return bridge_error("Image not found")
             suffix = resolved.suffix.lower()
+            if suffix in ALLOWED_VIDEO_EXTS:
+                # Videos show their poster frame; the video itself is never read
+                return self._video_poster(resolved)
             if suffix not in ALLOWED_IMAGE_EXTS:
                 return bridge_error("Unsupported file type")
             if suffix == ".svg":
@@ -291,7 +384,8 @@ class AssetService:
                 return bridge_error("Asset not found")
             if resolved.suffix.lower() not in (ALLOWED_IMAGE_EXTS | ALLOWED_VIDEO_EXTS):
                 return bridge_error("Unsupported file type")
-            reveal_in_file_manager(resolved)
+            # Exporting from the file manager should hand over the final resolution
+            reveal_in_file_manager(deliverable_path(resolved))
             return bridge_ok()
         except Exception as e:
             return bridge_error(str(e))
@@ -313,6 +407,7 @@ class AssetService:
                 return bridge_error("Unsupported file type")
             if not _move_to_trash(resolved):
                 return bridge_error("Failed to move to trash")
+            hires_variant_path(resolved).unlink(missing_ok=True)
             # Cleanup .meta.json sidecar file if exists
             meta_path = resolved.with_suffix(".meta.json")
             if meta_path.exists():
@@ -352,6 +447,9 @@ class AssetService:
             if new_path.exists():
                 return bridge_error(f"File already exists: {new_name}")
             resolved.rename(new_path)
+            variant = hires_variant_path(resolved)
+            if variant.exists():
+                variant.rename(hires_variant_path(new_path))
             return bridge_ok({"newPath": f"{resolved.parent.name}/{new_name}"})
         except Exception as e:
             return bridge_error(str(e))
@@ -371,7 +469,10 @@ class AssetService:
             return bridge_error(str(e))
 
     def get_video_data(self, relative_path: str) -> dict:
-        """Get base64-encoded video data.
+        """Get base64-encoded video data for playback.
+
+        Reads the whole file; grids and lists should use
+        ``get_video_thumbnail`` / ``get_asset_thumbnail`` instead.
 
         Args:
             relative_path: Path relative to brand assets (e.g., "video/scene_001.mp4")
@@ -7,13 +7,10 @@ from __future__ import annotations
 import asyncio
 import json
 import re
-import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from openai import OpenAI
-
 from sip_studio.advisor.tools import (
     _impl_complete_task_file,
     _impl_create_task_file,
@@ -24,7 +21,8 @@ from sip_studio.advisor.tools import (
 from sip_studio.config.logging import get_logger
 from sip_studio.config.settings import get_settings
 
-from .image_pool import TicketStatus, get_image_pool
+from .image_pool import ImageGenerationPool, TicketStatus, get_image_pool
+from .openai_client import chat_completion
 
 if TYPE_CHECKING:
     from sip_studio.advisor.agent import BrandAdvisor
@@ -51,6 +49,8 @@ REFUSAL_PHRASES = [
     "unable to generate",
     "failed on most",
 ]
+# Seconds between interrupt checks while waiting for batch images
+INTERRUPT_CHECK_INTERVAL = 0.5
 
 
 @dataclass
@@ -137,11 +137,11 @@ class TaskExtractor:
             return []
         try:
             settings = get_settings()
-            client = OpenAI(api_key=settings.openai_api_key)
             prompt = TaskExtractor.EXTRACTION_PROMPT.format(
                 previous_response=prev_response[:4000], user_message=message
             )
-            resp = client.chat.completions.create(
+            resp = await chat_completion(
+                settings.openai_api_key,
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0,
@@ -217,14 +217,14 @@ class IdeaPlanner:
             return []
         try:
             settings = get_settings()
-            client = OpenAI(api_key=settings.openai_api_key)
             prompt = IdeaPlanner.IDEAS_PROMPT.format(
                 user_message=user_message[:4000], context=context[:4000], count=min(count, 20)
             )
             logger.info(
                 "[BATCH] Using skill-enhanced IdeaPlanner (composition + prompt engineering)"
             )
-            resp = client.chat.completions.create(
+            resp = await chat_completion(
+                settings.openai_api_key,
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.7,
@@ -269,6 +269,71 @@ class IdeaPlanner:
             return []
 
 
+class TaskPromptPlanner:
+    """Write image prompts for an extracted task list in a single LLM call."""
+
+    TASKS_PROMPT = (
+        "You are an expert Prompt Engineer for an AI creative studio.\n\n"
+        "Write one image generation prompt for EACH numbered task below.\n\n"
+        "## PROMPT RULES\n"
+        "- Narrative descriptions, NOT keyword lists\n"
+        "- Cover subject, setting, style (e.g. 'lifestyle photography', 'product shot'),\n"
+        "  lighting and composition (framing, camera angle, depth of field)\n"
+        "- Include texture/material details; 60+ words per prompt\n"
+        "- Stay faithful to the task: do not merge, skip or reorder tasks\n\n"
+        "## BRAND CONTEXT\n{context}\n\n"
+        "## TASKS\n{tasks}\n\n"
+        "Return ONLY valid JSON (no markdown) as an array of objects:\n"
+        '- "task": the task number\n'
+        '- "prompt": the image prompt\n\n'
+        "JSON array:"
+    )
+
+    @staticmethod
+    async def plan(tasks: list[str], context: str = "") -> list[str | None]:
+        """Plan prompts using GPT-4o-mini.
+        Returns one entry per task (None where no prompt was produced), or an
+        empty list if planning failed.
+        """
+        if not tasks:
+            return []
+        try:
+            settings = get_settings()
+            numbered = "\n".join(f"{i}. {t[:500]}" for i, t in enumerate(tasks, 1))
+            prompt = TaskPromptPlanner.TASKS_PROMPT.format(tasks=numbered, context=context[:4000])
+            resp = await chat_completion(
+                settings.openai_api_key,
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.4,
+                max_tokens=min(16000, 250 * len(tasks) + 500),
+            )
+            text = (resp.choices[0].message.content or "").strip()
+            if not text.startswith("["):
+                match = re.search(r"\[.*\]", text, re.DOTALL)
+                if not match:
+                    logger.warning(f"[BATCH] Failed to parse task prompts from: {text[:200]}")
+                    return []
+                text = match.group()
+            items = json.loads(text)
+            if not isinstance(items, list):
+                return []
+            prompts: list[str | None] = [None] * len(tasks)
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                num, prompt_text = item.get("task"), item.get("prompt")
+                if isinstance(num, int) and 1 <= num <= len(tasks) and isinstance(prompt_text, str):
+                    prompts[num - 1] = prompt_text.strip() or None
+            logger.info(
+                "[BATCH] Planned %d/%d task prompts", sum(1 for p in prompts if p), len(tasks)
+            )
+            return prompts
+        except Exception as e:
+            logger.error(f"[BATCH] Task prompt planning failed: {e}")
+            return []
+
+
 class BatchExecutor:
     """Execute multi-task requests in controlled loop."""
 
@@ -281,12 +346,15 @@ class BatchExecutor:
 
     async def run(self, tasks: list[str], context: dict) -> BatchResult:
         """Execute tasks with parallel image generation.
-        Phase 1: Submit all tasks (async mode - generate_image returns immediately)
-        Phase 2: Poll ticket completion and mark tasks done as each image finishes
+        Phase 1: Write every task's prompt in one planning call and submit each to
+            the image pool; tasks without a planned prompt fall back to an agent turn
+            (async mode - generate_image returns immediately)
+        Phase 2: Mark tasks done as each image finishes
         Phase 3: Finalize task file and return summary
         Args:
             tasks: List of task descriptions
-            context: Dict with product_slugs, style_refs, aspect_ratio, project_slug
+            context: Dict with product_slugs, style_refs, aspect_ratio, project_slug,
+                and optionally brand_context (turn context text for prompt planning)
         Returns:
             BatchResult with completion stats and individual results
         """
@@ -309,86 +377,71 @@ class BatchExecutor:
             logger.info(f"[BATCH] Created task file with {len(tasks)} tasks")
             self._emit_progress("batch_started", {"total": len(tasks), "title": title})
             # Phase 1: Submit all tasks (non-blocking with async mode)
-            submitted_count = 0
-            for i, task_desc in enumerate(cleaned_tasks):
-                task_num = i + 1
+            batch_id = get_current_batch_id()
+            pool = get_image_pool()
+            id_to_task: dict[str, int] = {}
+            attempted: list[int] = []
+            prompts: list[str | None] = []
+            if batch_id:
+                # Fast path: one planning call writes every prompt, and each is
+                # queued on the pool right away
+                prompts = await TaskPromptPlanner.plan(
+                    cleaned_tasks, context.get("brand_context", "")
+                )
+            config = self._pool_config(context)
+            fallback: list[int] = []
+            for task_num, task_desc in enumerate(cleaned_tasks, 1):
+                prompt = prompts[task_num - 1] if task_num <= len(prompts) else None
+                if not prompt or not batch_id:
+                    fallback.append(task_num)
+                    continue
+                if self.state.get_interrupt():
+                    logger.info(f"[BATCH] Interrupted at task {task_num}")
+                    break
+                self._emit_progress("task_started", {"number": task_num, "description": task_desc})
+                _impl_update_task(task_num, done=False)
+                id_to_task[pool.submit(prompt, config, batch_id=batch_id)] = task_num
+                attempted.append(task_num)
+                result.results.append(
+                    TaskResult(task_number=task_num, description=task_desc, status="done")
+                )
+            if fallback and id_to_task:
+                logger.info(f"[BATCH] {len(fallback)} tasks without a planned prompt")
+            # Tasks the planner could not handle run through the agent one at a
+            # time (turns share the advisor's conversation), while queued images
+            # are already generating
+            for task_num in fallback:
+                task_desc = cleaned_tasks[task_num - 1]
                 if self.state.get_interrupt():
                     logger.info(f"[BATCH] Interrupted at task {task_num}")
                     break
                 self._emit_progress("task_started", {"number": task_num, "description": task_desc})
                 _impl_update_task(task_num, done=False)
+                before = set(pool.batch_ticket_ids(batch_id)) if batch_id else set()
                 # Execute task - with async mode, generate_image returns immediately
                 task_result = await self._execute_single_task(task_num, task_desc, context)
                 result.results.append(task_result)
-                submitted_count += 1
+                attempted.append(task_num)
+                if batch_id:
+                    for tid in pool.batch_ticket_ids(batch_id):
+                        if tid not in before:
+                            id_to_task[tid] = task_num
+            result.results.sort(key=lambda r: r.task_number)
+            submitted_count = len(attempted)
             # Phase 2/3: Update tasks as images finish (do not wait for full batch).
             logger.info(f"[BATCH] {submitted_count} tasks submitted, waiting for completion...")
             self._emit_progress("batch_waiting", {"message": "Generating images in parallel..."})
-            batch_id = get_current_batch_id()
             if not batch_id:
                 logger.warning("[BATCH] No current batch id - cannot track image completion")
                 result.completed = 0
                 result.failed = submitted_count
             else:
                 brand_dir, _err = self.state.get_brand_dir()
-                pool = get_image_pool()
-                # Discover submitted tickets for this batch (in submission order).
-                snapshot = pool.wait_for_batch(batch_id, timeout=0.01)
-                ticket_ids = [t.ticket_id for t in snapshot.tickets]
-                # Map ticket -> task number (best-effort by order).
-                id_to_task = {
-                    tid: idx + 1 for idx, tid in enumerate(ticket_ids[: len(cleaned_tasks)])
-                }
-                pending = set(ticket_ids)
-                completed = 0
-                failed = 0
-                start = time.time()
-                timeout_s = 600.0
-                while pending and (time.time() - start) < timeout_s:
-                    # Cooperative interruption: stop cancels outstanding tickets.
-                    if self.state.get_interrupt() in ("stop", "new_direction"):
-                        pool.cancel_batch(batch_id)
-                        break
-                    for tid in list(pending):
-                        res = pool.wait_for_ticket(tid, timeout=0.2)
-                        if not res.status.is_terminal():
-                            continue
-                        pending.discard(tid)
-                        ticket_task_num = id_to_task.get(tid)
-                        if ticket_task_num is None:
-                            continue
-                        if res.status == TicketStatus.COMPLETED and res.path:
-                            output_path = res.path
-                            if brand_dir:
-                                try:
-                                    p = Path(res.path)
-                                    if p.is_absolute():
-                                        output_path = p.resolve().relative_to(brand_dir).as_posix()
-                                except Exception:
-                                    output_path = res.path
-                            _impl_update_task(ticket_task_num, done=True, output_path=output_path)
-                            self._emit_progress(
-                                "task_completed",
-                                {"number": ticket_task_num, "output": output_path},
-                            )
-                            completed += 1
-                        elif res.status in (
-                            TicketStatus.FAILED,
-                            TicketStatus.CANCELLED,
-                            TicketStatus.TIMEOUT,
-                        ):
-                            failed += 1
-                            self._emit_progress(
-                                "task_failed",
-                                {
-                                    "number": ticket_task_num,
-                                    "error": res.error or res.status.value,
-                                },
-                            )
-                    if pending:
-                        await asyncio.sleep(0.2)
+                completed, failed = await self._track_completions(
+                    pool, batch_id, id_to_task, brand_dir
+                )
                 # Any tasks that never submitted a ticket count as failed.
-                missing = max(0, min(len(cleaned_tasks), submitted_count) - len(ticket_ids))
+                missing = len(set(attempted) - set(id_to_task.values()))
                 result.completed = completed
                 result.failed = failed + missing
             # Complete task file
@@ -406,6 +459,68 @@ class BatchExecutor:
             set_async_mode(False)
             logger.info("[BATCH] Disabled async mode")
 
+    async def _track_completions(
+        self,
+        pool: ImageGenerationPool,
+        batch_id: str,
+        id_to_task: dict[str, int],
+        brand_dir: Path | None,
+    ) -> tuple[int, int]:
+        """Mark tasks done as their images finish. Returns (completed, failed).
+        Results are pushed by the pool as each ticket settles. A stop or new
+        direction cancels the batch's outstanding tickets.
+        """
+        counts = {"completed": 0, "failed": 0}
+
+        async def consume() -> None:
+            async for res in pool.as_completed(batch_id, timeout=600.0):
+                ticket_task_num = id_to_task.get(res.ticket_id)
+                if ticket_task_num is None:
+                    continue
+                if res.status == TicketStatus.COMPLETED and res.path:
+                    output_path = res.path
+                    if brand_dir:
+                        try:
+                            p = Path(res.path)
+                            if p.is_absolute():
+                                output_path = p.resolve().relative_to(brand_dir).as_posix()
+                        except Exception:
+                            output_path = res.path
+                    _impl_update_task(ticket_task_num, done=True, output_path=output_path)
+                    self._emit_progress(
+                        "task_completed", {"number": ticket_task_num, "output": output_path}
+                    )
+                    counts["completed"] += 1
+                elif res.status in (
+                    TicketStatus.FAILED,
+                    TicketStatus.CANCELLED,
+                    TicketStatus.TIMEOUT,
+                ):
+                    counts["failed"] += 1
+                    self._emit_progress(
+                        "task_failed",
+                        {"number": ticket_task_num, "error": res.error or res.status.value},
+                    )
+
+        consumer = asyncio.create_task(consume())
+        try:
+            # Completions wake this immediately; the timeout only bounds how long
+            # a stop request can go unnoticed
+            while not consumer.done():
+                await asyncio.wait({consumer}, timeout=INTERRUPT_CHECK_INTERVAL)
+                if not consumer.done() and self.state.get_interrupt() in (
+                    "stop",
+                    "new_direction",
+                ):
+                    pool.cancel_batch(batch_id)
+                    consumer.cancel()
+                    break
+        finally:
+            if not consumer.done():
+                consumer.cancel()
+            await asyncio.gather(consumer, return_exceptions=True)
+        return counts["completed"], counts["failed"]
+
     async def _execute_single_task(
         self, task_num: int, task_desc: str, context: dict
     ) -> TaskResult:
@@ -457,6 +572,25 @@ class BatchExecutor:
             error="Max retries exceeded",
         )
 
+    @staticmethod
+    def _pool_config(context: dict) -> dict:
+        """Image pool ticket config for planned prompts."""
+        products = context.get("product_slugs") or []
+        style_slugs = [
+            s.get("slug") for s in context.get("style_refs") or [] if isinstance(s, dict)
+        ]
+        return {
+            "aspect_ratio": context.get("aspect_ratio", "1:1"),
+            "filename": None,
+            "reference_image": None,
+            "product_slug": products[0] if len(products) == 1 else None,
+            "product_slugs": products if len(products) > 1 else None,
+            "template_slug": style_slugs[0] if len(style_slugs) == 1 else None,
+            "strict": True,
+            "validate_identity": False,
+            "max_retries": 3,
+        }
+
     def _build_instruction(self, task_desc: str, context: dict, attempt: int) -> str:
         """Build instruction for single task execution."""
         product_info = ""
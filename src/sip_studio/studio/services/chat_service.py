@@ -236,6 +236,27 @@ class ChatService:
             return 5
         return None
 
+    def _build_turn_context(
+        self,
+        slug: str,
+        attached_products: list[str] | None,
+        project_slug: str | None,
+        attached_style_references: list[dict] | None,
+    ) -> str:
+        """Brand/product/project context used to plan batch prompts ("" on failure)."""
+        from sip_studio.brands.context import HierarchicalContextBuilder
+
+        try:
+            builder = HierarchicalContextBuilder(
+                brand_slug=slug,
+                product_slugs=attached_products,
+                project_slug=project_slug,
+                attached_style_references=attached_style_references,
+            )
+            return builder.build_turn_context()
+        except Exception:
+            return ""
+
     def _relativize_output_path(self, brand_dir: Path, raw_path: str | None) -> str | None:
         """Convert absolute paths under brand dir to stable relative paths (assets/...)."""
         if not raw_path:
@@ -341,19 +362,9 @@ class ChatService:
             if not research_mode_enabled and idea_count and idea_count >= 3:
                 logger.info(f"[BATCH] Detected idea+generate request ({idea_count} ideas)")
                 try:
-                    from sip_studio.brands.context import HierarchicalContextBuilder
-
-                    turn_context = ""
-                    try:
-                        builder = HierarchicalContextBuilder(
-                            brand_slug=slug,
-                            product_slugs=attached_products,
-                            project_slug=effective_project,
-                            attached_style_references=attached_style_references,
-                        )
-                        turn_context = builder.build_turn_context()
-                    except Exception:
-                        turn_context = ""
+                    turn_context = self._build_turn_context(
+                        slug, attached_products, effective_project, attached_style_references
+                    )
                     planned = asyncio.run(IdeaPlanner.plan(prepared, idea_count, turn_context))
                     if planned and len(planned) >= 3:
                         # TASKS.md: 1 planning step + N image tasks
@@ -480,6 +491,12 @@ class ChatService:
                                     "style_refs": attached_style_references,
                                     "aspect_ratio": validated_image_ratio.value,
                                     "project_slug": effective_project,
+                                    "brand_context": self._build_turn_context(
+                                        slug,
+                                        attached_products,
+                                        effective_project,
+                                        attached_style_references,
+                                    ),
                                 },
                             )
                         )
@@ -0,0 +1,50 @@
+"""Shared Gemini client.
+
+Creating a ``genai.Client`` sets up its HTTP transports, so building one per
+image request throws away connection reuse. Clients are cached per API key
+and per event loop: the async transport (``client.aio``) holds connections
+bound to the loop that opened them, so each loop (the image pool's
+background loop, the agent's loop) gets its own client, and synchronous
+callers share one more.
+"""
+
+import asyncio
+import threading
+import weakref
+
+from google import genai
+
+from sip_studio.config.settings import get_settings
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, genai.Client]]" = (
+    weakref.WeakKeyDictionary()
+)
+_sync_clients: dict[str, genai.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_gemini_client(api_key: str | None = None) -> genai.Client:
+    """Get the shared Gemini client for the current event loop (if any).
+
+    Args:
+        api_key: API key to use. Defaults to ``settings.gemini_api_key``.
+    """
+    key = api_key or get_settings().gemini_api_key
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _clients_lock:
+        cache = _sync_clients if loop is None else _clients.setdefault(loop, {})
+        client = cache.get(key)
+        if client is None:
+            client = genai.Client(api_key=key, vertexai=False)
+            cache[key] = client
+        return client
+
+
+def reset_gemini_clients() -> None:
+    """Drop all cached clients (for testing and API key changes)."""
+    with _clients_lock:
+        _clients.clear()
+        _sync_clients.clear()
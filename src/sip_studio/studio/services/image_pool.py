@@ -1,18 +1,28 @@
-"""Thread-based pool for parallel image generation.
-Uses ThreadPoolExecutor because Gemini client is synchronous.
+"""Async pool for parallel image generation.
+Tickets run as tasks on one long-lived background event loop. The default
+generator calls Gemini through the async client and the shared rate limiter,
+so queued tickets wait as coroutines rather than pinning threads, and
+concurrency is bounded by the provider's rate limit. Synchronous generator
+functions still run on a small thread pool.
 Thread-safe with proper locking and cancel token pattern.
 """
 
+import asyncio
+import contextvars
+import inspect
 import logging
 import queue
 import threading
 import time
 import uuid
 from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Callable
+from typing import AsyncIterator, Awaitable, Callable, cast
+
+from sip_studio.studio.services.rate_limiter import RequestPriority, request_priority
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +54,7 @@ class Ticket:
     result_path: str | None = None
     error: str | None = None
     created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
 
 
 @dataclass
@@ -65,27 +76,66 @@ class BatchResult:
     cancelled_count: int
 
 
+# Terminal tickets are dropped this long after finishing if nobody cleans up their batch
+DEFAULT_TICKET_TTL = 3600.0
+# Concurrent async generations; the shared rate limiter paces the actual API calls
+DEFAULT_MAX_IN_FLIGHT = 32
+
+SyncGeneratorFn = Callable[[Ticket], str]
+AsyncGeneratorFn = Callable[[Ticket], Awaitable[str]]
+GeneratorFn = SyncGeneratorFn | AsyncGeneratorFn
+
+
 class ImageGenerationPool:
-    """Thread-based pool for parallel image generation."""
+    """Async pool for parallel image generation.
+
+    Async generator functions are awaited on the pool's event loop, at most
+    ``max_in_flight`` at a time; synchronous ones run on ``max_workers``
+    threads. The public methods are blocking and safe to call from any
+    thread except the pool's loop.
+
+    Tickets are indexed by batch, with a count of unfinished tickets per
+    batch, so completing, waiting on, cancelling or cleaning up a batch only
+    touches that batch's tickets. Terminal tickets of batches that are never
+    cleaned up are reaped after ``ticket_ttl`` seconds.
+    """
 
     def __init__(
         self,
         max_workers: int = 5,
         default_timeout: float = 60.0,
-        generator_fn: Callable[[Ticket], str] | None = None,
+        generator_fn: GeneratorFn | None = None,
+        ticket_ttl: float = DEFAULT_TICKET_TTL,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
     ):
+        fn = generator_fn or self._default_generate
+        self._is_async = inspect.iscoroutinefunction(fn)
+        # Exactly one is set, depending on how the generator has to be called
+        self._async_fn = cast(AsyncGeneratorFn, fn) if self._is_async else None
+        self._sync_fn = None if self._is_async else cast(SyncGeneratorFn, fn)
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = asyncio.Semaphore(max_in_flight if self._is_async else max_workers)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._closed = False
         self._tickets: dict[str, Ticket] = {}
+        self._batches: dict[str, dict[str, None]] = {}  # Ordered ticket ids per batch
+        self._batch_pending: dict[str, int] = {}
         self._futures: dict[str, Future] = {}
         self._cancelled: set[str] = set()
         self._ticket_events: dict[str, threading.Event] = {}
         self._batch_events: dict[str, threading.Event] = {}
+        # as_completed() listeners per batch: settled tickets are pushed to their queues
+        self._batch_streams: dict[
+            str, list[tuple[asyncio.AbstractEventLoop, asyncio.Queue[TicketResult]]]
+        ] = {}
         self._lock = threading.RLock()
         self._progress_callback: Callable[[dict], None] | None = None
         self._main_thread_queue: queue.Queue | None = None
         self._default_timeout = default_timeout
-        self._generator_fn = generator_fn or self._default_generate
         self._last_status: dict[str, TicketStatus] = {}
+        self._ticket_ttl = ticket_ttl
+        self._last_reap = time.time()
 
     def set_main_thread_queue(self, q: queue.Queue):
         """Set queue for dispatching callbacks to main thread (PyWebView requirement)."""
@@ -98,21 +148,75 @@ class ImageGenerationPool:
         tid = str(uuid.uuid4())
         ticket = Ticket(id=tid, prompt=prompt, config=config, batch_id=batch_id)
         with self._lock:
+            self._maybe_reap(ticket.created_at)
             self._tickets[tid] = ticket
             self._ticket_events[tid] = threading.Event()
-            if batch_id and batch_id not in self._batch_events:
-                self._batch_events[batch_id] = threading.Event()
-        future = self._executor.submit(self._process_ticket, tid)
+            if batch_id:
+                self._batches.setdefault(batch_id, {})[tid] = None
+                self._batch_pending[batch_id] = self._batch_pending.get(batch_id, 0) + 1
+                be = self._batch_events.get(batch_id)
+                if be is None:
+                    self._batch_events[batch_id] = threading.Event()
+                else:
+                    be.clear()  # Batch grew after finishing
+        future = asyncio.run_coroutine_threadsafe(self._process_ticket(tid), self._ensure_loop())
         with self._lock:
             self._futures[tid] = future
         self._emit_progress(tid, TicketStatus.QUEUED, {})
         logger.debug("[POOL] submitted ticket %s", tid[:8])
         return tid
 
-    def _process_ticket(self, ticket_id: str):
-        """Process a single ticket (runs in worker thread)."""
-        tname = threading.current_thread().name
-        logger.debug("[POOL] processing ticket=%s thread=%s", ticket_id[:8], tname)
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot submit tickets after shutdown")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop,), name="image-pool-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+    async def _process_ticket(self, ticket_id: str):
+        """Process a single ticket (runs on the pool's event loop)."""
+        with self._lock:
+            cancelled = ticket_id in self._cancelled
+        if cancelled:
+            # Record the cancellation without waiting for a slot
+            await self._run_ticket(ticket_id)
+            return
+        try:
+            async with self._slots:
+                await self._run_ticket(ticket_id)
+        except asyncio.CancelledError:
+            # Pool shutting down while the ticket waited for a slot
+            self._mark_interrupted(ticket_id)
+            self._on_ticket_done(ticket_id)
+            raise
+
+    def _mark_interrupted(self, ticket_id: str):
+        """Mark a ticket whose task was cancelled by shutdown as CANCELLED."""
+        with self._lock:
+            ticket = self._tickets.get(ticket_id)
+            if not ticket or ticket.status.is_terminal():
+                return
+            ticket.status = TicketStatus.CANCELLED
+        self._emit_progress(ticket_id, TicketStatus.CANCELLED, {})
+
+    async def _run_ticket(self, ticket_id: str):
+        logger.debug("[POOL] processing ticket=%s", ticket_id[:8])
         try:
             with self._lock:
                 if ticket_id in self._cancelled:
@@ -126,7 +230,18 @@ class ImageGenerationPool:
                     return
                 ticket.status = TicketStatus.PROCESSING
             self._emit_progress(ticket_id, TicketStatus.PROCESSING, {})
-            result_path = self._generator_fn(ticket)
+            # Batch tickets yield the rate limit to interactive ones
+            lane = RequestPriority.BATCH if ticket.batch_id else RequestPriority.INTERACTIVE
+            with request_priority(lane):
+                if self._async_fn is not None:
+                    result_path = await self._async_fn(ticket)
+                else:
+                    assert self._sync_fn is not None
+                    loop = asyncio.get_running_loop()
+                    ctx = contextvars.copy_context()
+                    result_path = await loop.run_in_executor(
+                        self._executor, ctx.run, self._sync_fn, ticket
+                    )
             with self._lock:
                 ticket = self._tickets.get(ticket_id)
                 if ticket:
@@ -148,54 +263,80 @@ class ImageGenerationPool:
                     ticket.status = TicketStatus.FAILED
                     ticket.error = str(e)
             self._emit_progress(ticket_id, TicketStatus.FAILED, {"error": str(e)})
+        except asyncio.CancelledError:
+            self._mark_interrupted(ticket_id)
+            raise
         finally:
             self._on_ticket_done(ticket_id)
 
-    def _default_generate(self, ticket: Ticket) -> str:
-        """Default image generation using rate-limited Gemini API.
-        Runs in worker thread, so we create a new event loop for async code."""
-        import asyncio
-
+    @staticmethod
+    async def _default_generate(ticket: Ticket) -> str:
+        """Default image generation using the async, rate-limited Gemini API.
+        Runs on the pool's loop, sharing its Gemini client across tickets."""
         from sip_studio.advisor.tools.image_tools import _impl_generate_image
 
         cfg = ticket.config
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(
-                _impl_generate_image(
-                    prompt=ticket.prompt,
-                    aspect_ratio=cfg.get("aspect_ratio", "1:1"),
-                    filename=cfg.get("filename"),
-                    reference_image=cfg.get("reference_image"),
-                    product_slug=cfg.get("product_slug"),
-                    product_slugs=cfg.get("product_slugs"),
-                    template_slug=cfg.get("template_slug"),
-                    strict=cfg.get("strict", True),
-                    validate_identity=cfg.get("validate_identity", False),
-                    max_retries=cfg.get("max_retries", 3),
-                    skip_project=cfg.get("skip_project", False),
-                )
-            )
-            if result.startswith("Error"):
-                raise RuntimeError(result)
-            return result.split("\n\n")[0] if "\n\n" in result else result
-        finally:
-            loop.close()
+        result = await _impl_generate_image(
+            prompt=ticket.prompt,
+            aspect_ratio=cfg.get("aspect_ratio", "1:1"),
+            filename=cfg.get("filename"),
+            reference_image=cfg.get("reference_image"),
+            product_slug=cfg.get("product_slug"),
+            product_slugs=cfg.get("product_slugs"),
+            template_slug=cfg.get("template_slug"),
+            strict=cfg.get("strict", True),
+            validate_identity=cfg.get("validate_identity", False),
+            max_retries=cfg.get("max_retries", 3),
+            skip_project=cfg.get("skip_project", False),
+        )
+        if result.startswith("Error"):
+            raise RuntimeError(result)
+        return result.split("\n\n")[0] if "\n\n" in result else result
 
     def _on_ticket_done(self, ticket_id: str):
         """Called when ticket processing completes (success, fail, or cancel)."""
         with self._lock:
-            event = self._ticket_events.get(ticket_id)
-            if event:
-                event.set()
             ticket = self._tickets.get(ticket_id)
-            if ticket and ticket.batch_id:
-                batch_tickets = [t for t in self._tickets.values() if t.batch_id == ticket.batch_id]
-                if all(t.status.is_terminal() for t in batch_tickets):
-                    be = self._batch_events.get(ticket.batch_id)
-                    if be:
-                        be.set()
+            if ticket:
+                self._settle(ticket)
+
+    def _settle(self, ticket: Ticket):
+        """Record a ticket reaching a terminal state (once). Caller holds the lock."""
+        if ticket.finished_at is not None:
+            return
+        ticket.finished_at = time.time()
+        event = self._ticket_events.get(ticket.id)
+        if event:
+            event.set()
+        bid = ticket.batch_id
+        if bid and bid in self._batch_pending:
+            self._batch_pending[bid] -= 1
+            if self._batch_pending[bid] <= 0:
+                be = self._batch_events.get(bid)
+                if be:
+                    be.set()
+        if bid and bid in self._batch_streams:
+            result = self._ticket_result(ticket)
+            for loop, results in self._batch_streams[bid]:
+                try:
+                    loop.call_soon_threadsafe(results.put_nowait, result)
+                except RuntimeError:
+                    pass  # Listener's loop already closed
+
+    @staticmethod
+    def _ticket_result(ticket: Ticket) -> TicketResult:
+        return TicketResult(
+            ticket_id=ticket.id, status=ticket.status, path=ticket.result_path, error=ticket.error
+        )
+
+    def _batch_tickets(self, batch_id: str) -> list[Ticket]:
+        """Tickets of a batch, in submission order. Caller holds the lock."""
+        return [self._tickets[tid] for tid in self._batches.get(batch_id, ())]
+
+    def batch_ticket_ids(self, batch_id: str) -> list[str]:
+        """Ids of a batch's tickets, in submission order."""
+        with self._lock:
+            return list(self._batches.get(batch_id, ()))
 
     def wait_for_ticket(self, ticket_id: str, timeout: float | None = None) -> TicketResult:
         """Block until a single ticket completes. Returns result."""
@@ -208,12 +349,7 @@ class ImageGenerationPool:
                 return TicketResult(
                     ticket_id=ticket_id, status=TicketStatus.CANCELLED, error="Ticket not found"
                 )
-            return TicketResult(
-                ticket_id=ticket_id,
-                status=ticket.status,
-                path=ticket.result_path,
-                error=ticket.error,
-            )
+            return self._ticket_result(ticket)
 
     def wait_for_batch(self, batch_id: str, timeout: float | None = None) -> BatchResult:
         """Block until all tickets in batch complete. Returns results."""
@@ -221,11 +357,8 @@ class ImageGenerationPool:
         if event:
             event.wait(timeout=timeout or self._default_timeout * 10)
         with self._lock:
-            tickets = [t for t in self._tickets.values() if t.batch_id == batch_id]
-            results = [
-                TicketResult(ticket_id=t.id, status=t.status, path=t.result_path, error=t.error)
-                for t in tickets
-            ]
+            tickets = self._batch_tickets(batch_id)
+            results = [self._ticket_result(t) for t in tickets]
             return BatchResult(
                 batch_id=batch_id,
                 tickets=results,
@@ -234,25 +367,61 @@ class ImageGenerationPool:
                 cancelled_count=sum(1 for t in tickets if t.status == TicketStatus.CANCELLED),
             )
 
+    async def as_completed(
+        self, batch_id: str, timeout: float | None = None
+    ) -> AsyncIterator[TicketResult]:
+        """Yield each ticket of a batch as soon as it reaches a terminal state.
+        Tickets that already finished are yielded first; tickets added to the
+        batch while iterating are included. Safe to use from any event loop
+        other than the pool's own.
+        Args:
+            timeout: Seconds to wait overall (defaults to 10x the ticket timeout).
+                Iteration stops early if the batch does not finish in time.
+        """
+        loop = asyncio.get_running_loop()
+        results: asyncio.Queue[TicketResult] = asyncio.Queue()
+        listener = (loop, results)
+        with self._lock:
+            streams = self._batch_streams.setdefault(batch_id, [])
+            streams.append(listener)
+            for ticket in self._batch_tickets(batch_id):
+                if ticket.finished_at is not None:
+                    results.put_nowait(self._ticket_result(ticket))
+        deadline = loop.time() + (timeout or self._default_timeout * 10)
+        seen: set[str] = set()
+        try:
+            while True:
+                with self._lock:
+                    if seen.issuperset(self._batches.get(batch_id, ())) and results.empty():
+                        return
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    result = await asyncio.wait_for(results.get(), remaining)
+                except TimeoutError:
+                    return
+                if result.ticket_id not in seen:
+                    seen.add(result.ticket_id)
+                    yield result
+        finally:
+            with self._lock:
+                streams.remove(listener)
+                if not streams and self._batch_streams.get(batch_id) is streams:
+                    del self._batch_streams[batch_id]
+
     def cancel_batch(self, batch_id: str) -> int:
         """Mark all non-terminal tickets in batch for cancellation. Returns count."""
         cancelled = 0
         with self._lock:
-            for tid, ticket in self._tickets.items():
-                if ticket.batch_id == batch_id and not ticket.status.is_terminal():
-                    self._cancelled.add(tid)
+            for ticket in self._batch_tickets(batch_id):
+                if not ticket.status.is_terminal():
+                    self._cancelled.add(ticket.id)
                     if ticket.status == TicketStatus.QUEUED:
                         ticket.status = TicketStatus.CANCELLED
-                        event = self._ticket_events.get(tid)
-                        if event:
-                            event.set()
-                        self._emit_progress(tid, TicketStatus.CANCELLED, {})
+                        self._settle(ticket)
+                        self._emit_progress(ticket.id, TicketStatus.CANCELLED, {})
                         cancelled += 1
-            batch_tickets = [t for t in self._tickets.values() if t.batch_id == batch_id]
-            if all(t.status.is_terminal() for t in batch_tickets):
-                be = self._batch_events.get(batch_id)
-                if be:
-                    be.set()
         return cancelled
 
     def _emit_progress(self, ticket_id: str, status: TicketStatus, data: dict):
@@ -289,26 +458,86 @@ class ImageGenerationPool:
         self._progress_callback = callback
 
     def shutdown(self, wait: bool = True):
-        """Shutdown the pool."""
+        """Shutdown the pool.
+        Args:
+            wait: Wait for submitted tickets to finish. Otherwise unfinished
+                tickets are cancelled and this returns immediately.
+        """
+        with self._lock:
+            self._closed = True
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+            futures = list(self._futures.values())
+        if wait and futures:
+            wait_futures(futures)
+        if loop is not None and thread is not None:
+            asyncio.run_coroutine_threadsafe(self._stop_loop(), loop)
+            if wait:
+                thread.join()
         self._executor.shutdown(wait=wait)
 
+    @staticmethod
+    async def _stop_loop():
+        """Cancel remaining ticket tasks, then stop the loop."""
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        asyncio.get_running_loop().stop()
+
     def cleanup_batch(self, batch_id: str):
         """Remove ONLY terminal tickets from memory. Safe to call anytime."""
         with self._lock:
-            to_remove = [
-                tid
-                for tid, t in self._tickets.items()
-                if t.batch_id == batch_id and t.status.is_terminal()
+            for ticket in self._batch_tickets(batch_id):
+                if ticket.finished_at is not None:
+                    self._remove_ticket(ticket)
+
+    def reap_expired(self, now: float | None = None) -> int:
+        """Remove terminal tickets that finished more than ``ticket_ttl`` ago.
+
+        Runs automatically on submit; callers rarely need it directly.
+
+        Returns:
+            Number of tickets removed.
+        """
+        now = time.time() if now is None else now
+        cutoff = now - self._ticket_ttl
+        with self._lock:
+            self._last_reap = now
+            expired = [
+                t
+                for t in self._tickets.values()
+                if t.finished_at is not None and t.finished_at < cutoff
             ]
-            for tid in to_remove:
-                self._tickets.pop(tid, None)
-                self._futures.pop(tid, None)
-                self._ticket_events.pop(tid, None)
-                self._cancelled.discard(tid)
-                self._last_status.pop(tid, None)
-            remaining = [t for t in self._tickets.values() if t.batch_id == batch_id]
-            if not remaining:
-                self._batch_events.pop(batch_id, None)
+            for ticket in expired:
+                self._remove_ticket(ticket)
+        if expired:
+            logger.debug("[POOL] reaped %d expired tickets", len(expired))
+        return len(expired)
+
+    def _maybe_reap(self, now: float):
+        """Reap at most every ticket_ttl / 4 seconds. Caller holds the lock."""
+        if now - self._last_reap >= self._ticket_ttl / 4:
+            self.reap_expired(now)
+
+    def _remove_ticket(self, ticket: Ticket):
+        """Drop a terminal ticket and its bookkeeping. Caller holds the lock."""
+        tid = ticket.id
+        self._tickets.pop(tid, None)
+        self._futures.pop(tid, None)
+        self._ticket_events.pop(tid, None)
+        self._cancelled.discard(tid)
+        self._last_status.pop(tid, None)
+        bid = ticket.batch_id
+        if bid is not None:
+            members = self._batches.get(bid)
+            if members is not None:
+                members.pop(tid, None)
+                if not members:
+                    self._batches.pop(bid, None)
+                    self._batch_pending.pop(bid, None)
+                    self._batch_events.pop(bid, None)
 
 
 # Singleton
@@ -317,7 +546,7 @@ _pool_lock = threading.Lock()
 
 
 def get_image_pool(
-    max_workers: int = 5, generator_fn: Callable[[Ticket], str] | None = None, _reset: bool = False
+    max_workers: int = 5, generator_fn: GeneratorFn | None = None, _reset: bool = False
 ) -> ImageGenerationPool:
     """Get or create the global image pool singleton."""
     global _image_pool
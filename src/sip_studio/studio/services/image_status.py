@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import atexit
+import json
+import os
+import threading
+import time
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal
 
-from sip_studio.brands.storage import get_brand_dir, load_image_status_raw, save_image_status
+from sip_studio.brands.storage import (
+    get_brand_dir,
+    read_image_status_file,
+    write_image_status_file,
+)
 from sip_studio.config.logging import get_logger
+from sip_studio.utils.file_utils import write_atomically
 
 from ..state import BridgeState
 from ..utils.bridge_types import bridge_error, bridge_ok
@@ -18,10 +31,273 @@ ImageStatus = Literal["unsorted", "kept", "trashed"]
 STATUS_FILE_NAME = "image_status.json"
 CURRENT_VERSION = 1
 UNREAD_TRACKING_STARTED_AT_KEY = "unreadTrackingStartedAt"
+BACKFILL_CHECKPOINTS_KEY = "backfillCheckpoints"
+# Folder mtimes this recent are not trusted as checkpoints: a file created in the
+# same filesystem clock tick as the scan would not change them again
+CHECKPOINT_SETTLE_SECONDS = 2.0
+# Seconds to batch status changes before writing them to disk
+FLUSH_DELAY = 1.0
+# Asset folders whose mtimes signal deletions worth a stale-entry sweep
+WATCHED_FOLDERS = ("generated", "kept", "trash")
+# Seconds between checks of those folders, and between sweeps regardless of them
+# (entries can point outside the asset folders)
+STALE_POLL_INTERVAL = 2.0
+STALE_SWEEP_INTERVAL = 300.0
+# Entries stat'ed per sweep step; the store lock is released between steps
+STALE_SWEEP_CHUNK = 500
+
+_upscale_executor: ThreadPoolExecutor | None = None
+_upscale_lock = threading.Lock()
+_sweep_executor: ThreadPoolExecutor | None = None
+
+
+def _get_upscale_executor() -> ThreadPoolExecutor:
+    """Get the shared executor for upscale-on-keep jobs (lazy init)."""
+    global _upscale_executor
+    with _upscale_lock:
+        if _upscale_executor is None:
+            _upscale_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="upscale")
+        return _upscale_executor
+
+
+def _get_sweep_executor() -> ThreadPoolExecutor:
+    """Get the shared executor for background stale-entry sweeps (lazy init)."""
+    global _sweep_executor
+    with _upscale_lock:
+        if _sweep_executor is None:
+            _sweep_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="status-sweep")
+        return _sweep_executor
+
+
+def _upscale_kept_image(path: str, meta: dict, final_size: str) -> None:
+    """Render a kept image's high-resolution variant and record it in the metadata."""
+    from sip_studio.generators.resolution import upscale_image
+
+    try:
+        variant = upscale_image(path, aspect_ratio=meta.get("aspect_ratio"), target_size=final_size)
+        if variant is None:
+            return
+        meta = {**meta, "hires_path": str(variant), "hires_size": final_size}
+        write_atomically(Path(path).with_suffix(".meta.json"), json.dumps(meta, indent=2))
+    except Exception as e:
+        logger.warning(f"Upscale on keep failed for {path}: {e}")
+
+
+def schedule_upscale_on_keep(path: str | None) -> bool:
+    """Render a kept draft-resolution image's final-size variant in the background.
+    Only images whose generation metadata records a size below the resolution
+    policy's final size are upscaled. Returns True if an upscale was scheduled."""
+    from sip_studio.advisor.tools import load_image_metadata
+    from sip_studio.generators.resolution import get_resolution_policy
+
+    if not path or not Path(path).is_file():
+        return False
+    meta = load_image_metadata(path)
+    policy = get_resolution_policy()
+    if not meta or not policy.needs_upscale(meta.get("image_size")):
+        return False
+    _get_upscale_executor().submit(_upscale_kept_image, path, meta, policy.final)
+    return True
+
+
+class _StatusStore:
+    """In-memory image_status.json for one brand, with lookup indexes.
+    Loaded once and reloaded only when the file changes underneath it (by
+    mtime and size). Mutations mark the store dirty, and a timer writes every
+    change made within FLUSH_DELAY seconds in a single save.
+    Callers hold ``lock`` while reading or mutating.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.data: dict = {"version": CURRENT_VERSION, "images": {}}
+        # path -> ids (currentPath and originalPath), status -> ids; both insertion ordered
+        self.by_path: dict[str, dict[str, None]] = {}
+        # file name of currentPath -> ids (the normalized form backfill compares)
+        self.by_name: dict[str, dict[str, None]] = {}
+        self.by_status: dict[str, dict[str, None]] = {}
+        # status -> ids sorted by timestamp, rebuilt lazily after changes to that status
+        self._order: dict[str, list[str]] = {}
+        self.dirty = False
+        # Stale sweep bookkeeping (see ImageStatusService._maybe_sweep)
+        self.folder_sig: tuple[int, ...] | None = None
+        self.polled_at = 0.0
+        self.swept_at = 0.0
+        self.sweeping = False
+        self._loaded = False
+        self._file_sig: tuple[int, int] | None = None
+        self._timer: threading.Timer | None = None
+
+    @property
+    def images(self) -> dict[str, dict]:
+        return self.data["images"]
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def refresh(self) -> bool:
+        """Load the file if it is new or changed on disk. Returns True if loaded.
+        Unsaved changes win over a concurrent external edit."""
+        sig = self._stat()
+        if self._loaded and (sig == self._file_sig or self.dirty):
+            return False
+        self.data = read_image_status_file(self.path)
+        self._file_sig = sig
+        self._loaded = True
+        self.reindex()
+        return True
+
+    def reindex(self) -> None:
+        self.by_path.clear()
+        self.by_name.clear()
+        self.by_status.clear()
+        self._order.clear()
+        for image_id, entry in self.images.items():
+            if isinstance(entry, dict):
+                self._index(image_id, entry)
+
+    def _index(self, image_id: str, entry: dict) -> None:
+        for key in (entry.get("currentPath"), entry.get("originalPath")):
+            if key:
+                self.by_path.setdefault(key, {})[image_id] = None
+        name = Path(entry.get("currentPath") or "").name
+        self.by_name.setdefault(name, {})[image_id] = None
+        status = entry.get("status") or "unsorted"
+        self.by_status.setdefault(status, {})[image_id] = None
+        self._order.pop(status, None)
+
+    def _unindex(self, image_id: str, entry: dict) -> None:
+        for key in (entry.get("currentPath"), entry.get("originalPath")):
+            ids = self.by_path.get(key) if key else None
+            if key and ids is not None:
+                ids.pop(image_id, None)
+                if not ids:
+                    del self.by_path[key]
+        name = Path(entry.get("currentPath") or "").name
+        ids = self.by_name.get(name)
+        if ids is not None:
+            ids.pop(image_id, None)
+            if not ids:
+                del self.by_name[name]
+        status = entry.get("status") or "unsorted"
+        ids = self.by_status.get(status)
+        if ids is not None:
+            ids.pop(image_id, None)
+        self._order.pop(status, None)
+
+    def add(self, entry: dict) -> None:
+        self.images[entry["id"]] = entry
+        self._index(entry["id"], entry)
+        self.mark_dirty()
+
+    def update(self, image_id: str, **fields) -> dict:
+        entry = self.images[image_id]
+        self._unindex(image_id, entry)
+        entry.update(fields)
+        self._index(image_id, entry)
+        self.mark_dirty()
+        return entry
+
+    def remove(self, image_id: str) -> dict | None:
+        entry = self.images.pop(image_id, None)
+        if isinstance(entry, dict):
+            self._unindex(image_id, entry)
+        # Its file may still be on disk; let the next backfill rescan every folder
+        self.data.pop(BACKFILL_CHECKPOINTS_KEY, None)
+        self.mark_dirty()
+        return entry
+
+    def find_by_path(self, path: str) -> str | None:
+        ids = self.by_path.get(path)
+        return next(iter(ids)) if ids else None
+
+    def ids_with_status(self, status: str) -> list[str]:
+        return list(self.by_status.get(status, ()))
+
+    def sorted_ids(self, status: str) -> list[str]:
+        """Ids with a status, oldest first by timestamp (cached until they change)."""
+        order = self._order.get(status)
+        if order is None:
+            ids = self.by_status.get(status, {})
+            order = sorted(ids, key=lambda i: self.images[i].get("timestamp") or "")
+            self._order[status] = order
+        return order
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(FLUSH_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes now."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.dirty:
+                return
+            try:
+                write_image_status_file(self.path, self.data)
+            except OSError as e:
+                logger.warning("Failed to save %s: %s", self.path, e)
+                self.mark_dirty()  # Retry on the next timer
+                return
+            self.dirty = False
+            self._file_sig = self._stat()
+
+    def discard(self) -> None:
+        """Drop pending changes and stop the flush timer (for testing)."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.dirty = False
+
+
+_stores: dict[Path, _StatusStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _get_store(path: Path) -> _StatusStore:
+    """Get the shared store for a status file (every service instance uses it)."""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = _StatusStore(path)
+        return store
+
+
+def flush_image_status() -> None:
+    """Write all pending image status changes (runs at exit)."""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.flush()
+
+
+def reset_image_status_stores() -> None:
+    """Forget all loaded stores without saving (for testing)."""
+    with _stores_lock:
+        for store in _stores.values():
+            store.discard()
+        _stores.clear()
+
+
+atexit.register(flush_image_status)
 
 
 class ImageStatusService:
-    """Track image lifecycle with viewedAt for unread/read status."""
+    """Track image lifecycle with viewedAt for unread/read status.
+    Backed by a shared, indexed in-memory store per brand; writes are
+    coalesced and flushed in the background (see ``flush``).
+    """
 
     def __init__(self, state: BridgeState):
         self._state = state
@@ -30,20 +306,35 @@ class ImageStatusService:
         """Get path to image_status.json for a brand."""
         return get_brand_dir(brand_slug) / STATUS_FILE_NAME
 
-    def _load_status_data(self, brand_slug: str) -> dict:
-        """Load status data from file, creating empty structure if missing."""
-        data = load_image_status_raw(brand_slug)
+    @contextmanager
+    def _open(self, brand_slug: str) -> Iterator[_StatusStore]:
+        """Lock and yield the brand's store, loading (and migrating) it if needed."""
+        with self._use(_get_store(self._get_status_file(brand_slug))) as store:
+            yield store
+
+    @contextmanager
+    def _use(self, store: _StatusStore) -> Iterator[_StatusStore]:
+        with store.lock:
+            if store.refresh():
+                self._migrate(store)
+            yield store
+
+    def _migrate(self, store: _StatusStore) -> None:
+        """Apply legacy data migrations after a load."""
+        data = store.data
         # Migrate legacy data: ensure unread tracking baseline exists + mark legacy images as viewed
         baseline, changed = self._ensure_unread_tracking_started_at(data)
         changed = self._migrate_legacy_viewed_at(data, baseline) or changed
         changed = self._migrate_legacy_status_fields(data) or changed
         if changed:
-            self._save_status_data(brand_slug, data)
-        return data
+            store.mark_dirty()
 
-    def _save_status_data(self, brand_slug: str, data: dict) -> None:
-        """Atomically save status data to file."""
-        save_image_status(brand_slug, data)
+    def flush(self, brand_slug: str | None = None) -> None:
+        """Write pending changes to disk now (all brands if no slug given)."""
+        if brand_slug is None:
+            flush_image_status()
+        else:
+            _get_store(self._get_status_file(brand_slug)).flush()
 
     def _generate_id(self) -> str:
         """Generate unique image ID."""
@@ -121,67 +412,148 @@ class ImageStatusService:
     def get_status(self, brand_slug: str, image_id: str) -> dict:
         """Get status entry for a specific image."""
         try:
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
-            if image_id not in images:
-                return bridge_error(f"Image not found: {image_id}")
-            return bridge_ok(images[image_id])
+            with self._open(brand_slug) as store:
+                entry = store.images.get(image_id)
+                if entry is None:
+                    return bridge_error(f"Image not found: {image_id}")
+                return bridge_ok(dict(entry))
         except Exception as e:
             return bridge_error(str(e))
 
     def set_status(self, brand_slug: str, image_id: str, status: ImageStatus) -> dict:
         """Update status of an image."""
         try:
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
-            if image_id not in images:
-                return bridge_error(f"Image not found: {image_id}")
-            entry = images[image_id]
-            entry["status"] = status
-            now = self._now_iso()
-            if status == "kept":
-                entry["keptAt"] = now
-                entry["trashedAt"] = None
-            elif status == "trashed":
-                entry["trashedAt"] = now
-                entry["keptAt"] = None
-            else:
-                entry["keptAt"] = None
-                entry["trashedAt"] = None
-            images[image_id] = entry
-            data["images"] = images
-            self._save_status_data(brand_slug, data)
+            with self._open(brand_slug) as store:
+                if image_id not in store.images:
+                    return bridge_error(f"Image not found: {image_id}")
+                previous = store.images[image_id].get("status")
+                now = self._now_iso()
+                kept_at = now if status == "kept" else None
+                trashed_at = now if status == "trashed" else None
+                entry = dict(
+                    store.update(image_id, status=status, keptAt=kept_at, trashedAt=trashed_at)
+                )
+            if status == "kept" and previous != "kept":
+                schedule_upscale_on_keep(entry.get("currentPath"))
             return bridge_ok(entry)
         except Exception as e:
             return bridge_error(str(e))
 
-    def list_by_status(self, brand_slug: str, status: ImageStatus) -> dict:
-        """List all images with a specific status, filtering out missing files."""
+    def list_by_status(
+        self,
+        brand_slug: str,
+        status: ImageStatus,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> dict:
+        """List images with a specific status, oldest first.
+        Served from the in-memory index; entries whose files disappeared are
+        dropped by a background sweep (see ``sweep_stale``).
+        Args:
+            offset: Number of entries to skip.
+            limit: Maximum number of entries to return (all if None).
+        """
         try:
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
-            # Filter by status and verify file exists on disk
-            filtered = []
-            stale_ids = []
-            for img_id, v in images.items():
-                if v.get("status") != status:
-                    continue
-                path = v.get("originalPath") or v.get("currentPath")
-                if path and Path(path).exists():
-                    filtered.append(v)
-                else:
-                    stale_ids.append(img_id)
-            # Clean up stale entries from index
-            if stale_ids:
-                for img_id in stale_ids:
-                    del images[img_id]
-                data["images"] = images
-                self._save_status_data(brand_slug, data)
-                logger.info(f"Cleaned up {len(stale_ids)} stale image entries")
-            return bridge_ok(filtered)
+            return bridge_ok(self._page(brand_slug, status, offset, limit)[0])
         except Exception as e:
             return bridge_error(str(e))
 
+    def page_by_status(
+        self, brand_slug: str, status: ImageStatus, offset: int = 0, limit: int = 100
+    ) -> dict:
+        """Get one page of images with a status, plus the total count for virtualized lists."""
+        try:
+            images, total = self._page(brand_slug, status, offset, limit)
+            return bridge_ok({"images": images, "total": total, "offset": offset})
+        except Exception as e:
+            return bridge_error(str(e))
+
+    def _page(
+        self, brand_slug: str, status: str, offset: int, limit: int | None
+    ) -> tuple[list[dict], int]:
+        offset = max(offset, 0)
+        with self._open(brand_slug) as store:
+            order = store.sorted_ids(status)
+            end = None if limit is None else offset + max(limit, 0)
+            images = [dict(store.images[i]) for i in order[offset:end]]
+            total = len(order)
+        self._maybe_sweep(brand_slug, store)
+        return images, total
+
+    def _folder_sig(self, brand_slug: str) -> tuple[int, ...]:
+        """Mtimes of the asset folders; a deletion or move inside them changes it."""
+        assets = get_brand_dir(brand_slug) / "assets"
+        sig = []
+        for folder in WATCHED_FOLDERS:
+            try:
+                sig.append((assets / folder).stat().st_mtime_ns)
+            except OSError:
+                sig.append(0)
+        return tuple(sig)
+
+    def _maybe_sweep(self, brand_slug: str, store: _StatusStore) -> None:
+        """Queue a background stale sweep if the asset folders changed or one is due."""
+        now = time.monotonic()
+        with store.lock:
+            if store.sweeping or now - store.polled_at < STALE_POLL_INTERVAL:
+                return
+            store.polled_at = now
+        sig = self._folder_sig(brand_slug)
+        with store.lock:
+            if sig == store.folder_sig and now - store.swept_at < STALE_SWEEP_INTERVAL:
+                return
+            if store.sweeping:
+                return
+            store.sweeping = True
+        try:
+            _get_sweep_executor().submit(self._run_sweep, brand_slug, store, sig)
+        except RuntimeError:  # Executor shut down at exit
+            store.sweeping = False
+
+    def _run_sweep(self, brand_slug: str, store: _StatusStore, sig: tuple[int, ...]) -> None:
+        try:
+            self._sweep_store(store)
+            with store.lock:
+                store.folder_sig = sig
+                store.swept_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Stale image sweep failed for {brand_slug}: {e}")
+        finally:
+            store.sweeping = False
+
+    def sweep_stale(self, brand_slug: str) -> int:
+        """Drop entries whose files no longer exist. Returns the number removed.
+        Files are stat'ed in chunks outside the store lock so the UI is never blocked."""
+        return self._sweep_store(_get_store(self._get_status_file(brand_slug)))
+
+    def _sweep_store(self, store: _StatusStore) -> int:
+        with self._use(store):
+            candidates = [
+                (img_id, e.get("originalPath") or e.get("currentPath"))
+                for img_id, e in store.images.items()
+                if isinstance(e, dict)
+            ]
+        removed = 0
+        for start in range(0, len(candidates), STALE_SWEEP_CHUNK):
+            chunk = candidates[start : start + STALE_SWEEP_CHUNK]
+            missing = [(i, p) for i, p in chunk if not (p and Path(p).exists())]
+            if not missing:
+                continue
+            with self._use(store):
+                for img_id, path in missing:
+                    entry = store.images.get(img_id)
+                    # Skip entries that were moved or removed since the stat
+                    if (
+                        entry is None
+                        or (entry.get("originalPath") or entry.get("currentPath")) != path
+                    ):
+                        continue
+                    store.remove(img_id)
+                    removed += 1
+        if removed:
+            logger.info(f"Cleaned up {removed} stale image entries")
+        return removed
+
     def register_image(
         self,
         brand_slug: str,
@@ -191,10 +563,8 @@ class ImageStatusService:
     ) -> dict:
         """Register a new image with unsorted status."""
         try:
-            data = self._load_status_data(brand_slug)
             image_id = self._generate_id()
             now = self._now_iso()
-            self._ensure_unread_tracking_started_at(data)
             source_path = source_template_path
             if source_template_path and not source_template_path.startswith(
                 ("data:", "http://", "https://")
@@ -222,53 +592,61 @@ class ImageStatusService:
                 "keptAt": None,
                 "trashedAt": None,
             }
-            data["images"][image_id] = entry
-            self._save_status_data(brand_slug, data)
-            return bridge_ok(entry)
+            with self._open(brand_slug) as store:
+                store.add(entry)
+            return bridge_ok(dict(entry))
         except Exception as e:
             return bridge_error(str(e))
 
     def mark_viewed(self, brand_slug: str, image_id: str) -> dict:
         """Mark image as viewed (read)."""
         try:
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
-            if image_id not in images:
-                return bridge_error(f"Image not found: {image_id}")
-            entry = images[image_id]
-            if not entry.get("viewedAt"):
-                entry["viewedAt"] = self._now_iso()
-                images[image_id] = entry
-                data["images"] = images
-                self._save_status_data(brand_slug, data)
-            return bridge_ok(entry)
+            with self._open(brand_slug) as store:
+                entry = store.images.get(image_id)
+                if entry is None:
+                    return bridge_error(f"Image not found: {image_id}")
+                if not entry.get("viewedAt"):
+                    entry = store.update(image_id, viewedAt=self._now_iso())
+                return bridge_ok(dict(entry))
+        except Exception as e:
+            return bridge_error(str(e))
+
+    def mark_viewed_many(self, brand_slug: str, image_ids: list[str]) -> dict:
+        """Mark several images as viewed in one update.
+        Returns the ids that were newly marked and the ids that were not found."""
+        try:
+            now = self._now_iso()
+            updated = []
+            missing = []
+            with self._open(brand_slug) as store:
+                for image_id in image_ids:
+                    entry = store.images.get(image_id)
+                    if entry is None:
+                        missing.append(image_id)
+                    elif not entry.get("viewedAt"):
+                        store.update(image_id, viewedAt=now)
+                        updated.append(image_id)
+            return bridge_ok({"updated": updated, "missing": missing, "viewedAt": now})
         except Exception as e:
             return bridge_error(str(e))
 
     def update_path(self, brand_slug: str, image_id: str, new_path: str) -> dict:
         """Update the current path of an image."""
         try:
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
-            if image_id not in images:
-                return bridge_error(f"Image not found: {image_id}")
-            images[image_id]["currentPath"] = new_path
-            data["images"] = images
-            self._save_status_data(brand_slug, data)
-            return bridge_ok(images[image_id])
+            with self._open(brand_slug) as store:
+                if image_id not in store.images:
+                    return bridge_error(f"Image not found: {image_id}")
+                return bridge_ok(dict(store.update(image_id, currentPath=new_path)))
         except Exception as e:
             return bridge_error(str(e))
 
     def delete_image(self, brand_slug: str, image_id: str) -> dict:
         """Remove an image entry from the status file."""
         try:
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
-            if image_id not in images:
-                return bridge_error(f"Image not found: {image_id}")
-            del images[image_id]
-            data["images"] = images
-            self._save_status_data(brand_slug, data)
+            with self._open(brand_slug) as store:
+                if image_id not in store.images:
+                    return bridge_error(f"Image not found: {image_id}")
+                store.remove(image_id)
             return bridge_ok()
         except Exception as e:
             return bridge_error(str(e))
@@ -276,12 +654,11 @@ class ImageStatusService:
     def find_by_path(self, brand_slug: str, path: str) -> dict:
         """Find image entry by current path. Returns entry with ID or error if not found."""
         try:
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
-            for img_id, entry in images.items():
-                if entry.get("currentPath") == path or entry.get("originalPath") == path:
-                    return bridge_ok({**entry, "id": img_id})
-            return bridge_error(f"Image not found for path: {path}")
+            with self._open(brand_slug) as store:
+                img_id = store.find_by_path(path)
+                if img_id is None:
+                    return bridge_error(f"Image not found for path: {path}")
+                return bridge_ok({**store.images[img_id], "id": img_id})
         except Exception as e:
             return bridge_error(str(e))
 
@@ -290,67 +667,82 @@ class ImageStatusService:
     ) -> dict:
         """Find existing entry by path or register new one."""
         try:
-            found = self.find_by_path(brand_slug, path)
-            if found.get("success"):
-                return found
-            # Register new entry
-            data = self._load_status_data(brand_slug)
-            image_id = self._generate_id()
-            now = self._now_iso()
-            kept_at = now if status == "kept" else None
-            trashed_at = now if status == "trashed" else None
-            entry = {
-                "id": image_id,
-                "status": status,
-                "originalPath": path,
-                "currentPath": path,
-                "prompt": None,
-                "sourceTemplatePath": None,
-                "timestamp": now,
-                "viewedAt": None,
-                "keptAt": kept_at,
-                "trashedAt": trashed_at,
-            }
-            data["images"][image_id] = entry
-            self._save_status_data(brand_slug, data)
-            return bridge_ok(entry)
+            with self._open(brand_slug) as store:
+                img_id = store.find_by_path(path)
+                if img_id is not None:
+                    return bridge_ok({**store.images[img_id], "id": img_id})
+                # Register new entry
+                image_id = self._generate_id()
+                now = self._now_iso()
+                kept_at = now if status == "kept" else None
+                trashed_at = now if status == "trashed" else None
+                entry = {
+                    "id": image_id,
+                    "status": status,
+                    "originalPath": path,
+                    "currentPath": path,
+                    "prompt": None,
+                    "sourceTemplatePath": None,
+                    "timestamp": now,
+                    "viewedAt": None,
+                    "keptAt": kept_at,
+                    "trashedAt": trashed_at,
+                }
+                store.add(entry)
+            return bridge_ok(dict(entry))
         except Exception as e:
             return bridge_error(str(e))
 
     def backfill_from_folders(self, brand_slug: str) -> dict:
-        """Scan asset folders and backfill missing entries."""
+        """Scan asset folders and backfill missing entries.
+        Only folders whose mtime moved since the last backfill are scanned, in
+        parallel; new entries are added in one batch (a single coalesced write).
+        """
         try:
-            from sip_studio.studio.utils.bridge_types import ALLOWED_IMAGE_EXTS
-
-            brand_dir = get_brand_dir(brand_slug)
-            data = self._load_status_data(brand_slug)
-            baseline_iso, _ = self._ensure_unread_tracking_started_at(data)
-            baseline_dt = self._parse_iso(baseline_iso) or datetime.now(timezone.utc)
-            # Use normalized paths for consistent comparison
-            existing_paths = {
-                self._normalize_path(e.get("currentPath")) for e in data.get("images", {}).values()
-            }
-            added = []
+            assets_dir = get_brand_dir(brand_slug) / "assets"
             folders_status = [("generated", "unsorted"), ("kept", "kept"), ("trash", "trashed")]
+            with self._open(brand_slug) as store:
+                baseline_iso, _ = self._ensure_unread_tracking_started_at(store.data)
+                checkpoints = dict(store.data.get(BACKFILL_CHECKPOINTS_KEY) or {})
+                # Normalized (file name) paths already tracked
+                known = set(store.by_name)
+            baseline_dt = self._parse_iso(baseline_iso) or datetime.now(timezone.utc)
+            changed = []
+            new_checkpoints = {}
+            settled_before = time.time() - CHECKPOINT_SETTLE_SECONDS
             for folder, status in folders_status:
-                folder_path = brand_dir / "assets" / folder
-                if not folder_path.exists():
+                try:
+                    mtime = (assets_dir / folder).stat().st_mtime_ns
+                except OSError:
                     continue
-                for fp in folder_path.iterdir():
-                    if not fp.is_file() or fp.suffix.lower() not in ALLOWED_IMAGE_EXTS:
-                        continue
-                    path_str = str(fp)
-                    if self._normalize_path(path_str) in existing_paths:
+                if mtime / 1e9 < settled_before:
+                    new_checkpoints[folder] = mtime
+                if checkpoints.get(folder) != mtime:
+                    changed.append((folder, status))
+            found: list[list[tuple[str, float, ImageStatus]]] = []
+            if changed:
+                with ThreadPoolExecutor(max_workers=len(changed)) as pool:
+                    found = list(
+                        pool.map(
+                            lambda fs: self._scan_folder(assets_dir / fs[0], fs[1], known),
+                            changed,
+                        )
+                    )
+            added = []
+            batch_names: set[str] = set()
+            with self._open(brand_slug) as store:
+                for path_str, mtime_s, status in (f for batch in found for f in batch):
+                    # Re-check: an image may have been registered while we scanned
+                    name = self._normalize_path(path_str)
+                    if name in store.by_name and name not in batch_names:
                         continue
-                    image_id = self._generate_id()
-                    mtime_dt = datetime.fromtimestamp(fp.stat().st_mtime, timezone.utc)
+                    batch_names.add(name)
+                    mtime_dt = datetime.fromtimestamp(mtime_s, timezone.utc)
                     ts = mtime_dt.isoformat()
                     # Backward compat: anything that existed before baseline is assumed read
                     viewed_at = baseline_iso if mtime_dt <= baseline_dt else None
-                    kept_at = ts if status == "kept" else None
-                    trashed_at = ts if status == "trashed" else None
                     entry = {
-                        "id": image_id,
+                        "id": self._generate_id(),
                         "status": status,
                         "originalPath": path_str,
                         "currentPath": path_str,
@@ -358,46 +750,59 @@ class ImageStatusService:
                         "sourceTemplatePath": None,
                         "timestamp": ts,
                         "viewedAt": viewed_at,
-                        "keptAt": kept_at,
-                        "trashedAt": trashed_at,
+                        "keptAt": ts if status == "kept" else None,
+                        "trashedAt": ts if status == "trashed" else None,
                     }
-                    data["images"][image_id] = entry
+                    store.add(entry)
                     added.append(entry)
-            if added:
-                self._save_status_data(brand_slug, data)
+                if store.data.get(BACKFILL_CHECKPOINTS_KEY) != new_checkpoints:
+                    store.data[BACKFILL_CHECKPOINTS_KEY] = new_checkpoints
+                    store.mark_dirty()
             return bridge_ok({"added": added, "count": len(added)})
         except Exception as e:
             return bridge_error(str(e))
 
+    def _scan_folder(
+        self, folder_path: Path, status: ImageStatus, known: set[str]
+    ) -> list[tuple[str, float, ImageStatus]]:
+        """List untracked images in a folder as (path, mtime, status).
+        Only files that are not tracked yet are stat'ed."""
+        from sip_studio.studio.utils.bridge_types import ALLOWED_IMAGE_EXTS
+
+        found = []
+        try:
+            with os.scandir(folder_path) as it:
+                for de in it:
+                    if Path(de.name).suffix.lower() not in ALLOWED_IMAGE_EXTS:
+                        continue
+                    if self._normalize_path(de.path) in known or not de.is_file():
+                        continue
+                    found.append((str(folder_path / de.name), de.stat().st_mtime, status))
+        except OSError as e:
+            logger.debug("Failed to scan %s: %s", folder_path, e)
+        return found
+
     def cleanup_old_trash(self, brand_slug: str, days: int = 30) -> dict:
         """Delete trash items older than specified days."""
         try:
             from datetime import timedelta
 
-            data = self._load_status_data(brand_slug)
-            images = data.get("images", {})
             cutoff = datetime.now(timezone.utc) - timedelta(days=days)
             deleted = []
-            to_remove = []
-            for image_id, entry in images.items():
-                if not isinstance(entry, dict) or entry.get("status") != "trashed":
-                    continue
-                trashed_dt = self._parse_iso(entry.get("trashedAt"))
-                if not trashed_dt or trashed_dt >= cutoff:
-                    continue
-                path = Path(entry.get("currentPath", ""))
-                if path.exists():
-                    try:
-                        path.unlink()
-                    except OSError as e:
-                        logger.debug("Failed to delete trashed image %s: %s", path, e)
-                to_remove.append(image_id)
-                deleted.append(entry)
-            for image_id in to_remove:
-                del images[image_id]
-            if to_remove:
-                data["images"] = images
-                self._save_status_data(brand_slug, data)
+            with self._open(brand_slug) as store:
+                for image_id in store.ids_with_status("trashed"):
+                    entry = store.images[image_id]
+                    trashed_dt = self._parse_iso(entry.get("trashedAt"))
+                    if not trashed_dt or trashed_dt >= cutoff:
+                        continue
+                    path = Path(entry.get("currentPath", ""))
+                    if path.exists():
+                        try:
+                            path.unlink()
+                        except OSError as e:
+                            logger.debug("Failed to delete trashed image %s: %s", path, e)
+                    store.remove(image_id)
+                    deleted.append(entry)
             return bridge_ok({"deleted": deleted, "count": len(deleted)})
         except Exception as e:
             return bridge_error(str(e))
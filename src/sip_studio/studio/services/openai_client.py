@@ -0,0 +1,123 @@
+"""Shared async OpenAI client for the small helper LLM calls.
+
+Task extraction, idea and prompt planning, session summaries and titles
+each made a short chat completion through a freshly built client, paying
+TLS and connection setup every time (and the synchronous client blocked
+the event loop while it waited). They now share one ``AsyncOpenAI`` per
+API key, with a pooled, keep-alive HTTP client that uses HTTP/2 when the
+optional ``h2`` package is installed.
+
+Pooled connections are bound to the event loop that opened them, and the
+bridge runs each chat turn (and each helper step) in its own
+``asyncio.run``, so the clients live on one long-lived background loop:
+``chat_completion`` hands the request to that loop from whichever loop the
+caller is on. ``reset_openai_clients`` closes them, and runs at exit.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Any
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from sip_studio.config.settings import get_settings
+
+# Helper calls are short; keep a few connections warm. Typed loosely:
+# depending on the release, openai builds on httpx or its httpx2 fork, and
+# both accept these limits.
+_LIMITS: Any = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=120.0
+)
+# Seconds reset_openai_clients waits for the connections to close
+_CLOSE_TIMEOUT = 5.0
+
+_clients: dict[str, AsyncOpenAI] = {}
+_loop: asyncio.AbstractEventLoop | None = None
+_clients_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """Start the background loop the clients live on, on first use."""
+    global _loop
+    with _clients_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_run_loop, args=(loop,), name="openai-client-loop", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def get_openai_client(api_key: str | None = None) -> AsyncOpenAI:
+    """Get the shared async OpenAI client for an API key.
+
+    The client must only be used on the background loop; go through
+    ``chat_completion`` from anywhere else.
+
+    Args:
+        api_key: API key to use. Defaults to ``settings.openai_api_key``.
+    """
+    key = api_key or get_settings().openai_api_key
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            http_client = DefaultAsyncHttpxClient(http2=_http2_available(), limits=_LIMITS)
+            client = AsyncOpenAI(api_key=key, http_client=http_client)
+            _clients[key] = client
+        return client
+
+
+async def chat_completion(api_key: str | None = None, **kwargs: Any) -> Any:
+    """Create a chat completion with the shared client, from any event loop.
+
+    Args:
+        api_key: API key to use. Defaults to ``settings.openai_api_key``.
+        **kwargs: Arguments for ``client.chat.completions.create``.
+    """
+
+    async def create() -> Any:
+        return await get_openai_client(api_key).chat.completions.create(**kwargs)
+
+    # Cancelling the caller (e.g. a wait_for timeout) cancels the request too
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(create(), _ensure_loop()))
+
+
+def reset_openai_clients() -> None:
+    """Close and drop all shared clients (for testing, API key changes and exit)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        loop = _loop
+    if loop is None or not clients:
+        return
+
+    async def close_all() -> None:
+        await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout=_CLOSE_TIMEOUT)
+    except (TimeoutError, RuntimeError):
+        pass
+
+
+atexit.register(reset_openai_clients)
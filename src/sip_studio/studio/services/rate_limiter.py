@@ -2,15 +2,28 @@
 CRITICAL: All Gemini generate_content calls MUST use rate_limited_generate_content.
 """
 
+import asyncio
+import heapq
+import json
+import logging
 import threading
 import time
 from collections import deque
-from typing import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from pathlib import Path
+from typing import Callable, Iterator
+
+from filelock import FileLock
+from filelock import Timeout as FileLockTimeout
 
 # Gemini SDK error types
 from google.genai import errors as genai_errors
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
+logger = logging.getLogger(__name__)
+
 
 def _is_retryable(exc: BaseException) -> bool:
     """Check if exception is retryable (429, 5xx, network errors)."""
@@ -24,57 +37,370 @@ def _is_retryable(exc: BaseException) -> bool:
     return False
 
 
+class RequestPriority(IntEnum):
+    """Priority lanes for Gemini requests (lower value is served first)."""
+
+    INTERACTIVE = 0  # Chat images the user is waiting on
+    BATCH = 1  # Queued batch/todo generation
+    BACKGROUND = 2  # Analysis and other work nobody is watching
+
+
+_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "gemini_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Set the default priority of rate-limited calls made in this context."""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class _Waiter:
+    """A caller queued on a bucket. Ordered by (priority, arrival)."""
+
+    __slots__ = ("priority", "seq", "tokens", "granted", "wake")
+
+    def __init__(self, priority: int, seq: int, tokens: int, wake: Callable[[], None]):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.granted = False
+        self.wake = wake
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+# Length of the window the RPM quota applies to
+WINDOW_SECONDS = 60.0
+
+
+class _TokenBucket:
+    """Grant times of the last ``WINDOW_SECONDS``, at most ``rpm`` of them.
+
+    A token is free once the grant that used it leaves the window, so no
+    window of that length ever sees more than ``rpm`` requests (a refilling
+    bucket would allow a full burst plus a minute of refill).
+    """
+
+    def __init__(self, name: str, rpm: int):
+        self.name = name
+        self.capacity = rpm
+        self.grants: deque[float] = deque()  # oldest first, one entry per token
+        self.waiters: list[_Waiter] = []  # heap
+
+    @property
+    def tokens(self) -> int:
+        return self.capacity - len(self.grants)
+
+    def expire(self, now: float):
+        while self.grants and self.grants[0] <= now - WINDOW_SECONDS:
+            self.grants.popleft()
+
+    def take(self, tokens: int, now: float):
+        self.grants.extend([now] * tokens)
+
+    def give_back(self, tokens: int):
+        """Return the most recently granted tokens unused."""
+        for _ in range(min(tokens, len(self.grants))):
+            self.grants.pop()
+
+    def time_until(self, tokens: int, now: float) -> float:
+        excess = len(self.grants) + tokens - self.capacity
+        if excess <= 0:
+            return 0.0
+        return max(0.0, self.grants[excess - 1] + WINDOW_SECONDS - now)
+
+
 class GeminiRateLimiter:
-    """Thread-safe rate limiter using Condition variable.
-    Does NOT sleep while holding the lock - uses Condition.wait() which releases.
+    """Thread- and asyncio-safe sliding-window rate limiter with priority lanes.
+    Each bucket grants at most ``rpm`` requests in any 60 second window.
+    Waiters queue by priority (then arrival) and are handed tokens in that
+    order, so interactive requests overtake queued batch and background work.
+    Only the head waiter sleeps on a timer, until enough earlier grants leave
+    the window; the others sleep until they become head. Models listed in
+    ``model_rpm`` get their own bucket; all others share the default one.
     Supports dependency injection for testing.
     """
 
+    # Whether polling can block on I/O; async waiters then poll off the event loop
+    _poll_blocks = False
+
     def __init__(
         self,
         max_rpm: int = 15,
         time_fn: Callable[[], float] = time.monotonic,
-        sleep_fn: Callable[[float], None] = time.sleep,
+        sleep_fn: Callable[[float], None] | None = None,
+        model_rpm: dict[str, int] | None = None,
     ):
+        """Initialize the limiter.
+        Args:
+            max_rpm: Requests per minute for the default bucket.
+            time_fn: Injectable clock (for testing).
+            sleep_fn: Injectable sleep used by waiters instead of waiting on their
+                wake-up event (for testing with a fake clock).
+            model_rpm: Per-model requests per minute, each in its own bucket.
+        """
         self._max_rpm = max_rpm
         self._time_fn = time_fn
         self._sleep_fn = sleep_fn
-        self._timestamps: deque[float] = deque()
+        self._model_rpm = dict(model_rpm or {})
         self._lock = threading.Lock()
-        self._condition = threading.Condition(self._lock)
+        self._seq = 0
+        self._buckets: dict[str | None, _TokenBucket] = {}
+
+    @property
+    def max_rpm(self) -> int:
+        """Requests allowed per minute in the default bucket."""
+        return self._max_rpm
+
+    def capacity(self, model: str | None = None) -> int:
+        """Largest reservation the bucket used for ``model`` can grant at once."""
+        return self._model_rpm.get(model, self._max_rpm) if model else self._max_rpm
 
-    def acquire(self, timeout: float = 60.0) -> bool:
-        """Block until rate limit allows another request.
+    def acquire(
+        self,
+        timeout: float = 60.0,
+        tokens: int = 1,
+        priority: RequestPriority | None = None,
+        model: str | None = None,
+    ) -> bool:
+        """Block until the bucket grants the request.
         Returns True if acquired, False if timeout.
-        Uses injected time_fn for testability.
+        Args:
+            timeout: Max seconds to wait.
+            tokens: Number of requests to reserve. All are granted together or none
+                are, so a batch never holds part of the quota while waiting for the rest.
+            priority: Lane to queue in (defaults to the ``request_priority`` context).
+            model: Gemini model the requests are for; selects its bucket.
         """
+        event = threading.Event()
+        bucket, waiter = self._enqueue(tokens, priority, model, event.set)
         deadline = self._time_fn() + timeout
-        with self._condition:
+        while True:
+            wait = self._poll(bucket, waiter, deadline)
+            if wait is None:
+                return waiter.granted
+            if self._sleep_fn is not None:
+                self._sleep_fn(wait)
+            else:
+                event.wait(wait)
+                event.clear()
+
+    async def acquire_async(
+        self,
+        timeout: float = 60.0,
+        tokens: int = 1,
+        priority: RequestPriority | None = None,
+        model: str | None = None,
+    ) -> bool:
+        """Async variant of ``acquire`` that holds no thread while waiting.
+        Returns True if acquired, False if timeout.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(event.set)
+
+        bucket, waiter = self._enqueue(tokens, priority, model, wake)
+        deadline = self._time_fn() + timeout
+        try:
             while True:
-                now = self._time_fn()
-                # Prune timestamps older than 60s
-                while self._timestamps and self._timestamps[0] < now - 60:
-                    self._timestamps.popleft()
-                if len(self._timestamps) < self._max_rpm:
-                    self._timestamps.append(now)
-                    return True
-                remaining = deadline - now
-                if remaining <= 0:
-                    return False
-                # Calculate wait time until oldest timestamp expires
-                wait_time = min(self._timestamps[0] + 60 - now + 0.1, remaining)
-                if wait_time > 0:
-                    # Release lock while sleeping (use injected sleep_fn for testing)
-                    self._condition.release()
-                    try:
-                        self._sleep_fn(min(wait_time, 0.1))  # Sleep in small increments
-                    finally:
-                        self._condition.acquire()
+                if self._poll_blocks:
+                    wait = await asyncio.to_thread(self._poll, bucket, waiter, deadline)
+                else:
+                    wait = self._poll(bucket, waiter, deadline)
+                if wait is None:
+                    return waiter.granted
+                if self._sleep_fn is not None:
+                    self._sleep_fn(wait)  # Fake clock: advance it, then let others run
+                    await asyncio.sleep(0)
+                    continue
+                try:
+                    await asyncio.wait_for(event.wait(), wait)
+                except TimeoutError:
+                    pass
+                event.clear()
+        except asyncio.CancelledError:
+            if self._poll_blocks:
+                # Don't block the loop; the refund lands as soon as the worker runs
+                loop.run_in_executor(None, self._abandon, bucket, waiter)
+            else:
+                self._abandon(bucket, waiter)
+            raise
+
+    def _enqueue(
+        self,
+        tokens: int,
+        priority: RequestPriority | None,
+        model: str | None,
+        wake: Callable[[], None],
+    ) -> tuple[_TokenBucket, _Waiter]:
+        limit = self.capacity(model)
+        if tokens < 1 or tokens > limit:
+            raise ValueError(f"tokens must be between 1 and {limit}, got {tokens}")
+        lane = _request_priority.get() if priority is None else priority
+        with self._lock:
+            bucket = self._bucket_locked(model)
+            self._seq += 1
+            waiter = _Waiter(int(lane), self._seq, tokens, wake)
+            heapq.heappush(bucket.waiters, waiter)
+        return bucket, waiter
+
+    def _poll(self, bucket: _TokenBucket, waiter: _Waiter, deadline: float) -> float | None:
+        """Try to serve the queue. Returns None when the waiter is done (granted
+        or timed out), otherwise how long it should sleep before polling again."""
+        with self._exchange(bucket), self._lock:
+            now = self._time_fn()
+            self._dispatch_locked(bucket, now)
+            if waiter.granted:
+                return None
+            remaining = deadline - now
+            if remaining <= 0:
+                self._remove_locked(bucket, waiter, now)
+                return None
+            if bucket.waiters[0] is waiter:
+                return min(remaining, bucket.time_until(waiter.tokens, now))
+            return remaining
+
+    def _abandon(self, bucket: _TokenBucket, waiter: _Waiter):
+        """Leave the queue, refunding tokens granted after cancellation."""
+        with self._exchange(bucket), self._lock:
+            now = self._time_fn()
+            if waiter.granted:
+                self._dispatch_locked(bucket, now, refund=waiter.tokens)
+            else:
+                self._remove_locked(bucket, waiter, now)
+
+    def _remove_locked(self, bucket: _TokenBucket, waiter: _Waiter, now: float):
+        was_head = bucket.waiters[0] is waiter
+        bucket.waiters.remove(waiter)
+        heapq.heapify(bucket.waiters)
+        if was_head:
+            self._dispatch_locked(bucket, now)
+            if bucket.waiters:
+                bucket.waiters[0].wake()
+
+    def _dispatch_locked(self, bucket: _TokenBucket, now: float, refund: float = 0):
+        """Grant tokens to waiters in priority order (caller holds the lock).
+        All changes to a bucket's tokens happen here. ``refund`` returns unused
+        tokens first. A new head that still has to wait is woken to time its
+        own wait."""
+        bucket.expire(now)
+        if refund:
+            bucket.give_back(int(refund))
+        served = False
+        while bucket.waiters and bucket.tokens >= bucket.waiters[0].tokens:
+            waiter = heapq.heappop(bucket.waiters)
+            bucket.take(waiter.tokens, now)
+            waiter.granted = True
+            waiter.wake()
+            served = True
+        if served and bucket.waiters:
+            bucket.waiters[0].wake()
+
+    @contextmanager
+    def _exchange(self, bucket: _TokenBucket) -> Iterator[None]:
+        """Hook around every locked section that dispatches ``bucket``; entered
+        before ``self._lock`` is taken, so it may block without stalling the
+        other threads' waiters."""
+        yield
+
+    def _bucket_locked(self, model: str | None) -> _TokenBucket:
+        key = model if model in self._model_rpm else None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rpm = self._model_rpm[key] if key is not None else self._max_rpm
+            bucket = _TokenBucket(key or "default", rpm)
+            self._buckets[key] = bucket
+        return bucket
 
     def reset(self):
-        """Reset limiter state (for testing)."""
+        """Empty every bucket's window (for testing)."""
         with self._lock:
-            self._timestamps.clear()
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            with self._exchange(bucket), self._lock:
+                self._dispatch_locked(bucket, self._time_fn(), refund=bucket.capacity)
+
+
+class SharedGeminiRateLimiter(GeminiRateLimiter):
+    """Rate limiter whose buckets are shared by every local process.
+    Grant windows live in a small JSON state file guarded by a file lock, so
+    the Studio app, background threads with their own event loops and CLI
+    pipeline runs all draw on one RPM budget instead of each assuming they
+    have the whole quota. Priority queueing stays per process; only the
+    grant window is shared. Uses the wall clock, which all processes agree on.
+    The file exchange runs outside the in-process lock, and async waiters
+    poll from a worker thread, so a slow or contended state file never
+    blocks an event loop.
+    """
+
+    _poll_blocks = True
+
+    def __init__(
+        self,
+        state_path: Path,
+        max_rpm: int = 15,
+        time_fn: Callable[[], float] = time.time,
+        sleep_fn: Callable[[float], None] | None = None,
+        model_rpm: dict[str, int] | None = None,
+        lock_timeout: float = 5.0,
+    ):
+        """Initialize the limiter.
+        Args:
+            state_path: JSON file holding the shared bucket state. A ``.lock``
+                file is created next to it.
+            lock_timeout: Seconds to wait for the file lock before falling back
+                to this process's own view of the bucket.
+        """
+        super().__init__(max_rpm=max_rpm, time_fn=time_fn, sleep_fn=sleep_fn, model_rpm=model_rpm)
+        self._state_path = state_path
+        self._file_lock = FileLock(str(state_path.with_suffix(".lock")), timeout=lock_timeout)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def _exchange(self, bucket: _TokenBucket) -> Iterator[None]:
+        """Load the shared window into ``bucket`` and save it back afterwards.
+        The file lock is held throughout but taken before ``self._lock``, so
+        waiting for another process never stalls this one's other waiters."""
+        try:
+            self._file_lock.acquire()
+        except FileLockTimeout:
+            logger.warning("Rate limit state is locked; using this process's own bucket")
+            yield
+            return
+        try:
+            state = self._read_state()
+            entry = state.get(bucket.name)
+            grants: list[float] | None = None
+            if isinstance(entry, dict):
+                try:
+                    grants = sorted(float(g) for g in entry["grants"])
+                except (KeyError, TypeError, ValueError):
+                    pass
+            if grants is not None:
+                with self._lock:
+                    bucket.grants = deque(grants[-bucket.capacity :])
+            yield
+            with self._lock:
+                state[bucket.name] = {"grants": list(bucket.grants)}
+            self._state_path.write_text(json.dumps(state))
+        finally:
+            self._file_lock.release()
+
+    def _read_state(self) -> dict:
+        try:
+            state = json.loads(self._state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
 
 
 # Singleton with factory for testing
@@ -83,35 +409,76 @@ _limiter_lock = threading.Lock()
 
 
 def get_rate_limiter(
-    max_rpm: int = 15,
+    max_rpm: int | None = None,
     time_fn: Callable[[], float] | None = None,
     sleep_fn: Callable[[float], None] | None = None,
+    model_rpm: dict[str, int] | None = None,
+    shared: bool | None = None,
     _reset: bool = False,
 ) -> GeminiRateLimiter:
     """Get or create the global rate limiter singleton.
     Args:
-            max_rpm: Max requests per minute
+            max_rpm: Max requests per minute (defaults to settings.image_pool_max_rpm)
             time_fn: Injectable time function (for testing)
             sleep_fn: Injectable sleep function (for testing)
+            model_rpm: Per-model RPM buckets (defaults to settings.gemini_model_rpm)
+            shared: Share the budget with other local processes (defaults to
+                settings.gemini_shared_rate_limit)
             _reset: Force create new instance (for testing only)
     """
     global _rate_limiter
     with _limiter_lock:
         if _rate_limiter is None or _reset:
-            _rate_limiter = GeminiRateLimiter(
-                max_rpm=max_rpm, time_fn=time_fn or time.monotonic, sleep_fn=sleep_fn or time.sleep
-            )
+            if max_rpm is None or model_rpm is None or shared is None:
+                from sip_studio.config.settings import get_settings
+
+                settings = get_settings()
+                if max_rpm is None:
+                    max_rpm = settings.image_pool_max_rpm
+                if model_rpm is None:
+                    model_rpm = settings.gemini_model_rpm
+                if shared is None:
+                    shared = settings.gemini_shared_rate_limit
+            if shared:
+                from sip_studio.config.settings import USER_CONFIG_DIR
+
+                _rate_limiter = SharedGeminiRateLimiter(
+                    USER_CONFIG_DIR / "rate_limits" / "gemini.json",
+                    max_rpm=max_rpm,
+                    time_fn=time_fn or time.time,
+                    sleep_fn=sleep_fn,
+                    model_rpm=model_rpm,
+                )
+            else:
+                _rate_limiter = GeminiRateLimiter(
+                    max_rpm=max_rpm,
+                    time_fn=time_fn or time.monotonic,
+                    sleep_fn=sleep_fn,
+                    model_rpm=model_rpm,
+                )
         return _rate_limiter
 
 
 def rate_limited_generate_content(
-    client, model: str, contents, config, timeout: float = 60.0, max_retries: int = 3
+    client,
+    model: str,
+    contents,
+    config,
+    timeout: float = 60.0,
+    max_retries: int = 3,
+    reserved: bool = False,
+    priority: RequestPriority | None = None,
 ):
     """Rate-limited wrapper for client.models.generate_content.
     CRITICAL: Each retry attempt acquires rate limit separately.
     All Gemini image generation calls MUST use this function.
+    Args:
+        reserved: Caller already reserved a token for the first attempt
+            (e.g. via ``limiter.acquire(tokens=n)`` for a batch). Retries still acquire.
+        priority: Lane to queue in (defaults to the ``request_priority`` context).
     """
     limiter = get_rate_limiter()
+    have_token = reserved
 
     @retry(
         stop=stop_after_attempt(max_retries),
@@ -120,16 +487,51 @@ def rate_limited_generate_content(
         reraise=True,
     )
     def _call_with_rate_limit():
+        nonlocal have_token
         # Acquire rate limit for EACH attempt (including retries)
-        if not limiter.acquire(timeout):
+        if have_token:
+            have_token = False
+        elif not limiter.acquire(timeout, priority=priority, model=model):
             raise TimeoutError("Rate limiter timeout - too many concurrent requests")
         return client.models.generate_content(model=model, contents=contents, config=config)
 
     return _call_with_rate_limit()
 
 
+async def rate_limited_generate_content_async(
+    client,
+    model: str,
+    contents,
+    config,
+    timeout: float = 60.0,
+    max_retries: int = 3,
+    priority: RequestPriority | None = None,
+):
+    """Async rate-limited wrapper for client.aio.models.generate_content.
+    Shares the global limiter with the sync wrapper; waiting for a slot and the
+    request itself suspend the coroutine instead of blocking a thread.
+    CRITICAL: Each retry attempt acquires rate limit separately.
+    """
+    limiter = get_rate_limiter()
+
+    @retry(
+        stop=stop_after_attempt(max_retries),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    )
+    async def _call_with_rate_limit():
+        if not await limiter.acquire_async(timeout, priority=priority, model=model):
+            raise TimeoutError("Rate limiter timeout - too many concurrent requests")
+        return await client.aio.models.generate_content(
+            model=model, contents=contents, config=config
+        )
+
+    return await _call_with_rate_limit()
+
+
 # Audit helper: grep for direct generate_content calls
-AUDIT_PATTERN = r"client\.models\.generate_content\("
+AUDIT_PATTERN = r"client\.(aio\.)?models\.generate_content\("
 AUDIT_ALLOWED_FILES = [
     "rate_limiter.py",
 ]
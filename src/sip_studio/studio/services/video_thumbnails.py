@@ -0,0 +1,235 @@
+"""Poster frames and scrub strips for video assets.
+
+The asset grid previously had no lightweight preview for videos, and the only
+way to show one was ``get_video_data``, which base64-encodes the whole MP4.
+Each video now gets a poster frame and an N-frame horizontal scrub strip from
+a single FFmpeg run, cached as WebP in the shared thumbnail cache (keyed like
+image thumbnails, so edits invalidate them). Generation runs on a small
+background pool, scheduled when clips land and when asset listings show
+videos without thumbnails. The bridge never waits for it: a cache miss queues
+the extraction and reports the thumbnails as pending, and the asset grid shows
+the poster and scrubs through the strip on hover once they are ready.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .asset_service import _get_cache_key, _get_thumb_cache_dir
+
+logger = logging.getLogger(__name__)
+
+POSTER_SIZE = 256
+STRIP_FRAMES = 10
+STRIP_FRAME_WIDTH = 160
+_FFMPEG_TIMEOUT = 60
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_in_flight: dict[str, Future[VideoThumbnails]] = {}
+_in_flight_lock = threading.Lock()
+
+
+class VideoThumbnailError(Exception):
+    """Raised when thumbnails cannot be extracted from a video."""
+
+
+# Failed extractions by thumbnail cache key, so a broken video isn't retried
+# until it changes
+_failures: dict[str, VideoThumbnailError] = {}
+
+
+@dataclass(frozen=True)
+class VideoThumbnails:
+    """Cached preview images for one video."""
+
+    poster: Path
+    strip: Path
+    frames: int = STRIP_FRAMES
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared thumbnail pool (a couple of FFmpeg processes at most)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, min(4, (os.cpu_count() or 2) // 2))
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="video-thumb")
+        return _executor
+
+
+def cached_thumbnails(video_path: Path) -> VideoThumbnails | None:
+    """Get the cached thumbnails for the current version of a video, if present."""
+    key = _get_cache_key(video_path)
+    cache_dir = _get_thumb_cache_dir()
+    poster = cache_dir / f"{key}.poster.webp"
+    strip = cache_dir / f"{key}.strip.webp"
+    if poster.exists() and strip.exists():
+        return VideoThumbnails(poster=poster, strip=strip)
+    return None
+
+
+def schedule_video_thumbnails(video_path: Path) -> Future[VideoThumbnails]:
+    """Queue thumbnail extraction for a video on the background pool.
+
+    Already cached videos get a completed future, and so do videos whose last
+    extraction failed (with that error); a video that is already queued shares
+    the existing future, so callers can schedule freely.
+    """
+    video_path = Path(video_path)
+    cached = cached_thumbnails(video_path)
+    done: Future[VideoThumbnails] = Future()
+    if cached is not None:
+        done.set_result(cached)
+        return done
+    cache_key = _get_cache_key(video_path)
+    key = str(video_path.resolve())
+    with _in_flight_lock:
+        failure = _failures.get(cache_key)
+        if failure is not None:
+            done.set_exception(failure)
+            return done
+        future = _in_flight.get(key)
+        if future is None:
+            future = _get_executor().submit(generate_video_thumbnails, video_path)
+            _in_flight[key] = future
+            future.add_done_callback(lambda f: _forget(key, cache_key, f))
+        return future
+
+
+def _forget(key: str, cache_key: str, future: Future[VideoThumbnails]) -> None:
+    with _in_flight_lock:
+        _in_flight.pop(key, None)
+        if not future.cancelled():
+            error = future.exception()
+            if isinstance(error, VideoThumbnailError):
+                _failures[cache_key] = error
+
+
+def peek_video_thumbnails(video_path: Path) -> VideoThumbnails | None:
+    """Get a video's thumbnails without waiting for them.
+
+    Returns:
+        The cached thumbnails, or None once extraction is queued.
+
+    Raises:
+        VideoThumbnailError: If extraction failed for this version of the video.
+    """
+    future = schedule_video_thumbnails(video_path)
+    return future.result() if future.done() else None
+
+
+def get_video_thumbnails(
+    video_path: Path, timeout: float | None = _FFMPEG_TIMEOUT
+) -> VideoThumbnails:
+    """Get thumbnails for a video, extracting them (via the pool) on a cache miss.
+
+    Raises:
+        VideoThumbnailError: If extraction fails.
+    """
+    return schedule_video_thumbnails(video_path).result(timeout=timeout)
+
+
+def generate_video_thumbnails(video_path: Path, frames: int = STRIP_FRAMES) -> VideoThumbnails:
+    """Extract the poster frame and scrub strip with one FFmpeg call.
+
+    Args:
+        video_path: Video to preview.
+        frames: Number of evenly spaced frames in the scrub strip.
+
+    Returns:
+        Paths to the cached WebP poster and strip.
+
+    Raises:
+        VideoThumbnailError: If FFmpeg is missing or extraction fails.
+    """
+    from PIL import Image
+
+    from sip_studio.assembler import FFmpegError, get_probe_cache
+
+    cached = cached_thumbnails(video_path)
+    if cached is not None:
+        return cached
+    if shutil.which("ffmpeg") is None:
+        raise VideoThumbnailError("FFmpeg not found; cannot create video thumbnails")
+    try:
+        duration = get_probe_cache().duration(video_path)
+    except FFmpegError as e:
+        raise VideoThumbnailError(str(e)) from e
+
+    key = _get_cache_key(video_path)
+    cache_dir = _get_thumb_cache_dir()
+    poster = cache_dir / f"{key}.poster.webp"
+    strip = cache_dir / f"{key}.strip.webp"
+    with tempfile.TemporaryDirectory(prefix="video-thumb-") as tmp:
+        poster_png = Path(tmp) / "poster.png"
+        strip_png = Path(tmp) / "strip.png"
+        cmd = build_thumbnail_command(video_path, duration, poster_png, strip_png, frames)
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=_FFMPEG_TIMEOUT)
+        except subprocess.CalledProcessError as e:
+            tail = (e.stderr or "").strip().splitlines()[-5:]
+            raise VideoThumbnailError(
+                f"Thumbnail extraction failed for {video_path.name}: {' '.join(tail)}"
+            ) from e
+        except subprocess.TimeoutExpired as e:
+            raise VideoThumbnailError(
+                f"Thumbnail extraction timed out for {video_path.name}"
+            ) from e
+        for src, dst in ((poster_png, poster), (strip_png, strip)):
+            part = dst.with_name(f".{dst.name}.part")
+            with Image.open(src) as im:
+                im.save(part, format="WEBP", quality=80)
+            os.replace(part, dst)
+    logger.debug("Created video thumbnails for %s", video_path.name)
+    return VideoThumbnails(poster=poster, strip=strip, frames=frames)
+
+
+def build_thumbnail_command(
+    video_path: Path,
+    duration: float,
+    poster_out: Path,
+    strip_out: Path,
+    frames: int = STRIP_FRAMES,
+) -> list[str]:
+    """Build the FFmpeg command writing the poster and strip PNGs in one decode.
+
+    The poster is taken shortly after the start (clips often open on a fade),
+    and the strip samples ``frames`` evenly spaced frames tiled horizontally.
+    """
+    poster_at = min(1.0, duration / 10)
+    strip_rate = frames / max(duration, 0.1)
+    filter_complex = (
+        "[0:v]split=2[p][s];"
+        f"[p]trim=start={poster_at:.3f},setpts=PTS-STARTPTS,"
+        f"scale={POSTER_SIZE}:{POSTER_SIZE}:force_original_aspect_ratio=decrease[poster];"
+        f"[s]fps={strip_rate:.6f},scale={STRIP_FRAME_WIDTH}:-2,tile={frames}x1[strip]"
+    )
+    return [
+        "ffmpeg",
+        "-y",
+        "-v",
+        "error",
+        "-i",
+        str(video_path),
+        "-filter_complex",
+        filter_complex,
+        "-map",
+        "[poster]",
+        "-frames:v",
+        "1",
+        str(poster_out),
+        "-map",
+        "[strip]",
+        "-frames:v",
+        "1",
+        str(strip_out),
+    ]
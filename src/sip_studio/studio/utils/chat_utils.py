@@ -10,6 +10,7 @@ from typing import Callable
 
 from sip_studio.advisor.image_analyzer import analyze_image, format_analysis_for_message
 from sip_studio.config.logging import get_logger
+from sip_studio.generators.resolution import deliverable_path
 
 from .bridge_types import ALLOWED_IMAGE_EXTS, ALLOWED_TEXT_EXTS
 
@@ -80,6 +81,12 @@ async def process_attachments(
                     safe_name = resolved.name
         if rel_path and full_path:
             is_image = full_path.suffix.lower() in ALLOWED_IMAGE_EXTS
+            if is_image and ref_path and not data_b64:
+                # Re-using a kept image: send its final-resolution variant if it has one
+                variant = deliverable_path(full_path)
+                if variant != full_path:
+                    rel_path = variant.relative_to(brand_dir).as_posix()
+                    full_path = variant
             saved.append((safe_name, rel_path, full_path, is_image))
     return saved
 
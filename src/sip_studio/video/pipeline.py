@@ -24,6 +24,7 @@ Example usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from dataclasses import dataclass, field
@@ -36,7 +37,14 @@ from sip_studio.agents import (
     ImageProductionManager,
     develop_script,
 )
-from sip_studio.assembler import FFmpegAssembler, FFmpegError
+from sip_studio.assembler import (
+    EncodingProfile,
+    FFmpegAssembler,
+    FFmpegError,
+    proxy_path_for,
+    select_profile,
+    select_profile_for_clip,
+)
 from sip_studio.config.settings import get_settings
 from sip_studio.config.user_preferences import UserPreferences
 from sip_studio.generators import (
@@ -45,6 +53,7 @@ from sip_studio.generators import (
     VideoGenerationError,
     VideoGeneratorFactory,
     VideoProvider,
+    select_music_candidate,
 )
 from sip_studio.models import (
     AssetType,
@@ -56,10 +65,13 @@ from sip_studio.models import (
 from sip_studio.utils.file_utils import write_atomically
 
 if TYPE_CHECKING:
-    pass
+    from sip_studio.assembler.runner import FFmpegProgress
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the proxy once the final render is done
+PROXY_FINISH_TIMEOUT = 60.0
+
 
 class PipelineError(Exception):
     """Exception raised for pipeline-level errors."""
@@ -82,6 +94,19 @@ class PipelineConfig:
         skip_image_review: Skip image quality review for faster drafts (default: False).
         image_variants_per_request: Number of image variants per element (default: 1).
             If >1, generates multiple variants and uses early-exit review. Max 4.
+        music_candidates: Number of music tracks to generate concurrently with
+            different seeds (default: 1). The steadiest audible one (smallest
+            loudness range) is used; the others are kept in the music directory
+            as alternatives.
+        render_proxy: Render a fast 480p preview alongside the final assembly so
+            it can be shown before the full-quality video is ready (default: True).
+        encoding_profile: Encoding profile for re-encodes during assembly: "draft",
+            "standard" or "archival" (default: None, i.e. standard).
+        encode_latency_target: Seconds the assembly re-encodes may take. When set
+            (and no encoding_profile is given), the best profile that the
+            machine's encoder benchmark says fits is used (default: None).
+        normalize_loudness: Set music and clip audio levels from cached EBU R128
+            loudness measurements instead of fixed volumes (default: False).
     """
 
     idea: str
@@ -96,6 +121,11 @@ class PipelineConfig:
     image_max_concurrent: int = 8
     skip_image_review: bool = False
     image_variants_per_request: int = 1
+    music_candidates: int = 1
+    render_proxy: bool = True
+    encoding_profile: str | None = None
+    encode_latency_target: float | None = None
+    normalize_loudness: bool = False
 
 
 @dataclass
@@ -110,6 +140,7 @@ class PipelineResult:
         video_clips: List of generated video clips.
         music: Generated background music (if enabled).
         final_video_path: Path to the assembled final video (if not dry_run).
+        proxy_video_path: Path to the low-resolution preview (if one was rendered).
         stages_completed: List of completed stage names.
     """
 
@@ -120,11 +151,14 @@ class PipelineResult:
     video_clips: list[GeneratedAsset] = field(default_factory=list)
     music: GeneratedMusic | None = None
     final_video_path: Path | None = None
+    proxy_video_path: Path | None = None
     stages_completed: list[str] = field(default_factory=list)
 
 
 # Type alias for progress callbacks
 ProgressCallback = Callable[[str, str], None]
+# Called with (video path, is_final): first the proxy, then the final render
+PreviewCallback = Callable[[Path, bool], None]
 
 
 class VideoPipeline:
@@ -144,6 +178,9 @@ class VideoPipeline:
         # Optional: register progress callback
         pipeline.on_progress = lambda stage, msg: print(f"[{stage}] {msg}")
 
+        # Optional: show the proxy as soon as it exists, then swap in the final
+        pipeline.on_preview = lambda path, is_final: print(f"Playable: {path}")
+
         result = await pipeline.run()
     """
 
@@ -156,6 +193,8 @@ class VideoPipeline:
         self.config = config
         self.settings = get_settings()
         self.on_progress: ProgressCallback | None = None
+        self.on_preview: PreviewCallback | None = None
+        self._proxy_video_path: Path | None = None
         self._package: ProductionPackage | None = None
 
     def _emit_progress(self, stage: str, message: str) -> None:
@@ -164,6 +203,14 @@ class VideoPipeline:
         if self.on_progress:
             self.on_progress(stage, message)
 
+    def _emit_preview(self, path: Path, is_final: bool) -> None:
+        """Hand a playable video to the preview callback if registered."""
+        if self.on_preview:
+            try:
+                self.on_preview(path, is_final)
+            except Exception as e:
+                logger.warning("Preview callback failed: %s", e)
+
     async def run(self) -> PipelineResult:
         """Run the full video generation pipeline.
 
@@ -251,6 +298,7 @@ class VideoPipeline:
             video_clips=video_clips,
             music=music,
             final_video_path=final_video_path,
+            proxy_video_path=self._proxy_video_path,
             stages_completed=stages_completed,
         )
 
@@ -435,15 +483,28 @@ class VideoPipeline:
         genre = script.music_brief.genre.value
         self._emit_progress("music", f"Generating {mood} {genre} music...")
 
+        music_generator = MusicGenerator(
+            project_id=self.settings.google_cloud_project,
+            location="us-central1",
+        )
         try:
-            music_generator = MusicGenerator(
-                project_id=self.settings.google_cloud_project,
-                location="us-central1",
-            )
-            generated_music = await music_generator.generate(
-                brief=script.music_brief,
-                output_dir=output_dir,
-            )
+            if self.config.music_candidates > 1:
+                candidates = await music_generator.generate_candidates(
+                    brief=script.music_brief,
+                    output_dir=output_dir,
+                    num_candidates=self.config.music_candidates,
+                )
+                generated_music = await asyncio.to_thread(select_music_candidate, candidates)
+                self._emit_progress(
+                    "music",
+                    f"Generated {len(candidates)} music candidates, using "
+                    f"{Path(generated_music.file_path).name}",
+                )
+            else:
+                generated_music = await music_generator.generate(
+                    brief=script.music_brief,
+                    output_dir=output_dir,
+                )
             self._emit_progress(
                 "music",
                 f"Generated music: {generated_music.duration_seconds:.0f}s",
@@ -453,6 +514,8 @@ class VideoPipeline:
             logger.warning("Music generation failed: %s", e)
             self._emit_progress("music", f"Music generation failed: {e}")
             return None
+        finally:
+            await music_generator.close()
 
     async def _assemble_video(
         self,
@@ -483,35 +546,184 @@ class VideoPipeline:
         self._emit_progress("assembly", f"Assembling {len(clips_with_paths)} clips...")
 
         try:
-            assembler = FFmpegAssembler()
+            assembler = FFmpegAssembler(
+                encoding_profile=self.config.encoding_profile,
+                normalize_loudness=self.config.normalize_loudness,
+            )
         except FFmpegError as e:
             raise PipelineError(f"FFmpeg not available: {e}") from e
+        except ValueError as e:
+            raise PipelineError(str(e)) from e
 
         # Sort clips by scene number
         clip_paths = sorted(
             [Path(c.local_path) for c in clips_with_paths],
             key=lambda p: int(p.stem.split("_")[-1]) if "_" in p.stem else 0,
         )
+        if self.config.encode_latency_target is not None and not self.config.encoding_profile:
+            assembler.encoding_profile = await self._profile_for_latency_target(
+                assembler, clip_paths, self.config.encode_latency_target, music is not None
+            )
 
         # Generate output filename
         safe_title = script.title.replace(" ", "_").lower()[:50]
         final_video_path = output_dir / f"{safe_title}_final.mp4"
 
-        if music:
-            self._emit_progress("assembly", "Assembling with background music...")
-            assembler.assemble_with_music(
-                clip_paths=clip_paths,
-                music=music,
-                output_path=final_video_path,
-                music_volume=self.config.music_volume,
+        # The proxy encodes from the raw clips while the final render normalizes
+        # and mixes, so there is something to show well before the final is done
+        proxy_task: asyncio.Task[Path | None] | None = None
+        if self.config.render_proxy:
+            proxy_task = asyncio.create_task(
+                self._render_proxy(assembler, clip_paths, music, final_video_path)
             )
-        else:
-            self._emit_progress("assembly", "Concatenating clips...")
-            assembler.concatenate_clips(clip_paths, final_video_path)
+
+        # FFmpeg runs as an asyncio subprocess, so the event loop stays free
+        # and cancelling the pipeline task kills the encode
+        on_ffmpeg_progress = self._ffmpeg_progress_reporter()
+        try:
+            if music:
+                self._emit_progress("assembly", "Assembling with background music...")
+                await assembler.assemble_with_music_async(
+                    clip_paths=clip_paths,
+                    music=music,
+                    output_path=final_video_path,
+                    music_volume=self.config.music_volume,
+                    on_progress=on_ffmpeg_progress,
+                    incremental=True,
+                )
+            else:
+                self._emit_progress("assembly", "Concatenating clips...")
+                await assembler.concatenate_clips_async(
+                    clip_paths, final_video_path, on_progress=on_ffmpeg_progress
+                )
+        except BaseException:
+            if proxy_task is not None:
+                proxy_task.cancel()
+                await asyncio.gather(proxy_task, return_exceptions=True)
+            raise
+        if proxy_task is not None:
+            # The proxy is a light deliverable of its own (e.g. for sharing), so let
+            # it finish, but don't hold the final video back on a stalled encode
+            try:
+                self._proxy_video_path = await asyncio.wait_for(proxy_task, PROXY_FINISH_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Proxy render did not finish within %.0fs", PROXY_FINISH_TIMEOUT)
 
         self._emit_progress("assembly", f"Final video: {final_video_path}")
+        self._emit_preview(final_video_path, is_final=True)
         return final_video_path
 
+    async def _profile_for_latency_target(
+        self,
+        assembler: FFmpegAssembler,
+        clip_paths: list[Path],
+        latency_target: float,
+        with_music: bool = False,
+    ) -> EncodingProfile:
+        """Pick the best encoding profile expected to meet the latency target.
+
+        Only clips that differ from the common profile are re-encoded (the rest
+        are stream-copied), so the estimate covers their normalization plus the
+        music mix's audio encode. Candidates are timed on a short excerpt of the
+        first such clip; if that fails, the cached synthetic benchmark is used,
+        and if that fails too the assembler's current profile is kept.
+        """
+        from sip_studio.assembler.encoding import (
+            PROFILES,
+            QUALITY_ORDER,
+            estimate_audio_seconds,
+            get_benchmark_results,
+        )
+
+        def probe() -> tuple[list[Path], float, float, dict]:
+            reencode = assembler.clips_to_normalize(clip_paths)
+            total = sum(assembler.get_video_duration(p) for p in clip_paths)
+            duration = sum(assembler.get_video_duration(p) for p in reencode)
+            info = assembler.get_video_info(reencode[0]) if reencode else {}
+            return reencode, total, duration, info
+
+        try:
+            reencode, total, duration, info = await asyncio.to_thread(probe)
+        except FFmpegError as e:
+            logger.warning("Could not probe clips, keeping default profile: %s", e)
+            return assembler.encoding_profile
+        if not reencode:
+            # Everything is stream-copied: the profile costs nothing but audio quality
+            profile = PROFILES[QUALITY_ORDER[0]]
+            self._emit_progress("assembly", f"Using {profile.name} encoding profile")
+            return profile
+        if with_music:
+            latency_target = max(0.0, latency_target - estimate_audio_seconds(total))
+        fps = info.get("fps") or 24.0
+        width = info.get("width") or 0
+        height = info.get("height") or 0
+        try:
+            profile = await asyncio.to_thread(
+                select_profile_for_clip,
+                reencode[0],
+                duration,
+                latency_target,
+                fps,
+                width,
+                height,
+                info.get("duration"),
+            )
+        except FFmpegError as e:
+            logger.warning("Excerpt benchmark failed, using the synthetic one: %s", e)
+            try:
+                results = await asyncio.to_thread(get_benchmark_results)
+            except FFmpegError as e:
+                logger.warning("Encoder benchmark unavailable, keeping default profile: %s", e)
+                return assembler.encoding_profile
+            profile = select_profile(
+                duration, latency_target, results, fps=fps, width=width, height=height
+            )
+        self._emit_progress("assembly", f"Using {profile.name} encoding profile")
+        return profile
+
+    async def _render_proxy(
+        self,
+        assembler: FFmpegAssembler,
+        clip_paths: list[Path],
+        music: GeneratedMusic | None,
+        final_video_path: Path,
+    ) -> Path | None:
+        """Render the low-resolution preview; failures only cost the preview.
+
+        Returns:
+            Path to the proxy, or None if it could not be rendered.
+        """
+        try:
+            proxy_path = await assembler.render_proxy_async(
+                clip_paths,
+                proxy_path_for(final_video_path),
+                music=music,
+                music_volume=self.config.music_volume,
+            )
+        except FFmpegError as e:
+            logger.warning("Proxy render failed: %s", e)
+            return None
+        self._emit_progress("assembly", f"Preview ready: {proxy_path}")
+        self._emit_preview(proxy_path, is_final=False)
+        return proxy_path
+
+    def _ffmpeg_progress_reporter(self, step: int = 10) -> Callable[[FFmpegProgress], None]:
+        """Build an FFmpeg progress callback that emits every ``step`` percent."""
+        last: dict[float | None, int] = {}
+
+        def report(progress: FFmpegProgress) -> None:
+            percent = progress.percent
+            if percent is None:
+                return
+            bucket = int(percent // step)
+            if last.get(progress.total_duration) == bucket:
+                return
+            last[progress.total_duration] = bucket
+            fps = f" at {progress.fps:.0f} fps" if progress.fps else ""
+            self._emit_progress("assembly", f"Encoding {percent:.0f}%{fps}")
+
+        return report
+
     @staticmethod
     def _generate_project_id() -> str:
         """Generate a unique project identifier."""
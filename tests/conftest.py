@@ -54,6 +54,63 @@ def reset_rate_limiter():
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_gemini_clients():
+    """Drop shared Gemini clients so tests patching genai.Client get fresh ones."""
+    from sip_studio.studio.services.gemini_client import reset_gemini_clients
+
+    reset_gemini_clients()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_openai_clients():
+    """Close shared OpenAI clients so tests never share one."""
+    from sip_studio.studio.services.openai_client import reset_openai_clients
+
+    reset_openai_clients()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_image_status_stores():
+    """Drop cached image status stores (and their pending writes) between tests."""
+    from sip_studio.studio.services.image_status import reset_image_status_stores
+
+    reset_image_status_stores()
+    yield
+    reset_image_status_stores()
+
+
+@pytest.fixture(autouse=True)
+def isolate_clip_cache(tmp_path: Path):
+    """Point the global clip cache at a per-test directory.
+    Prevents tests from reading or polluting ~/.sip-studio/cache/clips.
+    """
+    from sip_studio.generators.clip_cache import get_clip_cache
+
+    get_clip_cache(cache_dir=tmp_path / "clip_cache", _reset=True)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_probe_cache():
+    """Start each test with an empty ffprobe cache."""
+    from sip_studio.assembler.probe import get_probe_cache
+
+    get_probe_cache(_reset=True)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_loudness_cache():
+    """Start each test with an empty loudness cache."""
+    from sip_studio.assembler.loudness import get_loudness_cache
+
+    get_loudness_cache(_reset=True)
+    yield
+
+
 # ============================================================================
 # Environment Fixtures
 # ============================================================================
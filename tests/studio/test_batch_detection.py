@@ -29,3 +29,48 @@ def test_detect_idea_batch_request_requires_generate_and_images():
     assert svc._detect_idea_batch_request("Generate 5 images of the product") == 5
     assert svc._detect_idea_batch_request("Give me 5 images of the product") == 5
     assert svc._detect_idea_batch_request("Show me some images of the product") == 5
+
+
+async def test_batch_executor_submits_planned_prompts_without_agent_turns():
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from sip_studio.studio.services.batch_executor import BatchExecutor
+    from sip_studio.studio.services.image_pool import ImageGenerationPool
+
+    prompts_seen: list[str] = []
+
+    async def gen(ticket) -> str:
+        prompts_seen.append(ticket.prompt)
+        return f"/tmp/{len(prompts_seen)}.png"
+
+    pool = ImageGenerationPool(generator_fn=gen)
+    advisor = MagicMock()
+
+    async def agent_turn(*args, **kwargs):
+        # The agent's generate_image call queues its own ticket in async mode
+        pool.submit("agent prompt", {}, batch_id="b1")
+        return {"response": "Generated the image."}
+
+    advisor.chat_with_metadata = AsyncMock(side_effect=agent_turn)
+    state = BridgeState()
+    mod = "sip_studio.studio.services.batch_executor"
+    planned = AsyncMock(return_value=["hero prompt", None, "flatlay prompt"])
+    with (
+        patch(f"{mod}.TaskPromptPlanner.plan", planned),
+        patch(f"{mod}.get_image_pool", return_value=pool),
+        patch(f"{mod}.get_current_batch_id", return_value="b1"),
+        patch(f"{mod}.set_async_mode"),
+        patch(f"{mod}._impl_create_task_file", return_value="Created task file"),
+        patch(f"{mod}._impl_update_task") as update_task,
+        patch(f"{mod}._impl_complete_task_file"),
+    ):
+        result = await BatchExecutor(advisor, state).run(
+            ["1. Hero shot", "2. Lifestyle", "3. Flatlay"], {"product_slugs": ["mug"]}
+        )
+    pool.shutdown()
+
+    assert advisor.chat_with_metadata.await_count == 1  # Only the unplanned task
+    assert prompts_seen[:2] == ["hero prompt", "flatlay prompt"]
+    assert (result.completed, result.failed) == (3, 0)
+    done = {c.args[0] for c in update_task.call_args_list if c.kwargs.get("done")}
+    assert done == {1, 2, 3}
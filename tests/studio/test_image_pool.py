@@ -1,5 +1,6 @@
 """Tests for the image generation pool."""
 
+import asyncio
 import threading
 import time
 
@@ -254,6 +255,212 @@ class TestImageGenerationPool:
             pool.shutdown()
 
 
+class TestAsyncGenerator:
+    def test_async_tickets_not_bound_by_thread_count(self):
+        """Async generators share the pool loop, running more tickets than max_workers."""
+        running = [0, 0]  # current, peak
+        loops = set()
+
+        async def gen(ticket: Ticket) -> str:
+            loops.add(asyncio.get_running_loop())
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            await asyncio.sleep(0.05)
+            running[0] -= 1
+            return f"/tmp/{ticket.id}.png"
+
+        pool = ImageGenerationPool(max_workers=1, generator_fn=gen)
+        try:
+            for i in range(20):
+                pool.submit(f"prompt-{i}", {}, batch_id="async")
+            result = pool.wait_for_batch("async", timeout=5.0)
+            assert result.completed_count == 20
+            assert running[1] == 20
+            assert len(loops) == 1
+        finally:
+            pool.shutdown()
+
+    def test_in_flight_limit(self):
+        """max_in_flight bounds concurrent async generations."""
+        running = [0, 0]
+
+        async def gen(ticket: Ticket) -> str:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            await asyncio.sleep(0.02)
+            running[0] -= 1
+            return "/tmp/x.png"
+
+        pool = ImageGenerationPool(generator_fn=gen, max_in_flight=3)
+        try:
+            for i in range(9):
+                pool.submit(f"prompt-{i}", {}, batch_id="limited")
+            assert pool.wait_for_batch("limited", timeout=5.0).completed_count == 9
+            assert running[1] == 3
+        finally:
+            pool.shutdown()
+
+    def test_shutdown_without_wait_cancels_pending(self):
+        """Unfinished tickets are cancelled and waiters released on shutdown."""
+
+        async def gen(ticket: Ticket) -> str:
+            await asyncio.sleep(10)
+            return "/tmp/x.png"
+
+        pool = ImageGenerationPool(generator_fn=gen, max_in_flight=1)
+        tids = [pool.submit(f"prompt-{i}", {}, batch_id="stop") for i in range(3)]
+        time.sleep(0.05)
+        pool.shutdown(wait=False)
+        result = pool.wait_for_batch("stop", timeout=2.0)
+        assert result.cancelled_count == 3
+        assert pool.wait_for_ticket(tids[0], timeout=1.0).status == TicketStatus.CANCELLED
+
+
+class TestBatchIndex:
+    def test_batches_tracked_independently(self):
+        """Completion only touches the finishing ticket's batch."""
+        pool = ImageGenerationPool(max_workers=4, generator_fn=_mk_gen(delay=0.01))
+        try:
+            for i in range(3):
+                pool.submit(f"a-{i}", {}, batch_id="a")
+                pool.submit(f"b-{i}", {}, batch_id="b")
+            assert pool.wait_for_batch("a", timeout=5.0).completed_count == 3
+            assert pool.wait_for_batch("b", timeout=5.0).completed_count == 3
+            pool.cleanup_batch("a")
+            with pool._lock:
+                assert "a" not in pool._batches and "a" not in pool._batch_pending
+                assert len(pool._batches["b"]) == 3
+                assert pool._batch_pending["b"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_cancelled_queued_ticket_counted_once(self):
+        """A queued ticket cancelled then skipped by its worker settles once."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def gen(ticket: Ticket) -> str:
+            started.set()
+            release.wait(5.0)
+            return "/tmp/x.png"
+
+        pool = ImageGenerationPool(max_workers=1, generator_fn=gen)
+        try:
+            pool.submit("p1", {}, batch_id="c")
+            pool.submit("p2", {}, batch_id="c")
+            started.wait(5.0)
+            assert pool.cancel_batch("c") == 1
+            release.set()
+            result = pool.wait_for_batch("c", timeout=5.0)
+            assert (result.completed_count, result.cancelled_count) == (1, 1)
+            pool.shutdown()
+            assert pool._batch_pending["c"] == 0
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_batch_reopens_when_ticket_added(self):
+        """Submitting to a finished batch makes wait_for_batch wait again."""
+        pool = ImageGenerationPool(max_workers=1, generator_fn=_mk_gen(delay=0.05))
+        try:
+            pool.submit("p1", {}, batch_id="d")
+            pool.wait_for_batch("d", timeout=5.0)
+            pool.submit("p2", {}, batch_id="d")
+            assert pool.wait_for_batch("d", timeout=5.0).completed_count == 2
+        finally:
+            pool.shutdown()
+
+
+class TestAsCompleted:
+    async def test_yields_each_ticket_as_it_finishes(self):
+        """Results stream in completion order, including already-finished tickets."""
+        delays = {"fast": 0.0, "mid": 0.1, "slow": 0.3}
+
+        async def gen(ticket: Ticket) -> str:
+            await asyncio.sleep(delays[ticket.prompt])
+            if ticket.prompt == "mid":
+                raise RuntimeError("boom")
+            return f"/tmp/{ticket.prompt}.png"
+
+        pool = ImageGenerationPool(generator_fn=gen)
+        try:
+            fast = pool.submit("fast", {}, batch_id="s")
+            await asyncio.to_thread(pool.wait_for_ticket, fast, 5.0)
+            slow = pool.submit("slow", {}, batch_id="s")
+            mid = pool.submit("mid", {}, batch_id="s")
+            seen = []
+            async for res in pool.as_completed("s", timeout=5.0):
+                seen.append((res.ticket_id, res.status))
+            assert seen == [
+                (fast, TicketStatus.COMPLETED),
+                (mid, TicketStatus.FAILED),
+                (slow, TicketStatus.COMPLETED),
+            ]
+            assert not pool._batch_streams
+        finally:
+            pool.shutdown()
+
+    async def test_cancelled_tickets_are_pushed(self):
+        """Cancelling a batch ends the stream without waiting for a timeout."""
+        release = threading.Event()
+
+        def gen(ticket: Ticket) -> str:
+            release.wait(5.0)
+            return "/tmp/x.png"
+
+        pool = ImageGenerationPool(max_workers=1, generator_fn=gen)
+        try:
+            for i in range(3):
+                pool.submit(f"p{i}", {}, batch_id="c")
+            stream = pool.as_completed("c", timeout=5.0)
+            await asyncio.sleep(0.05)
+            assert pool.cancel_batch("c") == 2
+            first, second = await stream.__anext__(), await stream.__anext__()
+            assert first.status == second.status == TicketStatus.CANCELLED
+            release.set()
+            last = await stream.__anext__()
+            assert last.status == TicketStatus.COMPLETED
+        finally:
+            release.set()
+            pool.shutdown()
+
+
+class TestReaper:
+    def test_reaps_only_expired_terminal_tickets(self):
+        """Abandoned terminal tickets are dropped after the TTL."""
+
+        def gen(ticket: Ticket) -> str:
+            if ticket.prompt == "slow":
+                time.sleep(0.3)
+            return "/tmp/x.png"
+
+        pool = ImageGenerationPool(max_workers=2, generator_fn=gen, ticket_ttl=60.0)
+        try:
+            done = pool.submit("fast", {}, batch_id="old")
+            slow = pool.submit("slow", {})
+            pool.wait_for_ticket(done, timeout=5.0)
+            assert pool.reap_expired() == 0  # Not expired yet
+            assert pool.reap_expired(now=time.time() + 120) == 1
+            with pool._lock:
+                assert done not in pool._tickets and slow in pool._tickets
+                assert "old" not in pool._batches and "old" not in pool._batch_events
+        finally:
+            pool.shutdown()
+
+    def test_submit_triggers_reap(self):
+        """Expired tickets are reaped as new work arrives."""
+        pool = ImageGenerationPool(max_workers=1, generator_fn=_mk_gen(), ticket_ttl=0.04)
+        try:
+            first = pool.submit("p1", {})
+            pool.wait_for_ticket(first, timeout=5.0)
+            time.sleep(0.1)
+            pool.submit("p2", {})
+            with pool._lock:
+                assert first not in pool._tickets
+        finally:
+            pool.shutdown()
+
+
 class TestGetImagePool:
     def test_singleton_returns_same_instance(self):
         """get_image_pool returns same instance without _reset."""
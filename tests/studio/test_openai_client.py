@@ -0,0 +1,45 @@
+"""Tests for the shared async OpenAI client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sip_studio.studio.services import openai_client
+from sip_studio.studio.services.batch_executor import TaskExtractor
+from sip_studio.studio.services.openai_client import (
+    chat_completion,
+    get_openai_client,
+    reset_openai_clients,
+)
+
+
+def test_client_reused_across_loops():
+    client = MagicMock()
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def create(**kwargs):
+        loops.append(asyncio.get_running_loop())
+        return kwargs["model"]
+
+    client.chat.completions.create = create
+    client.close = AsyncMock()
+    with patch.object(openai_client, "AsyncOpenAI", return_value=client) as factory:
+        # Each chat turn runs its helpers in a separate asyncio.run
+        first = asyncio.run(chat_completion("sk-test", model="a"))
+        second = asyncio.run(chat_completion("sk-test", model="b"))
+        assert (first, second) == ("a", "b")
+        assert factory.call_count == 1
+        assert loops[0] is loops[1]
+        reset_openai_clients()
+    client.close.assert_awaited_once()
+    assert get_openai_client("sk-test") is not client
+
+
+async def test_task_extractor_uses_shared_client():
+    reply = MagicMock()
+    reply.choices[0].message.content = '["Hero shot", "Flatlay", "Lifestyle"]'
+    create = AsyncMock(return_value=reply)
+    history = [{"role": "assistant", "content": "1. Hero shot\n2. Flatlay\n3. Lifestyle"}]
+    with patch("sip_studio.studio.services.batch_executor.chat_completion", create):
+        tasks = await TaskExtractor.extract("generate all of them", history)
+    assert tasks == ["Hero shot", "Flatlay", "Lifestyle"]
+    create.assert_awaited_once()
@@ -1,16 +1,24 @@
 """Tests for the Gemini rate limiter."""
 
+import asyncio
+import json
 import threading
-from unittest.mock import MagicMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from filelock import FileLock
 from google.genai import errors as genai_errors
 
 from sip_studio.studio.services.rate_limiter import (
     GeminiRateLimiter,
+    RequestPriority,
+    SharedGeminiRateLimiter,
     _is_retryable,
     get_rate_limiter,
     rate_limited_generate_content,
+    rate_limited_generate_content_async,
+    request_priority,
 )
 
 
@@ -138,6 +146,165 @@ class TestGeminiRateLimiter:
         # Should succeed now
         assert limiter.acquire(timeout=0.1)
 
+    def test_batch_acquire_is_atomic(self):
+        """A batch reservation is granted whole or not at all."""
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(max_rpm=5, time_fn=clock.now, sleep_fn=clock.sleep)
+        assert limiter.acquire(timeout=1.0, tokens=3)
+        # Only 2 slots left: a batch of 3 must not take them
+        assert not limiter.acquire(timeout=0.1, tokens=3)
+        assert limiter.acquire(timeout=0.1, tokens=2)
+        assert not limiter.acquire(timeout=0.1)
+
+    def test_batch_acquire_waits_for_window(self):
+        """Batch waits exactly until enough earlier grants leave the window."""
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(max_rpm=3, time_fn=clock.now, sleep_fn=clock.sleep)
+        assert limiter.acquire(tokens=1)
+        clock.advance(10)
+        assert limiter.acquire(tokens=2)
+        assert limiter.acquire(timeout=120.0, tokens=2)
+        # The second of the needed grants was made at t=10
+        assert clock.now() == pytest.approx(70)
+
+    @pytest.mark.parametrize("tokens", [1, 4])
+    def test_no_window_exceeds_rpm(self, tokens):
+        """Starting with a full quota never lets a 60s window see more than rpm grants."""
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(max_rpm=15, time_fn=clock.now, sleep_fn=clock.sleep)
+        grants: list[float] = []
+        while clock.now() < 240:
+            assert limiter.acquire(timeout=120.0, tokens=tokens)
+            grants += [clock.now()] * tokens
+            clock.advance(0.5)
+        assert sum(t < 60 for t in grants) <= 15
+        for start in grants:
+            assert sum(start <= t < start + 60 for t in grants) <= 15
+
+    def test_batch_larger_than_quota_rejected(self):
+        """Reserving more tokens than the window allows is an error."""
+        limiter = GeminiRateLimiter(max_rpm=2)
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=3)
+
+    async def test_async_acquire_wakes_on_window(self):
+        """Async waiters sleep until the next token is due, not in fixed polls."""
+        offset = 0.0
+        limiter = GeminiRateLimiter(max_rpm=600, time_fn=lambda: time.monotonic() + offset)
+        assert await limiter.acquire_async(tokens=600)
+        # The quota was used up almost a minute ago; the oldest grant expires in ~0.1s
+        offset = 59.9
+        start = time.monotonic()
+        assert await limiter.acquire_async(timeout=5.0)
+        assert 0.05 <= time.monotonic() - start < 1.0
+
+    async def test_interactive_overtakes_queued_background(self):
+        """A later interactive request is served before an earlier background one."""
+        offset = 0.0
+        limiter = GeminiRateLimiter(max_rpm=600, time_fn=lambda: time.monotonic() + offset)
+        assert await limiter.acquire_async()
+        offset = 1.0
+        assert await limiter.acquire_async(tokens=599)
+        # One token frees up in ~0.1s, the rest a second later
+        offset = 59.9
+        order = []
+
+        async def wait(name, priority):
+            assert await limiter.acquire_async(timeout=5.0, priority=priority)
+            order.append(name)
+
+        background = asyncio.create_task(wait("background", RequestPriority.BACKGROUND))
+        await asyncio.sleep(0)
+        with request_priority(RequestPriority.INTERACTIVE):
+            interactive = asyncio.create_task(wait("interactive", None))
+        await asyncio.gather(background, interactive)
+        assert order == ["interactive", "background"]
+
+    def test_model_buckets_are_separate(self):
+        """Models with their own quota do not draw from the default bucket."""
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(
+            max_rpm=2, time_fn=clock.now, sleep_fn=clock.sleep, model_rpm={"flash": 1}
+        )
+        assert limiter.capacity("flash") == 1
+        assert limiter.acquire(timeout=0.1, model="flash")
+        assert not limiter.acquire(timeout=0.1, model="flash")
+        assert limiter.acquire(timeout=0.1, tokens=2, model="pro")
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=2, model="flash")
+
+    async def test_async_acquire_timeout(self):
+        """Async acquire gives up at the deadline."""
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(max_rpm=1, time_fn=clock.now, sleep_fn=clock.sleep)
+        assert await limiter.acquire_async()
+        assert not await limiter.acquire_async(timeout=0.01)
+
+
+class TestSharedGeminiRateLimiter:
+    def test_processes_share_one_budget(self, tmp_path):
+        """Two limiters on the same state file draw from the same tokens."""
+        clock = FakeClock(1000.0)
+        state = tmp_path / "gemini.json"
+        app = SharedGeminiRateLimiter(state, max_rpm=3, time_fn=clock.now, sleep_fn=clock.sleep)
+        cli = SharedGeminiRateLimiter(state, max_rpm=3, time_fn=clock.now, sleep_fn=clock.sleep)
+        assert app.acquire(timeout=0.1, tokens=2)
+        assert cli.acquire(timeout=0.1)
+        assert not cli.acquire(timeout=0.1)
+        assert not app.acquire(timeout=0.1)
+        # The window is shared too: a minute on, the tokens are free for whoever asks first
+        clock.advance(60)
+        assert cli.acquire(timeout=0.1, tokens=3)
+        assert not app.acquire(timeout=0.1)
+
+    def test_unreadable_state_starts_full(self, tmp_path):
+        """A corrupt state file is treated as a full bucket and rewritten."""
+        clock = FakeClock(1000.0)
+        state = tmp_path / "gemini.json"
+        state.write_text("{not json")
+        limiter = SharedGeminiRateLimiter(state, max_rpm=2, time_fn=clock.now, sleep_fn=clock.sleep)
+        assert limiter.acquire(timeout=0.1, tokens=2)
+        assert json.loads(state.read_text())["default"]["grants"] == [1000.0, 1000.0]
+
+    def test_file_lock_wait_releases_process_lock(self, tmp_path):
+        """Waiting on another process's file lock leaves the in-process lock free."""
+        state = tmp_path / "gemini.json"
+        limiter = SharedGeminiRateLimiter(state, max_rpm=2, lock_timeout=1.0)
+        other = FileLock(str(state.with_suffix(".lock")))
+        with other:
+            waiter = threading.Thread(target=limiter.acquire, kwargs={"timeout": 0.1})
+            waiter.start()
+            time.sleep(0.1)
+            assert limiter._lock.acquire(timeout=0.2)
+            limiter._lock.release()
+        waiter.join()
+
+    async def test_async_acquire_waits_for_file_lock_off_loop(self, tmp_path):
+        """The event loop keeps running while the state file is locked elsewhere."""
+        state = tmp_path / "gemini.json"
+        limiter = SharedGeminiRateLimiter(state, max_rpm=2, lock_timeout=0.5)
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        with FileLock(str(state.with_suffix(".lock"))):
+            # Falls back to this process's own bucket once the lock times out
+            assert await limiter.acquire_async(timeout=2.0)
+        beat.cancel()
+        assert ticks >= 10
+
+    def test_factory_uses_shared_limiter_when_enabled(self, tmp_path):
+        with patch("sip_studio.config.settings.USER_CONFIG_DIR", tmp_path):
+            limiter = get_rate_limiter(max_rpm=5, model_rpm={}, shared=True, _reset=True)
+        assert isinstance(limiter, SharedGeminiRateLimiter)
+        assert limiter.acquire(timeout=0.1)
+        assert (tmp_path / "rate_limits" / "gemini.json").exists()
+
 
 class TestIsRetryable:
     def test_server_error_retryable(self):
@@ -260,6 +427,20 @@ class TestRateLimitedGenerateContent:
             assert mock_acquire.call_count == 3
         assert result == "success"
 
+    def test_reserved_skips_first_acquire(self):
+        """A pre-reserved token covers the first attempt; retries still acquire."""
+        clock = FakeClock()
+        limiter = get_rate_limiter(max_rpm=10, time_fn=clock.now, sleep_fn=clock.sleep, _reset=True)
+        mock_client = MagicMock()
+        err = genai_errors.ServerError(500, _mk_err(500, "server error"))
+        mock_client.models.generate_content.side_effect = [err, "success"]
+        with patch.object(limiter, "acquire", wraps=limiter.acquire) as mock_acquire:
+            result = rate_limited_generate_content(
+                mock_client, "model", "contents", "config", max_retries=3, reserved=True
+            )
+            assert mock_acquire.call_count == 1
+        assert result == "success"
+
     def test_timeout_raises_error(self):
         """Rate limiter timeout raises TimeoutError."""
         clock = FakeClock()
@@ -269,3 +450,31 @@ class TestRateLimitedGenerateContent:
         mock_client = MagicMock()
         with pytest.raises(TimeoutError, match="Rate limiter timeout"):
             rate_limited_generate_content(mock_client, "model", "contents", "config", timeout=0.1)
+
+
+class TestRateLimitedGenerateContentAsync:
+    async def test_successful_call_uses_async_client(self):
+        """Awaits client.aio.models.generate_content."""
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(return_value="result")
+        result = await rate_limited_generate_content_async(
+            mock_client, "model", "contents", "config"
+        )
+        assert result == "result"
+        mock_client.aio.models.generate_content.assert_awaited_once_with(
+            model="model", contents="contents", config="config"
+        )
+        mock_client.models.generate_content.assert_not_called()
+
+    async def test_timeout_raises_error(self):
+        """Shares the global limiter with the sync wrapper."""
+        clock = FakeClock()
+        limiter = get_rate_limiter(max_rpm=1, time_fn=clock.now, sleep_fn=clock.sleep, _reset=True)
+        limiter.acquire(timeout=1.0)
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock()
+        with pytest.raises(TimeoutError, match="Rate limiter timeout"):
+            await rate_limited_generate_content_async(
+                mock_client, "model", "contents", "config", timeout=0.01
+            )
+        mock_client.aio.models.generate_content.assert_not_awaited()
@@ -1,7 +1,7 @@
 """Tests for the Brand Marketing Advisor tools."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -693,7 +693,7 @@ class TestGenerateImage:
         mock_response.parts = [mock_part]
 
         mock_client = MagicMock()
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_settings = MagicMock()
         mock_settings.gemini_api_key = "test-key"
@@ -710,6 +710,8 @@ class TestGenerateImage:
         # Should have called save on the image
         mock_image.save.assert_called_once()
         assert "test-brand" in result or "image_" in result
+        # The client is shared per loop; closing it would break the next call
+        mock_client.aclose.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_generate_image_with_product_slug(self, tmp_path: Path) -> None:
@@ -830,7 +832,7 @@ class TestGenerateImage:
         mock_response.parts = [mock_part]
 
         mock_client = MagicMock()
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_settings = MagicMock()
         mock_settings.gemini_api_key = "test-key"
@@ -850,7 +852,7 @@ class TestGenerateImage:
             )
 
         # Should proceed without reference (content is just the prompt string)
-        call_args = mock_client.models.generate_content.call_args
+        call_args = mock_client.aio.models.generate_content.call_args
         contents = call_args[1]["contents"]
         # Without reference image, contents should be just the prompt string
         assert contents == "A lifestyle shot"
@@ -902,7 +904,7 @@ class TestGenerateImage:
         mock_response.parts = [mock_part]
 
         mock_client = MagicMock()
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_settings = MagicMock()
         mock_settings.gemini_api_key = "test-key"
@@ -946,7 +948,7 @@ class TestGenerateImage:
         mock_response.parts = [mock_part]
 
         mock_client = MagicMock()
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_settings = MagicMock()
         mock_settings.gemini_api_key = "test-key"
@@ -988,7 +990,7 @@ class TestGenerateImage:
         mock_response.parts = [mock_part]
 
         mock_client = MagicMock()
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_settings = MagicMock()
         mock_settings.gemini_api_key = "test-key"
@@ -1034,7 +1036,7 @@ class TestGenerateImage:
         mock_response.parts = [mock_part]
 
         mock_client = MagicMock()
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_settings = MagicMock()
         mock_settings.gemini_api_key = "test-key"
@@ -1081,7 +1083,7 @@ class TestGenerateImage:
         mock_response.parts = [mock_part]
 
         mock_client = MagicMock()
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         mock_settings = MagicMock()
         mock_settings.gemini_api_key = "test-key"
@@ -135,7 +135,9 @@ class TestGenerateWithValidation:
         mock_image = PILImage.new("RGB", (10, 10), color="red")
 
         mock_part.as_image.return_value = mock_image
-        mock_client.models.generate_content.return_value = MagicMock(parts=[mock_part])
+        mock_client.aio.models.generate_content = AsyncMock(
+            return_value=MagicMock(parts=[mock_part])
+        )
         return mock_client
 
     @pytest.fixture
@@ -307,7 +309,7 @@ class TestGenerateWithValidation:
     async def test_handles_generation_errors_gracefully(self, tmp_path: Path, fake_reference_image):
         """Test handling when image generation fails."""
         mock_client = MagicMock()
-        mock_client.models.generate_content.side_effect = Exception("API error")
+        mock_client.aio.models.generate_content = AsyncMock(side_effect=Exception("API error"))
 
         result = await generate_with_validation(
             client=mock_client,
@@ -140,6 +140,18 @@ class TestGetAssetFull:
         assert "dataUrl" in result["data"]
         assert "image/png" in result["data"]["dataUrl"]
 
+    def test_serves_upscaled_variant(self, service, state, mock_brand_dir):
+        """Should return the final-resolution variant of a kept image once it exists."""
+        kept = mock_brand_dir / "assets" / "logo" / "kept.png"
+        kept.write_bytes(b"draft")
+        variant = mock_brand_dir / "assets" / "logo" / ".hires" / "kept.png"
+        variant.parent.mkdir()
+        variant.write_bytes(b"final")
+        state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
+        result = service.get_asset_full("logo/kept.png")
+        assert result["success"]
+        assert result["data"]["dataUrl"].endswith(base64.b64encode(b"final").decode())
+
     def test_error_for_missing_file(self, service, state, mock_brand_dir):
         """Should return error when file doesn't exist."""
         state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
@@ -249,6 +261,18 @@ class TestRenameAsset:
         assert result["success"]
         assert result["data"]["newPath"] == "logo/new.png"
 
+    def test_moves_upscaled_variant(self, service, state, mock_brand_dir):
+        """Should keep the final-resolution variant with the renamed image."""
+        old_path = mock_brand_dir / "assets" / "logo" / "old.png"
+        old_path.write_bytes(b"draft")
+        hires = mock_brand_dir / "assets" / "logo" / ".hires"
+        hires.mkdir()
+        (hires / "old.png").write_bytes(b"final")
+        state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
+        assert service.rename_asset("logo/old.png", "new.png")["success"]
+        assert (hires / "new.png").read_bytes() == b"final"
+        assert not (hires / "old.png").exists()
+
     def test_error_when_no_brand(self, service, state):
         """Should return error when no brand dir."""
         state.get_brand_dir = MagicMock(return_value=(None, "No brand selected"))
@@ -375,6 +399,153 @@ class TestGetVideoData:
         assert "not found" in result["error"]
 
 
+# =============================================================================
+# Video thumbnail tests
+# =============================================================================
+def _fake_thumbnail_ffmpeg(cmd, **kwargs):
+    """Write the poster and strip PNGs an FFmpeg run would produce."""
+    from PIL import Image
+
+    for out in (cmd[cmd.index("[poster]") + 3], cmd[cmd.index("[strip]") + 3]):
+        Image.new("RGB", (32, 18), "red").save(out)
+    return MagicMock(stdout="", stderr="")
+
+
+@pytest.fixture
+def thumb_env(tmp_path):
+    """Isolate the thumbnail cache and fake FFmpeg/ffprobe."""
+    cache_dir = tmp_path / "thumb-cache"
+    cache_dir.mkdir()
+    probe = MagicMock()
+    probe.duration.return_value = 8.0
+    with (
+        patch(
+            "sip_studio.studio.services.video_thumbnails._get_thumb_cache_dir",
+            return_value=cache_dir,
+        ),
+        patch("sip_studio.studio.services.video_thumbnails.shutil.which", return_value="ffmpeg"),
+        patch("sip_studio.assembler.get_probe_cache", return_value=probe),
+        patch(
+            "sip_studio.studio.services.video_thumbnails.subprocess.run",
+            side_effect=_fake_thumbnail_ffmpeg,
+        ) as run,
+    ):
+        yield cache_dir, run
+
+
+def _wait_for_thumbnails(video_path):
+    """Let the background extraction of a video finish (or fail)."""
+    from sip_studio.studio.services.video_thumbnails import schedule_video_thumbnails
+
+    try:
+        schedule_video_thumbnails(video_path).result(timeout=10)
+    except Exception:
+        pass
+
+
+class TestGetVideoThumbnail:
+    """Tests for video poster frames and scrub strips."""
+
+    def test_returns_poster_and_strip(self, service, state, mock_brand_dir, thumb_env):
+        """Should extract both images in one FFmpeg call and cache them as WebP."""
+        cache_dir, run = thumb_env
+        video_path = mock_brand_dir / "assets" / "video" / "scene.mp4"
+        video_path.write_bytes(b"fake video content")
+        state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
+
+        pending = service.get_video_thumbnail("video/scene.mp4")
+        _wait_for_thumbnails(video_path)
+        result = service.get_video_thumbnail("video/scene.mp4")
+        again = service.get_video_thumbnail("video/scene.mp4")
+
+        assert pending["success"] and pending["data"] == {"pending": True}
+        assert result["success"]
+        assert result["data"]["posterUrl"].startswith("data:image/webp;base64,")
+        assert result["data"]["stripUrl"].startswith("data:image/webp;base64,")
+        assert result["data"]["frames"] == 10
+        assert again["data"] == result["data"]
+        run.assert_called_once()
+        filter_complex = run.call_args.args[0][run.call_args.args[0].index("-filter_complex") + 1]
+        assert "tile=10x1" in filter_complex
+        assert len(list(cache_dir.glob("*.webp"))) == 2
+
+    def test_asset_thumbnail_uses_poster(self, service, state, mock_brand_dir, thumb_env):
+        """Should serve the poster frame instead of reading the video."""
+        video_path = mock_brand_dir / "assets" / "video" / "scene.mp4"
+        video_path.write_bytes(b"fake video content")
+        state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
+        pending = service.get_asset_thumbnail("video/scene.mp4")
+        _wait_for_thumbnails(video_path)
+        result = service.get_asset_thumbnail("video/scene.mp4")
+        assert not pending["success"]
+        assert "still being generated" in pending["error"]
+        assert result["success"]
+        assert result["data"]["dataUrl"].startswith("data:image/webp;base64,")
+
+    def test_cache_miss_does_not_wait(self, service, state, mock_brand_dir, thumb_env):
+        """Should return at once while the extraction is still running."""
+        import threading
+
+        _, run = thumb_env
+        release = threading.Event()
+        run.side_effect = lambda cmd, **kw: (release.wait(10), _fake_thumbnail_ffmpeg(cmd))[1]
+        video_path = mock_brand_dir / "assets" / "video" / "slow.mp4"
+        video_path.write_bytes(b"fake video content")
+        state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
+        try:
+            assert service.get_video_thumbnail("video/slow.mp4")["data"] == {"pending": True}
+            assert service.get_video_thumbnail("video/slow.mp4")["data"] == {"pending": True}
+        finally:
+            release.set()
+        _wait_for_thumbnails(video_path)
+        assert "posterUrl" in service.get_video_thumbnail("video/slow.mp4")["data"]
+        run.assert_called_once()
+
+    def test_error_when_extraction_fails(self, service, state, mock_brand_dir, thumb_env):
+        """Should surface FFmpeg failures as bridge errors."""
+        import subprocess
+
+        _, run = thumb_env
+        run.side_effect = subprocess.CalledProcessError(1, "ffmpeg", stderr="moov atom not found")
+        video_path = mock_brand_dir / "assets" / "video" / "broken.mp4"
+        video_path.write_bytes(b"not a video")
+        state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
+        service.get_video_thumbnail("video/broken.mp4")
+        _wait_for_thumbnails(video_path)
+        result = service.get_video_thumbnail("video/broken.mp4")
+        assert not result["success"]
+        assert "moov atom" in result["error"]
+        # The failure is remembered until the video changes
+        run.assert_called_once()
+
+    def test_error_for_non_video(self, service, state, mock_brand_dir):
+        """Should reject non-video files."""
+        (mock_brand_dir / "assets" / "logo" / "a.png").write_bytes(b"png")
+        state.get_brand_dir = MagicMock(return_value=(mock_brand_dir, None))
+        result = service.get_video_thumbnail("logo/a.png")
+        assert not result["success"]
+        assert "Unsupported" in result["error"]
+
+    def test_listing_schedules_background_generation(self, service):
+        """Should queue thumbnails for videos when the asset tree is listed."""
+        mock_assets = [{"filename": "clip.mp4", "path": "/tmp/clip.mp4", "type": "video"}]
+        with (
+            patch(
+                "sip_studio.studio.services.asset_service.list_brand_assets",
+                return_value=mock_assets,
+            ),
+            patch("sip_studio.studio.services.asset_service.ASSET_CATEGORIES", ["video"]),
+            patch("pathlib.Path.exists", return_value=True),
+            patch("pathlib.Path.stat", return_value=MagicMock(st_size=1024)),
+            patch(
+                "sip_studio.studio.services.video_thumbnails.schedule_video_thumbnails"
+            ) as schedule,
+        ):
+            result = service.get_assets("test")
+        assert result["success"]
+        schedule.assert_called_once_with(Path("/tmp/clip.mp4"))
+
+
 # =============================================================================
 # get_image_metadata tests
 # =============================================================================
@@ -0,0 +1,93 @@
+"""Tests for the content-addressed video clip cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sip_studio.generators.clip_cache import ClipCache, get_clip_cache
+from sip_studio.generators.sora_generator import SoraVideoGenerator
+from sip_studio.models.script import SceneAction
+
+
+def _write(path: Path, size: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+class TestMakeKey:
+    def test_key_is_stable(self) -> None:
+        k1 = ClipCache.make_key("veo", "m", "prompt", params={"duration": 8, "ratio": "16:9"})
+        k2 = ClipCache.make_key("veo", "m", "prompt", params={"ratio": "16:9", "duration": 8})
+        assert k1 == k2
+
+    def test_key_changes_with_request(self) -> None:
+        base = ClipCache.make_key("veo", "m", "prompt", params={"duration": 8})
+        assert ClipCache.make_key("veo", "m", "prompt 2", params={"duration": 8}) != base
+        assert ClipCache.make_key("veo", "m2", "prompt", params={"duration": 8}) != base
+        assert ClipCache.make_key("sora", "m", "prompt", params={"duration": 8}) != base
+        assert ClipCache.make_key("veo", "m", "prompt", params={"duration": 4}) != base
+
+    def test_key_hashes_reference_contents(self, tmp_path: Path) -> None:
+        ref = tmp_path / "ref.png"
+        ref.write_bytes(b"one")
+        k1 = ClipCache.make_key("veo", "m", "p", [ref])
+        ref.write_bytes(b"two!")
+        k2 = ClipCache.make_key("veo", "m", "p", [ref])
+        assert k1 != k2
+
+
+class TestClipCache:
+    def test_put_then_get_materializes_clip(self, tmp_path: Path) -> None:
+        cache = ClipCache(cache_dir=tmp_path / "cache")
+        src = _write(tmp_path / "gen" / "scene_001.mp4", 10)
+        cache.put("abc", src)
+        dest = tmp_path / "out" / "scene_001.mp4"
+        assert cache.get("abc", dest) == dest
+        assert dest.read_bytes() == b"x" * 10
+
+    def test_miss_and_disabled(self, tmp_path: Path) -> None:
+        cache = ClipCache(cache_dir=tmp_path / "cache", enabled=False)
+        src = _write(tmp_path / "gen.mp4", 10)
+        cache.put("abc", src)
+        assert cache.get("abc", tmp_path / "out.mp4") is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = ClipCache(cache_dir=tmp_path / "cache", max_bytes=25)
+        for i, key in enumerate(["a", "b"]):
+            cache.put(key, _write(tmp_path / f"{key}.mp4", 10))
+            os.utime(cache.cache_dir / f"{key}.mp4", (1000 + i, 1000 + i))
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a", tmp_path / "hit.mp4")
+        cache.put("c", _write(tmp_path / "c.mp4", 10))
+        remaining = sorted(p.stem for p in cache.cache_dir.glob("*.mp4"))
+        assert remaining == ["a", "c"]
+
+
+async def test_sora_second_identical_request_hits_cache(tmp_path: Path) -> None:
+    """An identical request returns the cached clip without calling the API."""
+    mock_video = MagicMock(id="video_123", status="completed", error=None)
+    mock_download = MagicMock(content=b"fake video content")
+    mock_client = AsyncMock()
+    mock_client.videos.create_and_poll = AsyncMock(return_value=mock_video)
+    mock_client.videos.download_content = AsyncMock(return_value=mock_download)
+    scene = SceneAction(
+        scene_number=1,
+        duration_seconds=4,
+        setting_description="A forest",
+        action_description="Hero walks",
+        camera_direction="Wide shot",
+    )
+
+    with patch("sip_studio.generators.sora_generator.AsyncOpenAI", return_value=mock_client):
+        generator = SoraVideoGenerator(api_key="test-key")
+        await generator.generate_video_clip(scene=scene, output_dir=str(tmp_path / "run1"))
+        asset = await generator.generate_video_clip(scene=scene, output_dir=str(tmp_path / "run2"))
+
+    assert mock_client.videos.create_and_poll.await_count == 1
+    assert Path(asset.local_path) == tmp_path / "run2" / "scene_001.mp4"
+    assert Path(asset.local_path).read_bytes() == b"fake video content"
+    assert any(get_clip_cache().cache_dir.glob("*.mp4"))
@@ -0,0 +1,147 @@
+"""Tests for the batch assembly queue."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.batch import AssemblyQueue, AssemblySpec, JobState
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.probe import ProbeCache
+
+
+def _probe_json(width: int, height: int, codec: str = "h264") -> dict:
+    return {
+        "streams": [
+            {
+                "index": 0,
+                "codec_type": "video",
+                "codec_name": codec,
+                "width": width,
+                "height": height,
+                "r_frame_rate": "24/1",
+                "pix_fmt": "yuv420p",
+            },
+            {
+                "index": 1,
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "48000",
+                "channels": 2,
+            },
+        ],
+        "format": {"duration": "4.0"},
+    }
+
+
+_LAYOUTS = {
+    "scene_1.mp4": _probe_json(1280, 720),
+    "scene_2.mp4": _probe_json(1280, 720),
+    "scene_3.mp4": _probe_json(1280, 720, codec="hevc"),
+}
+
+
+@pytest.fixture
+def clips(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name in _LAYOUTS:
+        path = tmp_path / name
+        path.write_bytes(b"video")
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def assembler() -> FFmpegAssembler:
+    def run(cmd, **kwargs):
+        # Normalized copies conform to the 720p target
+        layout = _LAYOUTS.get(Path(cmd[-1]).name, _probe_json(1280, 720))
+        return MagicMock(stdout=json.dumps(layout))
+
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        return FFmpegAssembler(probe_cache=ProbeCache(persist=False, run_fn=run))
+
+
+class _FakeFFmpeg:
+    """Async ``run_ffmpeg`` stand-in that records commands and concurrency."""
+
+    def __init__(self, fail_output: str | None = None):
+        self.commands: list[list[str]] = []
+        self.running = 0
+        self.max_running = 0
+        self.fail_output = fail_output
+
+    async def __call__(self, cmd: list[str], **kwargs) -> None:
+        self.commands.append(cmd)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_output and cmd[-1].endswith(self.fail_output):
+                raise FFmpegError("FFmpeg concatenation failed: disk full")
+            Path(cmd[-1]).write_bytes(b"out")
+        finally:
+            self.running -= 1
+
+    def normalizations(self) -> list[list[str]]:
+        return [c for c in self.commands if "concat" not in c]
+
+
+async def test_shared_normalization_runs_once(
+    clips: list[Path], assembler: FFmpegAssembler, tmp_path: Path
+) -> None:
+    fake = _FakeFFmpeg()
+    queue = AssemblyQueue(assembler, max_processes=2)
+    queue.add(AssemblySpec(clips, tmp_path / "out" / "a.mp4"))
+    queue.add(AssemblySpec(list(reversed(clips)), tmp_path / "out" / "b.mp4"))
+    with patch("sip_studio.assembler.runner.run_ffmpeg", fake):
+        report = await queue.run()
+
+    assert [j.state for j in report.jobs] == [JobState.DONE, JobState.DONE]
+    assert len(fake.normalizations()) == 1  # Only the hevc clip, shared by both outputs
+    assert report.normalizations_run == 1
+    assert report.normalizations_shared == 1
+    assert report.output_seconds == 24.0
+    assert (tmp_path / "out" / "a.mp4").exists() and (tmp_path / "out" / "b.mp4").exists()
+
+
+async def test_crop_variant_and_process_limit(
+    clips: list[Path], assembler: FFmpegAssembler, tmp_path: Path
+) -> None:
+    fake = _FakeFFmpeg()
+    updates: list[JobState] = []
+    queue = AssemblyQueue(
+        assembler, max_processes=2, on_job_progress=lambda job: updates.append(job.state)
+    )
+    queue.add(AssemblySpec(clips, tmp_path / "wide.mp4"))
+    queue.add(AssemblySpec(clips, tmp_path / "tall.mp4", size=(1080, 1920), fit="crop"))
+    with patch("sip_studio.assembler.runner.run_ffmpeg", fake):
+        report = await queue.run()
+
+    assert len(report.succeeded) == 2
+    assert report.normalizations_run == 4  # One for the wide cut, all three for the tall
+    assert fake.max_running <= 2
+    crops = [c for c in fake.normalizations() if "crop=1080:1920" in " ".join(c)]
+    assert len(crops) == 3
+    assert JobState.NORMALIZING in updates and JobState.ENCODING in updates
+
+
+async def test_failed_job_does_not_stop_others(
+    clips: list[Path], assembler: FFmpegAssembler, tmp_path: Path
+) -> None:
+    fake = _FakeFFmpeg(fail_output="bad.mp4")
+    queue = AssemblyQueue(assembler, max_processes=2)
+    good = queue.add(AssemblySpec(clips, tmp_path / "good.mp4"))
+    bad = queue.add(AssemblySpec(clips, tmp_path / "bad.mp4"))
+    missing = queue.add(AssemblySpec([tmp_path / "gone.mp4"], tmp_path / "x.mp4"))
+    with patch("sip_studio.assembler.runner.run_ffmpeg", fake):
+        report = await queue.run()
+
+    assert good.state == JobState.DONE
+    assert bad.state == JobState.FAILED and "disk full" in (bad.error or "")
+    assert missing.state == JobState.FAILED
+    assert report.failed == [bad, missing]
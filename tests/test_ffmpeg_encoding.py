@@ -0,0 +1,159 @@
+"""Tests for encoding profiles and the encoder benchmark."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.encoding import (
+    PROFILES,
+    BenchmarkResult,
+    get_benchmark_results,
+    get_encoding_profile,
+    run_encoder_benchmark,
+    select_profile,
+    select_profile_for_clip,
+)
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.normalize import TargetProfile, build_normalize_command
+
+
+def _results(draft: float, standard: float, archival: float) -> list[BenchmarkResult]:
+    return [
+        BenchmarkResult(profile="draft", fps=draft, frames=96, elapsed=96 / draft),
+        BenchmarkResult(profile="standard", fps=standard, frames=96, elapsed=96 / standard),
+        BenchmarkResult(profile="archival", fps=archival, frames=96, elapsed=96 / archival),
+    ]
+
+
+class TestProfiles:
+    def test_standard_keeps_previous_settings(self) -> None:
+        profile = get_encoding_profile()
+        assert profile.name == "standard"
+        assert profile.video_args()[:6] == ["-c:v", "libx264", "-preset", "medium", "-crf", "23"]
+        assert profile.video_args(normalize=True)[3:6] == ["veryfast", "-crf", "20"]
+        assert profile.audio_args() == ["-c:a", "aac", "-b:a", "192k"]
+
+    def test_unknown_profile_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown encoding profile 'fast'"):
+            get_encoding_profile("fast")
+
+    def test_assembler_uses_profile(self, tmp_path: Path) -> None:
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+            assembler = FFmpegAssembler(encoding_profile="draft")
+        cmd = assembler._build_concat_command(tmp_path / "list.txt", tmp_path / "o.mp4", True)
+        assert cmd[cmd.index("-preset") + 1] == "ultrafast"
+        assert cmd[cmd.index("-tune") + 1] == "fastdecode"
+        assert cmd[cmd.index("-b:a") + 1] == "128k"
+
+    def test_normalize_command_uses_profile(self, tmp_path: Path) -> None:
+        target = TargetProfile(width=1280, height=720, fps=24.0)
+        cmd = build_normalize_command(
+            tmp_path / "in.mp4", tmp_path / "out.mp4", target, True, 4, PROFILES["archival"]
+        )
+        assert cmd[cmd.index("-preset") + 1] == "medium"
+        assert cmd[cmd.index("-crf") + 1] == "16"
+        assert cmd[cmd.index("-threads") + 1] == "4"
+        assert cmd[cmd.index("-b:a") + 1] == "256k"
+
+
+class TestBenchmark:
+    def test_measures_fps_per_profile(self) -> None:
+        run = MagicMock()
+        clock = iter([0.0, 1.0, 10.0, 12.0])
+        with patch("sip_studio.assembler.encoding.time.perf_counter", lambda: next(clock)):
+            results = run_encoder_benchmark(
+                [PROFILES["draft"], PROFILES["standard"]], seconds=4.0, run_fn=run
+            )
+        assert [(r.profile, r.fps) for r in results] == [("draft", 96.0), ("standard", 48.0)]
+        cmd = run.call_args_list[0].args[0]
+        assert cmd[cmd.index("-i") + 1] == "testsrc=size=1280x720:rate=24:duration=4.0"
+        assert cmd[-3:] == ["-f", "null", "-"]
+
+    def test_failure_raises(self) -> None:
+        error = subprocess.CalledProcessError(1, "ffmpeg", stderr="Unknown encoder 'libx264'")
+        with pytest.raises(FFmpegError, match="benchmark of draft failed: Unknown encoder"):
+            run_encoder_benchmark([PROFILES["draft"]], run_fn=MagicMock(side_effect=error))
+
+    def test_results_cached(self, tmp_path: Path) -> None:
+        path = tmp_path / "bench.json"
+        with patch(
+            "sip_studio.assembler.encoding.run_encoder_benchmark",
+            return_value=_results(400.0, 100.0, 25.0),
+        ) as bench:
+            first = get_benchmark_results(path=path)
+            second = get_benchmark_results(path=path)
+            get_benchmark_results(refresh=True, path=path)
+        assert first == second
+        assert bench.call_count == 2
+
+    def test_results_from_older_benchmark_rerun(self, tmp_path: Path) -> None:
+        path = tmp_path / "bench.json"
+        with patch(
+            "sip_studio.assembler.encoding.run_encoder_benchmark",
+            return_value=_results(400.0, 100.0, 25.0),
+        ) as bench:
+            get_benchmark_results(path=path)
+            data = json.loads(path.read_text())
+            data["machine"]["benchmark"] -= 1
+            path.write_text(json.dumps(data))
+            get_benchmark_results(path=path)
+        assert bench.call_count == 2
+
+
+class TestSelectProfile:
+    def test_best_profile_within_target(self) -> None:
+        results = _results(draft=400.0, standard=100.0, archival=25.0)
+        # 20s at 24 fps = 480 frames: archival 19.2s, standard 4.8s, draft 1.2s
+        assert select_profile(20.0, 30.0, results).name == "archival"
+        assert select_profile(20.0, 10.0, results).name == "standard"
+        assert select_profile(20.0, 2.0, results).name == "draft"
+        assert select_profile(20.0, 0.5, results).name == "draft"
+
+    def test_scales_with_frame_size(self) -> None:
+        results = _results(draft=400.0, standard=100.0, archival=25.0)
+        # 1080p has 2.25x the pixels of the 720p benchmark
+        assert select_profile(20.0, 10.0, results, width=1920, height=1080).name == "draft"
+
+
+class TestSelectProfileForClip:
+    def _run(self, seconds_per_preset: dict[str, float]):
+        """Fake runner plus clock where each preset's excerpt encode takes a fixed time."""
+        now = [0.0]
+        run = MagicMock()
+
+        def fake_run(cmd, **kwargs):
+            now[0] += seconds_per_preset[cmd[cmd.index("-preset") + 1]]
+
+        run.side_effect = fake_run
+        return run, lambda: now[0]
+
+    def test_stops_at_first_profile_meeting_target(self, tmp_path: Path) -> None:
+        # 2s excerpt at 24 fps = 48 frames; archival normalizes with "medium": 4s -> 12 fps
+        run, clock = self._run({"medium": 4.0, "veryfast": 1.0, "ultrafast": 0.1})
+        with patch("sip_studio.assembler.encoding.time.perf_counter", clock):
+            profile = select_profile_for_clip(
+                tmp_path / "clip.mp4", 20.0, 10.0, 24.0, 1920, 1080, run_fn=run
+            )
+        # archival: 480 frames / 12 fps = 40s; standard: 480 / 48 = 10s -> meets target
+        assert profile.name == "standard"
+        assert run.call_count == 2
+        cmd = run.call_args_list[0].args[0]
+        assert cmd[cmd.index("-t") + 1] == "2"
+        assert cmd[cmd.index("-i") + 1] == str(tmp_path / "clip.mp4")
+        # Timed with the normalization settings, the re-encode an assembly runs
+        assert cmd[cmd.index("-crf") + 1] == "16"
+
+    def test_short_clip_bounds_excerpt_frames(self, tmp_path: Path) -> None:
+        run, clock = self._run({"medium": 1.0, "veryfast": 1.0, "ultrafast": 1.0})
+        with patch("sip_studio.assembler.encoding.time.perf_counter", clock):
+            profile = select_profile_for_clip(
+                tmp_path / "clip.mp4", 4.0, 1.0, 24.0, 1280, 720, clip_duration=0.5, run_fn=run
+            )
+        # Only 12 frames per excerpt (12 fps): nothing meets 1s, so all are tried
+        assert profile.name == "draft"
+        assert run.call_count == 3
@@ -0,0 +1,184 @@
+"""Tests for incremental re-assembly (segment manifest + cached music bed)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.ffmpeg import FFmpegAssembler
+from sip_studio.assembler.incremental import AssemblyManifest
+from sip_studio.assembler.probe import ProbeCache
+from sip_studio.models.music import GeneratedMusic, MusicBrief, MusicGenre, MusicMood
+
+_PROBE = {
+    "streams": [
+        {
+            "index": 0,
+            "codec_type": "video",
+            "codec_name": "h264",
+            "width": 1280,
+            "height": 720,
+            "r_frame_rate": "24/1",
+            "pix_fmt": "yuv420p",
+        }
+    ],
+    "format": {"duration": "8.0"},
+}
+
+
+def _fake_ffmpeg(cmd, **kwargs):
+    Path(cmd[-1]).write_bytes(b"rendered " + " ".join(cmd).encode())
+    return MagicMock(stdout="", stderr="")
+
+
+@pytest.fixture
+def music(tmp_path: Path) -> GeneratedMusic:
+    path = tmp_path / "music.wav"
+    path.write_bytes(b"RIFF music")
+    brief = MusicBrief(
+        prompt="Calm piano",
+        mood=MusicMood.CALM,
+        genre=MusicGenre.AMBIENT,
+        rationale="Background",
+    )
+    return GeneratedMusic(file_path=str(path), duration_seconds=30.0, prompt_used="x", brief=brief)
+
+
+@pytest.fixture
+def clips(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"scene_{i}.mp4"
+        path.write_bytes(f"clip {i}".encode())
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def assembler() -> FFmpegAssembler:
+    probe_run = MagicMock(return_value=MagicMock(stdout=json.dumps(_PROBE)))
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        return FFmpegAssembler(probe_cache=ProbeCache(persist=False, run_fn=probe_run))
+
+
+def _assemble(assembler, clips, music, output) -> list[list[str]]:
+    with patch("subprocess.run", side_effect=_fake_ffmpeg) as run:
+        assembler.assemble_with_music(clips, music, output, incremental=True)
+    return [c.args[0] for c in run.call_args_list]
+
+
+def test_first_assembly_renders_bed_and_remuxes(assembler, clips, music, tmp_path: Path) -> None:
+    output = tmp_path / "final.mp4"
+    cmds = _assemble(assembler, clips, music, output)
+
+    assert len(cmds) == 2
+    bed_cmd, remux_cmd = cmds
+    assert "-stream_loop" in bed_cmd
+    assert "afade=t=out:st=30.0" in bed_cmd[bed_cmd.index("-af") + 1]
+    assert bed_cmd[bed_cmd.index("-t") + 1] == "32.000"
+    # Clips have no audio, so both streams are copied
+    assert remux_cmd[remux_cmd.index("-c") + 1] == "copy"
+    assert "-filter_complex" not in remux_cmd
+    assert output.exists()
+
+    manifest = AssemblyManifest.load(tmp_path / ".assembly" / "final.manifest.json")
+    assert manifest is not None
+    assert len(manifest.segments) == 4
+    assert len(list((tmp_path / ".assembly").glob("final.bed_*.m4a"))) == 1
+    assert not list((tmp_path / ".assembly").glob(".*part*"))
+    assert not (tmp_path / ".assembly" / "final.concat.txt").exists()
+
+
+def test_unchanged_assembly_is_skipped(assembler, clips, music, tmp_path: Path) -> None:
+    output = tmp_path / "final.mp4"
+    _assemble(assembler, clips, music, output)
+    assert _assemble(assembler, clips, music, output) == []
+
+
+def test_changed_scene_reuses_bed(assembler, clips, music, tmp_path: Path) -> None:
+    output = tmp_path / "final.mp4"
+    _assemble(assembler, clips, music, output)
+
+    clips[2].write_bytes(b"regenerated scene")
+    cmds = _assemble(assembler, clips, music, output)
+
+    # Same total duration and music: only the stream-copy remux runs
+    assert len(cmds) == 1
+    assert "concat" in cmds[0]
+
+
+def test_music_change_rerenders_bed(assembler, clips, music, tmp_path: Path) -> None:
+    output = tmp_path / "final.mp4"
+    _assemble(assembler, clips, music, output)
+
+    music_path = Path(music.file_path)
+    music_path.write_bytes(b"RIFF new music")
+    cmds = _assemble(assembler, clips, music, output)
+
+    assert len(cmds) == 2
+    assert len(list((tmp_path / ".assembly").glob("final.bed_*.m4a"))) == 1
+
+
+def test_tampered_output_is_rebuilt(assembler, clips, music, tmp_path: Path) -> None:
+    output = tmp_path / "final.mp4"
+    _assemble(assembler, clips, music, output)
+    st = output.stat()
+    os.utime(output, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert len(_assemble(assembler, clips, music, output)) == 1
+
+
+@pytest.fixture
+def voiced_assembler() -> FFmpegAssembler:
+    audio = {
+        "index": 1,
+        "codec_type": "audio",
+        "codec_name": "aac",
+        "sample_rate": "48000",
+        "channels": 2,
+    }
+    probe = {**_PROBE, "streams": [*_PROBE["streams"], audio]}
+    probe_run = MagicMock(return_value=MagicMock(stdout=json.dumps(probe)))
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        return FFmpegAssembler(probe_cache=ProbeCache(persist=False, run_fn=probe_run))
+
+
+def test_clip_audio_is_mixed_per_segment(voiced_assembler, clips, music, tmp_path: Path) -> None:
+    cmds = _assemble(voiced_assembler, clips, music, tmp_path / "final.mp4")
+
+    # Bed, one mix per clip, then the remux
+    assert len(cmds) == 6
+    mix_cmd = cmds[2]
+    filter_complex = mix_cmd[mix_cmd.index("-filter_complex") + 1]
+    assert "[0:a]volume=" in filter_complex and "amix=inputs=2" in filter_complex
+    assert mix_cmd[mix_cmd.index("-ss") + 1] == "8.000"
+    assert mix_cmd[mix_cmd.index("-c:a") + 1] == "pcm_s16le"
+
+    remux_cmd = cmds[-1]
+    assert "-filter_complex" not in remux_cmd
+    assert remux_cmd.count("concat") == 2
+    assert remux_cmd[remux_cmd.index("-c:v") + 1] == "copy"
+    assert remux_cmd[remux_cmd.index("-c:a") + 1] == "aac"
+    assert len(list((tmp_path / ".assembly").glob("final.seg_*.wav"))) == 4
+    assert not (tmp_path / ".assembly" / "final.audio.txt").exists()
+
+
+def test_changed_scene_remixes_only_its_segment(
+    voiced_assembler, clips, music, tmp_path: Path
+) -> None:
+    output = tmp_path / "final.mp4"
+    _assemble(voiced_assembler, clips, music, output)
+
+    clips[2].write_bytes(b"regenerated scene")
+    cmds = _assemble(voiced_assembler, clips, music, output)
+
+    assert len(cmds) == 2
+    mix_cmd, remux_cmd = cmds
+    assert mix_cmd[mix_cmd.index("-i") + 1] == str(clips[2])
+    assert mix_cmd[mix_cmd.index("-ss") + 1] == "16.000"
+    assert "concat" in remux_cmd
+    # The stale mix of the old scene is dropped
+    assert len(list((tmp_path / ".assembly").glob("final.seg_*.wav"))) == 4
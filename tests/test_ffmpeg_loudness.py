@@ -0,0 +1,168 @@
+"""Tests for cached loudness analysis and loudness-based mix gains."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.loudness import (
+    LoudnessCache,
+    LoudnessMeasurement,
+    compute_mix_gains,
+    parse_ebur128_summary,
+)
+from sip_studio.assembler.probe import ProbeCache
+
+_SUMMARY = """
+[Parsed_ebur128_0 @ 0x7f] t: 7.9  TARGET:-23 LUFS    M: -21.2 S: -20.9     I: -21.0 LUFS
+[Parsed_ebur128_0 @ 0x7f] Summary:
+
+  Integrated loudness:
+    I:         -20.0 LUFS
+    Threshold: -30.4 LUFS
+
+  Loudness range:
+    LRA:         4.2 LU
+    Threshold: -40.1 LUFS
+    LRA low:   -23.0 LUFS
+    LRA high:  -18.8 LUFS
+
+  True peak:
+    Peak:       -3.5 dBFS
+"""
+
+_PROBE = {
+    "streams": [
+        {
+            "index": 0,
+            "codec_type": "video",
+            "codec_name": "h264",
+            "width": 1280,
+            "height": 720,
+            "r_frame_rate": "24/1",
+            "pix_fmt": "yuv420p",
+        },
+        {"index": 1, "codec_type": "audio", "codec_name": "aac"},
+    ],
+    "format": {"duration": "5.0"},
+}
+
+
+def _ebur128(summary: str = _SUMMARY) -> MagicMock:
+    return MagicMock(return_value=MagicMock(stdout="", stderr=summary))
+
+
+def test_parse_summary_ignores_running_values() -> None:
+    result = parse_ebur128_summary(_SUMMARY)
+    assert result == LoudnessMeasurement(integrated=-20.0, loudness_range=4.2, true_peak=-3.5)
+
+
+def test_parse_without_summary_raises() -> None:
+    with pytest.raises(FFmpegError, match="No ebur128 summary"):
+        parse_ebur128_summary("Stream map '0:a:0' matches no streams.")
+
+
+class TestLoudnessCache:
+    def test_sidecar_reused_until_file_changes(self, tmp_path: Path) -> None:
+        clip = tmp_path / "scene_1.mp4"
+        clip.write_bytes(b"clip")
+        run = _ebur128()
+
+        first = LoudnessCache(run_fn=run).measure(clip)
+        second = LoudnessCache(run_fn=run).measure(clip)  # New process, same sidecar
+        assert first == second
+        assert run.call_count == 1
+        assert (tmp_path / ".scene_1.mp4.loudness.json").exists()
+        cmd = run.call_args.args[0]
+        assert cmd[cmd.index("-af") + 1] == "ebur128=peak=true"
+
+        st = clip.stat()
+        os.utime(clip, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        LoudnessCache(run_fn=run).measure(clip)
+        assert run.call_count == 2
+
+    def test_failure_raises(self, tmp_path: Path) -> None:
+        clip = tmp_path / "scene_1.mp4"
+        clip.write_bytes(b"clip")
+        error = subprocess.CalledProcessError(1, "ffmpeg", stderr="Invalid data found")
+        cache = LoudnessCache(persist=False, run_fn=MagicMock(side_effect=error))
+        with pytest.raises(FFmpegError, match="Loudness analysis failed for scene_1.mp4"):
+            cache.measure(clip)
+
+
+class TestMixGains:
+    def test_clips_to_target_music_ducked(self) -> None:
+        clips = [LoudnessMeasurement(integrated=-20.0), LoudnessMeasurement(integrated=-20.0)]
+        music = LoudnessMeasurement(integrated=-10.0)
+        gains = compute_mix_gains(clips, [4.0, 6.0], music, music_volume=1.0)
+        assert gains.video_gain_db == 4.0
+        assert gains.music_gain_db == -12.0  # -16 LUFS program, music 6 dB under
+        quieter = compute_mix_gains(clips, [4.0, 6.0], music, music_volume=0.5)
+        assert quieter.music_gain_db == pytest.approx(-18.02)
+
+    def test_clip_gain_limited_by_true_peak(self) -> None:
+        clips = [LoudnessMeasurement(integrated=-20.0, true_peak=-2.0)]
+        gains = compute_mix_gains(clips, [5.0], LoudnessMeasurement(-10.0), 1.0)
+        assert gains.video_gain_db == 1.0
+        assert gains.music_gain_db == -15.0  # Ducked under the clips' actual level
+
+    def test_silent_clips_use_music_only_target(self) -> None:
+        clips = [LoudnessMeasurement(integrated=-70.0)]
+        gains = compute_mix_gains(clips, [5.0], LoudnessMeasurement(-12.0), 0.4)
+        assert gains.video_gain_db == 0.0
+        assert gains.music_gain_db == pytest.approx(-11.96)
+
+
+def test_assembler_mix_uses_cached_gains(tmp_path: Path) -> None:
+    clips = []
+    for i in range(2):
+        clip = tmp_path / f"scene_{i}.mp4"
+        clip.write_bytes(b"clip")
+        clips.append(clip)
+    music = tmp_path / "music.wav"
+    music.write_bytes(b"music")
+    probe_run = MagicMock(return_value=MagicMock(stdout=json.dumps(_PROBE)))
+    loudness_run = _ebur128()
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        assembler = FFmpegAssembler(
+            probe_cache=ProbeCache(persist=False, run_fn=probe_run),
+            normalize_loudness=True,
+            loudness_cache=LoudnessCache(run_fn=loudness_run),
+        )
+
+    for _ in range(2):
+        cmd, concat_file, _ = assembler._prepare_music_mix(
+            clips, music, tmp_path / "final.mp4", 0.4, 2.0
+        )
+        concat_file.unlink()
+    assert loudness_run.call_count == 3  # Two clips and the music, measured once
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "[0:a]volume=2.5dB[video_audio]" in graph  # +4 dB capped by the -3.5 dBFS peak
+    assert "normalize=0" in graph
+
+
+def test_assembler_falls_back_to_fixed_volumes(tmp_path: Path) -> None:
+    clip = tmp_path / "scene_1.mp4"
+    clip.write_bytes(b"clip")
+    music = tmp_path / "music.wav"
+    music.write_bytes(b"music")
+    probe_run = MagicMock(return_value=MagicMock(stdout=json.dumps(_PROBE)))
+    error = subprocess.CalledProcessError(1, "ffmpeg", stderr="boom")
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        assembler = FFmpegAssembler(
+            probe_cache=ProbeCache(persist=False, run_fn=probe_run),
+            normalize_loudness=True,
+            loudness_cache=LoudnessCache(persist=False, run_fn=MagicMock(side_effect=error)),
+        )
+    cmd, concat_file, _ = assembler._prepare_music_mix(
+        [clip], music, tmp_path / "final.mp4", 0.4, 2.0
+    )
+    concat_file.unlink()
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "volume=0.4[music]" in graph and "normalize=0" not in graph
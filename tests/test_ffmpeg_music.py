@@ -1,11 +1,13 @@
 """Tests for FFmpeg audio mixing with background music."""
 
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.probe import ProbeCache
 from sip_studio.models.music import (
     GeneratedMusic,
     MusicBrief,
@@ -63,11 +65,36 @@ def sample_video_clips(tmp_path: Path) -> list[Path]:
     return clips
 
 
+# Clips that already share one profile, so normalization re-encodes nothing
+_CONFORMING_PROBE = {
+    "streams": [
+        {
+            "index": 0,
+            "codec_type": "video",
+            "codec_name": "h264",
+            "width": 1280,
+            "height": 720,
+            "r_frame_rate": "24/1",
+            "pix_fmt": "yuv420p",
+        },
+        {
+            "index": 1,
+            "codec_type": "audio",
+            "codec_name": "aac",
+            "sample_rate": "48000",
+            "channels": 2,
+        },
+    ],
+    "format": {"duration": "10.0"},
+}
+
+
 @pytest.fixture
 def assembler() -> FFmpegAssembler:
     """Create an FFmpegAssembler with mocked FFmpeg check."""
+    probe_run = MagicMock(return_value=MagicMock(stdout=json.dumps(_CONFORMING_PROBE)))
     with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
-        return FFmpegAssembler()
+        return FFmpegAssembler(probe_cache=ProbeCache(persist=False, run_fn=probe_run))
 
 
 class TestAssembleWithMusicValidation:
@@ -152,14 +179,10 @@ class TestAssembleWithMusicValidation:
 
         # Mock the internal calls to avoid actual FFmpeg execution
         with (
-            patch.object(assembler, "concatenate_clips"),
             patch.object(assembler, "get_video_duration", return_value=30.0),
             patch("subprocess.run") as mock_run,
         ):
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
-            # Create the temp concat file
-            concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-            concat_temp.write_bytes(b"temp")
 
             # Volume 0.0 should work
             assembler.assemble_with_music(
@@ -192,16 +215,10 @@ class TestAssembleWithMusicExecution:
         output_path = tmp_path / "output.mp4"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=60.0),
             patch.object(assembler, "has_audio_stream", return_value=True),
             patch("subprocess.run") as mock_run,
         ):
-            # Create the temp concat file that concatenate_clips would create
-            concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-            concat_temp.write_bytes(b"temp video content")
-            mock_concat.return_value = concat_temp
-
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             result = assembler.assemble_with_music(
@@ -211,27 +228,24 @@ class TestAssembleWithMusicExecution:
             )
 
             assert result == output_path
-            mock_concat.assert_called_once()
             mock_run.assert_called_once()
 
-    def test_concatenate_clips_called_first(
+    def test_single_pass_concat_and_mix(
         self,
         assembler: FFmpegAssembler,
         sample_video_clips: list[Path],
         sample_generated_music: GeneratedMusic,
         tmp_path: Path,
     ) -> None:
-        """Test that concatenate_clips is called with correct arguments."""
+        """Test that clips are concatenated and mixed in one FFmpeg invocation."""
         output_path = tmp_path / "output.mp4"
-        expected_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
 
         with (
             patch.object(assembler, "concatenate_clips") as mock_concat,
-            patch.object(assembler, "get_video_duration", return_value=30.0),
+            patch.object(assembler, "get_video_duration", return_value=30.0) as mock_duration,
+            patch.object(assembler, "has_audio_stream", return_value=True) as mock_audio,
             patch("subprocess.run") as mock_run,
         ):
-            expected_temp.write_bytes(b"temp")
-            mock_concat.return_value = expected_temp
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             assembler.assemble_with_music(
@@ -240,12 +254,68 @@ class TestAssembleWithMusicExecution:
                 output_path,
             )
 
-            mock_concat.assert_called_once_with(
+            mock_concat.assert_not_called()
+            # Each clip is probed; the concatenated output never is
+            probed = [c.args[0] for c in mock_duration.call_args_list]
+            assert probed == sample_video_clips
+            assert [c.args[0] for c in mock_audio.call_args_list] == sample_video_clips
+            cmd = mock_run.call_args.args[0]
+            concat_list = tmp_path / ".concat_list_output.txt"
+            idx = cmd.index(str(concat_list))
+            assert cmd[idx - 5 : idx] == ["-f", "concat", "-safe", "0", "-i"]
+            # Fade out is placed from the summed clip durations (3 x 30s)
+            filter_complex = cmd[cmd.index("-filter_complex") + 1]
+            assert "afade=t=out:st=88.0" in filter_complex
+            assert "[0:a]" in filter_complex
+            assert not list(tmp_path.glob(".concat_temp_*"))
+
+    def test_mixed_audio_clips_use_music_only(
+        self,
+        assembler: FFmpegAssembler,
+        sample_video_clips: list[Path],
+        sample_generated_music: GeneratedMusic,
+        tmp_path: Path,
+    ) -> None:
+        """Test that video audio is only mixed when every clip has audio."""
+        output_path = tmp_path / "output.mp4"
+
+        with (
+            patch.object(assembler, "get_video_duration", return_value=10.0),
+            patch.object(assembler, "has_audio_stream", side_effect=[True, False, True]),
+            patch("subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
+
+            assembler.assemble_with_music(
                 sample_video_clips,
-                expected_temp,
-                reencode=False,
+                sample_generated_music,
+                output_path,
             )
 
+            filter_complex = mock_run.call_args.args[0][
+                mock_run.call_args.args[0].index("-filter_complex") + 1
+            ]
+            assert "[0:a]" not in filter_complex
+
+    def test_missing_clip_raises_error(
+        self,
+        assembler: FFmpegAssembler,
+        sample_video_clips: list[Path],
+        sample_generated_music: GeneratedMusic,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a missing clip fails before FFmpeg runs."""
+        sample_video_clips[1].unlink()
+
+        with patch("subprocess.run") as mock_run:
+            with pytest.raises(FFmpegError, match="not found"):
+                assembler.assemble_with_music(
+                    sample_video_clips,
+                    sample_generated_music,
+                    tmp_path / "output.mp4",
+                )
+            mock_run.assert_not_called()
+
     def test_creates_output_directory(
         self,
         assembler: FFmpegAssembler,
@@ -257,14 +327,9 @@ class TestAssembleWithMusicExecution:
         output_path = tmp_path / "nested" / "dir" / "output.mp4"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=30.0),
             patch("subprocess.run") as mock_run,
         ):
-            concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            concat_temp.write_bytes(b"temp")
-            mock_concat.return_value = concat_temp
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             assembler.assemble_with_music(
@@ -275,24 +340,21 @@ class TestAssembleWithMusicExecution:
 
             assert output_path.parent.exists()
 
-    def test_temp_file_cleanup_on_success(
+    def test_concat_list_cleanup_on_success(
         self,
         assembler: FFmpegAssembler,
         sample_video_clips: list[Path],
         sample_generated_music: GeneratedMusic,
         tmp_path: Path,
     ) -> None:
-        """Test that temp concat file is cleaned up after success."""
+        """Test that the concat list file is cleaned up after success."""
         output_path = tmp_path / "output.mp4"
-        concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
+        concat_list = output_path.parent / f".concat_list_{output_path.stem}.txt"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=30.0),
             patch("subprocess.run") as mock_run,
         ):
-            concat_temp.write_bytes(b"temp")
-            mock_concat.return_value = concat_temp
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             assembler.assemble_with_music(
@@ -301,29 +363,25 @@ class TestAssembleWithMusicExecution:
                 output_path,
             )
 
-            # Temp file should be deleted
-            assert not concat_temp.exists()
+            assert not concat_list.exists()
 
-    def test_temp_file_cleanup_on_error(
+    def test_concat_list_cleanup_on_error(
         self,
         assembler: FFmpegAssembler,
         sample_video_clips: list[Path],
         sample_generated_music: GeneratedMusic,
         tmp_path: Path,
     ) -> None:
-        """Test that temp concat file is cleaned up even on error."""
+        """Test that the concat list file is cleaned up even on error."""
         output_path = tmp_path / "output.mp4"
-        concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
+        concat_list = output_path.parent / f".concat_list_{output_path.stem}.txt"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=30.0),
             patch("subprocess.run") as mock_run,
         ):
             import subprocess
 
-            concat_temp.write_bytes(b"temp")
-            mock_concat.return_value = concat_temp
             mock_run.side_effect = subprocess.CalledProcessError(1, "ffmpeg", stderr="error")
 
             with pytest.raises(FFmpegError):
@@ -333,8 +391,7 @@ class TestAssembleWithMusicExecution:
                     output_path,
                 )
 
-            # Temp file should still be deleted
-            assert not concat_temp.exists()
+            assert not concat_list.exists()
 
 
 class TestBuildMusicMixCommand:
@@ -494,13 +551,9 @@ class TestAssembleWithMusicEdgeCases:
         output_path = tmp_path / "output.mp4"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=1.0),  # 1 second
             patch("subprocess.run") as mock_run,
         ):
-            concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-            concat_temp.write_bytes(b"temp")
-            mock_concat.return_value = concat_temp
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             # Should not raise - fade_out_start will be max(0, 1.0 - 2.0) = 0
@@ -524,13 +577,9 @@ class TestAssembleWithMusicEdgeCases:
         output_path = tmp_path / "output.mp4"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=10.0),
             patch("subprocess.run") as mock_run,
         ):
-            concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-            concat_temp.write_bytes(b"temp")
-            mock_concat.return_value = concat_temp
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             result = assembler.assemble_with_music(
@@ -540,7 +589,7 @@ class TestAssembleWithMusicEdgeCases:
             )
 
             assert result == output_path
-            mock_concat.assert_called_once()
+            mock_run.assert_called()
 
     def test_zero_fade_duration(
         self,
@@ -553,13 +602,9 @@ class TestAssembleWithMusicEdgeCases:
         output_path = tmp_path / "output.mp4"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=30.0),
             patch("subprocess.run") as mock_run,
         ):
-            concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-            concat_temp.write_bytes(b"temp")
-            mock_concat.return_value = concat_temp
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             result = assembler.assemble_with_music(
@@ -582,13 +627,9 @@ class TestAssembleWithMusicEdgeCases:
         output_path = tmp_path / "output.mp4"
 
         with (
-            patch.object(assembler, "concatenate_clips") as mock_concat,
             patch.object(assembler, "get_video_duration", return_value=30.0),
             patch("subprocess.run") as mock_run,
         ):
-            concat_temp = output_path.parent / f".concat_temp_{output_path.stem}.mp4"
-            concat_temp.write_bytes(b"temp")
-            mock_concat.return_value = concat_temp
             mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
 
             # Volume 0.0 should work (music will be silent)
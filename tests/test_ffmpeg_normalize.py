@@ -0,0 +1,169 @@
+"""Tests for clip normalization ahead of stream-copy concatenation."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.normalize import (
+    ClipNormalizer,
+    TargetProfile,
+    build_normalize_command,
+    choose_target_profile,
+)
+from sip_studio.assembler.probe import ProbeCache, ProbeResult
+
+
+def _probe_json(
+    width: int = 1280,
+    height: int = 720,
+    fps: str = "24/1",
+    codec: str = "h264",
+    audio: bool = True,
+) -> dict:
+    streams = [
+        {
+            "index": 0,
+            "codec_type": "video",
+            "codec_name": codec,
+            "width": width,
+            "height": height,
+            "r_frame_rate": fps,
+            "pix_fmt": "yuv420p",
+        }
+    ]
+    if audio:
+        streams.append(
+            {
+                "index": 1,
+                "codec_type": "audio",
+                "codec_name": "aac",
+                "sample_rate": "48000",
+                "channels": 2,
+            }
+        )
+    return {"streams": streams, "format": {"duration": "5.0"}}
+
+
+def _probe_cache(layouts: dict[str, dict]) -> ProbeCache:
+    def run(cmd, **kwargs):
+        return MagicMock(stdout=json.dumps(layouts[Path(cmd[-1]).name]))
+
+    return ProbeCache(persist=False, run_fn=run)
+
+
+def _fake_ffmpeg(cmd, **kwargs):
+    Path(cmd[-1]).write_bytes(b"normalized")
+    return MagicMock(stdout="", stderr="")
+
+
+@pytest.fixture
+def clips(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name in ("scene_1.mp4", "scene_2.mp4", "scene_3.mp4"):
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(path)
+    return paths
+
+
+class TestTargetProfile:
+    def test_majority_shape_wins(self) -> None:
+        probes = [
+            ProbeResult.from_ffprobe(Path("a"), _probe_json(1920, 1080, "30/1", audio=False)),
+            ProbeResult.from_ffprobe(Path("b"), _probe_json()),
+            ProbeResult.from_ffprobe(Path("c"), _probe_json(audio=False)),
+        ]
+        target = choose_target_profile(probes)
+        assert (target.width, target.height, target.fps) == (1280, 720, 24.0)
+        assert target.has_audio
+        assert target.conforms(probes[1])
+        assert not target.conforms(probes[2])  # Needs a silent track
+        assert not target.conforms(probes[0])
+
+    def test_ntsc_rate_tolerance(self) -> None:
+        target = TargetProfile(width=1280, height=720, fps=29.97)
+        probe = ProbeResult.from_ffprobe(Path("a"), _probe_json(fps="30000/1001"))
+        assert target.conforms(probe)
+
+    def test_no_video_raises(self) -> None:
+        with pytest.raises(FFmpegError):
+            choose_target_profile([ProbeResult(path="a")])
+
+    def test_command_adds_silent_audio(self, tmp_path: Path) -> None:
+        target = TargetProfile(width=1280, height=720, fps=24.0)
+        cmd = build_normalize_command(tmp_path / "in.mp4", tmp_path / "out.mp4", target, False)
+        assert "anullsrc=r=48000:cl=stereo" in cmd
+        assert cmd[cmd.index("-map", cmd.index("0:v:0")) + 1] == "1:a:0"
+        assert "-shortest" in cmd
+        vf = cmd[cmd.index("-vf") + 1]
+        assert "scale=1280:720" in vf and "fps=24" in vf
+
+
+class TestClipNormalizer:
+    def test_conforming_clips_untouched(self, clips: list[Path]) -> None:
+        cache = _probe_cache({c.name: _probe_json() for c in clips})
+        with patch("subprocess.run") as mock_run:
+            assert ClipNormalizer(cache).normalize(clips) == clips
+        mock_run.assert_not_called()
+
+    def test_only_outliers_reencoded(self, clips: list[Path]) -> None:
+        layouts = {c.name: _probe_json() for c in clips}
+        layouts["scene_2.mp4"] = _probe_json(1920, 1080, "30/1", codec="hevc")
+        cache = _probe_cache(layouts)
+        with patch("subprocess.run", side_effect=_fake_ffmpeg) as mock_run:
+            result = ClipNormalizer(cache, max_workers=2).normalize(clips)
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args[0][3] == str(clips[1])
+        assert result[0] == clips[0] and result[2] == clips[2]
+        assert result[1].parent.name == ".normalized"
+        assert result[1].read_bytes() == b"normalized"
+        assert not list(result[1].parent.glob(".*part*"))
+
+    def test_normalized_clip_reused(self, clips: list[Path]) -> None:
+        layouts = {c.name: _probe_json() for c in clips}
+        layouts["scene_3.mp4"] = _probe_json(audio=False)
+        layouts["scene_1.mp4"] = _probe_json(audio=False)
+        cache = _probe_cache(layouts)
+        with patch("subprocess.run", side_effect=_fake_ffmpeg) as mock_run:
+            first = ClipNormalizer(cache).normalize(clips)
+            second = ClipNormalizer(cache).normalize(clips)
+        assert mock_run.call_count == 2
+        assert first == second
+
+    def test_failure_raises_and_cleans_up(self, clips: list[Path]) -> None:
+        import subprocess
+
+        layouts = {c.name: _probe_json() for c in clips}
+        layouts["scene_1.mp4"] = _probe_json(640, 360)
+        cache = _probe_cache(layouts)
+        error = subprocess.CalledProcessError(1, "ffmpeg", stderr="boom")
+        with patch("subprocess.run", side_effect=error):
+            with pytest.raises(FFmpegError, match="normalization for scene_1.mp4 failed: boom"):
+                ClipNormalizer(cache).normalize(clips)
+        assert not list((clips[0].parent / ".normalized").iterdir())
+
+
+def test_concatenate_stream_copies_normalized_clips(clips: list[Path], tmp_path: Path) -> None:
+    layouts = {c.name: _probe_json() for c in clips}
+    layouts["scene_3.mp4"] = _probe_json(720, 1280)
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        assembler = FFmpegAssembler(probe_cache=_probe_cache(layouts))
+    listed: list[str] = []
+
+    def run(cmd, **kwargs):
+        if "concat" in cmd:
+            listed.extend(Path(cmd[cmd.index("-i") + 1]).read_text().splitlines())
+            return MagicMock(stdout="", stderr="")
+        return _fake_ffmpeg(cmd)
+
+    with patch("subprocess.run", side_effect=run) as mock_run:
+        assembler.concatenate_clips(clips, tmp_path / "out" / "final.mp4")
+    concat_cmd = mock_run.call_args.args[0]
+    assert concat_cmd[concat_cmd.index("-c") + 1] == "copy"
+    assert ".normalized/scene_3_" in listed[2]
+    assert listed[0].endswith("scene_1.mp4'")
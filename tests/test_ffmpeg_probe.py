@@ -0,0 +1,125 @@
+"""Tests for the cached ffprobe metadata layer."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.probe import ProbeCache, ProbeResult
+
+_FFPROBE_JSON = {
+    "streams": [
+        {
+            "index": 0,
+            "codec_type": "video",
+            "codec_name": "h264",
+            "width": 1920,
+            "height": 1080,
+            "r_frame_rate": "24/1",
+            "pix_fmt": "yuv420p",
+        },
+        {
+            "index": 1,
+            "codec_type": "audio",
+            "codec_name": "aac",
+            "sample_rate": "48000",
+            "channels": 2,
+        },
+    ],
+    "format": {"duration": "8.000000", "size": "123456", "format_name": "mov,mp4"},
+}
+
+
+def _runner(payload: dict = _FFPROBE_JSON) -> MagicMock:
+    return MagicMock(return_value=MagicMock(stdout=json.dumps(payload), stderr=""))
+
+
+@pytest.fixture
+def clip(tmp_path: Path) -> Path:
+    path = tmp_path / "scene_001.mp4"
+    path.write_bytes(b"fake video")
+    return path
+
+
+class TestProbeCache:
+    def test_single_probe_answers_all_questions(self, clip: Path) -> None:
+        run = _runner()
+        cache = ProbeCache(run_fn=run)
+        assert cache.duration(clip) == 8.0
+        assert cache.has_audio(clip)
+        info = cache.video_info(clip)
+        assert info["codec"] == "h264"
+        assert (info["width"], info["height"], info["fps"]) == (1920, 1080, 24.0)
+        assert info["size_bytes"] == 123456
+        run.assert_called_once()
+        cmd = run.call_args.args[0]
+        assert "-show_format" in cmd and "-show_streams" in cmd
+
+    def test_typed_accessors(self, clip: Path) -> None:
+        result = ProbeCache(run_fn=_runner(), persist=False).probe(clip)
+        assert isinstance(result, ProbeResult)
+        assert result.video_stream is not None
+        assert result.video_stream.pix_fmt == "yuv420p"
+        assert result.audio_streams[0].sample_rate == 48000
+
+    def test_modified_file_is_reprobed(self, clip: Path) -> None:
+        run = _runner()
+        cache = ProbeCache(run_fn=run, persist=False)
+        cache.probe(clip)
+        clip.write_bytes(b"a different, longer clip")
+        cache.probe(clip)
+        assert run.call_count == 2
+
+    def test_sidecar_survives_new_cache(self, clip: Path) -> None:
+        ProbeCache(run_fn=_runner()).probe(clip)
+        assert (clip.parent / ".scene_001.mp4.probe.json").exists()
+        run = _runner()
+        assert ProbeCache(run_fn=run).duration(clip) == 8.0
+        run.assert_not_called()
+
+    def test_stale_sidecar_ignored(self, clip: Path) -> None:
+        ProbeCache(run_fn=_runner()).probe(clip)
+        st = clip.stat()
+        os.utime(clip, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        run = _runner()
+        ProbeCache(run_fn=run).probe(clip)
+        run.assert_called_once()
+
+    def test_missing_file_and_failed_probe(self, tmp_path: Path, clip: Path) -> None:
+        cache = ProbeCache(run_fn=_runner())
+        with pytest.raises(FFmpegError, match="not found"):
+            cache.probe(tmp_path / "missing.mp4")
+        assert not cache.has_audio(tmp_path / "missing.mp4")
+        failing = MagicMock(side_effect=subprocess.CalledProcessError(1, "ffprobe", stderr="bad"))
+        with pytest.raises(FFmpegError, match="ffprobe failed"):
+            ProbeCache(run_fn=failing, persist=False).probe(clip)
+
+    def test_no_audio_and_missing_duration(self, clip: Path) -> None:
+        payload = {"streams": [{"index": 0, "codec_type": "video"}], "format": {}}
+        cache = ProbeCache(run_fn=_runner(payload), persist=False)
+        assert not cache.has_audio(clip)
+        with pytest.raises(FFmpegError, match="Invalid duration"):
+            cache.duration(clip)
+
+
+def test_assembler_uses_shared_cache(tmp_path: Path) -> None:
+    clips = []
+    for i in range(3):
+        c = tmp_path / f"clip_{i}.mp4"
+        c.write_bytes(b"video")
+        clips.append(c)
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        assembler = FFmpegAssembler()
+    with patch("subprocess.run", _runner()) as run:
+        duration, has_audio = assembler._probe_clips(clips)
+        assembler._probe_clips(clips)
+        assembler.get_video_info(clips[0])
+    assert (duration, has_audio) == (24.0, True)
+    # One ffprobe per clip, however many questions are asked
+    assert run.call_count == 3
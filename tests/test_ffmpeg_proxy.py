@@ -0,0 +1,142 @@
+"""Tests for low-resolution proxy renders."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.probe import ProbeCache
+from sip_studio.assembler.proxy import build_proxy_command, proxy_dimensions, proxy_path_for
+from sip_studio.models.music import GeneratedMusic, MusicBrief
+
+
+def _probe_json(width: int, height: int, audio: bool = True) -> dict:
+    streams = [
+        {
+            "index": 0,
+            "codec_type": "video",
+            "codec_name": "h264",
+            "width": width,
+            "height": height,
+            "r_frame_rate": "24/1",
+            "pix_fmt": "yuv420p",
+        }
+    ]
+    if audio:
+        streams.append({"index": 1, "codec_type": "audio", "codec_name": "aac"})
+    return {"streams": streams, "format": {"duration": "4.0"}}
+
+
+@pytest.fixture
+def clips(tmp_path: Path) -> list[Path]:
+    paths = []
+    for name in ("scene_1.mp4", "scene_2.mp4"):
+        path = tmp_path / name
+        path.write_bytes(b"video")
+        paths.append(path)
+    return paths
+
+
+def _assembler(layouts: dict[str, dict]) -> FFmpegAssembler:
+    def run(cmd, **kwargs):
+        return MagicMock(stdout=json.dumps(layouts[Path(cmd[-1]).name]))
+
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        return FFmpegAssembler(probe_cache=ProbeCache(persist=False, run_fn=run))
+
+
+def test_proxy_dimensions() -> None:
+    assert proxy_dimensions(1920, 1080) == (854, 480)
+    assert proxy_dimensions(640, 360) == (640, 360)
+    assert proxy_dimensions(641, 361) == (640, 360)
+    assert all(isinstance(side, int) for side in proxy_dimensions(1000, 999))
+
+
+def test_proxy_dimensions_portrait() -> None:
+    # 9:16 clips cap the short side too, not the height
+    assert proxy_dimensions(720, 1280) == (480, 854)
+    assert proxy_dimensions(1080, 1920) == (480, 854)
+    assert proxy_dimensions(360, 640) == (360, 640)
+    assert proxy_dimensions(1080, 1080) == (480, 480)
+
+
+def test_proxy_path_for() -> None:
+    assert proxy_path_for(Path("/out/ad_final.mp4")) == Path("/out/ad_final_proxy.mp4")
+
+
+def test_command_without_audio(tmp_path: Path) -> None:
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mov"]
+    cmd = build_proxy_command(clips, tmp_path / "p.mp4", 854, 480, 24.0, False)
+    assert cmd[cmd.index("-preset") + 1] == "ultrafast"
+    assert "-an" in cmd and "-c:a" not in cmd
+    assert "concat" not in cmd  # No concat demuxer
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    # Every input is scaled to the proxy frame and frame rate before joining
+    for i in range(2):
+        assert f"[{i}:v]scale=854:480:force_original_aspect_ratio=decrease" in graph
+    assert graph.count("pad=854:480") == 2 and graph.count("fps=24") == 2
+    assert "[v0][v1]concat=n=2:v=1:a=0[video_out]" in graph
+
+
+def test_command_with_clip_audio(tmp_path: Path) -> None:
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    cmd = build_proxy_command(clips, tmp_path / "p.mp4", 854, 480, 30.0, True)
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "[1:a]aresample=48000" in graph
+    assert "[v0][a0][v1][a1]concat=n=2:v=1:a=1[video_out][clip_audio]" in graph
+    assert cmd[cmd.index("[video_out]") + 2] == "[clip_audio]"
+
+
+def test_render_proxy_with_music(
+    clips: list[Path], tmp_path: Path, sample_music_brief: MusicBrief
+) -> None:
+    layouts = {c.name: _probe_json(1920, 1080) for c in clips}
+    assembler = _assembler(layouts)
+    music_file = tmp_path / "music.mp3"
+    music_file.write_bytes(b"music")
+    music = GeneratedMusic(
+        file_path=str(music_file),
+        duration_seconds=30.0,
+        prompt_used=sample_music_brief.prompt,
+        brief=sample_music_brief,
+    )
+    output = tmp_path / "ad_final_proxy.mp4"
+
+    def run(cmd, **kwargs):
+        Path(cmd[-1]).write_bytes(b"proxy")
+        return MagicMock(stdout="", stderr="")
+
+    with patch("subprocess.run", side_effect=run) as mock_run:
+        assert assembler.render_proxy(clips, output, music=music) == output
+
+    cmd = mock_run.call_args.args[0]
+    assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-i"] == [
+        *map(str, clips),
+        str(music_file),
+    ]
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "amix=inputs=2" in graph and "[video_out]" in graph
+    # Music is input 2, mixed with the joined clip audio
+    assert "[2:a]afade=t=in" in graph and "[clip_audio]" in graph
+    assert output.read_bytes() == b"proxy"
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_render_proxy_failure_cleans_up(clips: list[Path], tmp_path: Path) -> None:
+    assembler = _assembler({c.name: _probe_json(1280, 720, audio=False) for c in clips})
+    output = tmp_path / "ad_final_proxy.mp4"
+
+    def run(cmd, **kwargs):
+        Path(cmd[-1]).write_bytes(b"partial")
+        raise subprocess.CalledProcessError(1, "ffmpeg", stderr="encoder gave up")
+
+    with patch("subprocess.run", side_effect=run):
+        with pytest.raises(FFmpegError, match="proxy render failed: encoder gave up"):
+            assembler.render_proxy(clips, output)
+    assert not output.exists()
+    assert not list(tmp_path.glob(".*"))
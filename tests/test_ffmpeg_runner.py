@@ -0,0 +1,125 @@
+"""Tests for the asyncio FFmpeg runner."""
+
+from __future__ import annotations
+
+import asyncio
+import stat
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sip_studio.assembler.ffmpeg import FFmpegAssembler, FFmpegError
+from sip_studio.assembler.runner import FFmpegProgress, parse_progress_block, run_ffmpeg
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell script")
+
+
+def _fake_ffmpeg(tmp_path: Path, body: str) -> str:
+    """Write an executable stand-in for ffmpeg and return its path."""
+    script = tmp_path / "ffmpeg"
+    script.write_text(f"#!/bin/sh\n{body}\n")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+_PROGRESS = """
+echo "$@" > "$(dirname "$0")/args.txt"
+printf 'frame=48\\nfps=96.0\\nout_time_us=2000000\\nspeed=4.0x\\nprogress=continue\\n'
+printf 'frame=96\\nfps=96.0\\nout_time_us=4000000\\nspeed=4.0x\\nprogress=end\\n'
+"""
+
+
+def test_parse_progress_block() -> None:
+    progress = parse_progress_block(
+        {"out_time_ms": "1500000", "fps": "N/A", "frame": "36", "progress": "continue"},
+        total_duration=6.0,
+    )
+    assert progress.out_time == 1.5
+    assert progress.fps is None
+    assert progress.frame == 36
+    assert progress.percent == 25.0
+
+
+async def test_reports_progress(tmp_path: Path) -> None:
+    ffmpeg = _fake_ffmpeg(tmp_path, _PROGRESS)
+    updates: list[FFmpegProgress] = []
+    await run_ffmpeg(
+        [ffmpeg, "-i", "in.mp4", "out.mp4"], total_duration=4.0, on_progress=updates.append
+    )
+    assert [u.percent for u in updates] == [50.0, 100.0]
+    assert updates[0].fps == 96.0 and updates[0].speed == 4.0
+    args = (tmp_path / "args.txt").read_text().split()
+    assert args[:3] == ["-progress", "pipe:1", "-nostats"]
+
+
+async def test_error_keeps_stderr_tail(tmp_path: Path) -> None:
+    ffmpeg = _fake_ffmpeg(
+        tmp_path, 'i=0; while [ $i -lt 500 ]; do echo "line $i" >&2; i=$((i+1)); done; exit 1'
+    )
+    with pytest.raises(FFmpegError) as exc_info:
+        await run_ffmpeg([ffmpeg], description="mixing", stderr_tail_lines=3)
+    assert str(exc_info.value) == "FFmpeg mixing failed: line 497\nline 498\nline 499"
+
+
+async def test_cancel_kills_process(tmp_path: Path) -> None:
+    marker = tmp_path / "finished"
+    ffmpeg = _fake_ffmpeg(tmp_path, f"sleep 30; touch {marker}")
+    created: list[asyncio.subprocess.Process] = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def spy(*args, **kwargs):
+        proc = await real_exec(*args, **kwargs)
+        created.append(proc)
+        return proc
+
+    with patch("asyncio.create_subprocess_exec", spy):
+        task = asyncio.create_task(run_ffmpeg([ffmpeg]))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert created[0].returncode is not None
+    assert not marker.exists()
+
+
+async def test_reader_failure_kills_process(tmp_path: Path) -> None:
+    # A stdout line over the stream reader's 64 KiB limit makes the progress reader raise
+    ffmpeg = _fake_ffmpeg(tmp_path, "head -c 70000 /dev/zero | tr '\\0' x; exec sleep 30")
+    created: list[asyncio.subprocess.Process] = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def spy(*args, **kwargs):
+        proc = await real_exec(*args, **kwargs)
+        created.append(proc)
+        return proc
+
+    with patch("asyncio.create_subprocess_exec", spy):
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(run_ffmpeg([ffmpeg]), timeout=10)
+    assert created[0].returncode is not None
+
+
+async def test_concatenate_async_uses_runner(tmp_path: Path) -> None:
+    clips = []
+    for i in range(2):
+        clip = tmp_path / f"clip_{i}.mp4"
+        clip.write_bytes(b"video")
+        clips.append(clip)
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        assembler = FFmpegAssembler()
+    with (
+        patch("sip_studio.assembler.normalize.ClipNormalizer.normalize_async") as normalize,
+        patch.object(assembler, "_probe_clips", return_value=(10.0, True)),
+        patch("sip_studio.assembler.runner.run_ffmpeg") as run,
+    ):
+        normalize.return_value = clips
+        output = await assembler.concatenate_clips_async(
+            clips, tmp_path / "final.mp4", on_progress=MagicMock()
+        )
+    assert output == tmp_path / "final.mp4"
+    cmd = run.call_args.args[0]
+    assert cmd[cmd.index("-c") + 1] == "copy"
+    assert run.call_args.kwargs["total_duration"] == 10.0
+    assert not list(tmp_path.glob(".concat_list_*"))
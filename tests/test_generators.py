@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.genai import errors as genai_errors
 
 from sip_studio.generators import VideoGenerator
 from sip_studio.generators.image_generator import (
@@ -12,6 +13,7 @@ from sip_studio.generators.image_generator import (
 )
 from sip_studio.models.assets import AssetType
 from sip_studio.models.script import SceneAction, SharedElement
+from sip_studio.studio.services.rate_limiter import get_rate_limiter
 
 
 class TestImageGenerator:
@@ -243,6 +245,133 @@ class TestImageGenerator:
             assert len(assets) == 1
 
 
+def _candidate(*images: MagicMock) -> MagicMock:
+    parts = []
+    for image in images:
+        part = MagicMock()
+        part.inline_data = True
+        part.as_image.return_value = image
+        parts.append(part)
+    candidate = MagicMock()
+    candidate.content.parts = parts
+    return candidate
+
+
+class TestImageVariantBatch:
+    """Tests for batched variant generation."""
+
+    @pytest.mark.asyncio
+    async def test_single_request_yields_all_candidates(
+        self, sample_shared_element: SharedElement, tmp_path: Path
+    ) -> None:
+        """Models returning several candidates need only one request per batch."""
+        response = MagicMock()
+        response.candidates = [_candidate(MagicMock()) for _ in range(3)]
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = response
+        with patch("sip_studio.generators.image_generator.genai.Client", return_value=mock_client):
+            generator = ImageGenerator(api_key="test-key")
+            paths = await generator.generate_reference_image_variants(
+                sample_shared_element, tmp_path, 3
+            )
+        assert len(paths) == 3
+        assert mock_client.models.generate_content.call_count == 1
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.candidate_count == 3
+        assert generator._multi_candidate is True
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_pipelined_requests(
+        self, sample_shared_element: SharedElement, tmp_path: Path
+    ) -> None:
+        """Single-candidate models keep the first image and pipeline the rest."""
+        response = MagicMock()
+        response.candidates = [_candidate(MagicMock())]
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = response
+        with patch("sip_studio.generators.image_generator.genai.Client", return_value=mock_client):
+            generator = ImageGenerator(api_key="test-key")
+            limiter = get_rate_limiter(_reset=True)
+            with patch.object(limiter, "acquire", wraps=limiter.acquire) as mock_acquire:
+                paths = await generator.generate_reference_image_variants(
+                    sample_shared_element, tmp_path, 3
+                )
+                # One token for the probe request, then one batch reservation of 2
+                tokens = [c.args[1] if len(c.args) > 1 else 1 for c in mock_acquire.call_args_list]
+                assert tokens == [1, 2]
+            assert len(paths) == 3
+            assert mock_client.models.generate_content.call_count == 3
+            assert generator._multi_candidate is False
+            # Later batches skip the multi-candidate probe entirely
+            mock_client.models.generate_content.reset_mock()
+            await generator.generate_reference_image_variants(sample_shared_element, tmp_path, 2)
+            assert mock_client.models.generate_content.call_count == 2
+            config = mock_client.models.generate_content.call_args.kwargs["config"]
+            assert config.candidate_count is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("error", "learned"),
+        [
+            (
+                genai_errors.ClientError(
+                    400,
+                    {"error": {"message": "Multiple candidates is not enabled for this model"}},
+                ),
+                False,
+            ),
+            (genai_errors.ClientError(429, {"error": {"message": "Resource exhausted"}}), None),
+            (TimeoutError("read timed out"), None),
+        ],
+    )
+    async def test_probe_only_disabled_when_candidate_count_rejected(
+        self,
+        sample_shared_element: SharedElement,
+        tmp_path: Path,
+        error: Exception,
+        learned: bool | None,
+    ) -> None:
+        """Transient probe failures leave multi-candidate support to be probed again."""
+        ok = MagicMock()
+        ok.candidates = [_candidate(MagicMock())]
+        with (
+            patch("sip_studio.generators.image_generator.genai.Client"),
+            patch(
+                "sip_studio.generators.image_generator.rate_limited_generate_content",
+                side_effect=[error, ok, ok, ok, ok],
+            ) as mock_generate,
+        ):
+            generator = ImageGenerator(api_key="test-key")
+            paths = await generator.generate_reference_image_variants(
+                sample_shared_element, tmp_path, 2
+            )
+            assert len(paths) == 2
+            assert generator._multi_candidate is learned
+
+            mock_generate.reset_mock()
+            await generator.generate_reference_image_variants(sample_shared_element, tmp_path, 2)
+            first_config = mock_generate.call_args_list[0].args[3]
+            assert first_config.candidate_count == (None if learned is False else 2)
+
+    @pytest.mark.asyncio
+    async def test_failed_variants_are_skipped(
+        self, sample_shared_element: SharedElement, tmp_path: Path
+    ) -> None:
+        """A failing variant request does not fail the batch."""
+        ok = MagicMock()
+        ok.candidates = [_candidate(MagicMock())]
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = [ValueError("boom"), ok]
+        with patch("sip_studio.generators.image_generator.genai.Client", return_value=mock_client):
+            generator = ImageGenerator(api_key="test-key")
+            generator._multi_candidate = False
+            paths = await generator.generate_reference_image_variants(
+                sample_shared_element, tmp_path, 2
+            )
+        assert len(paths) == 1
+        assert paths[0].endswith("_v0.png")
+
+
 class TestImageGenerationError:
     """Tests for ImageGenerationError exception."""
 
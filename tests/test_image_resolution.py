@@ -0,0 +1,183 @@
+"""Tests for the image resolution policy and upscale-on-keep."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image as PILImage
+
+from sip_studio.generators.image_generator import ImageGenerator
+from sip_studio.generators.resolution import (
+    ImagePurpose,
+    ResolutionPolicy,
+    deliverable_path,
+    get_resolution_policy,
+    hires_variant_path,
+    upscale_image,
+)
+from sip_studio.models.script import SharedElement
+from sip_studio.studio.services.image_status import ImageStatusService
+from sip_studio.studio.services.rate_limiter import RequestPriority
+from sip_studio.studio.state import BridgeState
+
+
+def _png(path: Path, size: tuple[int, int]) -> Path:
+    PILImage.new("RGB", size, "white").save(path)
+    return path
+
+
+def _image_response(payload: bytes) -> MagicMock:
+    image = MagicMock()
+    image.save.side_effect = lambda loc: Path(loc).write_bytes(payload)
+    part = MagicMock()
+    part.inline_data = True
+    part.as_image.return_value = image
+    response = MagicMock()
+    response.parts = [part]
+    return response
+
+
+class TestResolutionPolicy:
+    def test_defaults_per_purpose(self) -> None:
+        policy = ResolutionPolicy()
+        assert policy.image_size(ImagePurpose.REFERENCE) == "1K"
+        assert policy.image_size(ImagePurpose.VALIDATION_ATTEMPT) == "1K"
+        assert policy.image_size(ImagePurpose.DRAFT) == "2K"
+        assert policy.image_size(ImagePurpose.FINAL) == "4K"
+
+    def test_needs_upscale(self) -> None:
+        policy = ResolutionPolicy()
+        assert policy.needs_upscale("2K")
+        assert not policy.needs_upscale("4K")
+        assert not policy.needs_upscale(None)
+        assert not ResolutionPolicy(upscale_on_keep=False).needs_upscale("1K")
+
+    def test_max_policy_from_settings(self) -> None:
+        settings = MagicMock(sip_image_resolution_policy="max", sip_upscale_on_keep=True)
+        with patch("sip_studio.config.settings.get_settings", return_value=settings):
+            policy = get_resolution_policy()
+        assert all(policy.image_size(p) == "4K" for p in ImagePurpose)
+        assert not policy.upscale_on_keep
+
+    async def test_reference_images_use_reference_size(
+        self, sample_shared_element: SharedElement, tmp_path: Path
+    ) -> None:
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = _image_response(b"png")
+        with patch("sip_studio.generators.image_generator.genai.Client", return_value=mock_client):
+            generator = ImageGenerator(api_key="test-key")
+            await generator.generate_reference_image(sample_shared_element, tmp_path)
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.image_config.image_size == "1K"
+
+
+class TestUpscaleImage:
+    def test_writes_variant_and_keeps_original(self, tmp_path: Path) -> None:
+        path = _png(tmp_path / "draft.png", (1024, 1024))
+        original = path.read_bytes()
+        client = MagicMock()
+        client.models.generate_content.return_value = _image_response(b"upscaled")
+        variant = upscale_image(path, client=client, target_size="4K")
+        assert variant == hires_variant_path(path) == tmp_path / ".hires" / "draft.png"
+        assert variant.read_bytes() == b"upscaled"
+        assert path.read_bytes() == original
+        config = client.models.generate_content.call_args.kwargs["config"]
+        assert config.image_config.image_size == "4K"
+        assert config.image_config.aspect_ratio == "1:1"
+        assert not list((tmp_path / ".hires").glob(".*upscale*"))
+
+    def test_skips_image_already_at_target(self, tmp_path: Path) -> None:
+        path = _png(tmp_path / "big.png", (2048, 1152))
+        client = MagicMock()
+        assert upscale_image(path, client=client, target_size="2K") is None
+        client.models.generate_content.assert_not_called()
+
+    def test_uses_shared_client_in_background_lane(self, tmp_path: Path) -> None:
+        path = _png(tmp_path / "draft.png", (1024, 1024))
+        client = MagicMock()
+        with (
+            patch(
+                "sip_studio.studio.services.gemini_client.get_gemini_client",
+                return_value=client,
+            ),
+            patch(
+                "sip_studio.studio.services.rate_limiter.rate_limited_generate_content",
+                return_value=_image_response(b"upscaled"),
+            ) as generate,
+        ):
+            upscale_image(path, target_size="4K")
+        assert generate.call_args.args[0] is client
+        assert generate.call_args.kwargs["priority"] is RequestPriority.BACKGROUND
+
+    def test_deliverable_path_prefers_current_variant(self, tmp_path: Path) -> None:
+        path = _png(tmp_path / "kept.png", (1024, 1024))
+        assert deliverable_path(path) == path
+        variant = hires_variant_path(path)
+        variant.parent.mkdir()
+        variant.write_bytes(b"upscaled")
+        assert deliverable_path(path) == variant
+        # The image was replaced after the variant was rendered
+        st = variant.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert deliverable_path(path) == path
+
+    def test_raises_when_no_image_returned(self, tmp_path: Path) -> None:
+        path = _png(tmp_path / "draft.png", (512, 512))
+        client = MagicMock()
+        client.models.generate_content.return_value = MagicMock(parts=[])
+        with pytest.raises(ValueError):
+            upscale_image(path, client=client)
+        assert path.exists()
+
+
+class TestUpscaleOnKeep:
+    @pytest.fixture
+    def service(self, tmp_path: Path):
+        brands_dir = tmp_path / "brands"
+        (brands_dir / "brand").mkdir(parents=True)
+        with patch("sip_studio.brands.storage.base.get_brands_dir", return_value=brands_dir):
+            with patch(
+                "sip_studio.studio.services.image_status.get_brand_dir",
+                lambda slug: brands_dir / slug,
+            ):
+                yield ImageStatusService(BridgeState())
+
+    def _register(self, service: ImageStatusService, path: Path, image_size: str | None) -> str:
+        if image_size:
+            meta = {"image_size": image_size, "aspect_ratio": "1:1"}
+            path.with_suffix(".meta.json").write_text(json.dumps(meta))
+        return service.register_image("brand", str(path))["data"]["id"]
+
+    def test_keeping_draft_schedules_upscale(self, service, tmp_path: Path) -> None:
+        path = _png(tmp_path / "draft.png", (64, 64))
+        image_id = self._register(service, path, "2K")
+        with patch("sip_studio.studio.services.image_status._get_upscale_executor") as ex:
+            service.set_status("brand", image_id, "kept")
+            # Re-keeping an already kept image does not upscale again
+            service.set_status("brand", image_id, "kept")
+        ex.return_value.submit.assert_called_once()
+
+    def test_final_size_and_untracked_images_not_upscaled(self, service, tmp_path: Path) -> None:
+        final_id = self._register(service, _png(tmp_path / "final.png", (64, 64)), "4K")
+        bare_id = self._register(service, _png(tmp_path / "bare.png", (64, 64)), None)
+        with patch("sip_studio.studio.services.image_status._get_upscale_executor") as ex:
+            service.set_status("brand", final_id, "kept")
+            service.set_status("brand", bare_id, "kept")
+        ex.return_value.submit.assert_not_called()
+
+    def test_upscale_job_records_variant_in_metadata(self, tmp_path: Path) -> None:
+        from sip_studio.studio.services.image_status import _upscale_kept_image
+
+        path = _png(tmp_path / "draft.png", (64, 64))
+        variant = hires_variant_path(path)
+        with patch("sip_studio.generators.resolution.upscale_image", return_value=variant):
+            _upscale_kept_image(str(path), {"image_size": "2K", "aspect_ratio": "1:1"}, "4K")
+        meta = json.loads(path.with_suffix(".meta.json").read_text())
+        # The kept image itself is unchanged, so its recorded size stays
+        assert meta["image_size"] == "2K"
+        assert meta["hires_path"] == str(variant)
+        assert meta["hires_size"] == "4K"
@@ -1,9 +1,11 @@
 """Tests for image status tracking service."""
 
 import json
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -86,6 +88,7 @@ class TestRegisterImage:
     ) -> None:
         """Test that register_image persists to image_status.json."""
         service.register_image("test-brand", "/path/to/image.png")
+        service.flush("test-brand")
         status_file = temp_brands_dir / "test-brand" / STATUS_FILE_NAME
         assert status_file.exists()
         data = json.loads(status_file.read_text())
@@ -212,6 +215,68 @@ class TestListByStatus:
         assert result["data"] == []
 
 
+class TestPaging:
+    """Tests for paged, timestamp-ordered listing."""
+
+    def test_page_is_sorted_by_timestamp(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that pages come back oldest first with the total count."""
+        ids = [service.register_image("test-brand", f"/{i}.png")["data"]["id"] for i in range(5)]
+        with service._open("test-brand") as store:
+            for n, image_id in enumerate(reversed(ids)):
+                store.update(image_id, timestamp=f"2025-01-0{n + 1}T00:00:00+00:00")
+        result = service.page_by_status("test-brand", "unsorted", offset=1, limit=2)
+        assert result["data"]["total"] == 5
+        assert [e["id"] for e in result["data"]["images"]] == [ids[3], ids[2]]
+        listed = service.list_by_status("test-brand", "unsorted", offset=3)
+        assert [e["id"] for e in listed["data"]] == [ids[1], ids[0]]
+
+
+class TestStaleSweep:
+    """Tests for background removal of entries whose files are gone."""
+
+    def test_sweep_removes_missing_files(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that sweep_stale drops only entries whose files no longer exist."""
+        gen_dir = temp_brands_dir / "test-brand" / "assets" / "generated"
+        (gen_dir / "keep.png").write_bytes(b"fake")
+        (gen_dir / "gone.png").write_bytes(b"fake")
+        kept = service.register_image("test-brand", str(gen_dir / "keep.png"))["data"]["id"]
+        gone = service.register_image("test-brand", str(gen_dir / "gone.png"))["data"]["id"]
+        (gen_dir / "gone.png").unlink()
+        assert service.sweep_stale("test-brand") == 1
+        assert service.get_status("test-brand", kept)["success"] is True
+        assert service.get_status("test-brand", gone)["success"] is False
+
+    def test_listing_schedules_sweep_only_when_folders_change(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that listing never stats entries itself and sweeps after a deletion."""
+        gen_dir = temp_brands_dir / "test-brand" / "assets" / "generated"
+        (gen_dir / "a.png").write_bytes(b"fake")
+        service.register_image("test-brand", str(gen_dir / "a.png"))
+        executor = MagicMock()
+        executor.submit.side_effect = lambda fn, *args: fn(*args)
+        with (
+            patch(
+                "sip_studio.studio.services.image_status._get_sweep_executor",
+                return_value=executor,
+            ),
+            patch("sip_studio.studio.services.image_status.STALE_POLL_INTERVAL", 0),
+        ):
+            assert len(service.list_by_status("test-brand", "unsorted")["data"]) == 1
+            assert executor.submit.call_count == 1  # First listing catches up
+            service.list_by_status("test-brand", "unsorted")
+            assert executor.submit.call_count == 1  # Folders unchanged
+            (gen_dir / "a.png").unlink()
+            # The sweep runs after the page is built, so the next listing reflects it
+            service.list_by_status("test-brand", "unsorted")
+            assert executor.submit.call_count == 2
+            assert service.list_by_status("test-brand", "unsorted")["data"] == []
+
+
 class TestUpdatePath:
     """Tests for updating image path."""
 
@@ -265,6 +330,7 @@ class TestAtomicWrite:
     ) -> None:
         """Test that no temp file remains after write."""
         service.register_image("test-brand", "/path/to/image.png")
+        service.flush("test-brand")
         brand_dir = temp_brands_dir / "test-brand"
         tmp_file = brand_dir / "image_status.json.tmp"
         assert not tmp_file.exists()
@@ -381,6 +447,40 @@ class TestBackfillFromFolders:
         # New image should be unread
         assert result["data"]["added"][0]["viewedAt"] is None
 
+    def test_backfill_scans_only_changed_folders(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that folders whose mtime matches the checkpoint are not rescanned."""
+        assets = temp_brands_dir / "test-brand" / "assets"
+        (assets / "generated" / "image1.png").write_bytes(b"fake")
+        old = time.time() - 60
+        for folder in ("generated", "kept", "trash"):
+            os.utime(assets / folder, (old, old))
+        assert service.backfill_from_folders("test-brand")["data"]["count"] == 1
+        with patch.object(service, "_scan_folder", wraps=service._scan_folder) as scan:
+            assert service.backfill_from_folders("test-brand")["data"]["count"] == 0
+            scan.assert_not_called()
+            (assets / "generated" / "image2.png").write_bytes(b"fake")
+            os.utime(assets / "generated", (old + 30, old + 30))
+            result = service.backfill_from_folders("test-brand")
+        assert result["data"]["count"] == 1
+        assert [c.args[0].name for c in scan.call_args_list] == ["generated"]
+
+    def test_backfill_rescans_after_entry_removed(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that removing an entry invalidates checkpoints so its file is found again."""
+        assets = temp_brands_dir / "test-brand" / "assets"
+        (assets / "kept" / "image1.png").write_bytes(b"fake")
+        old = time.time() - 60
+        for folder in ("generated", "kept", "trash"):
+            os.utime(assets / folder, (old, old))
+        added = service.backfill_from_folders("test-brand")["data"]["added"]
+        service.delete_image("test-brand", added[0]["id"])
+        result = service.backfill_from_folders("test-brand")
+        assert result["data"]["count"] == 1
+        assert result["data"]["added"][0]["status"] == "kept"
+
 
 class TestCleanupOldTrash:
     """Tests for cleaning up old trashed images."""
@@ -398,6 +498,7 @@ class TestCleanupOldTrash:
         image_id = reg["data"]["id"]
         service.set_status("test-brand", image_id, "trashed")
         # Manually backdate the trashedAt
+        service.flush("test-brand")
         status_file = temp_brands_dir / "test-brand" / STATUS_FILE_NAME
         data = json.loads(status_file.read_text())
         old_time = (datetime.now(timezone.utc) - timedelta(days=35)).isoformat()
@@ -431,6 +532,66 @@ class TestCleanupOldTrash:
         assert img_path.exists()
 
 
+class TestMarkViewedMany:
+    """Tests for marking several images viewed at once."""
+
+    def test_marks_unviewed_and_reports_missing(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that only unviewed images are updated and unknown ids are reported."""
+        a = service.register_image("test-brand", "/a.png")["data"]["id"]
+        b = service.register_image("test-brand", "/b.png")["data"]["id"]
+        service.mark_viewed("test-brand", a)
+        result = service.mark_viewed_many("test-brand", [a, b, "img_missing"])
+        assert result["success"] is True
+        assert result["data"]["updated"] == [b]
+        assert result["data"]["missing"] == ["img_missing"]
+        assert service.get_status("test-brand", b)["data"]["viewedAt"] is not None
+
+
+class TestStatusStore:
+    """Tests for the indexed, write-coalescing status store."""
+
+    def test_mutations_coalesce_into_one_write(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that a burst of changes is saved in a single write on flush."""
+        with patch("sip_studio.studio.services.image_status.write_image_status_file") as write:
+            ids = [
+                service.register_image("test-brand", f"/{i}.png")["data"]["id"] for i in range(5)
+            ]
+            for image_id in ids:
+                service.mark_viewed("test-brand", image_id)
+            write.assert_not_called()
+            service.flush("test-brand")
+        write.assert_called_once()
+        assert len(write.call_args.args[1]["images"]) == 5
+
+    def test_find_by_path_follows_updates(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that the path index tracks moves and deletions."""
+        image_id = service.register_image("test-brand", "/gen/a.png")["data"]["id"]
+        service.update_path("test-brand", image_id, "/kept/a.png")
+        assert service.find_by_path("test-brand", "/kept/a.png")["data"]["id"] == image_id
+        # The original path still resolves to the same entry
+        assert service.find_by_path("test-brand", "/gen/a.png")["data"]["id"] == image_id
+        service.delete_image("test-brand", image_id)
+        assert service.find_by_path("test-brand", "/kept/a.png")["success"] is False
+
+    def test_reloads_after_external_change(
+        self, service: ImageStatusService, temp_brands_dir: Path
+    ) -> None:
+        """Test that an edit made to the file by another process is picked up."""
+        image_id = service.register_image("test-brand", "/a.png")["data"]["id"]
+        service.flush("test-brand")
+        status_file = temp_brands_dir / "test-brand" / STATUS_FILE_NAME
+        data = json.loads(status_file.read_text())
+        data["images"][image_id]["prompt"] = "edited elsewhere"
+        status_file.write_text(json.dumps(data))
+        assert service.get_status("test-brand", image_id)["data"]["prompt"] == "edited elsewhere"
+
+
 class TestLoadStatusData:
     """Tests for loading status data."""
 
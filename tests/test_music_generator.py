@@ -1,15 +1,20 @@
 """Tests for music generator using Lyria 2."""
 
 import base64
+import io
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-import requests
 
+from sip_studio.assembler.loudness import LoudnessCache
 from sip_studio.generators.music_generator import (
     MusicGenerationError,
     MusicGenerator,
+    _Base64FieldWriter,
+    select_music_candidate,
 )
 from sip_studio.models.music import (
     GeneratedMusic,
@@ -47,6 +52,30 @@ def mock_audio_content() -> bytes:
     return wav_header + b"\x00" * 1000  # Add some audio data
 
 
+class _LyriaStub:
+    """Records requests and serves a canned Lyria response via httpx.MockTransport."""
+
+    def __init__(self, body: dict | None = None, status: int = 200, exc: Exception | None = None):
+        self.body = body if body is not None else {}
+        self.status = status
+        self.exc = exc
+        self.requests: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(json.loads(request.content))
+        if self.exc:
+            raise self.exc
+        return httpx.Response(self.status, json=self.body)
+
+    @property
+    def last_json(self) -> dict:
+        return self.requests[-1]
+
+
+def _attach(generator: MusicGenerator, stub: _LyriaStub) -> None:
+    generator._client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+
+
 @pytest.fixture
 def music_generator() -> MusicGenerator:
     """Create a MusicGenerator instance for testing."""
@@ -99,18 +128,13 @@ class TestMusicGeneratorGenerate:
             ]
         }
 
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(mock_response)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response_obj
 
             result = await music_generator.generate(sample_music_brief, tmp_path)
 
@@ -137,24 +161,18 @@ class TestMusicGeneratorGenerate:
         encoded_audio = base64.b64encode(mock_audio_content).decode("utf-8")
         mock_response = {"predictions": [{"bytesBase64Encoded": encoded_audio}]}
 
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(mock_response)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response_obj
 
             await music_generator.generate(sample_music_brief, tmp_path, seed=12345)
 
             # Verify seed was included in request
-            call_args = mock_post.call_args
-            request_body = call_args.kwargs["json"]
+            request_body = stub.last_json
             assert request_body["instances"][0]["seed"] == 12345
 
     @pytest.mark.asyncio
@@ -167,18 +185,13 @@ class TestMusicGeneratorGenerate:
         """Test handling of empty predictions response."""
         mock_response = {"predictions": []}
 
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(mock_response)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response_obj
 
             with pytest.raises(MusicGenerationError, match="No predictions returned"):
                 await music_generator.generate(sample_music_brief, tmp_path)
@@ -193,18 +206,13 @@ class TestMusicGeneratorGenerate:
         """Test handling of response without audio content."""
         mock_response = {"predictions": [{"mimeType": "audio/wav"}]}
 
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(mock_response)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response_obj
 
             with pytest.raises(MusicGenerationError, match="No audio content"):
                 await music_generator.generate(sample_music_brief, tmp_path)
@@ -217,19 +225,13 @@ class TestMusicGeneratorGenerate:
         tmp_path: Path,
     ) -> None:
         """Test handling of HTTP error from API."""
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub({"error": "Invalid prompt"}, status=400)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.raise_for_status.side_effect = requests.exceptions.HTTPError(
-                response=MagicMock(text="Bad Request", json=lambda: {"error": "Invalid prompt"})
-            )
-            mock_post.return_value = mock_response_obj
 
             with pytest.raises(MusicGenerationError, match="API request failed"):
                 await music_generator.generate(sample_music_brief, tmp_path)
@@ -242,15 +244,13 @@ class TestMusicGeneratorGenerate:
         tmp_path: Path,
     ) -> None:
         """Test handling of network error."""
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(exc=httpx.ConnectError("Connection refused"))
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
 
             with pytest.raises(MusicGenerationError, match="Network error"):
                 await music_generator.generate(sample_music_brief, tmp_path)
@@ -268,18 +268,13 @@ class TestMusicGeneratorGenerate:
         encoded_audio = base64.b64encode(mock_audio_content).decode("utf-8")
         mock_response = {"predictions": [{"bytesBase64Encoded": encoded_audio}]}
 
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(mock_response)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response_obj
 
             result = await music_generator.generate(sample_music_brief, output_dir)
 
@@ -339,23 +334,17 @@ class TestMusicGeneratorRequestBody:
         encoded_audio = base64.b64encode(mock_audio_content).decode("utf-8")
         mock_response = {"predictions": [{"bytesBase64Encoded": encoded_audio}]}
 
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(mock_response)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response_obj
 
             await music_generator.generate(sample_music_brief, tmp_path)
 
-            call_args = mock_post.call_args
-            request_body = call_args.kwargs["json"]
+            request_body = stub.last_json
             assert request_body["instances"][0]["prompt"] == sample_music_brief.prompt
             neg_prompt = request_body["instances"][0]["negative_prompt"]
             assert neg_prompt == sample_music_brief.negative_prompt
@@ -378,22 +367,131 @@ class TestMusicGeneratorRequestBody:
         encoded_audio = base64.b64encode(mock_audio_content).decode("utf-8")
         mock_response = {"predictions": [{"bytesBase64Encoded": encoded_audio}]}
 
-        with (
-            patch.object(music_generator, "_get_auth_headers") as mock_auth,
-            patch("sip_studio.generators.music_generator.requests.post") as mock_post,
-        ):
+        stub = _LyriaStub(mock_response)
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers") as mock_auth:
             mock_auth.return_value = {
                 "Authorization": "Bearer token",
                 "Content-Type": "application/json",
             }
-            mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response_obj
 
             await music_generator.generate(brief, tmp_path)
 
-            call_args = mock_post.call_args
-            request_body = call_args.kwargs["json"]
+            request_body = stub.last_json
             # Empty string is falsy, so negative_prompt should not be included
             assert "negative_prompt" not in request_body["instances"][0]
+
+
+class TestStreamingDecode:
+    """Tests for incremental base64 decoding of the Lyria response."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 100_000])
+    def test_writer_handles_any_chunking(self, mock_audio_content: bytes, chunk_size: int) -> None:
+        """Audio decodes identically regardless of how the body is chunked."""
+        encoded = base64.b64encode(mock_audio_content).decode("utf-8").replace("/", "\\/")
+        body = json.dumps(
+            {"predictions": [{"mimeType": "audio/wav", "bytesBase64Encoded": "X"}]}
+        ).replace('"X"', f'"{encoded}"')
+        raw = body.encode()
+        out = io.BytesIO()
+        writer = _Base64FieldWriter("bytesBase64Encoded", out)
+        for i in range(0, len(raw), chunk_size):
+            writer.feed(raw[i : i + chunk_size])
+        result = writer.close()
+
+        assert out.getvalue() == mock_audio_content
+        assert result["predictions"][0]["mimeType"] == "audio/wav"
+        assert result["predictions"][0]["bytesBase64Encoded"] == ""
+
+    def test_writer_rejects_truncated_payload(self) -> None:
+        """A stream cut off inside the audio field raises."""
+        writer = _Base64FieldWriter("bytesBase64Encoded", io.BytesIO())
+        writer.feed(b'{"predictions": [{"bytesBase64Encoded": "AAAA')
+        with pytest.raises(MusicGenerationError, match="ended inside"):
+            writer.close()
+
+
+class TestMusicCandidates:
+    """Tests for concurrent best-of-N generation."""
+
+    @pytest.mark.asyncio
+    async def test_generate_candidates_uses_each_seed(
+        self,
+        music_generator: MusicGenerator,
+        sample_music_brief: MusicBrief,
+        mock_audio_content: bytes,
+        tmp_path: Path,
+    ) -> None:
+        """Each seed gets its own request and output file."""
+        encoded_audio = base64.b64encode(mock_audio_content).decode("utf-8")
+        stub = _LyriaStub({"predictions": [{"bytesBase64Encoded": encoded_audio}]})
+        _attach(music_generator, stub)
+        with patch.object(music_generator, "_get_auth_headers", return_value={}):
+            results = await music_generator.generate_candidates(
+                sample_music_brief, tmp_path, seeds=[1, 2, 3]
+            )
+
+        assert sorted(r["instances"][0]["seed"] for r in stub.requests) == [1, 2, 3]
+        assert [Path(r.file_path).name for r in results] == [
+            "background_music_1.wav",
+            "background_music_2.wav",
+            "background_music_3.wav",
+        ]
+
+    @staticmethod
+    def _candidates(tmp_path: Path, brief: MusicBrief, count: int) -> list[GeneratedMusic]:
+        tracks = []
+        for i in range(count):
+            path = tmp_path / f"background_music_{i}.wav"
+            path.write_bytes(f"RIFF {i}".encode())
+            tracks.append(
+                GeneratedMusic(
+                    file_path=str(path), duration_seconds=30.0, prompt_used="x", brief=brief
+                )
+            )
+        return tracks
+
+    @staticmethod
+    def _loudness(levels: dict[str, tuple[float, float]]) -> LoudnessCache:
+        """Cache whose ebur128 run reports (integrated, LRA) per file name."""
+
+        def run(cmd, **kwargs):
+            integrated, lra = levels[Path(cmd[cmd.index("-i") + 1]).name]
+            summary = f"Summary:\n I: {integrated} LUFS\n LRA: {lra} LU\n Peak: -3.0 dBFS\n"
+            return MagicMock(stdout="", stderr=summary)
+
+        return LoudnessCache(persist=False, run_fn=run)
+
+    def test_select_prefers_steadiest_audible_track(
+        self, sample_music_brief: MusicBrief, tmp_path: Path
+    ) -> None:
+        """The smallest loudness range wins; silent takes are skipped."""
+        tracks = self._candidates(tmp_path, sample_music_brief, 3)
+        cache = self._loudness(
+            {
+                "background_music_0.wav": (-14.0, 9.5),
+                "background_music_1.wav": (-70.0, 0.0),
+                "background_music_2.wav": (-16.0, 3.2),
+            }
+        )
+        assert select_music_candidate(tracks, cache) is tracks[2]
+
+    def test_select_falls_back_to_first_without_analysis(
+        self, sample_music_brief: MusicBrief, tmp_path: Path
+    ) -> None:
+        """If FFmpeg is unavailable the first candidate is used."""
+        tracks = self._candidates(tmp_path, sample_music_brief, 2)
+        cache = LoudnessCache(persist=False, run_fn=MagicMock(side_effect=FileNotFoundError))
+        assert select_music_candidate(tracks, cache) is tracks[0]
+
+    def test_auth_credentials_cached(self) -> None:
+        """Credentials are loaded once and reused while valid."""
+        generator = MusicGenerator(project_id="test-project")
+        with patch("sip_studio.generators.music_generator.google.auth.default") as mock_default:
+            mock_creds = MagicMock(token="t", valid=True)
+            mock_default.return_value = (mock_creds, "test-project")
+            generator._get_auth_headers()
+            generator._get_auth_headers()
+
+        assert mock_default.call_count == 1
+        mock_creds.refresh.assert_not_called()
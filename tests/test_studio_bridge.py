@@ -203,6 +203,33 @@ class TestAssetDelegation:
         bridge.delete_asset("generated/image.png")
         mock_asset_service.delete_asset.assert_called_once_with("generated/image.png")
 
+    def test_replace_asset_schedules_upscale_of_kept_image(
+        self, bridge, mock_asset_service, tmp_path
+    ):
+        """Keeping a quick-edit result should upscale it and drop the stale variant."""
+        bridge._asset = mock_asset_service
+        bridge._state.get_brand_dir = MagicMock(return_value=(tmp_path, None))
+        mock_asset_service.replace_asset.return_value = {
+            "success": True,
+            "data": {"path": "generated/image.png"},
+        }
+        stale = tmp_path / "assets" / "generated" / ".hires" / "image.png"
+        stale.parent.mkdir(parents=True)
+        stale.write_bytes(b"old")
+        with patch("sip_studio.studio.bridge.schedule_upscale_on_keep") as schedule:
+            result = bridge.replace_asset("generated/image.png", "generated/edit.png")
+        assert result["success"]
+        schedule.assert_called_once_with(str(tmp_path / "assets" / "generated" / "image.png"))
+        assert not stale.exists()
+
+    def test_failed_replace_does_not_upscale(self, bridge, mock_asset_service):
+        """A failed replace should not schedule an upscale."""
+        bridge._asset = mock_asset_service
+        mock_asset_service.replace_asset.return_value = {"success": False, "error": "nope"}
+        with patch("sip_studio.studio.bridge.schedule_upscale_on_keep") as schedule:
+            bridge.replace_asset("generated/image.png", "generated/edit.png")
+        schedule.assert_not_called()
+
 
 # =============================================================================
 # Image status tests
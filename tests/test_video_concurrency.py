@@ -0,0 +1,137 @@
+"""Tests for the adaptive video provider concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sip_studio.config.user_preferences import UserPreferences
+from sip_studio.generators.base import VideoGenerationError, VideoRateLimitError
+from sip_studio.generators.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+    is_rate_limit_error,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.t = 0.0
+
+    def now(self) -> float:
+        return self.t
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class TestIsRateLimitError:
+    def test_explicit_rate_limit_error(self) -> None:
+        assert is_rate_limit_error(VideoRateLimitError("slow down"))
+
+    def test_status_code_429(self) -> None:
+        assert is_rate_limit_error(_StatusError(429))
+        assert not is_rate_limit_error(_StatusError(500))
+
+    def test_wrapped_cause_is_inspected(self) -> None:
+        try:
+            try:
+                raise _StatusError(429)
+            except _StatusError as inner:
+                raise VideoGenerationError("Failed to generate video clip") from inner
+        except VideoGenerationError as e:
+            assert is_rate_limit_error(e)
+
+    def test_quota_message(self) -> None:
+        assert is_rate_limit_error(RuntimeError("RESOURCE_EXHAUSTED: quota exceeded"))
+        assert not is_rate_limit_error(RuntimeError("invalid prompt"))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_additive_increase_on_success(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter("veo", initial_limit=2, max_limit=8)
+        for _ in range(10):
+            limiter.record_success(latency=60.0)
+        assert limiter.limit > 2
+        assert limiter.limit <= 8
+
+    def test_growth_pauses_when_latency_degrades(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter("veo", initial_limit=2, latency_tolerance=2.0)
+        limiter.record_success(latency=10.0)
+        grown = limiter._limit
+        for _ in range(10):
+            limiter.record_success(latency=100.0)
+        assert limiter._limit < grown + 1.0
+
+    def test_multiplicative_decrease_with_cooldown(self) -> None:
+        clock = _Clock()
+        limiter = AdaptiveConcurrencyLimiter(
+            "kling", initial_limit=8, cooldown=30.0, time_fn=clock.now
+        )
+        limiter.record_rate_limited()
+        assert limiter.limit == 4
+        assert limiter.interval == 4.0
+        # Burst from the same congestion event only backs off once
+        limiter.record_rate_limited()
+        assert limiter.limit == 4
+        clock.t = 31.0
+        limiter.record_rate_limited()
+        assert limiter.limit == 2
+
+    def test_never_drops_below_min_limit(self) -> None:
+        clock = _Clock()
+        limiter = AdaptiveConcurrencyLimiter("sora", initial_limit=1, time_fn=clock.now)
+        limiter.record_rate_limited()
+        assert limiter.limit == 1
+
+    def test_fixed_limiter_does_not_adapt(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter.fixed("veo", 3, interval=2.0)
+        limiter.record_success(latency=1.0)
+        limiter.record_rate_limited()
+        assert limiter.limit == 3
+        assert limiter.interval == 2.0
+
+    async def test_slot_bounds_in_flight(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter.fixed("veo", 2)
+        peak = 0
+
+        async def work() -> None:
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+        assert limiter.in_flight == 0
+        assert limiter.successes == 6
+
+    async def test_slot_backs_off_on_rate_limit(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter("veo", initial_limit=4, initial_interval=0.5)
+        with pytest.raises(VideoRateLimitError):
+            async with limiter.slot():
+                raise VideoRateLimitError("429")
+        assert limiter.limit == 2
+        assert limiter.rate_limited == 1
+        assert limiter.in_flight == 0
+
+
+def test_learned_limits_persist(tmp_path: Path) -> None:
+    cfg = tmp_path / "config.json"
+    with patch.object(UserPreferences, "get_config_path", return_value=cfg):
+        limiter = AdaptiveConcurrencyLimiter("kling", initial_limit=2, max_limit=5)
+        for _ in range(6):
+            limiter.record_success(latency=30.0)
+        limiter.persist()
+
+        prefs = UserPreferences.load()
+        assert prefs.video_concurrency["kling"].max_concurrent == round(limiter._limit, 2)
+
+        restored = get_concurrency_limiter("kling", max_limit=5, _reset=True)
+        assert restored.limit == limiter.limit
@@ -1,5 +1,6 @@
 """Tests for video generation pipeline API."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -136,6 +137,26 @@ class TestVideoPipeline:
         assert len(progress_events) == 1
         assert progress_events[0] == ("test_stage", "Test message")
 
+    def test_ffmpeg_progress_throttled(self) -> None:
+        """Test FFmpeg progress is forwarded in coarse steps."""
+        from sip_studio.assembler.runner import FFmpegProgress
+
+        pipeline = VideoPipeline(PipelineConfig(idea="Test idea"))
+        progress_events: list[tuple[str, str]] = []
+        pipeline.on_progress = lambda stage, message: progress_events.append((stage, message))
+
+        report = pipeline._ffmpeg_progress_reporter()
+        for t in (1.0, 2.0, 2.5, 5.0):
+            report(FFmpegProgress(out_time=t, fps=120.0, total_duration=20.0))
+        report(FFmpegProgress(out_time=20.0, total_duration=20.0, done=True))
+
+        assert progress_events == [
+            ("assembly", "Encoding 5% at 120 fps"),
+            ("assembly", "Encoding 10% at 120 fps"),
+            ("assembly", "Encoding 25% at 120 fps"),
+            ("assembly", "Encoding 100%"),
+        ]
+
     def test_generate_project_id(self) -> None:
         """Test project ID generation."""
         project_id = VideoPipeline._generate_project_id()
@@ -146,6 +167,77 @@ class TestVideoPipeline:
         parts = project_id.split("_")
         assert len(parts) == 4
 
+    @pytest.mark.asyncio
+    async def test_assembly_previews_proxy_before_final(
+        self, sample_video_script: VideoScript, tmp_path: Path
+    ) -> None:
+        """Test the proxy is handed to the preview callback before the final render."""
+        clip = tmp_path / "scene_1.mp4"
+        clip.write_bytes(b"fake mp4")
+        pipeline = VideoPipeline(PipelineConfig(idea="Test idea"))
+        previews: list[tuple[str, bool]] = []
+        pipeline.on_preview = lambda path, is_final: previews.append((path.name, is_final))
+
+        assembler = MagicMock()
+
+        async def render_proxy(clip_paths, output_path, **kwargs):
+            return output_path
+
+        async def concatenate(clip_paths, output_path, **kwargs):
+            await asyncio.sleep(0.01)  # Final render outlasts the proxy
+            return output_path
+
+        assembler.render_proxy_async = render_proxy
+        assembler.concatenate_clips_async = concatenate
+        clips = [
+            GeneratedAsset(asset_type=AssetType.VIDEO_CLIP, scene_number=1, local_path=str(clip))
+        ]
+        with patch("sip_studio.video.pipeline.FFmpegAssembler", return_value=assembler):
+            final = await pipeline._assemble_video(sample_video_script, clips, None, tmp_path)
+
+        stem = final.stem
+        assert previews == [(f"{stem}_proxy.mp4", False), (final.name, True)]
+        assert pipeline._proxy_video_path == tmp_path / f"{stem}_proxy.mp4"
+
+    @pytest.mark.asyncio
+    async def test_assembly_waits_for_proxy_outlasting_final(
+        self, sample_video_script: VideoScript, tmp_path: Path
+    ) -> None:
+        """Test a proxy still encoding when the final render ends is finished, not cancelled."""
+        clip = tmp_path / "scene_1.mp4"
+        clip.write_bytes(b"fake mp4")
+        pipeline = VideoPipeline(PipelineConfig(idea="Test idea"))
+        assembler = MagicMock()
+
+        async def render_proxy(clip_paths, output_path, **kwargs):
+            await asyncio.sleep(0.05)  # Proxy outlasts the final render
+            return output_path
+
+        async def concatenate(clip_paths, output_path, **kwargs):
+            return output_path
+
+        assembler.render_proxy_async = render_proxy
+        assembler.concatenate_clips_async = concatenate
+        clips = [
+            GeneratedAsset(asset_type=AssetType.VIDEO_CLIP, scene_number=1, local_path=str(clip))
+        ]
+        with patch("sip_studio.video.pipeline.FFmpegAssembler", return_value=assembler):
+            final = await pipeline._assemble_video(sample_video_script, clips, None, tmp_path)
+        assert pipeline._proxy_video_path == tmp_path / f"{final.stem}_proxy.mp4"
+
+        # A stalled proxy is given up after the bound
+        async def stalled_proxy(clip_paths, output_path, **kwargs):
+            await asyncio.sleep(10)
+
+        assembler.render_proxy_async = stalled_proxy
+        pipeline._proxy_video_path = None
+        with (
+            patch("sip_studio.video.pipeline.FFmpegAssembler", return_value=assembler),
+            patch("sip_studio.video.pipeline.PROXY_FINISH_TIMEOUT", 0.01),
+        ):
+            await pipeline._assemble_video(sample_video_script, clips, None, tmp_path)
+        assert pipeline._proxy_video_path is None
+
     @pytest.mark.asyncio
     async def test_dry_run_returns_script_only(
         self,
@@ -239,6 +331,48 @@ class TestVideoPipeline:
 
             assert "Script development failed" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_latency_estimate_covers_only_reencoded_clips(self, tmp_path: Path) -> None:
+        """Test the profile estimate skips stream-copied clips and reserves the music mix."""
+        from sip_studio.assembler.encoding import PROFILES
+
+        clips = [tmp_path / f"scene_{i}.mp4" for i in range(3)]
+        assembler = MagicMock()
+        assembler.clips_to_normalize.return_value = [clips[2]]
+        assembler.get_video_duration.return_value = 10.0
+        assembler.get_video_info.return_value = {"fps": 24.0, "width": 1280, "height": 720}
+        pipeline = VideoPipeline(PipelineConfig(idea="Test idea"))
+
+        with patch(
+            "sip_studio.video.pipeline.select_profile_for_clip",
+            return_value=PROFILES["draft"],
+        ) as select:
+            profile = await pipeline._profile_for_latency_target(
+                assembler, clips, 5.0, with_music=True
+            )
+
+        assert profile.name == "draft"
+        clip, duration, target = select.call_args.args[:3]
+        assert (clip, duration) == (clips[2], 10.0)
+        # 30s of audio re-encoded for the music mix at 100x realtime
+        assert target == pytest.approx(4.7)
+
+    @pytest.mark.asyncio
+    async def test_latency_target_without_reencode_uses_best_profile(self, tmp_path: Path) -> None:
+        """Test conforming clips skip the benchmark entirely."""
+        assembler = MagicMock()
+        assembler.clips_to_normalize.return_value = []
+        assembler.get_video_duration.return_value = 10.0
+        pipeline = VideoPipeline(PipelineConfig(idea="Test idea"))
+
+        with patch("sip_studio.video.pipeline.select_profile_for_clip") as select:
+            profile = await pipeline._profile_for_latency_target(
+                assembler, [tmp_path / "scene_1.mp4"], 1.0
+            )
+
+        assert profile.name == "archival"
+        select.assert_not_called()
+
 
 class TestVideoPipelineFullRun:
     """Tests for full pipeline execution with mocks."""